@@ -90,13 +90,9 @@ class Receiptor(doing.DoDoer):
                 yield from self.catchup(ser.pre, wit)
 
         clients = dict()
-        doers = []
         for wit in wits:
             try:
-                client, clientDoer = httpClient(hab, wit)
-                clients[wit] = client
-                doers.append(clientDoer)
-                self.extend([clientDoer])
+                clients[wit] = self.clienter.client(httpUrl(hab, wit))
             except (kering.MissingEntryError, gaierror) as e:
                 logger.error(f"unable to create http client for witness {wit}: {e}")
 
@@ -147,11 +143,14 @@ class Receiptor(doing.DoDoer):
 
             client = clients[wit]
 
-            sent = httping.streamCESRRequests(client=client, dest=wit, ims=bytearray(msg))
-            while len(client.responses) < sent:
-                yield self.tock
+            sent = self.clienter.post(client, ims=msg, dest=wit)
+            while sent:
+                while not client.responses:
+                    yield self.tock
+                sent += self.clienter.fallback(client, client.respond()) - 1
 
-        self.remove(doers)
+        for client in clients.values():
+            self.clienter.remove(client)
 
         return rcts.keys()
 
@@ -213,15 +212,19 @@ class Receiptor(doing.DoDoer):
 
         hab = self.hby.habs[pre]
 
-        client, clientDoer = httpClient(hab, wit)
-        self.extend([clientDoer])
+        client = self.clienter.client(httpUrl(hab, wit))
 
+        ims = bytearray()
         for fmsg in hab.db.clonePreIter(pre=pre):
-            httping.streamCESRRequests(client=client, dest=wit, ims=bytearray(fmsg))
+            ims.extend(fmsg)
+
+        sent = self.clienter.post(client, ims=ims, dest=wit) if ims else 0
+        while sent:
             while not client.responses:
                 yield self.tock
+            sent += self.clienter.fallback(client, client.respond()) - 1
 
-        self.remove([clientDoer])
+        self.clienter.remove(client)
 
     def witDo(self, tymth=None, tock=0.0, **kwa):
         """
@@ -290,12 +293,17 @@ class WitnessReceiptor(doing.DoDoer):
     for receipts from each of those witnesses, and propagates those receipts to each
     of the other witnesses after receiving the complete set.
 
+    Up to .window events of different identifiers are receipted concurrently each by
+    its own eventDo doer that waits on a WigWatch of its event instead of reading .wigs.
+
     Removes all Doers and exits as Done once all witnesses have been sent the entire
     receipt set.  Could be enhanced to have a `once` method that runs once and cleans up
     and an `all` method that runs and waits for more messages to receipt.
     """
 
-    def __init__(self, hby, msgs=None, cues=None, force=False, auths=None, **kwa):
+    Window = 8  # maximum number of events receipted concurrently
+
+    def __init__(self, hby, msgs=None, cues=None, force=False, auths=None, window=None, **kwa):
         """
         For the current event, gather the current set of witnesses, send the event,
         gather all receipts and send them to all other witnesses
@@ -308,19 +316,25 @@ class WitnessReceiptor(doing.DoDoer):
                 Messages have {"pre": <str>, "sn": <int>, "auths": <dict>}
             force (bool): True means to send witnesses all receipts even if we have a full complement.
             auths (dict): map of witness AIDs to (time,auth) tuples for providing TOTP auth for witnessing
+            window (int): maximum number of events receipted concurrently. None means .Window
         """
         self.hby = hby
         self.force = force
         self.msgs = msgs if msgs is not None else decking.Deck()
         self.cues = cues if cues is not None else decking.Deck()
         self.auths = auths if auths is not None else dict()
+        self.window = window if window is not None else self.Window
+        self.receipting = dict()  # event receipting doers keyed by prefix
+        self.clienter = httping.Clienter()
 
-        super(WitnessReceiptor, self).__init__(doers=[doing.doify(self.receiptDo)], **kwa)
+        super(WitnessReceiptor, self).__init__(doers=[self.clienter, doing.doify(self.receiptDo)], **kwa)
 
     def receiptDo(self, tymth=None, tock=0.0, **kwa):
         """
-        Sends events, their receipts, receipt signatures, delegation chain, and location record
-         URLs between witnesses in the set of current witnesses.
+        Starts an eventDo doer for each event in .msgs while fewer than .window
+        events are being receipted. Events of the same identifier are receipted
+        one at a time in order so at most .window events are in flight to any
+        witness.
 
         Returns:
              a doifiable Hio generator to perform event and receipt sending.
@@ -337,111 +351,138 @@ class WitnessReceiptor(doing.DoDoer):
         _ = (yield self.tock)
 
         while True:
-            while self.msgs:
-                evt = self.msgs.popleft()
-                pre = evt["pre"]
+            for pre, doer in list(self.receipting.items()):
+                if doer.done:
+                    self.remove([doer])
+                    del self.receipting[pre]
 
-                if pre not in self.hby.habs:
+            held = []
+            while self.msgs and len(self.receipting) < self.window:
+                evt = self.msgs.popleft()
+                if evt["pre"] in self.receipting:  # wait for prior event of same identifier
+                    held.append(evt)
                     continue
 
-                hab = self.hby.habs[pre]
+                doer = doing.doify(self.eventDo, evt=evt)
+                self.receipting[evt["pre"]] = doer
+                self.extend([doer])
+            self.msgs.extendleft(reversed(held))
 
-                sn = evt["sn"] if "sn" in evt else hab.kever.sner.num
-                wits = hab.kever.wits
+            yield self.tock
 
-                if len(wits) == 0:
-                    continue
+    def eventDo(self, tymth=None, tock=0.0, evt=None, **kwa):
+        """
+        Sends event, its receipts, receipt signatures, delegation chain, and location record
+        URLs between witnesses in the set of current witnesses. Waits for the witness
+        receipts on a WigWatch of the event that is updated as they are stored.
+
+        Returns:
+             a doifiable Hio generator to receipt one event.
+
+        Parameters:
+            tymth (function): function returning cycle time for configuring this Doer's cycle time.
+            tock (float): cycle time for this Doer, default is 0.0 seconds.
+            evt (dict): event to receipt {"pre": <str>, "sn": <int>}
+        """
+        self.wind(tymth)
+        self.tock = tock
+        _ = (yield self.tock)
 
-                msg = hab.makeOwnEvent(sn=sn)
-                ser = serdering.SerderKERI(raw=msg)
+        pre = evt["pre"]
+        if pre not in self.hby.habs:
+            return True
 
-                dgkey = dbing.dgKey(ser.preb, ser.saidb)
+        hab = self.hby.habs[pre]
 
-                witers = []
-                for wit in wits:
-                    auth = self.auths[wit] if wit in self.auths else None
-                    witer = messenger(hab, wit, auth=auth)
-                    witers.append(witer)
-                    self.extend([witer])
+        sn = evt["sn"] if "sn" in evt else hab.kever.sner.num
+        wits = hab.kever.wits
 
-                # Check to see if we already have all the receipts we need for this event
-                wigs = hab.db.getWigs(dgkey)
-                completed = len(wigs) == len(wits)
-                if len(wigs) != len(wits):  # We have all the receipts, skip
-                    for idx, witer in enumerate(witers):
-                        wit = wits[idx]
+        if len(wits) == 0:
+            return True
 
-                        for dmsg in hab.db.cloneDelegation(hab.kever):
-                            witer.msgs.append(bytearray(dmsg))
+        msg = hab.makeOwnEvent(sn=sn)
+        ser = serdering.SerderKERI(raw=msg)
 
-                        if ser.ked['t'] in (coring.Ilks.icp, coring.Ilks.dip) or \
-                                "ba" in ser.ked and wit in ser.ked["ba"]:  # Newly added witness, must send full KEL to catch up
-                            for fmsg in hab.db.clonePreIter(pre=pre):
-                                witer.msgs.append(bytearray(fmsg))
+        dgkey = dbing.dgKey(ser.preb, ser.saidb)
 
-                        witer.msgs.append(bytearray(msg))  # make a copy
-                        _ = (yield self.tock)
+        witers = []
+        for wit in wits:
+            auth = self.auths[wit] if wit in self.auths else None
+            witer = messenger(hab, wit, auth=auth, clienter=self.clienter)
+            witers.append(witer)
+            self.extend([witer])
 
-                    while True:
-                        wigs = hab.db.getWigs(dgkey)
-                        if len(wigs) == len(wits):
-                            break
-                        _ = yield self.tock
+        # Check to see if we already have all the receipts we need for this event
+        watch = hab.db.watchWigs(dgkey, need=len(wits))
+        try:
+            completed = watch.done
+            if not completed:
+                for idx, witer in enumerate(witers):
+                    wit = wits[idx]
 
-                # If we started with all our receipts, exit unless told to force resubmit of all receipts
-                if completed and not self.force:
-                    self.cues.push(evt)
-                    continue
+                    for dmsg in hab.db.cloneDelegation(hab.kever):
+                        witer.msgs.append(bytearray(dmsg))
+
+                    if ser.ked['t'] in (coring.Ilks.icp, coring.Ilks.dip) or \
+                            "ba" in ser.ked and wit in ser.ked["ba"]:  # Newly added witness, must send full KEL to catch up
+                        for fmsg in hab.db.clonePreIter(pre=pre):
+                            witer.msgs.append(bytearray(fmsg))
 
-                # generate all rct msgs to send to all witnesses
-                awigers = [indexing.Siger(qb64b=bytes(wig)) for wig in wigs]
-
-                # make sure all witnesses have fully receipted KERL and know about each other
-                for witer in witers:
-                    ewits = []
-                    wigers = []
-                    for i, wit in enumerate(wits):
-                        if wit == witer.wit:
-                            continue
-                        ewits.append(wit)
-                        wigers.append(awigers[i])
-
-                    if len(wigers) == 0:
-                        continue
-
-                    rctMsg = bytearray()
-
-                    # Now that the witnesses have not met each other, send them each other's receipts
-                    if ser.ked['t'] in (coring.Ilks.icp, coring.Ilks.dip):  # introduce new witnesses
-                        rctMsg.extend(schemes(self.hby.db, eids=ewits))
-                    elif ser.ked['t'] in (coring.Ilks.rot, coring.Ilks.drt) and \
-                            ("ba" in ser.ked and witer.wit in ser.ked["ba"]):  # Newly added witness, introduce to all
-                        rctMsg.extend(schemes(self.hby.db, eids=ewits))
-
-                    rserder = eventing.receipt(pre=ser.pre,
-                                               sn=sn,
-                                               said=ser.said)
-                    rctMsg.extend(eventing.messagize(serder=rserder, wigers=wigers))
-
-                    witer.msgs.append(rctMsg)
+                    witer.msgs.append(bytearray(msg))  # make a copy
                     _ = (yield self.tock)
 
-                while True:
-                    done = True
-                    for witer in witers:
-                        if not witer.idle:
-                            yield 1.0
-                            done = False
-                            break
-                    if done:
-                        break
+                while not watch.done:  # updated as witness receipts are stored
+                    _ = yield self.tock
+        finally:
+            hab.db.unwatchWigs(watch)
 
-                self.remove(witers)
+        # If we started with all our receipts, exit unless told to force resubmit of all receipts
+        if completed and not self.force:
+            self.remove(witers)
+            self.cues.push(evt)
+            return True
 
-                self.cues.push(evt)
-                yield self.tock
+        # generate all rct msgs to send to all witnesses
+        wigs = hab.db.getWigs(dgkey)
+        awigers = [indexing.Siger(qb64b=bytes(wig)) for wig in wigs]
 
-            yield self.tock
+        # make sure all witnesses have fully receipted KERL and know about each other
+        for witer in witers:
+            ewits = []
+            wigers = []
+            for i, wit in enumerate(wits):
+                if wit == witer.wit:
+                    continue
+                ewits.append(wit)
+                wigers.append(awigers[i])
+
+            if len(wigers) == 0:
+                continue
+
+            rctMsg = bytearray()
+
+            # Now that the witnesses have not met each other, send them each other's receipts
+            if ser.ked['t'] in (coring.Ilks.icp, coring.Ilks.dip):  # introduce new witnesses
+                rctMsg.extend(schemes(self.hby.db, eids=ewits))
+            elif ser.ked['t'] in (coring.Ilks.rot, coring.Ilks.drt) and \
+                    ("ba" in ser.ked and witer.wit in ser.ked["ba"]):  # Newly added witness, introduce to all
+                rctMsg.extend(schemes(self.hby.db, eids=ewits))
+
+            rserder = eventing.receipt(pre=ser.pre,
+                                       sn=sn,
+                                       said=ser.said)
+            rctMsg.extend(eventing.messagize(serder=rserder, wigers=wigers))
+
+            witer.msgs.append(rctMsg)
+            _ = (yield self.tock)
+
+        while not all(witer.idle for witer in witers):
+            _ = yield self.tock
+
+        self.remove(witers)
+
+        self.cues.push(evt)
+        return True
 
 
 class WitnessInquisitor(doing.DoDoer):
@@ -473,8 +514,9 @@ class WitnessInquisitor(doing.DoDoer):
         self.klas = klas if klas is not None else HTTPMessenger
         self.msgs = msgs if msgs is not None else decking.Deck()
         self.sent = decking.Deck()
+        self.clienter = httping.Clienter()
 
-        super(WitnessInquisitor, self).__init__(doers=[doing.doify(self.msgDo)], **kwa)
+        super(WitnessInquisitor, self).__init__(doers=[self.clienter, doing.doify(self.msgDo)], **kwa)
 
     def msgDo(self, tymth=None, tock=1.0, **opts):
         """
@@ -533,10 +575,10 @@ class WitnessInquisitor(doing.DoDoer):
                     logger.error(f"must have location in endpoint to query for pre={pre}")
                     continue
 
-                witer = messengerFrom(hab=hab, pre=ctrl, urls=locs)
+                witer = messengerFrom(hab=hab, pre=ctrl, urls=locs, clienter=self.clienter)
             else:
                 wit = random.choice(wits)
-                witer = messenger(hab, wit)
+                witer = messenger(hab, wit, clienter=self.clienter)
 
             self.extend([witer])
 
@@ -629,7 +671,8 @@ class WitnessPublisher(doing.DoDoer):
         self.posted = 0
         self.msgs = msgs if msgs is not None else decking.Deck()
         self.cues = cues if cues is not None else decking.Deck()
-        super(WitnessPublisher, self).__init__(doers=[doing.doify(self.sendDo)], **kwa)
+        self.clienter = httping.Clienter()
+        super(WitnessPublisher, self).__init__(doers=[self.clienter, doing.doify(self.sendDo)], **kwa)
 
     def sendDo(self, tymth=None, tock=0.0, **opts):
         """
@@ -657,7 +700,7 @@ class WitnessPublisher(doing.DoDoer):
 
                 witers = []
                 for wit in wits:
-                    witer = messenger(hab, wit)
+                    witer = messenger(hab, wit, clienter=self.clienter)
                     witers.append(witer)
                     witer.msgs.append(bytearray(msg))  # make a copy so everyone munges their own
                     self.extend([witer])
@@ -888,15 +931,21 @@ class HTTPMessenger(doing.DoDoer):
     """
     Interacts with Recipients on HTTP and SSE for sending events and receiving receipts
 
+    Messages queued together on .msgs are posted as one batched CESR request
+    falling back to one request per message for older recipients.
+
     """
 
-    def __init__(self, hab, wit, url, msgs=None, sent=None, doers=None, auth=None, **kwa):
+    def __init__(self, hab, wit, url, msgs=None, sent=None, doers=None, auth=None,
+                 clienter=None, **kwa):
         """
         For the current event, gather the current set of witnesses, send the event,
         gather all receipts and send them to all other witnesses
 
         Parameters:
             hab: Habitat of the identifier to populate witnesses
+            clienter (Clienter): shared pool of keep-alive connections run by the
+                caller. None means use own Clienter run by this messenger
 
         """
         self.hab = hab
@@ -913,13 +962,20 @@ class HTTPMessenger(doing.DoDoer):
         if up.scheme != kering.Schemes.http and up.scheme != kering.Schemes.https:
             raise ValueError(f"invalid scheme {up.scheme} for HTTPMessenger")
 
-        self.client = http.clienting.Client(scheme=up.scheme, hostname=up.hostname, port=up.port)
-        clientDoer = http.clienting.ClientDoer(client=self.client)
-
-        doers.extend([clientDoer])
+        if clienter is None:
+            clienter = httping.Clienter()
+            doers.extend([clienter])
+        self.clienter = clienter
+        self.client = self.clienter.client(url)
 
         super(HTTPMessenger, self).__init__(doers=doers, **kwa)
 
+    def exit(self, deeds=None):
+        """ Release pooled client when this messenger exits """
+        if deeds is None:
+            self.clienter.remove(self.client)
+        super(HTTPMessenger, self).exit(deeds=deeds)
+
     def msgDo(self, tymth=None, tock=0.0, **kwa):
         """
         Returns doifiable Doist compatible generator method (doer dog)
@@ -935,12 +991,14 @@ class HTTPMessenger(doing.DoDoer):
             while not self.msgs:
                 yield self.tock
 
-            msg = self.msgs.popleft()
+            msg = bytearray()
+            while self.msgs:  # batch all queued messages into one request
+                msg.extend(self.msgs.popleft())
             headers = dict()
             if self.auth is not None:
                 headers["Authorization"] = self.auth
 
-            self.posted += httping.streamCESRRequests(client=self.client, dest=self.wit, ims=msg, headers=headers)
+            self.posted += self.clienter.post(self.client, ims=msg, dest=self.wit, headers=headers)
             while self.client.requests:
                 yield self.tock
 
@@ -958,6 +1016,9 @@ class HTTPMessenger(doing.DoDoer):
         while True:
             while self.client.responses:
                 rep = self.client.respond()
+                if reposted := self.clienter.fallback(self.client, rep):  # older peer
+                    self.posted += reposted - 1
+                    continue
                 self.sent.append(rep)
                 yield
             yield
@@ -1052,22 +1113,23 @@ def mailbox(hab, cid):
     return mbx
 
 
-def messenger(hab, pre, auth=None):
+def messenger(hab, pre, auth=None, clienter=None):
     """ Create a Messenger (tcp or http) based on available endpoints
 
     Parameters:
         hab (Habitat): Environment to use to look up witness URLs
         pre (str): qb64 identifier prefix of recipient to create a messanger for
         auth (str): optional auth code to send with any request for messenger
+        clienter (Clienter): optional shared HTTP connection pool for messenger
 
     Returns:
         Optional(TcpWitnesser, HTTPMessenger): witnesser for ensuring full reciepts
     """
     urls = hab.fetchUrls(eid=pre)
-    return messengerFrom(hab, pre, urls, auth)
+    return messengerFrom(hab, pre, urls, auth, clienter=clienter)
 
 
-def messengerFrom(hab, pre, urls, auth=None):
+def messengerFrom(hab, pre, urls, auth=None, clienter=None):
     """ Create a Witnesser (tcp or http) based on provided endpoints
 
     Parameters:
@@ -1075,13 +1137,14 @@ def messengerFrom(hab, pre, urls, auth=None):
         pre (str): qb64 identifier prefix of recipient to create a messanger for
         urls (dict): map of schemes to urls of available endpoints
         auth (str): optional auth code to send with any request for messenger
+        clienter (Clienter): optional shared HTTP connection pool for messenger
 
     Returns:
         Optional(TcpWitnesser, HTTPMessenger): witnesser for ensuring full reciepts
     """
     if kering.Schemes.http in urls or kering.Schemes.https in urls:
         url = urls[kering.Schemes.http] if kering.Schemes.http in urls else urls[kering.Schemes.https]
-        witer = HTTPMessenger(hab=hab, wit=pre, url=url, auth=auth)
+        witer = HTTPMessenger(hab=hab, wit=pre, url=url, auth=auth, clienter=clienter)
     elif kering.Schemes.tcp in urls:
         url = urls[kering.Schemes.tcp]
         witer = TCPMessenger(hab=hab, wit=pre, url=url)
@@ -1116,6 +1179,24 @@ def streamMessengerFrom(hab, pre, urls, msg, headers=None):
     return witer
 
 
+def httpUrl(hab, wit):
+    """ Return http or https URL of the witness
+
+    Parameters:
+        hab (Habitat): Environment to use to look up witness URLs
+        wit (str): qb64 identifier prefix of witness
+
+    Returns:
+        str: http URL if any otherwise https URL of witness
+
+    """
+    urls = hab.fetchUrls(eid=wit, scheme=kering.Schemes.http) or hab.fetchUrls(eid=wit, scheme=kering.Schemes.https)
+    if not urls:
+        raise kering.MissingEntryError(f"unable to query witness {wit}, no http endpoint")
+
+    return urls[kering.Schemes.http] if kering.Schemes.http in urls else urls[kering.Schemes.https]
+
+
 def httpClient(hab, wit):
     """ Create and return a http.client and http.ClientDoer for the witness
 
@@ -1128,12 +1209,7 @@ def httpClient(hab, wit):
         ClientDoer: Doer for client
 
     """
-    urls = hab.fetchUrls(eid=wit, scheme=kering.Schemes.http) or hab.fetchUrls(eid=wit, scheme=kering.Schemes.https)
-    if not urls:
-        raise kering.MissingEntryError(f"unable to query witness {wit}, no http endpoint")
-
-    url = urls[kering.Schemes.http] if kering.Schemes.http in urls else urls[kering.Schemes.https]
-    up = urlparse(url)
+    up = urlparse(httpUrl(hab, wit))
     client = http.clienting.Client(scheme=up.scheme, hostname=up.hostname, port=up.port, path=up.path)
     clientDoer = http.clienting.ClientDoer(client=client)
 
@@ -0,0 +1,3 @@
+import argparse
+
+parser = argparse.ArgumentParser(description="A collection of database operations")
@@ -0,0 +1,71 @@
+# -*- encoding: utf-8 -*-
+"""
+keri.kli.commands.db.backup module
+
+"""
+import argparse
+import os
+
+from hio.base import doing
+
+from keri import help
+from keri.app import keeping
+from keri.app.cli.common.parsing import Parsery
+from keri.db import basing, dbing
+from keri.vdr import viring
+
+logger = help.ogler.getLogger()
+
+
+def handler(args):
+    """
+    Launch online backup of KERI databases
+
+    Args:
+        args(Namespace): arguments object from command line
+    """
+    backer = BackupDoer(args)
+    return [backer]
+
+
+parser = argparse.ArgumentParser(description='Backs up the database, keystore and registry while in use',
+                                 parents=[Parsery.keystore()])
+parser.set_defaults(handler=handler)
+parser.add_argument('--path', help='directory to write backup into', required=True)
+parser.add_argument('--no-compact', dest="compact", action="store_false",
+                    help='copy pages as is instead of compacting, faster but larger')
+parser.add_argument('--temp', '-t', help='create a temporary keystore, used for testing', default=False)
+
+
+def dbers(name, base="", temp=False):
+    """
+    Returns:
+        dbers (list): of (dirname, LMDBer) of the database, keystore and
+            registry of keystore name, not reopened
+    """
+    return [("db", basing.Baser(name=name, base=base, temp=temp, reopen=False)),
+            ("ks", keeping.Keeper(name=name, base=base, temp=temp, reopen=False)),
+            ("reg", viring.Reger(name=name, base=base, temp=temp, reopen=False))]
+
+
+class BackupDoer(doing.Doer):
+
+    def __init__(self, args):
+        self.args = args
+        super(BackupDoer, self).__init__()
+
+    def recur(self, tyme):
+        for dirname, dber in dbers(self.args.name, self.args.base, self.args.temp):
+            if not dber.exists(name=dber.name, base=dber.base):
+                continue  # nothing to back up
+
+            # open only the environment since backup needs no sub dbs
+            dbing.LMDBer.reopen(dber, readonly=True)
+            try:
+                path = dber.backup(path=os.path.join(self.args.path, dirname),
+                                   compact=self.args.compact)
+            finally:
+                dber.close()
+            print(f"Backed up {dber.path} to {path}")
+
+        return True
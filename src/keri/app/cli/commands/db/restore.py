@@ -0,0 +1,58 @@
+# -*- encoding: utf-8 -*-
+"""
+keri.kli.commands.db.restore module
+
+"""
+import argparse
+import os
+
+from hio.base import doing
+
+from keri import help, kering
+from keri.app.cli.commands.db.backup import dbers
+from keri.app.cli.common.parsing import Parsery
+
+logger = help.ogler.getLogger()
+
+
+def handler(args):
+    """
+    Launch restore of KERI databases from backup
+
+    Args:
+        args(Namespace): arguments object from command line
+    """
+    restorer = RestoreDoer(args)
+    return [restorer]
+
+
+parser = argparse.ArgumentParser(description='Restores the database, keystore and registry from a backup '
+                                             'made by kli db backup. Stop all users of the keystore first.',
+                                 parents=[Parsery.keystore()])
+parser.set_defaults(handler=handler)
+parser.add_argument('--path', help='directory of backup to restore from', required=True)
+parser.add_argument('--temp', '-t', help='create a temporary keystore, used for testing', default=False)
+
+
+class RestoreDoer(doing.Doer):
+
+    def __init__(self, args):
+        self.args = args
+        super(RestoreDoer, self).__init__()
+
+    def recur(self, tyme):
+        for dirname, dber in dbers(self.args.name, self.args.base, self.args.temp):
+            path = os.path.join(self.args.path, dirname)
+            if not os.path.exists(os.path.join(path, "data.mdb")):
+                continue  # not in backup
+
+            try:
+                dber.restore(path=path)
+            except kering.DatabaseError as ex:  # restored but out of date
+                print(f"Restored {dber.path} from {path}: {ex}")
+                continue
+            finally:
+                dber.close()
+            print(f"Restored {dber.path} from {path}")
+
+        return True
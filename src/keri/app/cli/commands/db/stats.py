@@ -0,0 +1,83 @@
+# -*- encoding: utf-8 -*-
+"""
+keri.kli.commands.db.stats module
+
+"""
+import argparse
+import json
+
+from hio.base import doing
+
+from keri import help
+from keri.app import storing
+from keri.app.cli.commands.db.backup import dbers
+from keri.app.cli.common.parsing import Parsery
+from keri.db import dbing
+
+logger = help.ogler.getLogger()
+
+
+def handler(args):
+    """
+    Launch report of storage statistics of KERI databases
+
+    Args:
+        args(Namespace): arguments object from command line
+    """
+    stater = StatsDoer(args)
+    return [stater]
+
+
+parser = argparse.ArgumentParser(description='Reports entries and pages of each sub database of the database, '
+                                             'keystore and registry',
+                                 parents=[Parsery.keystore()])
+parser.set_defaults(handler=handler)
+parser.add_argument('--mailbox', help='also report mailbox database of this name such as a witness alias',
+                    default=None)
+parser.add_argument('--sort', help='column to sort sub databases by, largest first', default="bytes",
+                    choices=["bytes", "entries", "depth", "branch", "leaf", "overflow"])
+parser.add_argument('--json', action="store_true", help='print stats as JSON instead of tables')
+parser.add_argument('--temp', '-t', help='create a temporary keystore, used for testing', default=False)
+
+
+class StatsDoer(doing.Doer):
+
+    def __init__(self, args):
+        self.args = args
+        super(StatsDoer, self).__init__()
+
+    def recur(self, tyme):
+        dbs = dbers(self.args.name, self.args.base, self.args.temp)
+        if self.args.mailbox is not None:
+            dbs.append(("mbx", storing.Mailboxer(name=self.args.mailbox, temp=self.args.temp,
+                                                 reopen=False)))
+
+        report = dict()
+        for dirname, dber in dbs:
+            if not dber.exists(name=dber.name, base=dber.base):
+                continue
+
+            # open only the environment since stats needs no sub dbs
+            dbing.LMDBer.reopen(dber, readonly=True)
+            try:
+                report[dirname] = dict(path=dber.path, mapSize=dber.mapSize,
+                                       mapUsed=dber.mapUsed, subdbs=dber.stats())
+            finally:
+                dber.close()
+
+        if self.args.json:
+            print(json.dumps(report, indent=1))
+            return True
+
+        for dirname, info in report.items():
+            subdbs = sorted(info["subdbs"].items(), key=lambda item: item[1][self.args.sort],
+                            reverse=True)
+            print(f"{info['path']}  map {info['mapUsed']} of {info['mapSize']} bytes used")
+            print(f"{'name':<16} {'entries':>10} {'depth':>5} {'branch':>8} {'leaf':>8} "
+                  f"{'overflow':>8} {'bytes':>12}")
+            for name, stat in subdbs:
+                print(f"{name:<16} {stat['entries']:>10} {stat['depth']:>5} {stat['branch']:>8} "
+                      f"{stat['leaf']:>8} {stat['overflow']:>8} {stat['bytes']:>12}")
+            print()
+
+        return True
@@ -148,4 +148,5 @@ class InitDoer(doing.DoDoer):
 
             self.remove(authn.doers)
 
+        rgy.close()
         hby.close()
@@ -30,6 +30,8 @@ parser = argparse.ArgumentParser(description='Migrates a database and keystore',
                                  parents=[Parsery.keystore()])
 parser.set_defaults(handler=handler)
 parser.add_argument('--temp', '-t', help='create a temporary keystore, used for testing', default=False)
+parser.add_argument('--size', type=int, default=None,
+                    help='records per transaction of batched migrations, interrupted batched migrations resume')
 
 
 class MigrateDoer(doing.Doer):
@@ -50,7 +52,7 @@ class MigrateDoer(doing.Doer):
             pass
 
         print(f"Migrating {self.args.name}...")
-        db.migrate()
+        db.migrate(size=self.args.size)
         print(f"Finished migrating {self.args.name}")
 
         return True
@@ -73,6 +73,7 @@ def rollback(tymth, tock=0.0, **opts):
             hby.db.delSigs(dgkey)  # idempotent
             hby.db.delDts(dgkey)  # idempotent do not change dts if already
             hby.db.delKes(dbing.snKey(serder.preb, serder.sn))
+            hby.db.verifiers.remove((serder.pre, serder.sn))
 
             seqner = coring.Number(num=serder.sn - 1)
             fner = coring.Number(numh=ked['f'])
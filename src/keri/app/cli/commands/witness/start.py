@@ -41,6 +41,10 @@ parser.add_argument('--config-file',
                     action='store',
                     default=None,
                     help="configuration filename override")
+parser.add_argument('-w', '--workers',
+                    action='store',
+                    default=0,
+                    help="Number of worker processes sharing the HTTP port. Default is 0 for none.")
 parser.add_argument("--keypath", action="store", required=False, default=None)
 parser.add_argument("--certpath", action="store", required=False, default=None)
 parser.add_argument("--cafilepath", action="store", required=False, default=None)
@@ -70,14 +74,15 @@ def launch(args):
                configFile=args.configFile,
                keypath=args.keypath,
                certpath=args.certpath,
-               cafilepath=args.cafilepath)
+               cafilepath=args.cafilepath,
+               workers=int(args.workers))
 
     logger.info("\n******* Ended Witness for %s listening: http/%s, tcp/%s"
                 ".******\n\n", args.name, args.http, args.tcp)
 
 
 def runWitness(name="witness", base="", alias="witness", bran="", tcp=5631, http=5632, expire=0.0,
-               configDir="", configFile="", keypath=None, certpath=None, cafilepath=None):
+               configDir="", configFile="", keypath=None, certpath=None, cafilepath=None, workers=0):
     """
     Setup and run one witness
     """
@@ -107,6 +112,7 @@ def runWitness(name="witness", base="", alias="witness", bran="", tcp=5631, http
                                           httpPort=http,
                                           keypath=keypath,
                                           certpath=certpath,
-                                          cafilepath=cafilepath))
+                                          cafilepath=cafilepath,
+                                          workers=workers))
 
     directing.runController(doers=doers, expire=expire)
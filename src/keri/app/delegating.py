@@ -28,6 +28,8 @@ class Anchorer(doing.DoDoer):
 
     """
 
+    EscrowPeriod = 0.5  # seconds between passes over all delegation escrows
+
     def __init__(self, hby, proxy=None, auths=None, **kwa):
         """
         Initialize Anchorer.
@@ -42,6 +44,8 @@ class Anchorer(doing.DoDoer):
         self.witq = agenting.WitnessInquisitor(hby=hby)
         self.witDoer = agenting.Receiptor(hby=self.hby)
         self.publishers = dict()
+        self.witnessed = dict()  # WigWatch of escrowed events keyed by (pre, said)
+        self.noticed = set()  # (pre, said) of done watches already rechecked
         self.proxy = proxy
         self.auths = auths
 
@@ -123,9 +127,37 @@ class Anchorer(doing.DoDoer):
         self.tock = tock
         _ = (yield self.tock)
 
+        retyme = self.tyme
         while True:
-            self.processEscrows()
-            yield 0.5
+            if self.tyme >= retyme:
+                self.processEscrows()
+                retyme = self.tyme + self.EscrowPeriod
+            elif self.notices():  # receipts completed since last check
+                self.processPartialWitnessEscrow()
+            yield self.tock
+
+    def notices(self):
+        """
+        Returns:
+            noticed (bool): True when a watched event of the partial witness
+                escrow completed since last call. Each completion is noticed
+                once so one that is still waiting is left to the periodic
+                escrow pass.
+        """
+        noticed = False
+        for key, watch in self.witnessed.items():
+            if watch.done and key not in self.noticed:
+                self.noticed.add(key)
+                noticed = True
+        return noticed
+
+    def unwatch(self, key):
+        """
+        Stop watching witness receipts of escrowed event at key (pre, said)
+        """
+        if (watch := self.witnessed.pop(key, None)) is not None:
+            self.hby.db.unwatchWigs(watch)
+        self.noticed.discard(key)
 
     def processEscrows(self):
         """Process delegation escrows"""
@@ -162,14 +194,18 @@ class Anchorer(doing.DoDoer):
         that the event is complete.
 
         """
+        escrowed = set()
         for (pre, said), serder in self.hby.db.dpwe.getItemIter():  # group partial witness escrow
+            escrowed.add((pre, said))
             kever = self.hby.kevers[pre]
             dgkey = dbing.dgKey(pre, serder.said)
             seqner = coring.Seqner(sn=serder.sn)
 
-            # Load all the witness receipts we have so far
-            wigs = self.hby.db.getWigs(dgkey)
-            if len(wigs) == len(kever.wits):  # We have all of them, this event is finished
+            # Watch the witness receipts as they are stored
+            if (watch := self.witnessed.get((pre, said))) is None:
+                watch = self.hby.db.watchWigs(dgkey, need=len(kever.wits))
+                self.witnessed[(pre, said)] = watch
+            if watch.done:  # We have all of them, this event is finished
                 if len(kever.wits) > 0:
                     witnessed = False
                     for cue in self.witDoer.cues:
@@ -212,8 +248,12 @@ class Anchorer(doing.DoDoer):
                 self.witq.query(hab=phab, pre=dkever.prefixer.qb64, anchor=seal)
 
                 self.hby.db.dpwe.rem(keys=(pre, said))
+                self.unwatch((pre, said))
                 self.hby.db.dune.pin(keys=(srdr.pre, srdr.said), val=srdr)
 
+        for key in set(self.witnessed) - escrowed:  # removed from escrow elsewhere
+            self.unwatch(key)
+
     def processWitnessPublication(self):
         """
         Process escrow of partially signed delegation events.  Message processing waits for
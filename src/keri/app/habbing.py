@@ -670,6 +670,9 @@ class Habery:
         Parameters:
            clear is boolean, True means clear resource directories
         """
+        if self.mgr:
+            self.mgr.close()
+
         if self.ks:
             self.ks.close(clear=self.ks.temp or clear)
 
@@ -5,7 +5,9 @@ keri.peer.httping module
 """
 import datetime
 import json
+from collections import deque
 from dataclasses import dataclass
+from types import SimpleNamespace
 from urllib import parse
 from pathlib import Path
 
@@ -23,6 +25,7 @@ from keri.help import helping
 logger = help.ogler.getLogger()
 
 CESR_CONTENT_TYPE = "application/cesr+json"
+CESR_STREAM_CONTENT_TYPE = "application/cesr"
 CESR_ATTACHMENT_HEADER = "CESR-ATTACHMENT"
 CESR_DESTINATION_HEADER = "CESR-DESTINATION"
 
@@ -211,35 +214,268 @@ def streamCESRRequests(client, ims, dest, path=None, headers=None):
     return cnt
 
 
+def batchCESRRequest(client, ims, dest, path=None, headers=None):
+    """
+    Turns a stream of KERI messages with their attachments into one batched CESR
+    http request against the provided hio http Client. The stream is the
+    application/cesr body of the request as is so the receiver parses it once.
+
+    Parameters
+       client (Client): hio http Client that will send the stream as a CESR request
+       ims (bytearray):  stream of KERI messages with attachments
+       dest (str): qb64 identifier prefix of destination controller
+       path (str): path to post to
+       headers (dict): additional headers of request
+
+    Returns
+       int: Number of individual requests posted, always 1
+
+    """
+    path = path if path is not None else "/"
+    path = parse.urljoin(client.requester.path, path)
+
+    cold = kering.sniff(ims)  # check for spurious counters at front of stream
+    if cold in (parsing.Colds.txt, parsing.Colds.bny):  # not message error out to flush stream
+        raise kering.ColdStartError("Expecting message counter tritet={}"
+                                    "".format(cold))
+
+    body = bytes(ims)
+    del ims[:]
+
+    heads = (Hict([
+        ("Content-Type", CESR_STREAM_CONTENT_TYPE),
+        ("Content-Length", len(body)),
+        (CESR_DESTINATION_HEADER, dest)
+    ]))
+    heads.update(headers if headers is not None else Hict())
+
+    client.request(
+        method="POST",
+        path=path,
+        headers=heads,
+        body=body
+    )
+
+    return 1
+
+
+def batchRejected(rep):
+    """
+    Returns True if rep is the response of a peer that does not accept batched
+    CESR requests to the batched CESR request it answers, False otherwise.
+
+    Parameters:
+        rep (Response): attrified hio http response
+    """
+    if rep.status not in (406, 415):  # not acceptable or unsupported media type
+        return False
+    heads = rep.request.get("headers") or Hict()
+    return heads.get("Content-Type") == CESR_STREAM_CONTENT_TYPE
+
+
+@dataclass
+class Connection:
+    """
+    Pooled keep-alive connection of Clienter. All access of Clienter to the
+    internals of the hio HTTP Client it wraps (.waited, .latest, .connector,
+    .respondent and the extra request key naming the PooledClient of a
+    request) goes through this class so a change in hio is fixed here.
+
+    Attributes:
+        client (http.clienting.Client): hio HTTP client of connection
+        doer (http.clienting.ClientDoer): doer that services client
+        used (datetime.datetime): time connection last delivered a response
+    """
+    client: http.clienting.Client
+    doer: http.clienting.ClientDoer
+    used: datetime.datetime
+
+    Pooled = "pooled"  # extra request key hio keeps on request but does not send
+
+    @property
+    def busy(self):
+        """ True when a request is in flight or queued on connection """
+        return bool(self.client.waited or self.client.requests)
+
+    @property
+    def load(self):
+        """ int number of requests in flight or queued on connection """
+        return len(self.client.requests) + self.client.waited
+
+    @property
+    def cutoff(self):
+        """ True when the server closed or dropped the connection """
+        return bool(self.client.connector.cutoff)
+
+    @property
+    def requests(self):
+        """ deque of request dicts queued on connection not yet transmitted """
+        return self.client.requests
+
+    @property
+    def responses(self):
+        """ deque of response dicts received on connection """
+        return self.client.responses
+
+    def request(self, pooled, **request):
+        """ Queue request dict for PooledClient pooled onto connection """
+        self.client.request(**{self.Pooled: pooled}, **request)
+
+    @classmethod
+    def owner(cls, request):
+        """ Returns PooledClient that made request dict, None if none """
+        return request.get(cls.Pooled)
+
+    def settle(self):
+        """
+        Finish parsing response in flight when the server closed the connection
+        since a response without Content-Length ends at close. hio otherwise
+        does so only on its next service of the client.
+        """
+        if self.cutoff and self.client.waited and self.client.respondent:
+            self.client.respondent.close()
+            self.client.serviceResponse()
+
+    def abandon(self):
+        """
+        Returns request dict in flight when connection is cut off before its
+        response ended, None otherwise. The request is not resent since it may
+        not be idempotent.
+        """
+        if not (self.cutoff and self.client.waited):
+            return None
+        request, self.client.latest = self.client.latest, None
+        self.client.waited = False
+        return request
+
+
+class PooledClient:
+    """
+    PooledClient is the handle returned by Clienter for requests to one origin.
+    It provides the request and response interface of a hio HTTP Client used by
+    the request helpers in this module while its requests are sent on keep-alive
+    connections pooled by origin in the Clienter. Responses are delivered to
+    the PooledClient whose request they answer.
+
+    Attributes:
+        clienter (Clienter): pool that sends the requests of this client
+        origin (tuple): (scheme, hostname, port) of requests
+        requester (SimpleNamespace): scheme, hostname, port and base path
+        dt (datetime.datetime): time of latest request
+    """
+
+    def __init__(self, clienter, origin, path="/"):
+        """
+        Parameters:
+            clienter (Clienter): pool that sends the requests of this client
+            origin (tuple): (scheme, hostname, port) of requests
+            path (str): base path of requests
+        """
+        self.clienter = clienter
+        self.origin = origin
+        scheme, hostname, port = origin
+        self.requester = SimpleNamespace(scheme=scheme, hostname=hostname,
+                                         port=port, path=path if path else "/")
+        self.dt = helping.nowUTC()
+        self._responses = deque()
+
+    def request(self, method="GET", path=None, qargs=None, headers=None,
+                body=None, fargs=None, **kwa):
+        """
+        Queue request onto a pooled connection to .origin. Parameters as for
+        hio http Client.request except that values not provided default to
+        empty rather than to those of the prior request on the connection.
+        """
+        if hasattr(body, "encode"):
+            body = body.encode("utf-8")
+        self.dt = helping.nowUTC()
+        self.clienter.submit(self, dict(method=method,
+                                        path=path if path is not None else self.requester.path,
+                                        qargs=qargs if qargs is not None else dict(),
+                                        fragment="",
+                                        headers=headers if headers is not None else Hict(),
+                                        body=body if body is not None else b"",
+                                        fargs=fargs,
+                                        **kwa))
+
+    @property
+    def requests(self):
+        """ list of requests of this client not yet transmitted """
+        return self.clienter.queued(self)
+
+    @property
+    def responses(self):
+        """ deque of response dicts received for this client """
+        self.clienter.dispatch(self.origin)
+        return self._responses
+
+    def respond(self):
+        """
+        Pops and returns next response as namedtuple if any. Otherwise None
+        """
+        if self.responses:
+            return http.clienting.Client.attrify(self._responses.popleft())
+        return None
+
+
 class Clienter(doing.DoDoer):
     """
-    Clienter is a DoDoer that manages hio HTTP clients using a ClientDoer for each HTTP request.
-    It executes HTTP requests using a HIO HTTP Client run by a ClientDoer. Once a request has
-    received a response then the corresponding Doer is removed from this Clienter.
+    Clienter is a DoDoer that pools keep-alive hio HTTP client connections per
+    origin (scheme, host, port). Each request is queued onto an idle pooled
+    connection to its origin, a new connection while fewer than .MaxConnections
+    are open, or else the least loaded connection where it waits behind the
+    request in flight so no new TCP or TLS handshake is needed. Requests are
+    made through the PooledClient returned by .request or .client and each
+    response is delivered to the PooledClient whose request it answers.
 
     Doers:
-        - clientDo: Periodically checks for stale clients and removes them if they have not received a response
-          within the specified timeout period.
+        - clientDo: Periodically dispatches responses, removes stale clients that
+          have not had their responses taken within the timeout and closes
+          connections idle longer than .IdleTimeout or closed by the server.
+
+    Attributes:
+        clients (list[PooledClient]): active clients in order of creation
+        pool (dict): lists of Connection keyed by origin
+        legacy (set): origins known to reject batched CESR requests
     """
 
     TimeoutClient = 300  # seconds to wait for response before removing client, default is 5 minutes
+    MaxConnections = 4  # maximum concurrent connections per origin
+    IdleTimeout = 30  # seconds before closing pooled connection with no requests
 
     def __init__(self):
         """
-        Initialize clienter with an empty list of client tuples.
+        Initialize clienter with an empty list of clients and empty pool.
 
         Attributes:
-            clients (list((client, clientdoer, timestamp)):
-                list of client tuples containing (client, clientDoer, datetime) for each active client.
+            clients (list[PooledClient]): active clients in order of creation
+            pool (dict): lists of Connection keyed by origin
+            legacy (set): origins known to reject batched CESR requests
             doers (list): List of Doers to be managed by this Clienter, initialized with clientDo method.
         """
         self.clients = []
+        self.pool = dict()
+        self.legacy = set()
         doers = [doing.doify(self.clientDo)]
         super(Clienter, self).__init__(doers=doers)
 
+    def client(self, url):
+        """
+        Returns PooledClient for requests to origin of url with base path of url
+
+        Parameters:
+            url (str): URL whose scheme, host, port and path to use
+        """
+        purl = parse.urlparse(url)
+        client = PooledClient(self, origin=(purl.scheme, purl.hostname, purl.port),
+                              path=purl.path)
+        self.clients.append(client)
+        return client
+
     def request(self, method, url, body=None, headers=None):
         """
-        Perform an HTTP request using a hio http Client and ClientDoer and returns the Client.
+        Perform an HTTP request on a pooled connection and return the PooledClient
+        that receives its response.
 
         Parameters:
             method (str): HTTP method to use (e.g., "GET", "POST")
@@ -248,51 +484,186 @@ class Clienter(doing.DoDoer):
             headers (dict, optional): Headers to include in the request, defaults to None
 
         Returns:
-            http.clienting.Client: The hio HTTP Client used for the request, or None if an error occurs.
+            PooledClient: client that receives the response, or None if an error occurs.
         """
         purl = parse.urlparse(url)
+        client = self.client(url)
 
         try:
-            client = http.clienting.Client(scheme=purl.scheme,
-                                           hostname=purl.hostname,
-                                           port=purl.port,
-                                           portOptional=True)
+            client.request(
+                method=method,
+                path=f"{purl.path}?{purl.query}",
+                headers=headers,
+                body=body
+            )
         except Exception as e:
+            self.clients.remove(client)
             print(f"error establishing client connection={e}")
             return None
 
-        if hasattr(body, "encode"):
-            body = body.encode("utf-8")
+        return client
 
-        client.request(
-            method=method,
-            path=f"{purl.path}?{purl.query}",
-            qargs=None,
-            headers=headers,
-            body=body
-        )
+    def post(self, client, ims, dest, path=None, headers=None):
+        """
+        Post stream of KERI messages ims with attachments to dest as one batched
+        CESR request unless the origin of client is known to reject them in
+        which case as one CESR request per message. Responses to batched
+        requests must be passed to .fallback.
 
-        clientDoer = http.clienting.ClientDoer(client=client)
-        self.extend([clientDoer])
-        self.clients.append((client, clientDoer, helping.nowUTC()))
+        Parameters:
+            client (PooledClient): client to post with
+            ims (bytearray): stream of KERI messages with attachments
+            dest (str): qb64 identifier prefix of destination controller
+            path (str): path to post to
+            headers (dict): additional headers of requests
 
-        return client
+        Returns:
+            int: Number of individual requests posted
+        """
+        if client.origin in self.legacy:
+            return streamCESRRequests(client=client, ims=ims, dest=dest, path=path,
+                                      headers=headers)
+        return batchCESRRequest(client=client, ims=ims, dest=dest, path=path,
+                                headers=headers)
+
+    def fallback(self, client, rep):
+        """
+        Negotiate down to one CESR request per message when rep is the rejection
+        of a batched CESR request by an older peer. Remembers the origin of
+        client as legacy and reposts the rejected stream message by message.
+
+        Parameters:
+            client (PooledClient): client that posted the request rep answers
+            rep (Response): attrified response taken from client
+
+        Returns:
+            int: Number of individual requests reposted in place of the rejected
+                request, 0 when rep is not a rejected batched request
+        """
+        if not batchRejected(rep):
+            return 0
+
+        logger.info(f"Clienter: {client.origin} rejected batched CESR, falling back")
+        self.legacy.add(client.origin)
+        heads = Hict(rep.request["headers"])
+        dest = heads.get(CESR_DESTINATION_HEADER)
+        for head in ("Content-Type", "Content-Length", CESR_DESTINATION_HEADER):
+            heads.pop(head, None)
+        return streamCESRRequests(client=client, ims=bytearray(rep.request["body"]),
+                                  dest=dest, path=rep.request["path"], headers=heads)
+
+    def connect(self, origin):
+        """
+        Returns Connection to origin to queue a request onto, opening a new
+        connection when none is idle and fewer than .MaxConnections are open.
+
+        Parameters:
+            origin (tuple): (scheme, hostname, port)
+        """
+        conns = self.pool.setdefault(origin, [])
+        for conn in conns:
+            if not conn.busy:
+                return conn
+
+        if len(conns) < self.MaxConnections:
+            scheme, hostname, port = origin
+            client = http.clienting.Client(scheme=scheme,
+                                           hostname=hostname,
+                                           port=port,
+                                           portOptional=True)
+            conn = Connection(client=client,
+                              doer=http.clienting.ClientDoer(client=client),
+                              used=helping.nowUTC())
+            conns.append(conn)
+            self.extend([conn.doer])
+            return conn
+
+        return min(conns, key=lambda c: c.load)
+
+    def submit(self, client, request):
+        """
+        Queue request dict for PooledClient client onto a pooled connection.
+        The request is tagged with client so its response is delivered to it.
+        """
+        self.connect(client.origin).request(pooled=client, **request)
+
+    def queued(self, client):
+        """
+        Returns list of requests of PooledClient client not yet transmitted
+        """
+        return [request for conn in self.pool.get(client.origin, [])
+                for request in conn.requests if Connection.owner(request) is client]
+
+    def dispatch(self, origin):
+        """
+        Deliver responses received on connections to origin to the PooledClients
+        whose requests they answer and retire connections closed by the server.
+        A request in flight on a connection cut off before its response ended
+        is failed with an errored response.
+        """
+        for conn in list(self.pool.get(origin, [])):
+            conn.settle()
+            closing = False
+            while conn.responses:
+                response = conn.responses.popleft()
+                conn.used = helping.nowUTC()
+                response["body"] = bytes(response["body"])  # connection reuses body
+                self.deliver(response)
+                connection = response["headers"].get("connection", "")
+                closing = closing or "close" in connection.lower()
+
+            if conn.cutoff:
+                if (request := conn.abandon()) is not None:
+                    self.deliver(dict(version=None, status=None,
+                                      reason="Connection closed",
+                                      headers=Hict(), body=b"", data=None,
+                                      request=request, errored=True,
+                                      error=f"Connection to {origin} closed "
+                                            f"before response ended"))
+                self.retire(origin, conn)
+            elif closing and not conn.busy:
+                self.retire(origin, conn)
+
+    def deliver(self, response):
+        """
+        Append response dict to the responses of the PooledClient whose request
+        it answers unless that client was removed
+
+        Parameters:
+            response (dict): hio response dict with its request
+        """
+        client = Connection.owner(response["request"])
+        if client in self.clients:  # otherwise removed so drop response
+            client._responses.append(response)
+
+    def retire(self, origin, conn):
+        """
+        Close pooled Connection conn to origin and requeue its requests not
+        yet transmitted onto other connections
+        """
+        self.pool[origin].remove(conn)
+        if not self.pool[origin]:
+            del self.pool[origin]
+        super(Clienter, self).remove([conn.doer])
+        while conn.requests:
+            request = conn.requests.popleft()
+            self.submit(request.pop(Connection.Pooled), request)
 
     def remove(self, client):
         """
-        Find a client tuple by hio HTTP Client and remove it and its Doer from the Clienter.
+        Remove PooledClient client from the Clienter and drop its requests not
+        yet transmitted. Its pooled connections stay open for reuse.
 
         Parameters:
-            client (http.clienting.Client): The hio HTTP Client to remove from the Clienter.
+            client (PooledClient): client to remove from the Clienter.
         """
-        doers = [(c, d, dt) for (c, d, dt) in self.clients if c == client]
-        if len(doers) == 0:
+        if client not in self.clients:
             return
 
-        tup = doers[0]
-        self.clients.remove(doers[0])
-        (_, doer, _) = tup
-        super(Clienter, self).remove([doer])
+        self.clients.remove(client)
+        for conn in self.pool.get(client.origin, []):
+            for request in [r for r in conn.requests if Connection.owner(r) is client]:
+                conn.requests.remove(request)
 
     def clientDo(self, tymth, tock=0.0, **kwa):
         """ Periodically prune stale clients
@@ -310,17 +681,24 @@ class Clienter(doing.DoDoer):
         yield self.tock
 
         while True:
+            for origin in list(self.pool):
+                self.dispatch(origin)
+
             toRemove = []
-            for (client, doer, dt) in self.clients:
-                if client.responses:
-                    now = helping.nowUTC()
-                    if (now - dt) > datetime.timedelta(seconds=self.TimeoutClient):
+            now = helping.nowUTC()
+            for client in self.clients:
+                if client._responses:
+                    if (now - client.dt) > datetime.timedelta(seconds=self.TimeoutClient):
                         toRemove.append(client)
 
-                yield self.tock
-
             for client in toRemove:
                 self.remove(client)
 
+            idle = datetime.timedelta(seconds=self.IdleTimeout)
+            for origin, conns in list(self.pool.items()):
+                for conn in list(conns):
+                    if not conn.busy and (now - conn.used) > idle:
+                        self.retire(origin, conn)
+
             yield self.tock
 
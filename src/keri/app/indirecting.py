@@ -20,7 +20,7 @@ from hio.help import decking
 
 from keri.kering import Vrsn_1_0, Vrsn_2_0
 import keri.app.oobiing
-from . import directing, storing, httping, forwarding, agenting, oobiing
+from . import directing, storing, httping, forwarding, agenting, oobiing, witnessing
 from .habbing import GroupHab
 from .. import help, kering
 from ..core import (eventing, parsing, routing, coring, serdering,
@@ -37,11 +37,18 @@ logger = help.ogler.getLogger()
 
 
 def setupWitness(hby, alias="witness", mbx=None, aids=None, tcpPort=5631, httpPort=5632,
-                 keypath=None, certpath=None, cafilepath=None):
+                 keypath=None, certpath=None, cafilepath=None, workers=0):
     """
     Setup witness controller and doers
 
+    When workers is positive that many worker processes share httpPort, see
+    witnessing. This process remains the only writer of the witness databases
+    and serves the HTTP requests the workers relay on a loopback port.
+
     """
+    if workers and (keypath is not None or certpath is not None or cafilepath is not None):
+        raise kering.ConfigurationError("Witness workers serve plain HTTP only.")
+
     host = "0.0.0.0"
     if platform.system() == "Windows":
         host = "127.0.0.1"
@@ -94,8 +101,20 @@ def setupWitness(hby, alias="witness", mbx=None, aids=None, tcpPort=5631, httpPo
     app.add_route("/receipts", receiptEnd)
     queryEnd = QueryEnd(hab=hab)
     app.add_route("/query", queryEnd)
-
-    server = createHttpServer(host, httpPort, app, keypath, certpath, cafilepath)
+    app.add_route("/escrows", ending.EscrowEnd(db=hby.db, reger=reger))
+
+    if workers:
+        relay = witnessing.listen("127.0.0.1", 0)
+        server = http.Server(app=app, servant=witnessing.BoundServer(bound=relay, owner=True))
+        spec = dict(db=witnessing.reopener(hby.db),
+                    mbx=witnessing.reopener(mbx),
+                    reger=witnessing.reopener(reger),
+                    relay=f"http://127.0.0.1:{relay.getsockname()[1]}")
+        doers.append(witnessing.Intaker(rxbs=parser.ims, mbx=mbx,
+                                        shared=witnessing.listen(host, httpPort),
+                                        spec=spec, workers=workers))
+    else:
+        server = createHttpServer(host, httpPort, app, keypath, certpath, cafilepath)
     if not server.reopen():
         raise RuntimeError(f"cannot create http server on port {httpPort}")
     httpServerDoer = http.ServerDoer(server=server)
@@ -845,6 +864,10 @@ class HttpEnd:
     of the provided Habitat.
 
     This also handles `req`, `exn` and `tel` messages that respond with a KEL replay.
+
+    A batch of messages with their attachments may instead be POSTed or PUT as one
+    application/cesr body which is fed to the parser as is. Mailbox queries in a
+    batch are not answered with server sent events.
     """
 
     TimeoutQNF = 30
@@ -886,6 +909,11 @@ class HttpEnd:
                schema:
                  type: object
                  description: KERI event message
+             application/cesr:
+               schema:
+                 type: string
+                 format: binary
+                 description: batch of KERI event messages with attachments
         responses:
            200:
               description: Mailbox query response for server sent events
@@ -897,7 +925,12 @@ class HttpEnd:
             return
 
         rep.set_header('Cache-Control', "no-cache")
-        rep.set_header('connection', "close")
+
+        if req.content_type == httping.CESR_STREAM_CONTENT_TYPE:  # batched messages
+            self.rxbs.extend(req.bounded_stream.read())
+            rep.set_header('Content-Type', "application/json")
+            rep.status = falcon.HTTP_204
+            return
 
         cr = httping.parseCesrHttpRequest(req=req)
         sadder = coring.Sadder(ked=cr.payload, kind=eventing.Kinds.json)
@@ -919,6 +952,7 @@ class HttpEnd:
                 rep.status = falcon.HTTP_204
             elif ilk in (Ilks.qry,):
                 if sadder.ked["r"] in ("mbx",):
+                    rep.set_header('connection', "close")  # stream ends with connection
                     rep.set_header('Content-Type', "text/event-stream")
                     rep.status = falcon.HTTP_200
                     rep.stream = QryRpyMailboxIterable(mbx=self.mbx, cues=self.qrycues, said=sadder.said)
@@ -946,6 +980,11 @@ class HttpEnd:
                schema:
                  type: object
                  description: KERI event message
+             application/cesr:
+               schema:
+                 type: string
+                 format: binary
+                 description: batch of KERI event messages with attachments
         responses:
            200:
               description: Mailbox query response for server sent events
@@ -957,7 +996,6 @@ class HttpEnd:
             return
 
         rep.set_header('Cache-Control', "no-cache")
-        rep.set_header('connection', "close")
 
         self.rxbs.extend(req.bounded_stream.read())
 
@@ -985,6 +1023,7 @@ class QryRpyMailboxIterable:
                 if serder.said == self.said:
                     kin = cue["kin"]
                     if kin == "stream":
+                        self.mbx.ack(cue["pre"], cue["topics"])  # querier has all below its indices
                         self.iter = iter(MailboxIterable(mbx=self.mbx, pre=cue["pre"], topics=cue["topics"],
                                                          retry=self.retry))
                 else:
@@ -996,6 +1035,12 @@ class QryRpyMailboxIterable:
 
 
 class MailboxIterable:
+    """
+    Server sent event stream of the messages of the mailbox topics of pre. Holds
+    the next ordinal to send per topic in .topics and only reads a topic from
+    the Mailboxer when its high-water mark shows new messages so an idle stream
+    returns an empty chunk without touching the database.
+    """
     TimeoutMBX = 30000000
 
     def __init__(self, mbx, pre, topics, retry=5000):
@@ -1017,6 +1062,9 @@ class MailboxIterable:
             data = bytearray()
             for topic, idx in self.topics.items():
                 key = self.pre + topic
+                if self.mbx.tip(key) < idx:  # nothing new at topic
+                    continue
+
                 for fn, _, msg in self.mbx.cloneTopicIter(key, idx):
                     data.extend(bytearray("id: {}\nevent: {}\nretry: {}\ndata: ".format(fn, topic, self.retry)
                                           .encode("utf-8")))
@@ -1068,7 +1116,6 @@ class ReceiptEnd(doing.DoDoer):
             return
 
         rep.set_header('Cache-Control', "no-cache")
-        rep.set_header('connection', "close")
 
         cr = httping.parseCesrHttpRequest(req=req)
         serder = serdering.SerderKERI(sad=cr.payload, kind=eventing.Kinds.json)
@@ -1197,9 +1244,15 @@ class QueryEnd:
 
      """
 
-    def __init__(self, hab):
-        self.hab = hab
-        self.reger = viring.Reger(name=hab.name, db=hab.db, temp=hab.temp)
+    def __init__(self, hab=None, db=None, reger=None):
+        """
+        Parameters:
+            hab (Hab | None): witness habitat whose databases to query
+            db (Baser | None): KEL database. None means db of hab
+            reger (Reger | None): TEL database. None means open one named for hab
+        """
+        self.db = db if db is not None else hab.db
+        self.reger = reger if reger is not None else viring.Reger(name=hab.name, db=hab.db, temp=hab.temp)
 
     def on_get(self, req, rep):
         """ Handles GET requests to query KEL or TEL events of a pre from a witness.
@@ -1245,19 +1298,19 @@ class QueryEnd:
             sn = req.get_param_as_int("sn")
             if sn is not None: ## query for event with seq-num >= sn
                 preb = pre.encode("utf-8")
-                dig = self.hab.db.getKeLast(key=dbing.snKey(pre=preb,
-                                                         sn=sn))
+                dig = self.db.getKeLast(key=dbing.snKey(pre=preb,
+                                                        sn=sn))
                 if dig is None:
                     raise falcon.HTTPBadRequest(description=f"non-existant event at seq-num {sn}")
 
-                for dig in self.hab.db.getKelIter(pre, sn=sn):
+                for dig in self.db.getKelIter(pre, sn=sn):
                     try:
-                        msg = self.hab.db.cloneEvtMsg(pre=pre, fn=0, dig=dig)
+                        msg = self.db.cloneEvtMsg(pre=pre, fn=0, dig=dig)
                     except Exception:
                         continue  # skip this event
                     evnts.extend(msg)
             else:
-                for msg in self.hab.db.clonePreIter(pre=pre):
+                for msg in self.db.clonePreIter(pre=pre):
                     evnts.extend(msg)
 
 
@@ -23,18 +23,22 @@ raw = json.dumps(ked, separators=(",", ":"), ensure_ascii=False).encode("utf-8")
 
 """
 import math
+import time
 from collections import namedtuple, deque
+from concurrent import futures
 from dataclasses import dataclass, asdict, field
 
 import pysodium
 from hio.base import doing
 
-from .. import kering
+from .. import help, kering
 from .. import core
 from ..core import coring
 from ..db import dbing, subing, koming
 from ..help import helping
 
+logger = help.ogler.getLogger()
+
 Algoage = namedtuple("Algoage", 'randy salty group extern')
 Algos = Algoage(randy='randy', salty='salty', group="group", extern="extern")  # randy is rerandomize, salty is use salt
 
@@ -205,6 +209,10 @@ class Keeper(dbing.LMDBer):
                 use riKey(pre, ri)
             Value is serialized list of fully qualified public keys that are the
                 current signing keys after the rotation given by rotation index
+        stgs (subing.CryptSignerSuber): named sub DB of pre-derived private keys
+            staged for upcoming rotations by Prederiver
+            Key is (stageKey of derivation inputs, public key qb64)
+            Value is private key (fully qualified qb64) encrypted like .pris
 
     Properties:
 
@@ -213,7 +221,7 @@ class Keeper(dbing.LMDBer):
     TailDirPath = "keri/ks"
     AltTailDirPath = ".keri/ks"
     TempPrefix = "keri_ks_"
-    MaxNamedDBs = 10
+    MaxNamedDBs = 12
 
     def __init__(self, headDirPath=None, perm=None, reopen=False, **kwa):
         """
@@ -290,6 +298,7 @@ class Keeper(dbing.LMDBer):
         self.pubs = koming.Komer(db=self,
                                  subkey='pubs.',
                                  schema=PubSet,)  # public key set at pre.ridx
+        self.stgs = subing.CryptSignerSuber(db=self, subkey='stgs.')  # staged pre-derived
         return self.opened
 
 
@@ -522,9 +531,8 @@ class SaltyCreator(Creator):
         if not codes:  # if not codes make list len count of same code
             codes = [code for i in range(count)]
 
-        stem = self.stem if self.stem else "{:x}".format(pidx)  # if not stem use pidx
-        for i, code in enumerate(codes):
-            path = "{}{:x}{:x}".format(stem, ridx, kidx + i)
+        for path, code in zip(self.paths(count=len(codes), pidx=pidx, ridx=ridx,
+                                         kidx=kidx), codes):
             signers.append(self.salter.signer(path=path,
                                               code=code,
                                               transferable=transferable,
@@ -532,6 +540,72 @@ class SaltyCreator(Creator):
                                               temp=temp))
         return signers
 
+    def paths(self, count=1, pidx=0, ridx=0, kidx=0):
+        """
+        Returns list of derivation paths one per key pair of set
+
+        Parameters:
+            count is count of key pairs in set
+            pidx is int prefix index for key pair sequence
+            ridx is int rotation index for key pair set
+            kidx is int starting key index for key pair set
+        """
+        stem = self.stem if self.stem else "{:x}".format(pidx)  # if not stem use pidx
+        return ["{}{:x}{:x}".format(stem, ridx, kidx + i) for i in range(count)]
+
+
+def stageKey(salt, path, code, tier, transferable=True, temp=False):
+    """
+    Returns qb64 digest key into Keeper .stgs of the signer derived from salt
+    and path with the given derivation parameters. Digest does not reveal salt.
+
+    Parameters:
+        salt (str): qb64 of salt
+        path (str): derivation path of signer
+        code (str): derivation code of signer seed
+        tier (str): security tier of stretch
+        transferable (bool): True means transferable derivation code of verfer
+        temp (bool): True means quick stretch for testing
+    """
+    ser = f"{salt}.{path}.{code}.{tier}.{int(transferable)}.{int(temp)}".encode("utf-8")
+    return coring.Diger(ser=ser).qb64
+
+
+def prederive(salt, tier, paths, codes, transferable=True, temp=False):
+    """
+    Returns list of qb64 signer seeds derived from salt one per path in paths.
+    Runs in Prederiver worker process so does the argon2id stretch there.
+
+    Parameters:
+        salt (str): qb64 of salt
+        tier (str): security tier of stretch
+        paths (list[str]): derivation paths of signers
+        codes (list[str]): derivation codes of signer seeds one per path
+        transferable (bool): True means transferable derivation code of verfer
+        temp (bool): True means quick stretch for testing
+    """
+    salter = core.Salter(qb64=salt, tier=tier)
+    return [salter.signer(path=path, code=code, transferable=transferable,
+                          tier=tier, temp=temp).qb64
+            for path, code in zip(paths, codes)]
+
+
+def _limitMemory(limit=None):
+    """
+    Prederiver worker process initializer that limits growth of address space
+    to limit bytes over that of the freshly started worker where supported by
+    platform.
+    """
+    if limit is None:
+        return
+    try:
+        import resource
+        with open("/proc/self/statm") as f:  # current address space in pages
+            size = int(f.read().split()[0]) * resource.getpagesize()
+        resource.setrlimit(resource.RLIMIT_AS, (size + limit, size + limit))
+    except (ImportError, ValueError, OSError) as ex:  # not supported so run unlimited
+        logger.info("Prederiver memory limit not applied: %s", ex)
+
 
 class Creatory:
     """
@@ -591,6 +665,133 @@ class Creatory:
 Initage = namedtuple("Initage", 'aeid pidx salt tier')
 
 
+class SignerCache:
+    """
+    In memory cache of decrypted Signers keyed by qb64 public key so that
+    repeated signing with the same keys does not decrypt the private key from
+    Keeper .pris and rebuild its Signer every time.
+
+    Entries expire .ttl seconds after they are cached and at most .size
+    entries are held with least recently used eviction. A cached signer holds
+    its seed in a bytearray. Evicted, expired and removed signers are zeroized
+    by overwriting that bytearray in place and replacing their signing function
+    with one that raises KeriError so any lingering reference fails loudly
+    instead of signing. Zeroization is best effort as the bytes decrypted from
+    .pris and the transient copies made while signing are not overwritten.
+
+    Attributes:
+        ttl (float): seconds a cached signer lives. 0 disables cache
+        size (int): maximum number of cached signers. 0 disables cache
+        hits (int): number of lookups found in cache
+        misses (int): number of lookups not found or expired
+
+    Hidden:
+        ._entries (dict): (signer, stamp) tuples keyed by qb64 public key in
+            least to most recently used order
+    """
+    TTL = 60.0  # default seconds a cached signer lives
+    Size = 64  # default maximum number of cached signers
+
+    def __init__(self, ttl=None, size=None):
+        """
+        Parameters:
+            ttl (float | None): seconds a cached signer lives. None means .TTL
+            size (int | None): maximum number of cached signers. None means .Size
+        """
+        self.ttl = ttl if ttl is not None else self.TTL
+        self.size = size if size is not None else self.Size
+        self.hits = 0
+        self.misses = 0
+        self._entries = dict()
+
+    def __len__(self):
+        return len(self._entries)
+
+    @property
+    def enabled(self):
+        """
+        Returns:
+            enabled (bool): True when both .ttl and .size allow caching
+        """
+        return self.ttl > 0 and self.size > 0
+
+    def get(self, pub):
+        """
+        Returns:
+            signer (Signer | None): cached signer for pub, None if not cached
+                or expired
+
+        Parameters:
+            pub (str): qb64 public key
+        """
+        if (entry := self._entries.pop(pub, None)) is None:
+            self.misses += 1
+            return None
+        signer, stamp = entry
+        if time.monotonic() - stamp >= self.ttl:  # expired
+            self.zeroize(signer)
+            self.misses += 1
+            return None
+        self._entries[pub] = entry  # most recently used
+        self.hits += 1
+        return signer
+
+    def put(self, pub, signer):
+        """
+        Cache signer for pub, evicting least recently used signers beyond .size
+
+        Parameters:
+            pub (str): qb64 public key
+            signer (Signer): decrypted signer for pub
+        """
+        if not self.enabled:
+            return
+        if (entry := self._entries.pop(pub, None)) is not None and entry[0] is not signer:
+            self.zeroize(entry[0])
+        if not isinstance(signer._raw, bytearray):  # hold seed so zeroize can overwrite it
+            signer._raw = bytearray(signer._raw)
+            sign = signer._sign
+            signer._sign = lambda seed, **kwa: sign(seed=bytes(seed), **kwa)
+        self._entries[pub] = (signer, time.monotonic())
+        while len(self._entries) > self.size:
+            self.zeroize(self._entries.pop(next(iter(self._entries)))[0])
+
+    def remove(self, pub):
+        """
+        Remove and zeroize cached signer for pub if any
+
+        Parameters:
+            pub (str): qb64 public key
+        """
+        if (entry := self._entries.pop(pub, None)) is not None:
+            self.zeroize(entry[0])
+
+    def clear(self):
+        """ Remove and zeroize all cached signers """
+        while self._entries:
+            self.zeroize(self._entries.popitem()[1][0])
+
+    @staticmethod
+    def zeroize(signer):
+        """
+        Overwrite seed of signer with zeros and make any further signing with
+        signer raise KeriError
+
+        Parameters:
+            signer (Signer): signer evicted, expired or removed from cache
+        """
+        if isinstance(signer._raw, bytearray):
+            signer._raw[:] = bytes(len(signer._raw))  # overwrite in place
+        else:
+            signer._raw = bytes(len(signer._raw))
+
+        def zeroized(**kwa):
+            raise kering.KeriError(f"Signer for {signer.verfer.qb64} evicted "
+                                   f"from cache and zeroized.")
+
+        signer._sign = zeroized
+
+
 class Manager:
     """Manages key pairs creation, storage, and signing
     Class for managing key pair creation, storage, retrieval, and message signing.
@@ -603,6 +804,7 @@ class Manager:
             decryption key is derived seed (private signing key seed)
         inited (bool): True means fully initialized wrt database.
                           False means not yet fully initialized
+        signers (SignerCache): decrypted signers cached by public key
 
     Attributes (Hidden):
 
@@ -642,7 +844,7 @@ class Manager:
 
     """
 
-    def __init__(self, *, ks=None, seed=None, **kwa):
+    def __init__(self, *, ks=None, seed=None, signerTTL=None, signerSize=None, **kwa):
         """
         Setup Manager.
 
@@ -658,6 +860,10 @@ class Manager:
                 and decryption secret for the Manager and must be stored on
                 another device from the device that runs the Manager.
                 Currently only code MtrDex.Ed25519_Seed is supported.
+            signerTTL (float | None): seconds a decrypted signer is cached.
+                0 disables signer cache. None means SignerCache.TTL
+            signerSize (int | None): maximum number of cached decrypted signers.
+                0 disables signer cache. None means SignerCache.Size
 
         Parameters: Passthrough to .setup for later initialization
             aeid (str): qb64 of non-transferable identifier prefix for
@@ -677,6 +883,7 @@ class Manager:
         self.decrypter = None
         self._seed = seed if seed is not None else ""
         self.inited = False
+        self.signers = SignerCache(ttl=signerTTL, size=signerSize)
 
         # save keyword arg parameters to init later if db not opened yet
         self._inits = kwa
@@ -773,6 +980,8 @@ class Manager:
             seed (str): qb64 of new seed from which new aeid is derived (private signing
                         key seed)
         """
+        self.signers.clear()  # decrypter changes so drop decrypted signers
+
         if self.aeid:  # check that last current seed matches last current .aeid
             # verifies seed belongs to aeid
             if not self.seed or not self.encrypter.verifySeed(self.seed):
@@ -814,6 +1023,16 @@ class Manager:
             for keys, signer in self.ks.pris.getItemIter(decrypter=self.decrypter):
                 self.ks.pris.pin(keys, signer, encrypter=self.encrypter)
 
+        # staged pre-derived signers. Those not readable are dropped since
+        # rotation derives any signers not staged
+        try:
+            staged = list(self.ks.stgs.getItemIter(decrypter=self.decrypter))
+        except (kering.KeriError, ValueError):
+            staged = []
+            self.ks.stgs.trim()
+        for keys, signer in staged:
+            self.ks.stgs.pin(keys, signer, encrypter=self.encrypter)
+
         self.ks.gbls.pin("aeid", aeid)  # set aeid in db
         self._seed = seed  # set .seed in memory
 
@@ -829,6 +1048,39 @@ class Manager:
         """
         return self._seed
 
+    def close(self):
+        """
+        Clear and zeroize cached decrypted signers. Call when keystore .ks is
+        closed.
+        """
+        self.signers.clear()
+
+    def fetchSigner(self, pub):
+        """
+        Returns:
+            signer (Signer): for public key pub from .signers cache else
+                decrypted from .ks.pris and then cached
+
+        Parameters:
+            pub (str | bytes): qb64 public key to lookup private key
+        """
+        if hasattr(pub, "decode"):
+            pub = pub.decode("utf-8")
+
+        if not self.ks.opened:  # closed keystore so drop decrypted signers
+            self.signers.clear()
+        elif (signer := self.signers.get(pub)) is not None:
+            return signer
+
+        if self.aeid and not self.decrypter:
+            raise kering.DecryptError("Unauthorized decryption attempt. "
+                                      "Aeid but no decrypter.")
+        if ((signer := self.ks.pris.get(pub, decrypter=self.decrypter))
+                is None):
+            raise ValueError("Missing prikey in db for pubkey={}".format(pub))
+        self.signers.put(pub, signer)
+        return signer
+
 
     @property
     def aeid(self):
@@ -1180,15 +1432,7 @@ class Manager:
                 raise ValueError("Missing prikey in db for pubkey={}".format(pub))
             verfers.append(signer.verfer)
 
-        salt = pp.salt
-        if salt:
-            if self.aeid:
-                if not self.decrypter:
-                    raise kering.DecryptError("Unauthorized decryption. Aeid but no decrypter.")
-                salt = self.decrypter.decrypt(qb64=salt).qb64
-            else:
-                salt = core.Salter(qb64=salt).qb64  # ensures salt was unencrypted
-
+        salt = self._salt(pp)
         creator = Creatory(algo=pp.algo).make(salt=salt, stem=pp.stem, tier=pp.tier)
 
         if not ncodes:  # all same code, make list of len count of same code
@@ -1200,10 +1444,17 @@ class Manager:
         ridx = ps.new.ridx + 1
         kidx = ps.nxt.kidx + len(ps.new.pubs)
 
-        # count set to 0 to ensure does not create signers if codes is empty
-        signers = creator.create(codes=ncodes, count=0,
-                                 pidx=pidx, ridx=ridx, kidx=kidx,
-                                 transferable=transferable, temp=temp)
+        signers = None
+        if pp.algo == Algos.salty and ncodes:  # use signers pre-derived by Prederiver
+            paths = creator.paths(count=len(ncodes), pidx=pidx, ridx=ridx, kidx=kidx)
+            signers = self.unstage([stageKey(salt, path, code, creator.tier,
+                                             transferable, temp)
+                                    for path, code in zip(paths, ncodes)])
+        if signers is None:
+            # count set to 0 to ensure does not create signers if codes is empty
+            signers = creator.create(codes=ncodes, count=0,
+                                     pidx=pidx, ridx=ridx, kidx=kidx,
+                                     transferable=transferable, temp=temp)
         digers = [coring.Diger(ser=signer.verfer.qb64b, code=dcode) for signer in signers]
 
         dt = helping.nowIso8601()
@@ -1220,6 +1471,9 @@ class Manager:
         # store public keys for lookup of private keys by public key for replay
         self.ks.pubs.put(riKey(pre, ri=ps.nxt.ridx), val=PubSet(pubs=ps.nxt.pubs))
 
+        for pub in ps.old.pubs + old.pubs:  # no longer current signers
+            self.signers.remove(pub)
+
         if erase:
             for pub in old.pubs:  # remove prior old prikeys not current old
                 self.ks.pris.rem(pub)
@@ -1227,6 +1481,109 @@ class Manager:
         return (verfers, digers)
 
 
+    def _salt(self, pp):
+        """
+        Returns:
+            salt (str): decrypted qb64 salt of prefix parameters pp or empty
+                when pp has no salt
+
+        Parameters:
+            pp (PrePrm): prefix parameters
+        """
+        salt = pp.salt
+        if salt:
+            if self.aeid:
+                if not self.decrypter:
+                    raise kering.DecryptError("Unauthorized decryption. Aeid but no decrypter.")
+                salt = self.decrypter.decrypt(qb64=salt).qb64
+            else:
+                salt = core.Salter(qb64=salt).qb64  # ensures salt was unencrypted
+        return salt
+
+    def prederivation(self, pre, ncodes=None, ncount=1,
+                      ncode=coring.MtrDex.Ed25519_Seed, transferable=True,
+                      temp=False):
+        """
+        Returns derivation spec dict of the next key set that a rotation of
+        pre made with the same parameters would create. The spec holds the
+        decrypted salt so must only be passed to a trusted worker such as the
+        process of Prederiver. Returns None when pre is not salty or is not
+        rotatable so there is nothing to pre-derive.
+
+        Parameters:
+            pre (str): qb64 of prefix
+            ncodes (list): derivation codes qb64 of next key set
+            ncount (int): count of next key set when ncodes not provided
+            ncode (str): derivation code of all ncount keys when ncodes not provided
+            transferable (bool): True means each public key uses transferable
+                derivation code
+            temp (bool): True is temporary for testing
+        """
+        if (pp := self.ks.prms.get(pre)) is None:
+            raise ValueError("Attempt to prederive nonexistent pre={}.".format(pre))
+
+        if (ps := self.ks.sits.get(pre)) is None:
+            raise ValueError("Attempt to prederive nonexistent pre={}.".format(pre))
+
+        if pp.algo != Algos.salty or not ps.nxt.pubs:
+            return None
+
+        if not ncodes:
+            ncodes = [ncode for i in range(ncount)]
+        if not ncodes:
+            return None
+
+        salt = self._salt(pp)
+        creator = Creatory(algo=pp.algo).make(salt=salt, stem=pp.stem, tier=pp.tier)
+        paths = creator.paths(count=len(ncodes), pidx=pp.pidx, ridx=ps.nxt.ridx + 1,
+                              kidx=ps.nxt.kidx + len(ps.nxt.pubs))
+        return dict(salt=salt, tier=creator.tier, paths=paths, codes=list(ncodes),
+                    transferable=transferable, temp=temp)
+
+    def stage(self, spec, seeds):
+        """
+        Stores pre-derived signers in Keeper .stgs encrypted with .encrypter
+        when any so a later rotation that derives the same keys uses them.
+
+        Parameters:
+            spec (dict): derivation spec from .prederivation
+            seeds (list[str]): qb64 signer seeds derived from spec by prederive
+        """
+        for path, code, seed in zip(spec["paths"], spec["codes"], seeds):
+            signer = core.Signer(qb64=seed, transferable=spec["transferable"])
+            key = stageKey(spec["salt"], path, code, spec["tier"],
+                           spec["transferable"], spec["temp"])
+            self.ks.stgs.pin(keys=(key, signer.verfer.qb64), val=signer,
+                             encrypter=self.encrypter)
+
+    def unstage(self, keys):
+        """
+        Returns:
+            signers (list | None): staged signers one per stageKey in keys when
+                all are staged otherwise None. Removes the returned signers
+                from staging.
+
+        Parameters:
+            keys (list[str]): stageKey of each signer
+        """
+        if self.aeid and not self.decrypter:
+            return None  # can not decrypt staged so derive instead
+
+        items = []
+        for key in keys:
+            try:
+                item = next(self.ks.stgs.getItemIter(keys=(key, ""),
+                                                     decrypter=self.decrypter), None)
+            except (kering.KeriError, ValueError):  # not staged with .encrypter
+                return None
+            if item is None:
+                return None
+            items.append(item)
+
+        for ikeys, _ in items:
+            self.ks.stgs.rem(keys=ikeys)
+        return [signer for _, signer in items]
+
     def sign(self, ser, pubs=None, verfers=None, indexed=True,
              indices=None, ondices=None, pre=None, path=None):
         """
@@ -1335,24 +1692,11 @@ class Manager:
 
         if pubs:
             for pub in pubs:
-                if self.aeid and not self.decrypter:
-                    raise kering.DecryptError("Unauthorized decryption attempt. "
-                                              "Aeid but no decrypter.")
-                if ((signer := self.ks.pris.get(pub, decrypter=self.decrypter))
-                        is None):
-                    raise ValueError("Missing prikey in db for pubkey={}".format(pub))
-                signers.append(signer)
+                signers.append(self.fetchSigner(pub))
 
         else:
             for verfer in verfers:
-                if self.aeid and not self.decrypter:
-                    raise kering.DecryptError("Unauthorized decryption attempt. "
-                                              "Aeid but no decrypter.")
-                if ((signer := self.ks.pris.get(verfer.qb64,
-                                                decrypter=self.decrypter))
-                        is None):
-                    raise ValueError("Missing prikey in db for pubkey={}".format(verfer.qb64))
-                signers.append(signer)
+                signers.append(self.fetchSigner(verfer.qb64))
 
         if indices and len(indices) != len(signers):
             raise ValueError(f"Mismatch indices length={len(indices)} and resultant"
@@ -1417,31 +1761,18 @@ class Manager:
         signers = []
         if pubs:
             for pub in pubs:
-                if self.aeid and not self.decrypter:
-                    raise kering.DecryptError("Unauthorized decryption attempt. "
-                                              "Aeid but no decrypter.")
-                if ((signer := self.ks.pris.get(pub, decrypter=self.decrypter))
-                        is None):
-                    raise ValueError("Missing prikey in db for pubkey={}".format(pub))
-                signers.append(signer)
+                signers.append(self.fetchSigner(pub))
 
         else:
             for verfer in verfers:
-                if self.aeid and not self.decrypter:
-                    raise kering.DecryptError("Unauthorized decryption attempt. "
-                                              "Aeid but no decrypter.")
-                if ((signer := self.ks.pris.get(verfer.qb64,
-                                                decrypter=self.decrypter))
-                        is None):
-                    raise ValueError("Missing prikey in db for pubkey={}".format(verfer.qb64))
-                signers.append(signer)
+                signers.append(self.fetchSigner(verfer.qb64))
 
         if hasattr(qb64, "encode"):
             qb64 = qb64.encode()  # convert str to bytes
         qb64 = bytes(qb64)  # convert bytearray or memoryview to bytes
 
         for signer in signers:
-            sigkey = signer.raw + signer.verfer.raw  # sigkey is raw seed + raw verkey
+            sigkey = bytes(signer.raw) + signer.verfer.raw  # sigkey is raw seed + raw verkey
             prikey = pysodium.crypto_sign_sk_to_box_sk(sigkey)  # raw private encrypt key
             pubkey = pysodium.crypto_scalarmult_curve25519_base(prikey)
             plain = pysodium.crypto_box_seal_open(qb64, pubkey, prikey)  # qb64b
@@ -1700,6 +2031,8 @@ class Manager:
         if advance:
             if not self.ks.sits.pin(pre, val=ps):
                 raise ValueError("Problem updating pubsit db for pre={}.".format(pre))
+            for pub in ps.old.pubs + old.pubs:  # no longer current signers
+                self.signers.remove(pub)
             if erase:
                 for pub in old.pubs:  # remove prior old prikeys not current old
                     self.ks.pris.rem(pub)
@@ -1707,6 +2040,86 @@ class Manager:
         return (verfers, digers)
 
 
+class Prederiver(doing.Doer):
+    """
+    Prederiver pre-derives the next key sets of salty prefixes in a separate
+    worker process so the argon2id stretch of SaltyCreator runs off the main
+    loop. Finished key sets are staged encrypted in the Keeper of .manager so
+    that the actual rotation of a prefix is close to instant.
+
+    Attributes:
+        manager (Manager): key manager whose prefixes are pre-derived
+        limit (int | None): address space growth limit in bytes of worker
+            process. None means limit by tier of salt, see Limits
+        pending (list): of (spec, future) for submitted derivations
+        executor (futures.ProcessPoolExecutor | None): worker pool when entered
+
+    """
+    Limits = {core.Tiers.low: (64 + 64) * 1024 * 1024,  # argon2id memlimit + slack
+              core.Tiers.med: (256 + 64) * 1024 * 1024,
+              core.Tiers.high: (1024 + 64) * 1024 * 1024}
+
+    def __init__(self, manager, limit=None, tier=core.Tiers.low, **kwa):
+        """
+        Parameters:
+            manager (Manager): key manager whose prefixes are pre-derived
+            limit (int | None): address space growth limit in bytes of worker
+            tier (str): highest tier of salts to be stretched sets default limit
+        """
+        super(Prederiver, self).__init__(**kwa)
+        self.manager = manager
+        self.limit = limit if limit is not None else self.Limits.get(tier)
+        self.pending = []
+        self.executor = None
+
+    def submit(self, pre, **kwa):
+        """
+        Submits pre-derivation of the next key set of pre. Parameters kwa are
+        those of Manager.prederivation and must match the ones of the
+        eventual rotation for the staged keys to be used.
+
+        Returns:
+            result (bool): True if submitted, False if nothing to pre-derive
+        """
+        if self.executor is None:
+            raise kering.ClosedError("Prederiver not entered.")
+        if (spec := self.manager.prederivation(pre, **kwa)) is None:
+            return False
+        future = self.executor.submit(prederive, spec["salt"], spec["tier"],
+                                      spec["paths"], spec["codes"],
+                                      spec["transferable"], spec["temp"])
+        self.pending.append((spec, future))
+        return True
+
+    def service(self):
+        """ Stage finished pre-derivations """
+        pending = []
+        for spec, future in self.pending:
+            if not future.done():
+                pending.append((spec, future))
+                continue
+            try:
+                self.manager.stage(spec, future.result())
+            except Exception as ex:  # worker failed or was killed so derive on rotate
+                logger.error("Prederiver failed: %s", ex)
+        self.pending = pending
+
+    def enter(self, *, temp=None):
+        self.executor = futures.ProcessPoolExecutor(max_workers=1,
+                                                    initializer=_limitMemory,
+                                                    initargs=(self.limit,))
+
+    def recur(self, tyme):
+        self.service()
+        return False
+
+    def exit(self):
+        if self.executor is not None:
+            self.executor.shutdown(wait=False, cancel_futures=True)
+            self.executor = None
+        self.pending = []
+
+
 class ManagerDoer(doing.Doer):
     """
     Basic Manager Doer to initialize keystore database .ks
@@ -1764,4 +2177,4 @@ class ManagerDoer(doing.Doer):
 
     def exit(self):
         """"""
-        pass
+        self.manager.close()
@@ -3,6 +3,7 @@
 keri.app.notifying module
 
 """
+import itertools
 import os
 from collections.abc import Iterable
 from typing import Union, Type
@@ -189,6 +190,10 @@ class DicterSuber(subing.Suber):
                                                top=self._tokey(keys)):
             yield self._tokeys(key), self.klas(raw=bytes(val))
 
+    def _des(self, val):
+        """ Deserializes val as .klas instance for range scans """
+        return self.klas(raw=bytes(val)) if val is not None else None
+
     def cntAll(self):
         """
         Return count over the all the items in subdb
@@ -204,6 +209,11 @@ class Noter(dbing.LMDBer):
     Noter stores Notifications generated by the agent that are
     intended to be read and dismissed by the controller of the agent.
 
+    Notes are keyed by (datetime, rid) so pages are read by keyset from the
+    keys of the last note of the previous page. Read notes are also indexed
+    by (datetime, rid) in .nrds so the unread count is constant time and old
+    read notes are pruned without walking unread ones.
+
     """
     TailDirPath = os.path.join("keri", "not")
     AltTailDirPath = os.path.join(".keri", "not")
@@ -221,6 +231,8 @@ class Noter(dbing.LMDBer):
         self.notes = None
         self.nidx = None
         self.ncigs = None
+        self.nrds = None
+        self.nmeta = None
 
         super(Noter, self).__init__(name=name, headDirPath=headDirPath, reopen=reopen, **kwa)
 
@@ -235,9 +247,28 @@ class Noter(dbing.LMDBer):
         self.notes = DicterSuber(db=self, subkey='nots.', sep='/', klas=Notice)
         self.nidx = subing.Suber(db=self, subkey='nidx.')
         self.ncigs = subing.CesrSuber(db=self, subkey='ncigs.', klas=coring.Cigar)
+        # index of read notes keyed by (datetime, rid)
+        self.nrds = subing.Suber(db=self, subkey='nrds.', sep='/')
+        # bookkeeping such as whether .nrds has been built for existing notes
+        self.nmeta = subing.Suber(db=self, subkey='nmeta.')
+
+        if not self.readonly and self.nmeta.get(keys=("nrds",)) is None:
+            self.reindex()
 
         return self.env
 
+    def reindex(self):
+        """
+        Rebuilds the read note index .nrds from .notes. Runs once on reopen of
+        a database whose notes were added before the index existed.
+        """
+        with self.batch():
+            self.nrds.trim()
+            for (dt, rid), note in self.notes.getItemIter():
+                if note.read:
+                    self.nrds.pin(keys=(dt, rid), val=rid)
+            self.nmeta.pin(keys=("nrds",), val="1")
+
     def add(self, note, cigar):
         """
         Adds note to database, keyed by the datetime and said of the note.
@@ -249,12 +280,15 @@ class Noter(dbing.LMDBer):
         """
         dt = note.datetime
         rid = note.rid
-        if self.nidx.get(keys=(rid,)) is not None:
-            return False
+        with self.batch():
+            if self.nidx.get(keys=(rid,)) is not None:
+                return False
 
-        self.nidx.pin(keys=(rid,), val=dt.encode())
-        self.ncigs.pin(keys=(rid,), val=cigar)
-        return self.notes.pin(keys=(dt, rid), val=note)
+            self.nidx.pin(keys=(rid,), val=dt.encode())
+            self.ncigs.pin(keys=(rid,), val=cigar)
+            if note.read:
+                self.nrds.pin(keys=(dt, rid), val=rid)
+            return self.notes.pin(keys=(dt, rid), val=note)
 
     def update(self, note, cigar):
         """
@@ -267,12 +301,16 @@ class Noter(dbing.LMDBer):
         """
         dt = note.datetime
         rid = note.rid
-        if self.nidx.get(keys=(rid,)) is None:
-            return False
+        with self.batch():
+            if (odt := self.nidx.get(keys=(rid,))) is None:
+                return False
 
-        self.nidx.pin(keys=(rid,), val=dt.encode())
-        self.ncigs.pin(keys=(rid,), val=cigar)
-        return self.notes.pin(keys=(dt, rid), val=note)
+            self.nidx.pin(keys=(rid,), val=dt.encode())
+            self.ncigs.pin(keys=(rid,), val=cigar)
+            self.nrds.rem(keys=(odt, rid))
+            if note.read:
+                self.nrds.pin(keys=(dt, rid), val=rid)
+            return self.notes.pin(keys=(dt, rid), val=note)
 
     def get(self, rid):
         """
@@ -285,12 +323,13 @@ class Noter(dbing.LMDBer):
             (Notice, Cigar) = couple of notice object and accompanying signature
 
         """
-        dt = self.nidx.get(keys=(rid,))
-        if dt is None:
-            return None
+        with self.snapshot():
+            dt = self.nidx.get(keys=(rid,))
+            if dt is None:
+                return None
 
-        note = self.notes.get(keys=(dt, rid))
-        cig = self.ncigs.get(keys=(rid,))
+            note = self.notes.get(keys=(dt, rid))
+            cig = self.ncigs.get(keys=(rid,))
 
         return note, cig
 
@@ -304,16 +343,14 @@ class Noter(dbing.LMDBer):
         Returns:
             bool:  True if deleted
         """
-        res = self.get(rid)
-        if res is None:
-            return False
+        with self.batch():
+            if (dt := self.nidx.get(keys=(rid,))) is None:
+                return False
 
-        note, _ = res
-        dt = note.datetime
-        rid = note.rid
-        self.nidx.rem(keys=(rid,))
-        self.ncigs.rem(keys=(rid,))
-        return self.notes.rem(keys=(dt, rid))
+            self.nidx.rem(keys=(rid,))
+            self.ncigs.rem(keys=(rid,))
+            self.nrds.rem(keys=(dt, rid))
+            return self.notes.rem(keys=(dt, rid))
 
     def getNoteCnt(self):
         """
@@ -325,35 +362,94 @@ class Noter(dbing.LMDBer):
         """
         return self.notes.cntAll()
 
+    def getUnreadCnt(self):
+        """
+        Return count of unread Notes in constant time
+
+        Returns:
+            int: count of notes not yet marked as read
+
+        """
+        with self.snapshot():
+            return self.notes.cntAll() - self.nrds.cntAll()
+
+    def getNotePage(self, after=None, limit=25, *, reverse=False):
+        """
+        Returns list of tuples (note, cigar) of a page of notes read by keyset
+        in one read transaction so cost is O(limit) regardless of page depth.
+
+        Parameters:
+            after (tuple | None): (datetime, rid) keys of last note of previous
+                page. None means first page
+            limit (int): maximum number of notes in page
+            reverse (bool): True means newest notes first
+
+        Returns:
+            list: of (Notice, Cigar) tuples
+        """
+        notes = []
+        with self.snapshot():
+            for _, note in self.notes.getRangeItemIter(seek=after,
+                                                       after=after is not None,
+                                                       reverse=reverse,
+                                                       limit=limit):
+                notes.append((note, self.ncigs.get(keys=(note.rid,))))
+
+        return notes
+
     def getNotes(self, start=0, end=25):
         """
         Returns list of tuples (note, cigar) of notes for controller of agent
 
         Parameters:
-            start (int): number of item to start
-            end (int): number of last item to return
+            start (int | str | datetime): number of item to start or datetime
+                of first note to return in which case end counts from it.
+                Prefer getNotePage for deep pages since skipping start items
+                is O(start)
+            end (int): number of last item to return, -1 means all
 
         """
+        seek = None
         if hasattr(start, "isoformat"):
             start = start.isoformat()
+        if isinstance(start, str):
+            seek, start = (start,), 0
 
         notes = []
-        it = self.notes.getItemIter(keys=())
+        with self.snapshot():
+            it = self.notes.getRangeItemIter(seek=seek,
+                                             limit=None if end == -1 else end + 1)
+            for _, note in itertools.islice(it, start, None):
+                notes.append((note, self.ncigs.get(keys=(note.rid,))))
 
-        # Run off the items before start
-        for _ in range(start):
-            try:
-                next(it)
-            except StopIteration:
-                break
+        return notes
 
-        for ((_, _), note) in it:
-            cig = self.ncigs.get(keys=(note.rid,))
-            notes.append((note, cig))
-            if (not end == -1) and len(notes) == (end - start) + 1:
-                break
+    def prune(self, before, limit=None):
+        """
+        Removes read notes whose datetime is before cutoff. Walks only the read
+        note index so unread notes are never scanned.
 
-        return notes
+        Parameters:
+            before (str | datetime): ISO8601 datetime cutoff exclusive
+            limit (int | None): maximum number of notes to remove
+
+        Returns:
+            int: number of notes removed
+        """
+        if hasattr(before, "isoformat"):
+            before = helping.toIso8601(before)  # same format as notice datetimes
+
+        count = 0
+        with self.batch():
+            for dt, rid in list(self.nrds.getRangeKeyIter(stop=(before,),
+                                                          limit=limit)):
+                self.nidx.rem(keys=(rid,))
+                self.ncigs.rem(keys=(rid,))
+                self.nrds.rem(keys=(dt, rid))
+                if self.notes.rem(keys=(dt, rid)):
+                    count += 1
+
+        return count
 
 
 class Notifier:
@@ -361,20 +457,43 @@ class Notifier:
 
     The notifications are not just signals to reload data and not persistent messages that can be reread
 
+    When .retention is set, read notices older than it are pruned a bounded
+    number at a time whenever a notice is added or marked as read. Read
+    notices are kept forever by default.
+
+    Attributes:
+        retention (datetime.timedelta | None): age after which read notices are
+            pruned. None means keep read notices forever
+
     """
+    Retention = None  # default keeps read notices forever, opt in to pruning
+    PruneLimit = 64  # maximum read notices pruned per add or mar
 
-    def __init__(self, hby, signaler=None, noter=None):
+    def __init__(self, hby, signaler=None, noter=None, retention=Retention):
         """
 
         Parameters:
             hby (Habery): habery database environment with Signator
             noter (Noter): database
             signaler (Signaler): signaler for sending signals to controller that new data is available
+            retention (datetime.timedelta | None): age after which read notices
+                are pruned. None means keep read notices forever
 
         """
         self.hby = hby
         self.signaler = signaler if signaler is not None else signaling.Signaler()
         self.noter = noter if noter is not None else Noter(name=hby.name, temp=hby.temp)
+        self.retention = retention
+
+    def prune(self, limit=PruneLimit):
+        """ Removes up to limit read notices older than .retention
+
+        Returns:
+            int: number of notices removed
+        """
+        if self.retention is None:
+            return 0
+        return self.noter.prune(before=helping.nowUTC() - self.retention, limit=limit)
 
     def add(self, attrs):
         """  Add unread notice to the end of the current list of notices
@@ -396,6 +515,7 @@ class Notifier:
                 note=note.pad,
             )
             self.signaler.push(attrs=signal, topic="/notification", ckey="/notification")
+            self.prune()
             return True
         else:
             return False
@@ -465,6 +585,7 @@ class Notifier:
                 note=note.pad,
             )
             self.signaler.push(attrs=signal, topic="/notification", ckey="/notification")
+            self.prune()
 
             return True
 
@@ -480,6 +601,34 @@ class Notifier:
         """
         return self.noter.getNoteCnt()
 
+    def getUnreadCnt(self):
+        """
+        Return count of unread Notes in constant time
+
+        Returns:
+            int: count of notes not yet marked as read
+
+        """
+        return self.noter.getUnreadCnt()
+
+    def getNotePage(self, after=None, limit=25, *, reverse=False):
+        """
+        Returns a page of verified notes read by keyset. Pass the
+        (datetime, rid) of the last note of a page as after to get the next.
+
+        Parameters:
+            after (tuple | None): (datetime, rid) keys of last note of previous
+                page. None means first page
+            limit (int): maximum number of notes in page
+            reverse (bool): True means newest notes first
+
+        Returns:
+            list: of Notice
+
+        """
+        return self._verified(self.noter.getNotePage(after=after, limit=limit,
+                                                     reverse=reverse))
+
     def getNotes(self, start=0, end=24):
         """
         Returns list of tuples (note, cigar) of notes for controller of agent
@@ -489,7 +638,10 @@ class Notifier:
             end (int): number of last item to return
 
         """
-        notesigs = self.noter.getNotes(start, end)
+        return self._verified(self.noter.getNotes(start, end))
+
+    def _verified(self, notesigs):
+        """ Returns notes of (note, cigar) notesigs after verifying each cigar """
         notes = []
         for note, cig in notesigs:
             if not self.hby.signator.verify(ser=note.raw, cigar=cig):
@@ -6,7 +6,9 @@ keri.kli.common.oobiing module
 import datetime
 import json
 import logging
+import time
 from collections import namedtuple
+from dataclasses import dataclass, asdict
 from urllib import parse
 from urllib.parse import urlparse
 
@@ -21,7 +23,7 @@ from .. import kering
 from ..kering import Vrsn_1_0, Vrsn_2_0
 from ..app import connecting
 from ..core import routing, eventing, parsing, scheming, serdering
-from ..db import basing
+from ..db import basing, caching
 from ..end import ending
 from ..end.ending import OOBI_RE, DOOBI_RE
 from ..help import helping
@@ -269,20 +271,79 @@ def oobiRequestExn(hab, dest, oobi):
     return exn, ims
 
 
+@dataclass
+class CachedOobi:
+    """
+    OOBI response cached by URL
+
+    Attributes:
+        response (dict): status, headers and body of 200 response
+        fetched (datetime): when response was fetched or last revalidated
+        etag (str | None): entity tag of response for conditional re-fetch
+    """
+    response: dict
+    fetched: datetime.datetime
+    etag: str | None = None
+
+
+@dataclass
+class OobiMetrics:
+    """
+    Running metrics of OOBI resolution by an Oobiery
+
+    Attributes:
+        requests (int): HTTP requests made
+        hits (int): resolutions served from cache without a request
+        revalidated (int): conditional re-fetches answered not modified
+        coalesced (int): resolutions of a URL already in flight
+        responses (int): responses received
+        latency (float): seconds from request to response of the latest
+        total (float): accumulated seconds from request to response
+        longest (float): longest seconds from request to response
+    """
+    requests: int = 0
+    hits: int = 0
+    revalidated: int = 0
+    coalesced: int = 0
+    responses: int = 0
+    latency: float = 0.0
+    total: float = 0.0
+    longest: float = 0.0
+
+
 class Oobiery:
     """ Resolver for OOBIs
 
+    Requests are made concurrently up to .maxConcurrent in flight overall and
+    .maxPerHost in flight to any one host. Further OOBIs wait in .oobis for a
+    later pass. A URL already in flight is not requested again. Successful
+    responses are cached by URL for .cacheTTL seconds during which the URL
+    resolves from cache, after which it is re-fetched conditionally on its
+    entity tag.
+
+    Attributes:
+        cache (LRUCache): CachedOobi keyed by URL
+        metrics (OobiMetrics): resolution counts and latencies
+
     """
 
     RetryDelay = 30
+    MaxConcurrent = 16  # requests in flight overall
+    MaxPerHost = 4  # requests in flight per host
+    CacheTTL = 300  # seconds a resolved OOBI response is reused without a request
+    CacheCapacity = 1024  # OOBI responses cached
 
-    def __init__(self, hby, rvy=None, clienter=None, cues=None):
+    def __init__(self, hby, rvy=None, clienter=None, cues=None, maxConcurrent=None,
+                 maxPerHost=None, cacheTTL=None):
         """  DoDoer to handle the request and parsing of OOBIs
 
         Parameters:
             hby (Habery): database environment
             clienter (Clienter): DoDoer client provider responsible for managing HTTP client requests
             cues (decking.Deck): outbound cues from processing oobis
+            maxConcurrent (int | None): requests in flight overall. None means .MaxConcurrent
+            maxPerHost (int | None): requests in flight per host. None means .MaxPerHost
+            cacheTTL (float | None): seconds responses are reused. None means .CacheTTL
         """
 
         self.hby = hby
@@ -302,6 +363,12 @@ class Oobiery:
 
         self.cues = cues if cues is not None else decking.Deck()
         self.clients = dict()
+        self.started = dict()  # perf counter of request keyed by URL
+        self.maxConcurrent = maxConcurrent if maxConcurrent is not None else self.MaxConcurrent
+        self.maxPerHost = maxPerHost if maxPerHost is not None else self.MaxPerHost
+        self.cacheTTL = cacheTTL if cacheTTL is not None else self.CacheTTL
+        self.cache = caching.LRUCache(capacity=self.CacheCapacity)
+        self.metrics = OobiMetrics()
         self.doers = [self.clienter, doing.doify(self.scoobiDo)]
 
     def registerReplyRoutes(self, router):
@@ -423,6 +490,9 @@ class Oobiery:
 
         """
         for (url,), obr in self.hby.db.oobis.getItemIter():
+            if len(self.clients) >= self.maxConcurrent:
+                break  # rest wait for requests in flight
+
             try:
                 # Don't process OOBIs we've already resolved or are in escrow being retried
                 if ((fnd := self.hby.db.roobi.get(keys=(url,))) is not None and fnd.state == Result.resolved) and \
@@ -485,93 +555,117 @@ class Oobiery:
             if client.responses:
                 response = client.responses.popleft()
                 self.clienter.remove(client)
+                del self.clients[url]
+                self.measure(url)
 
-                if response["status"] == 404:
-                    print(f"{url} not found")
-                    self.hby.db.coobi.rem(keys=(url,))
-                    self.hby.db.eoobi.pin(keys=(url,), val=obr)
-                    continue
+                if response["status"] == 304 and (entry := self.cache.get(url)) is not caching.LRUCache.Missing:
+                    self.metrics.revalidated += 1  # not modified so reuse cached
+                    entry.fetched = helping.nowUTC()
+                    response = entry.response
+
+                elif response["status"] == 200:
+                    self.cache.put(url, CachedOobi(response=dict(status=200,
+                                                                 headers=response["headers"],
+                                                                 body=bytes(response["body"])),
+                                                   fetched=helping.nowUTC(),
+                                                   etag=response["headers"].get("ETag")))
+
+                self.processResponse(url, obr, response)
+
+    def processResponse(self, url, obr, response):
+        """ Process OOBI response for url by parsing its messages and recording result
 
-                elif not response["status"] == 200:
-                    print("invalid status for oobi response: {}".format(response["status"]))
-                    self.hby.db.coobi.rem(keys=(url,))
-                    obr.state = Result.failed
-                    self.hby.db.roobi.put(keys=(url,), val=obr)
-
-                elif response["headers"]["Content-Type"] == "application/json+cesr":  # CESR Stream response to OOBI
-                    self.parser.parse(ims=bytearray(response["body"]))
-                    if ending.OOBI_AID_HEADER in response["headers"]:
-                        obr.cid = response["headers"][ending.OOBI_AID_HEADER]
-
-                    if obr.oobialias is not None and obr.cid:
-                        self.org.update(pre=obr.cid, data=dict(alias=obr.oobialias, oobi=url))
-
-                    self.hby.db.coobi.rem(keys=(url,))
-                    obr.state = Result.resolved
-                    self.hby.db.roobi.put(keys=(url,), val=obr)
-
-                elif response["headers"]["Content-Type"] == "application/schema+json":  # Schema response to data OOBI
-                    try:
-                        schemer = scheming.Schemer(raw=bytearray(response["body"]))
-                        if schemer.said == obr.said:
-                            self.hby.db.schema.pin(keys=(schemer.said,), val=schemer)
-                            result = Result.resolved
-                        else:
-                            result = Result.failed
-
-                    except (kering.ValidationError, ValueError):
-                        result = Result.failed
-
-                    obr.state = result
-                    self.hby.db.coobi.rem(keys=(url,))
-                    self.hby.db.roobi.put(keys=(url,), val=obr)
-
-                elif response["headers"]["Content-Type"].startswith("application/json"):  # Unsigned rpy OOBI or Schema
-
-                    try:
-                        schemer = scheming.Schemer(raw=bytearray(response["body"]))
-                        if schemer.said == obr.said:
-                            self.hby.db.schema.pin(keys=(schemer.said,), val=schemer)
-                            result = Result.resolved
-                        else:
-                            result = Result.failed
-
-                        obr.state = result
-                        self.hby.db.coobi.rem(keys=(url,))
-                        self.hby.db.roobi.put(keys=(url,), val=obr)
-                        continue
-
-                    except (kering.ValidationError, ValueError):
-                        pass
-
-                    try:
-                        serder = serdering.SerderKERI(raw=bytearray(response["body"]))
-                    except ValueError:
-                        obr.state = Result.failed
-                        self.hby.db.coobi.rem(keys=(url,))
-                        self.hby.db.roobi.put(keys=(url,), val=obr)
-                        continue
-                    if not serder.ked['t'] == coring.Ilks.rpy:
-                        obr.state = Result.failed
-                        self.hby.db.coobi.rem(keys=(url,))
-                        self.hby.db.roobi.put(keys=(url,), val=obr)
-
-                    elif serder.ked['r'] in ('/oobi/witness', '/oobi/controller'):
-                        self.processMultiOobiRpy(url, serder, obr)
-
-                    else:
-                        obr.state = Result.failed
-                        self.hby.db.coobi.rem(keys=(url,))
-                        self.hby.db.roobi.put(keys=(url,), val=obr)
+        Parameters:
+            url (str): OOBI URL
+            obr (OobiRecord): record of OOBI being resolved
+            response (dict): status, headers and body of response
+        """
+        if response["status"] == 404:
+            print(f"{url} not found")
+            self.hby.db.coobi.rem(keys=(url,))
+            self.hby.db.eoobi.pin(keys=(url,), val=obr)
+            return
+
+        elif not response["status"] == 200:
+            print("invalid status for oobi response: {}".format(response["status"]))
+            self.hby.db.coobi.rem(keys=(url,))
+            obr.state = Result.failed
+            self.hby.db.roobi.put(keys=(url,), val=obr)
+
+        elif response["headers"]["Content-Type"] == "application/json+cesr":  # CESR Stream response to OOBI
+            self.parser.parse(ims=bytearray(response["body"]))
+            if ending.OOBI_AID_HEADER in response["headers"]:
+                obr.cid = response["headers"][ending.OOBI_AID_HEADER]
+
+            if obr.oobialias is not None and obr.cid:
+                self.org.update(pre=obr.cid, data=dict(alias=obr.oobialias, oobi=url))
+
+            self.hby.db.coobi.rem(keys=(url,))
+            obr.state = Result.resolved
+            self.hby.db.roobi.put(keys=(url,), val=obr)
+
+        elif response["headers"]["Content-Type"] == "application/schema+json":  # Schema response to data OOBI
+            try:
+                schemer = scheming.Schemer(raw=bytearray(response["body"]))
+                if schemer.said == obr.said:
+                    self.hby.db.schema.pin(keys=(schemer.said,), val=schemer)
+                    result = Result.resolved
+                else:
+                    result = Result.failed
+
+            except (kering.ValidationError, ValueError):
+                result = Result.failed
 
+            obr.state = result
+            self.hby.db.coobi.rem(keys=(url,))
+            self.hby.db.roobi.put(keys=(url,), val=obr)
+
+        elif response["headers"]["Content-Type"].startswith("application/json"):  # Unsigned rpy OOBI or Schema
+
+            try:
+                schemer = scheming.Schemer(raw=bytearray(response["body"]))
+                if schemer.said == obr.said:
+                    self.hby.db.schema.pin(keys=(schemer.said,), val=schemer)
+                    result = Result.resolved
                 else:
-                    self.hby.db.coobi.rem(keys=(url,))
-                    obr.state = Result.failed
-                    self.hby.db.roobi.put(keys=(url,), val=obr)
-                    logger.error("invalid content type for oobi response: {}"
-                                 .format(response["headers"]["Content-Type"]))
+                    result = Result.failed
 
-                self.cues.append(dict(kin=obr.state, oobi=url))
+                obr.state = result
+                self.hby.db.coobi.rem(keys=(url,))
+                self.hby.db.roobi.put(keys=(url,), val=obr)
+                return
+
+            except (kering.ValidationError, ValueError):
+                pass
+
+            try:
+                serder = serdering.SerderKERI(raw=bytearray(response["body"]))
+            except ValueError:
+                obr.state = Result.failed
+                self.hby.db.coobi.rem(keys=(url,))
+                self.hby.db.roobi.put(keys=(url,), val=obr)
+                return
+            if not serder.ked['t'] == coring.Ilks.rpy:
+                obr.state = Result.failed
+                self.hby.db.coobi.rem(keys=(url,))
+                self.hby.db.roobi.put(keys=(url,), val=obr)
+
+            elif serder.ked['r'] in ('/oobi/witness', '/oobi/controller'):
+                self.processMultiOobiRpy(url, serder, obr)
+
+            else:
+                obr.state = Result.failed
+                self.hby.db.coobi.rem(keys=(url,))
+                self.hby.db.roobi.put(keys=(url,), val=obr)
+
+        else:
+            self.hby.db.coobi.rem(keys=(url,))
+            obr.state = Result.failed
+            self.hby.db.roobi.put(keys=(url,), val=obr)
+            logger.error("invalid content type for oobi response: {}"
+                         .format(response["headers"]["Content-Type"]))
+
+        self.cues.append(dict(kin=obr.state, oobi=url))
 
     def processMOOBIs(self):
         """ Process Client responses by parsing the messages and removing the client/doer
@@ -606,15 +700,75 @@ class Oobiery:
                 self.hby.db.oobis.pin(keys=(url,), val=obr)
 
     def request(self, url, obr):
-        client = self.clienter.request("GET", url=url)
+        """ Request OOBI url unless already in flight or fresh in cache. Defers
+        the request while .maxConcurrent requests overall or .maxPerHost to the
+        host of url are in flight.
+
+        Parameters:
+            url (str): OOBI URL
+            obr (OobiRecord): record of OOBI being resolved
+
+        Returns:
+            bool: True if requested, coalesced or resolved from cache. False if deferred
+        """
+        if url in self.clients:  # coalesce with request in flight
+            self.metrics.coalesced += 1
+            self.hby.db.oobis.rem(keys=(url,))
+            self.hby.db.coobi.pin(keys=(url,), val=obr)
+            return True
+
+        headers = dict()
+        if (entry := self.cache.get(url)) is not caching.LRUCache.Missing:
+            if (helping.nowUTC() - entry.fetched) < datetime.timedelta(seconds=self.cacheTTL):
+                self.metrics.hits += 1
+                self.hby.db.oobis.rem(keys=(url,))
+                self.hby.db.coobi.pin(keys=(url,), val=obr)
+                self.processResponse(url, obr, entry.response)
+                return True
+
+            if entry.etag:  # stale so re-fetch only if modified
+                headers["If-None-Match"] = entry.etag
+
+        host = parse.urlparse(url).netloc
+        if len(self.clients) >= self.maxConcurrent or \
+                sum(1 for u in self.clients if parse.urlparse(u).netloc == host) >= self.maxPerHost:
+            return False
+
+        client = self.clienter.request("GET", url=url, headers=headers)
         if client is None:
             self.hby.db.oobis.rem(keys=(url,))
             print(f"error getting client for {url}, aborting OOBI")
-            return
+            return True
 
         self.clients[url] = client
+        self.started[url] = time.perf_counter()
+        self.metrics.requests += 1
         self.hby.db.oobis.rem(keys=(url,))
         self.hby.db.coobi.pin(keys=(url,), val=obr)
+        return True
+
+    def measure(self, url):
+        """ Tally latency of response to request of url """
+        if (start := self.started.pop(url, None)) is None:
+            return
+
+        latency = time.perf_counter() - start
+        self.metrics.responses += 1
+        self.metrics.latency = latency
+        self.metrics.total += latency
+        self.metrics.longest = max(self.metrics.longest, latency)
+
+    def stats(self):
+        """
+        Returns:
+            stats (dict): OobiMetrics with mean latency, requests in flight and
+                responses cached
+        """
+        stats = asdict(self.metrics)
+        stats["mean"] = self.metrics.total / self.metrics.responses if self.metrics.responses else None
+        stats["inflight"] = len(self.clients)
+        stats["cached"] = len(self.cache)
+        return stats
 
     def processMultiOobiRpy(self, url, serder, mobr):
         data = serder.ked["a"]
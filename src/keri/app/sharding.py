@@ -0,0 +1,289 @@
+# -*- encoding: utf-8 -*-
+"""
+KERI
+keri.app.sharding module
+
+Prefix partitioned key event processing.
+
+A Sharder spreads KEL validation and storage over N shards. Each shard has its
+own Baser LMDB environment and Kevery. Every message is routed to the home
+shard of the controller prefix it concerns given by a hash of that prefix, so
+each KEL is validated and stored by exactly one shard.
+
+Validation of some events needs the KEL of another prefix, that is delegated
+events need the KEL of their delegator and transferable receipts need the KEL
+of their receipter. The Sharder coordinates these by mirroring the KEL of the
+other prefix from its home shard into the shard that needs it as a cloned
+replay before routing the message there. Mirrors are kept up to date on each
+such message and before each escrow pass so that escrowed events waiting on a
+later event of another prefix are unblocked.
+"""
+from collections.abc import Mapping
+from contextlib import contextmanager
+
+import blake3
+
+from hio.help import decking
+
+from .. import help
+from ..core import eventing, parsing
+from ..core.coring import Ilks
+from ..db import basing
+from ..kering import Vrsn_1_0
+
+logger = help.ogler.getLogger()
+
+
+class Shard:
+    """
+    One partition of a Sharder
+
+    Attributes:
+        index (int): index of shard in Sharder.shards
+        db (Baser): database of KELs of shard
+        kvy (Kevery): processes messages routed to shard
+        mirrorer (Parser): parses KELs mirrored from other shards into .db
+    """
+
+    def __init__(self, index, db, cues, lax=True, local=False):
+        """
+        Parameters:
+            index (int): index of shard in Sharder.shards
+            db (Baser): database of KELs of shard
+            cues (Deck): cues of Kevery shared by all shards
+            lax (bool): lax mode of Kevery
+            local (bool): local mode of Kevery
+        """
+        self.index = index
+        self.db = db
+        self.kvy = eventing.Kevery(db=db, cues=cues, lax=lax, local=local)
+        # mirrors are replayed clones so are not cued for receipts
+        self.mirrorer = parsing.Parser(kvy=eventing.Kevery(db=db, lax=True, local=False,
+                                                           cloned=True, direct=False),
+                                       version=Vrsn_1_0)
+
+    @property
+    def kevers(self):
+        """
+        Returns .db.kevers
+        """
+        return self.db.kevers
+
+
+class ShardKevers(Mapping):
+    """
+    Read only mapping of the Kever of each prefix from its home shard. Kevers
+    mirrored into other shards are not visited.
+    """
+
+    def __init__(self, sharder):
+        self.sharder = sharder
+
+    def __getitem__(self, pre):
+        return self.sharder.home(pre).kevers[pre]
+
+    def __iter__(self):
+        for shard in self.sharder.shards:
+            for (pre,), _ in shard.db.states.getItemIter():
+                if self.sharder.index(pre) == shard.index:
+                    yield pre
+
+    def __len__(self):
+        return sum(1 for _ in self)
+
+
+class Sharder:
+    """
+    Sharder routes parsed KERI messages to the home shard of their controller
+    prefix and coordinates validation that needs KELs of other shards. It stands
+    in for the Kevery of a Parser.
+
+    Attributes:
+        name (str): name of sharder. Shard databases are named name-index
+        shards (list[Shard]): shards in index order
+        cues (Deck): cues of the Keverys of all shards
+        mirrors (dict): next first seen ordinal to mirror keyed by
+            (shard index, prefix) of each KEL mirrored into a shard other than
+            its home shard
+
+    Properties:
+        kevers (ShardKevers): Kever of each prefix from its home shard
+    """
+    Count = 4  # default number of shards
+
+    def __init__(self, *, name="shard", base="", count=None, temp=False,
+                 headDirPath=None, cues=None, lax=True, local=False):
+        """
+        Parameters:
+            name (str): name of sharder. Shard databases are named name-index
+            base (str): optional directory path segment inserted before name
+            count (int | None): number of shards. None means .Count
+            temp (bool): True means shard databases are temporary
+            headDirPath (str | None): optional head directory of shard databases
+            cues (Deck | None): cues of the Keverys of all shards
+            lax (bool): lax mode of shard Keverys
+            local (bool): local mode of shard Keverys
+        """
+        self.name = name
+        count = count if count is not None else self.Count
+        if count < 1:
+            raise ValueError(f"Invalid shard count={count}.")
+        self.cues = cues if cues is not None else decking.Deck()
+        self.shards = []
+        for index in range(count):
+            db = basing.Baser(name=f"{name}-{index}", base=base, temp=temp,
+                              headDirPath=headDirPath, reopen=True)
+            self.shards.append(Shard(index=index, db=db, cues=self.cues,
+                                     lax=lax, local=local))
+        self.mirrors = dict()
+
+    @property
+    def kevers(self):
+        """
+        Returns ShardKevers of this sharder
+        """
+        return ShardKevers(self)
+
+    def index(self, pre):
+        """
+        Returns:
+            index (int): index of home shard of identifier prefix pre
+        """
+        if hasattr(pre, "encode"):
+            pre = pre.encode("utf-8")
+        return int.from_bytes(blake3.blake3(pre).digest(length=8), "big") % len(self.shards)
+
+    def home(self, pre):
+        """
+        Returns:
+            shard (Shard): home shard of identifier prefix pre
+        """
+        return self.shards[self.index(pre)]
+
+    def kever(self, pre):
+        """
+        Returns:
+            kever (Kever | None): of identifier prefix pre from its home shard
+        """
+        try:
+            return self.home(pre).kevers[pre]
+        except KeyError:
+            return None
+
+    def resolveVerifiers(self, pre=None, sn=0, dig=None):
+        """
+        Returns the Tholder and Verfers of pre at sn from its home shard.
+        See Baser.resolveVerifiers
+        """
+        return self.home(pre).db.resolveVerifiers(pre=pre, sn=sn, dig=dig)
+
+    def mirror(self, pre, shard):
+        """
+        Mirror KEL of pre and of its delegators into shard and keep it mirrored.
+        Nothing to do when shard is the home shard of pre.
+
+        Parameters:
+            pre (str): qb64 identifier prefix
+            shard (Shard): shard needing KEL of pre
+        """
+        home = self.home(pre)
+        if home is shard:
+            return
+
+        if (kever := self.kever(pre)) is not None and kever.delpre:
+            self.mirror(kever.delpre, shard)  # delegator first to validate delegation
+
+        key = (shard.index, pre)
+        fn = self.mirrors.setdefault(key, 0)
+        preb = pre.encode("utf-8")
+        ims = bytearray()
+        for _, fn, dig in home.db.getFelItemPreIter(preb, fn=fn):
+            ims.extend(home.db.cloneEvtMsg(pre=preb, fn=fn, dig=dig))
+            self.mirrors[key] = fn + 1
+
+        if ims:
+            logger.debug("Sharder %s mirroring %s from shard %s into shard %s",
+                         self.name, pre, home.index, shard.index)
+            shard.mirrorer.parse(ims=ims, local=False)
+
+    def delegator(self, serder):
+        """
+        Returns:
+            delpre (str | None): delegator prefix of delegated establishment event
+                serder or None when not delegated or not yet known
+        """
+        if serder.ilk == Ilks.dip:
+            return serder.delpre
+        if serder.ilk == Ilks.drt and (kever := self.kever(serder.pre)) is not None:
+            return kever.delpre
+        return None
+
+    def processEvent(self, serder, **kwa):
+        """ Process KEL event in home shard of its controller. See Kevery.processEvent """
+        shard = self.home(serder.pre)
+        if (delpre := self.delegator(serder)) is not None:
+            self.mirror(delpre, shard)
+        shard.kvy.processEvent(serder=serder, **kwa)
+
+    def processReceipt(self, serder, *, tsgs=None, **kwa):
+        """ Process receipt in home shard of receipted event. See Kevery.processReceipt """
+        shard = self.home(serder.pre)
+        for sprefixer, *_ in tsgs or []:
+            self.mirror(sprefixer.qb64, shard)  # receipter key state
+        shard.kvy.processReceipt(serder=serder, tsgs=tsgs, **kwa)
+
+    def processAttachedReceiptCouples(self, serder, cigars, **kwa):
+        """ Process receipts attached to event in home shard of event """
+        self.home(serder.pre).kvy.processAttachedReceiptCouples(serder=serder, cigars=cigars, **kwa)
+
+    def processAttachedReceiptQuadruples(self, serder, trqs, **kwa):
+        """ Process transferable receipts attached to event in home shard of event """
+        shard = self.home(serder.pre)
+        for sprefixer, *_ in trqs:
+            self.mirror(sprefixer.qb64, shard)  # receipter key state
+        shard.kvy.processAttachedReceiptQuadruples(serder=serder, trqs=trqs, **kwa)
+
+    def processQuery(self, serder, **kwa):
+        """ Process query in home shard of queried prefix. See Kevery.processQuery """
+        self.home(serder.ked["q"]["i"]).kvy.processQuery(serder=serder, **kwa)
+
+    def processEscrows(self):
+        """
+        Refresh mirrors then process escrows of each shard
+        """
+        for index, pre in list(self.mirrors):
+            self.mirror(pre, self.shards[index])
+        for shard in self.shards:
+            shard.kvy.processEscrows()
+
+    def close(self, clear=False):
+        """
+        Close shard databases
+
+        Parameters:
+            clear (bool): True means remove shard database directories
+        """
+        for shard in self.shards:
+            shard.db.close(clear=clear)
+
+
+@contextmanager
+def openSharder(*, name="test", count=2, temp=True, **kwa):
+    """
+    Context manager of Sharder with temporary shard databases by default. Local
+    multi-shard harness for tests.
+
+    Usage:
+
+    with openSharder(count=4) as sharder:
+        parsing.Parser(kvy=sharder).parse(ims=msgs)
+
+    """
+    sharder = None
+    try:
+        sharder = Sharder(name=name, count=count, temp=temp, **kwa)
+        yield sharder
+
+    finally:
+        if sharder is not None:
+            sharder.close(clear=sharder.shards[0].db.temp)
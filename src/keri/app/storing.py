@@ -3,36 +3,64 @@
 keri.app.storing module
 
 """
+import datetime
+import time
+from dataclasses import dataclass
 
 from hio.base import doing
 from hio.help import decking
 from ordered_set import OrderedSet as oset
 
 from . import forwarding
-from .. import help
+from .. import core, help
 from ..core import coring, serdering
 from ..core.coring import MtrDex
 from ..db import dbing, subing
+from ..help import helping
 
 logger = help.ogler.getLogger()
 
 
+@dataclass(frozen=True)
+class Retention:
+    """
+    Retention policy of the messages of a mailbox topic
+
+    Attributes:
+        maxAge (float | None): seconds a message is kept. None means forever
+        maxCount (int | None): most recent messages kept. None means all
+        truncate (bool): True means remove messages below the index a mailbox
+            query of the topic asks for since the querier has them already
+    """
+    maxAge: float | None = None
+    maxCount: int | None = None
+    truncate: bool = False
+
+
 class Mailboxer(dbing.LMDBer):
     """
     Mailboxer stores exn messages in order and provider iterator access at an index.
 
+    Attributes:
+        retention (Retention): default retention policy of topics
+        retentions (dict): Retention policies keyed by topic or by prefix that
+            override .retention for the topic or every topic of the prefix
+
     """
     TailDirPath = "keri/mbx"
     AltTailDirPath = ".keri/mbx"
     TempPrefix = "keri_mbx_"
+    TipRefresh = 1.0  # seconds before held tip of topic is read again from .tpcs
 
-    def __init__(self, name="mbx", headDirPath=None, reopen=True, **kwa):
+    def __init__(self, name="mbx", headDirPath=None, reopen=True, retention=None, **kwa):
         """
 
         Parameters:
             headDirPath:
             perm:
             reopen:
+            retention (Retention | None): default retention policy of topics.
+                None means keep every message until acknowledged or removed
             kwa:
 
         Mailboxer uses two dbs for mailbox messages these are .tpcs and .msgs.
@@ -44,10 +72,31 @@ class Mailboxer(dbing.LMDBer):
         The message itself is stored in .msgs where the key is the msg digest
             and the value is the serialized messag itself.
         Multiple messages can share the same topic but with a different ordinal.
+        Each message body is stored once however many topics index it with the
+        number of topic entries referencing it counted in .mrcs so it is
+        removed with its last topic entry. The datetime each topic entry was
+        stored is in .tdts at the same key as in .tpcs for age based retention.
+        The ordinal of the last entry of a topic emptied by retention is kept
+        in .tons so ordinals are never reused.
+
+        Mailboxer also holds in memory the high-water mark, the ordinal of the
+        last message, of each topic read through .tip and advanced by .storeMsg.
+        Mailbox streams compare their own per-topic marks against it so idle
+        subscribers cost a dict lookup instead of a scan of .tpcs. A held tip is
+        read again from .tpcs once it is .TipRefresh seconds old so messages
+        stored at a topic by another Mailboxer instance or process are seen
+        within that interval.
 
         """
         self.tpcs = None
         self.msgs = None
+        self.mrcs = None
+        self.tdts = None
+        self.tons = None
+        self.tips = dict()  # high-water mark ordinal of last message keyed by topic
+        self.tipped = dict()  # monotonic time tip of topic was last read from .tpcs
+        self.retention = retention if retention is not None else Retention()
+        self.retentions = dict()
 
         super(Mailboxer, self).__init__(name=name, headDirPath=headDirPath, reopen=reopen, **kwa)
 
@@ -60,6 +109,11 @@ class Mailboxer(dbing.LMDBer):
         super(Mailboxer, self).reopen(**kwa)
         self.tpcs = subing.OnSuber(db=self, subkey='tpcs.')
         self.msgs = subing.Suber(db=self, subkey='msgs.')  # key states
+        self.mrcs = subing.CesrSuber(db=self, subkey='mrcs.', klas=core.Number)
+        self.tdts = subing.CesrOnSuber(db=self, subkey='tdts.', klas=coring.Dater)
+        self.tons = subing.CesrSuber(db=self, subkey='tons.', klas=core.Number)
+        self.tips = dict()
+        self.tipped = dict()
 
         return self.env
 
@@ -85,14 +139,17 @@ class Mailboxer(dbing.LMDBer):
             topic (bytes):  topic identifier for message
             val (bytes): msg digest
         """
-        return self.tpcs.appendOn(key=topic, val=val)
+        on = self.tpcs.appendOn(keys=topic, val=val)
+        self.tips[self._topic(topic)] = on
+        return on
 
 
     def getTopicMsgs(self, topic, fn=0):
         """
         Returns:
-            msgs (Iterable[bytes]): belonging to topic indices with same topic but all
-                on >= fn i.e. all topic.on beginning with fn
+            msgs (Iterator[bytes]): belonging to topic indices with same topic but all
+                on >= fn i.e. all topic.on beginning with fn. Streamed one
+                message at a time so memory does not grow with the topic
 
          Parameters:
              topic (Option(bytes|str)): key prefix combined with serialized on
@@ -101,11 +158,9 @@ class Mailboxer(dbing.LMDBer):
              fn (int): starting index ordinal number used with onKey(pre,on)
                     to form key at at which to initiate retrieval
         """
-        msgs = []
         for keys, on, dig in self.tpcs.getOnItemIter(keys=topic, on=fn):
             if msg := self.msgs.get(keys=dig):
-                msgs.append(msg.encode())  # want bytes not str
-        return msgs
+                yield msg.encode()  # want bytes not str
 
 
     def storeMsg(self, topic, msg):
@@ -127,8 +182,186 @@ class Mailboxer(dbing.LMDBer):
             msg = msg.encode("utf-8")
 
         digb = coring.Diger(ser=msg, code=MtrDex.Blake3_256).qb64b
-        on = self.tpcs.appendOn(keys=topic, val=digb)
-        return self.msgs.pin(keys=digb, val=msg)
+        with self.batch():
+            if (last := self.tons.get(keys=topic)) is not None:  # emptied by retention
+                on = last.num + 1
+                self.tpcs.putOn(keys=topic, on=on, val=digb)
+                self.tons.rem(keys=topic)
+            else:
+                on = self.tpcs.appendOn(keys=topic, val=digb)
+            self.tdts.pinOn(keys=topic, on=on, val=coring.Dater())
+            if (rc := self.mrcs.get(keys=digb)) is not None:
+                self.mrcs.pin(keys=digb, val=core.Number(num=rc.num + 1))
+            elif self.msgs.get(keys=digb) is None:  # new body so count references
+                self.mrcs.pin(keys=digb, val=core.Number(num=1))
+            # else body stored before counting so stays uncounted and kept
+            result = self.msgs.pin(keys=digb, val=msg)
+            self.tips[self._topic(topic)] = on  # signal streams waiting on topic
+            retention = self.retentionOf(topic)
+            if retention.maxAge is not None or retention.maxCount is not None:
+                self.prune(topic, retention=retention)
+        return result
+
+    def retentionOf(self, topic):
+        """
+        Returns:
+            retention (Retention): policy of topic from .retentions by topic
+                then by prefix the part of topic before the first "/" else
+                the default .retention
+
+        Parameters:
+            topic (str | bytes): topic of messages
+        """
+        topic = self._topic(topic)
+        if (retention := self.retentions.get(topic)) is not None:
+            return retention
+        return self.retentions.get(topic.split("/", 1)[0], self.retention)
+
+    def prune(self, topic, *, retention=None, acked=None, now=None):
+        """
+        Remove the oldest messages at topic that retention does not keep. Scans
+        only the removed entries so cost is bounded by what is removed.
+
+        Returns:
+            removed (int): number of topic entries removed
+
+        Parameters:
+            topic (str | bytes): topic of messages
+            retention (Retention | None): policy to apply. None means .retentionOf(topic)
+            acked (int | None): index up to which the querier of topic has all
+                messages, removed when retention.truncate. None means none acked
+            now (datetime | None): timezone aware datetime to compute ages
+                relative to. None means now
+        """
+        retention = retention if retention is not None else self.retentionOf(topic)
+        cut = -1  # remove entries with on <= cut
+
+        if acked is not None and retention.truncate:
+            cut = max(cut, acked - 1)
+
+        if retention.maxCount is not None:
+            cut = max(cut, self.tip(topic) - retention.maxCount)
+
+        if retention.maxAge is not None:
+            now = now if now is not None else helping.nowUTC()
+            cutoff = now - datetime.timedelta(seconds=retention.maxAge)
+            for _, on, dater in self.tdts.getOnItemIter(keys=topic, on=cut + 1):
+                if dater.datetime > cutoff:
+                    break
+                cut = on
+
+        if cut < 0:
+            return 0
+
+        entries = []
+        for _, on, dig in self.tpcs.getOnItemIter(keys=topic, on=0):
+            if on > cut:
+                break
+            entries.append((on, dig))
+
+        with self.batch():
+            for on, dig in entries:
+                self.remTopicMsg(topic, on=on, dig=dig)
+            if entries and next(self.tpcs.getOnItemIter(keys=topic, on=cut + 1), None) is None:
+                # emptied so keep last ordinal
+                self.tons.pin(keys=topic, val=core.Number(num=entries[-1][0]))
+
+        return len(entries)
+
+    def prunePre(self, pre, *, retention=None, now=None):
+        """
+        Apply retention to every topic of prefix pre
+
+        Returns:
+            removed (int): number of topic entries removed
+
+        Parameters:
+            pre (str | bytes): qb64 identifier prefix of mailbox topics
+            retention (Retention | None): policy to apply. None means the policy
+                of each topic
+            now (datetime | None): timezone aware datetime to compute ages
+                relative to. None means now
+        """
+        pre = self._topic(pre)
+        topics = []
+        seek = None
+        while (keys := next(self.tpcs.getRangeKeyIter(keys=pre, seek=seek, limit=1), None)) is not None:
+            topic = self.tpcs.sep.join(keys[:-1])
+            if topic == pre or topic.startswith(pre + "/"):
+                topics.append(topic)
+            seek = (topic, "g")  # past every hex ordinal of topic so next topic
+
+        return sum(self.prune(topic, retention=retention, now=now) for topic in topics)
+
+    def ack(self, pre, topics):
+        """
+        Truncate the topics of prefix pre that the querier has read below the
+        indices of its mailbox query. Only topics whose retention truncates.
+
+        Returns:
+            removed (int): number of topic entries removed
+
+        Parameters:
+            pre (str): qb64 identifier prefix of mailbox
+            topics (dict): next index wanted keyed by topic name such as "/receipt"
+        """
+        return sum(self.prune(self._topic(pre) + topic, acked=idx)
+                   for topic, idx in topics.items())
+
+    def remTopicMsg(self, topic, on, dig):
+        """
+        Remove entry at on of topic and its message once no topic references it.
+        Messages stored before reference counting are kept even when stored
+        again since older topic entries may still reference them.
+
+        Parameters:
+            topic (str | bytes): topic of message
+            on (int): ordinal of entry at topic
+            dig (str): digest of message at entry
+        """
+        with self.batch():
+            self.tpcs.remOn(keys=topic, on=on)
+            self.tdts.remOn(keys=topic, on=on)
+            if (rc := self.mrcs.get(keys=dig)) is None:
+                return  # not counted so may be referenced elsewhere
+            if rc.num > 1:
+                self.mrcs.pin(keys=dig, val=core.Number(num=rc.num - 1))
+            else:
+                self.mrcs.rem(keys=dig)
+                self.msgs.rem(keys=dig)
+
+    @staticmethod
+    def _topic(topic):
+        """ Returns topic as str key of .tips """
+        return topic.decode("utf-8") if hasattr(topic, "decode") else topic
+
+    def tip(self, topic):
+        """
+        Returns:
+            on (int): high-water mark ordinal of last message stored at topic,
+                -1 when topic has no messages. Read from .tpcs on first use of
+                topic then held in memory and advanced by .storeMsg. Read again
+                once held .TipRefresh seconds to see messages stored by other
+                writers. Read every time when .readonly since then another
+                process is the writer
+
+        Parameters:
+            topic (str | bytes): topic of messages
+        """
+        topic = self._topic(topic)
+        now = time.monotonic()
+        if ((on := self.tips.get(topic)) is None or
+                now - self.tipped.get(topic, now - self.TipRefresh) >= self.TipRefresh):
+            on = -1
+            for keys, _ in self.tpcs.getRangeItemIter(keys=(topic, ""), topive=True,
+                                                      reverse=True, limit=1):
+                on = int(keys[-1], 16)
+            if on < 0 and (last := self.tons.get(keys=topic)) is not None:
+                on = last.num
+            if not self.readonly:
+                self.tips[topic] = on
+                self.tipped[topic] = now
+        return on
 
 
     def cloneTopicIter(self, topic, fn=0):
@@ -0,0 +1,491 @@
+# -*- encoding: utf-8 -*-
+"""
+KERI
+keri.app.witnessing module
+
+Multi-process witness support.
+
+A multi-process witness runs N worker processes that share the listen socket
+of the public HTTP port of the witness. Each worker frames inbound CESR streams
+and pre-verifies their signatures with a Screener, then forwards the messages
+that pass to the single writer process over a queue. The writer process owns
+the Kevery, escrows, receipting and mailbox writes of the witness and so is the
+only writer of its LMDB environments. Workers open the same environments read
+only to pre-verify against key state and to serve KEL, TEL and mailbox reads
+directly. Every other request is relayed to the writer which serves it on a
+loopback port.
+"""
+import multiprocessing
+import os
+import queue
+import socket
+import time
+from urllib.parse import urljoin
+
+import falcon
+from hio.base import doing
+from hio.core import http, tcp
+from hio.help import Hict
+
+from . import httping, indirecting, storing
+from .. import help, kering
+from ..core import coring, eventing, parsing, serdering
+from ..core.coring import Ilks
+from ..db import basing
+from ..kering import Vrsn_1_0
+from ..vdr import viring
+
+logger = help.ogler.getLogger()
+
+
+def reopener(lmdber):
+    """
+    Returns:
+        kwa (dict): init parameters with which another process opens the LMDB
+            environment of lmdber at its .path
+
+    Parameters:
+        lmdber (LMDBer): opened database
+    """
+    suffix = os.path.join(lmdber.TailDirPath, lmdber.base, lmdber.name)
+    if lmdber.path.endswith(os.sep + suffix):
+        head = lmdber.path[:-len(suffix) - 1]
+    elif lmdber.path.endswith(os.path.join(lmdber.AltTailDirPath, lmdber.base, lmdber.name)):
+        head = None  # fell back to alt head so falls back again the same way
+    else:
+        raise ValueError(f"Unexpected path={lmdber.path} of {lmdber.name}.")
+
+    return dict(name=lmdber.name, base=lmdber.base, headDirPath=head, temp=False)
+
+
+class Screener:
+    """
+    Screener frames the messages of an inbound CESR stream and pre-verifies
+    their signatures without changing any state. It stands in for the Kevery,
+    Tevery, Exchanger, Revery and Verifier of its parser.
+
+    Only definitively invalid messages are screened out, that is messages that
+    do not parse and messages none of whose signatures verify against the keys
+    that must sign them. Keys of establishment events are in the event itself.
+    Keys of interaction events and queries are read from the key state in .db
+    when it shows the key state the message is signed under. Messages whose
+    signing keys are not known here pass to be validated in full by the writer.
+
+    Attributes:
+        db (Baser | None): read only database of key state
+        parser (Parser): framing parser dispatching to this screener
+        passed (SerderKERI | None): message being screened once it passes
+        rejected (int): number of messages screened out
+    """
+
+    def __init__(self, db=None):
+        """
+        Parameters:
+            db (Baser | None): read only database of key state. None means
+                pre-verify establishment events and non-transferable
+                signatures only
+        """
+        self.db = db
+        self.parser = parsing.Parser(framed=True, kvy=self, tvy=self, exc=self,
+                                     rvy=self, vry=self, version=Vrsn_1_0)
+        self.passed = None
+        self.rejected = 0
+
+    def screen(self, ims):
+        """
+        Returns:
+            screened (list): of (serder, raw) duples of each message of ims that
+                passes where raw is the message with its attachments as received
+
+        Parameters:
+            ims (bytes | bytearray): inbound CESR stream
+        """
+        ims = bytearray(ims)
+        raw = bytes(ims)
+        screened = []
+        start = 0
+        while ims:
+            size = len(ims)
+            self.passed = None
+            self.parser.parseOne(ims=ims, local=False)
+            end = start + size - len(ims)
+            if self.passed is not None:
+                screened.append((self.passed, raw[start:end]))
+            else:
+                self.rejected += 1
+            if len(ims) == size:  # nothing consumed so cannot make progress
+                break
+            start = end
+
+        return screened
+
+    def state(self, pre):
+        """
+        Returns:
+            state (KeyStateRecord | None): key state of pre read from .db
+        """
+        return self.db.states.get(keys=pre) if self.db is not None else None
+
+    def verifyIndexed(self, serder, sigers, verfers):
+        """ Raises ValidationError when none of sigers verify serder with verfers """
+        _, indices = eventing.verifySigs(raw=serder.raw, sigers=sigers, verfers=verfers)
+        if not indices:
+            raise kering.ValidationError(f"No verified signatures for msg={serder.said}.")
+
+    def processEvent(self, serder, sigers=None, **kwa):
+        """ Screen KEL event by its controller signatures. Other events pass. """
+        if serder.ilk in (Ilks.icp, Ilks.rot, Ilks.dip, Ilks.drt):
+            self.verifyIndexed(serder, sigers, serder.verfers)
+        elif serder.ilk == Ilks.ixn:
+            state = self.state(serder.pre)
+            if (state is not None and int(state.s, 16) == serder.sn - 1
+                    and state.d == serder.ked["p"]):  # signed under this key state
+                self.verifyIndexed(serder, sigers, [coring.Verfer(qb64=key) for key in state.k])
+        self.passed = serder
+
+    def processAttachedReceiptCouples(self, **kwa):
+        """ Receipts attached to events are validated by the writer """
+
+    def processAttachedReceiptQuadruples(self, **kwa):
+        """ Receipts attached to events are validated by the writer """
+
+    def processReceipt(self, serder, **kwa):
+        """ Receipts sign the receipted event not held here so pass """
+        self.passed = serder
+
+    def processReply(self, serder, cigars=None, tsgs=None, **kwa):
+        """ Screen reply by its non-transferable signatures when it has no others """
+        if cigars and not tsgs and not any(cigar.verfer.verify(cigar.raw, serder.raw)
+                                           for cigar in cigars):
+            raise kering.ValidationError(f"No verified signatures for msg={serder.said}.")
+        self.passed = serder
+
+    def processQuery(self, serder, source=None, sigers=None, cigars=None, **kwa):
+        """ Screen query by the signatures of its source when its key state is known """
+        if source is not None and sigers and (state := self.state(source.qb64)) is not None:
+            self.verifyIndexed(serder, sigers, [coring.Verfer(qb64=key) for key in state.k])
+        for cigar in cigars or []:
+            if not cigar.verfer.verify(cigar.raw, serder.raw):
+                raise kering.ValidationError(f"Invalid signature for msg={serder.said}.")
+        self.passed = serder
+
+    def processACDC(self, serder, **kwa):
+        """ ACDCs are validated by the writer """
+        self.passed = serder
+
+
+class IntakeEnd:
+    """
+    Worker endpoint that screens KERI messages POSTed or PUT like HttpEnd and
+    forwards the messages that pass to the writer. Mailbox queries are answered
+    from the read only mailbox of the worker.
+
+    Attributes:
+        screener (Screener): pre-verifies inbound messages
+        outbound (multiprocessing.Queue): to writer of ("msgs", raw) and
+            ("ack", pre, topics) entries
+        mbx (Mailboxer): read only mailbox
+    """
+
+    def __init__(self, screener, outbound, mbx):
+        self.screener = screener
+        self.outbound = outbound
+        self.mbx = mbx
+
+    def on_post(self, req, rep):
+        """
+        Handles POST for KERI event messages like HttpEnd.on_post
+
+        Parameters:
+              req (Request) Falcon HTTP request
+              rep (Response) Falcon HTTP response
+        """
+        if req.method == "OPTIONS":
+            rep.status = falcon.HTTP_200
+            return
+
+        rep.set_header('Cache-Control', "no-cache")
+        if req.content_type == httping.CESR_STREAM_CONTENT_TYPE:  # batched messages
+            self.forward(self.screener.screen(req.bounded_stream.read()))
+            rep.set_header('Content-Type', "application/json")
+            rep.status = falcon.HTTP_204
+            return
+
+        cr = httping.parseCesrHttpRequest(req=req)
+        sadder = coring.Sadder(ked=cr.payload, kind=eventing.Kinds.json)
+        msg = bytearray(sadder.raw)
+        msg.extend(cr.attachments.encode("utf-8"))
+        screened = self.screener.screen(msg)
+
+        if (screened and isinstance(serder := screened[0][0], serdering.SerderKERI)
+                and serder.ilk == Ilks.qry and serder.ked["r"] in ("mbx",)):
+            rep.set_header('connection', "close")  # stream ends with connection
+            rep.set_header('Content-Type', "text/event-stream")
+            rep.status = falcon.HTTP_200
+            pre = serder.ked["q"]["i"]
+            topics = serder.ked["q"]["topics"]
+            if self.screener.state(pre) is None:  # writer would escrow it as not found
+                rep.data = b''
+                return
+            self.outbound.put(("ack", pre, topics))  # querier has all below its indices
+            rep.stream = indirecting.MailboxIterable(mbx=self.mbx, pre=pre, topics=topics)
+            return
+
+        self.forward(screened)
+        rep.set_header('Content-Type', "application/json")
+        rep.status = falcon.HTTP_204
+
+    def on_put(self, req, rep):
+        """
+        Handles PUT for KERI mbx event messages like HttpEnd.on_put
+
+        Parameters:
+              req (Request) Falcon HTTP request
+              rep (Response) Falcon HTTP response
+        """
+        if req.method == "OPTIONS":
+            rep.status = falcon.HTTP_200
+            return
+
+        rep.set_header('Cache-Control', "no-cache")
+        self.forward(self.screener.screen(req.bounded_stream.read()))
+        rep.set_header('Content-Type', "application/json")
+        rep.status = falcon.HTTP_204
+
+    def forward(self, screened):
+        """ Forward raw messages of screened to writer as one entry """
+        if screened:
+            self.outbound.put(("msgs", b''.join(raw for _, raw in screened)))
+
+
+class RelayIterable:
+    """
+    Response body of a request relayed to the writer. Yields empty until the
+    response of the writer arrives and then sets ._status and ._headers which
+    the hio WSGI server consults before writing the head of the response.
+    """
+    TimeoutRelay = 30  # seconds to wait for writer
+
+    def __init__(self, clienter, client):
+        self.clienter = clienter
+        self.client = client
+        self.start = time.perf_counter()
+        self.done = False
+
+    def __iter__(self):
+        return self
+
+    def __next__(self):
+        if self.done:
+            raise StopIteration
+
+        if self.client.responses:
+            response = self.client.responses.popleft()
+            self.clienter.remove(self.client)
+            self.done = True
+            self._status = response["status"]
+            body = bytes(response["body"])
+            self._headers = Hict([(key, val) for key, val in response["headers"].items()
+                                  if key.lower() not in RelayEnd.HopHeaders])
+            # delimit body by length since hio does not chunk on reused connections
+            self._headers["Content-Length"] = str(len(body))
+            return body
+
+        if time.perf_counter() - self.start > self.TimeoutRelay:
+            self.clienter.remove(self.client)
+            self.done = True
+            self._status = 504
+            self._headers = Hict([("Content-Length", "0")])
+            return b''
+
+        return b''
+
+
+class RelayEnd:
+    """
+    Worker sink that relays requests the worker does not serve itself to the
+    writer and streams back its response.
+
+    Attributes:
+        clienter (Clienter): pooled clients to writer
+        url (str): base URL of writer on its loopback port
+    """
+    HopHeaders = ("connection", "keep-alive", "transfer-encoding", "content-length",
+                  "host", "upgrade")
+
+    def __init__(self, clienter, url):
+        self.clienter = clienter
+        self.url = url
+
+    def __call__(self, req, rep, **kwa):
+        headers = {key: val for key, val in req.headers.items()
+                   if key.lower() not in self.HopHeaders}
+        client = self.clienter.request(req.method, urljoin(self.url, req.relative_uri),
+                                       body=req.bounded_stream.read(), headers=headers)
+        if client is None:
+            raise falcon.HTTPBadGateway(description="writer unavailable")
+        rep.stream = RelayIterable(clienter=self.clienter, client=client)
+
+
+class BoundServer(tcp.Server):
+    """
+    hio TCP server that accepts on a listen socket bound beforehand, such as
+    one shared by worker processes, instead of binding its own.
+
+    Attributes:
+        bound (socket.socket): listen socket, see listen
+        owner (bool): True means close closes .bound. False means leave it
+            open for the other processes sharing it
+    """
+
+    def __init__(self, bound, owner=False, **kwa):
+        self.bound = bound
+        self.owner = owner
+        super(BoundServer, self).__init__(ha=bound.getsockname(), **kwa)
+
+    def open(self):
+        self.ss = self.bound
+        self.ss.setblocking(False)
+        self.opened = True
+        return True
+
+    def reopen(self, **kwa):
+        """ Idempotently adopts .bound which cannot be rebound once closed """
+        return self.open()
+
+    def close(self):
+        if self.owner and self.ss is not None:
+            self.ss.close()
+        self.ss = None
+        self.opened = False
+
+
+def work(shared, outbound, spec, tock=0.03125):
+    """
+    Runs one worker process of a multi-process witness until terminated
+
+    Parameters:
+        shared (socket.socket): listen socket of public HTTP port
+        outbound (multiprocessing.Queue): to writer, see IntakeEnd
+        spec (dict): with reopener parameters of writer "db", "mbx" and "reger"
+            and "relay" base URL of writer
+        tock (float): tock of worker Doist
+    """
+    db = basing.Baser(reopen=False, **spec["db"])
+    db.CacheCapacity = 0  # reads the writes of writer so must not cache
+    db.reopen(readonly=True)
+    reger = viring.Reger(reopen=False, **spec["reger"])
+    reger.CacheCapacity = 0
+    reger.reopen(readonly=True)
+    mbx = storing.Mailboxer(readonly=True, **spec["mbx"])
+
+    clienter = httping.Clienter()
+    app = falcon.App(cors_enable=True)
+    app.add_route("/", IntakeEnd(screener=Screener(db=db), outbound=outbound, mbx=mbx))
+    app.add_route("/query", indirecting.QueryEnd(db=db, reger=reger))
+    app.add_sink(RelayEnd(clienter=clienter, url=spec["relay"]), prefix="/")
+
+    server = http.Server(app=app, servant=BoundServer(bound=shared))
+    doist = doing.Doist(tock=tock, real=True)
+    doist.do(doers=[http.ServerDoer(server=server), clienter])
+
+
+class Intaker(doing.Doer):
+    """
+    Intaker runs the worker processes of a multi-process witness from its writer
+    process and feeds the messages they screen to the parser of the writer.
+    Workers that die are restarted.
+
+    Attributes:
+        rxbs (bytearray): inbound stream of writer parser
+        mbx (Mailboxer): writer mailbox acked for mailbox queries of workers
+        shared (socket.socket): listen socket of public HTTP port
+        spec (dict): worker spec, see work
+        workers (int): number of worker processes
+        inbound (multiprocessing.Queue | None): from workers when entered
+        procs (list): of worker processes when entered
+        forwarded (int): entries taken from workers
+    """
+    Workers = 2
+    Batch = 1024  # entries taken from workers per recur
+
+    def __init__(self, rxbs, mbx, shared, spec, workers=None, **kwa):
+        """
+        Parameters:
+            rxbs (bytearray): inbound stream of writer parser
+            mbx (Mailboxer): writer mailbox
+            shared (socket.socket): listen socket of public HTTP port
+            spec (dict): worker spec, see work
+            workers (int | None): number of worker processes. None means .Workers
+        """
+        super(Intaker, self).__init__(**kwa)
+        self.rxbs = rxbs
+        self.mbx = mbx
+        self.shared = shared
+        self.spec = spec
+        self.workers = workers if workers is not None else self.Workers
+        self.context = multiprocessing.get_context("spawn")
+        self.inbound = None
+        self.procs = []
+        self.forwarded = 0
+
+    def spawn(self):
+        """ Returns started worker process """
+        proc = self.context.Process(target=work, args=(self.shared, self.inbound, self.spec),
+                                    daemon=True)
+        proc.start()
+        return proc
+
+    def service(self):
+        """ Feed entries from workers to writer and restart dead workers """
+        for _ in range(self.Batch):
+            try:
+                entry = self.inbound.get_nowait()
+            except queue.Empty:
+                break
+            self.forwarded += 1
+            if entry[0] == "msgs":
+                self.rxbs.extend(entry[1])
+            elif entry[0] == "ack":
+                self.mbx.ack(entry[1], entry[2])
+
+        for i, proc in enumerate(self.procs):
+            if not proc.is_alive():
+                logger.error("Witness worker %s exited with %s, restarting", proc.pid, proc.exitcode)
+                self.procs[i] = self.spawn()
+
+    def enter(self, *, temp=None):
+        self.inbound = self.context.Queue()
+        self.procs = [self.spawn() for _ in range(self.workers)]
+
+    def recur(self, tyme):
+        self.service()
+        return False
+
+    def exit(self):
+        for proc in self.procs:
+            proc.terminate()
+        for proc in self.procs:
+            proc.join()
+        self.procs = []
+        if self.inbound is not None:
+            self.inbound.close()
+            self.inbound = None
+        self.shared.close()
+
+
+def listen(host, port, backlog=128):
+    """
+    Returns:
+        ss (socket.socket): listen socket bound to (host, port) to be shared by
+            witness worker processes
+    """
+    ss = socket.socket(socket.AF_INET, socket.SOCK_STREAM)
+    ss.setsockopt(socket.SOL_SOCKET, socket.SO_REUSEADDR, 1)
+    try:
+        ss.bind((host, port))
+        ss.listen(backlog)
+    except OSError:
+        ss.close()
+        raise
+    return ss
@@ -22,7 +22,7 @@ from ..kering import (MissingEntryError,
                       LikelyDuplicitousError, UnverifiedWitnessReceiptError,
                       UnverifiedReceiptError, UnverifiedTransferableReceiptError,
                       QueryNotFoundError, MisfitEventSourceError,
-                      MissingDelegableApprovalError)
+                      MissingDelegableApprovalError, StaleEscrowError)
 from ..kering import Version, Versionage, TraitDex, Vrsn_1_0, Vrsn_2_0
 
 from .. import help
@@ -3384,6 +3384,10 @@ class Kever:
             self.db.wits.put(keys=dgkey, vals=[coring.Prefixer(qb64=w) for w in wits])
 
         self.db.putEvt(dgkey, serder.raw)  # idempotent (maybe already excrowed)
+        for seal in serder.seals or []:  # index anchored seals, idempotent
+            if isinstance(seal, dict):
+                self.db.seals.add(keys=(serder.pre, basing.sealDigest(seal)),
+                                  val=(Seqner(sn=serder.sn), Saider(qb64=serder.said)))
         # update event source
 
         # delegation for authorized delegated or issued event
@@ -3431,6 +3435,7 @@ class Kever:
                          serder.pre, dtsb.decode("utf-8"))
             logger.debug("Event Body=\n%s\n", serder.pretty())
         self.db.addKe(snKey(serder.preb, serder.sn), serder.saidb)
+        self.db.verifiers.remove((serder.pre, serder.sn))  # last event at sn may change
         logger.info("AID %s...%s: Added to KEL %s at sn=%s valid event SAID=%s",
                     pre[:4], pre[-4:], serder.ilk, serder.sn, serder.said)
         logger.debug("Event Body=\n%s\n", serder.pretty())
@@ -5562,16 +5567,26 @@ class Kevery:
         Parameters:
         """
 
+        meter = self.db.escrowMeter
         try:
-            self.processEscrowOutOfOrders()
-            self.processEscrowUnverWitness()
-            self.processEscrowUnverNonTrans()
-            self.processEscrowUnverTrans()
-            self.processEscrowPartialDels()
-            self.processEscrowPartialWigs()
-            self.processEscrowPartialSigs()
-            self.processEscrowDuplicitous()
-            self.processQueryNotFound()
+            with meter.timed("ooes"):
+                self.processEscrowOutOfOrders()
+            with meter.timed("uwes"):
+                self.processEscrowUnverWitness()
+            with meter.timed("ures"):
+                self.processEscrowUnverNonTrans()
+            with meter.timed("vres"):
+                self.processEscrowUnverTrans()
+            with meter.timed("pdes"):
+                self.processEscrowPartialDels()
+            with meter.timed("pwes"):
+                self.processEscrowPartialWigs()
+            with meter.timed("pses"):
+                self.processEscrowPartialSigs()
+            with meter.timed("ldes"):
+                self.processEscrowDuplicitous()
+            with meter.timed("qnfs"):
+                self.processQueryNotFound()
 
         except Exception as ex:  # log diagnostics errors etc
             if logger.isEnabledFor(logging.DEBUG):
@@ -5645,7 +5660,7 @@ class Kevery:
                         # escrow stale so raise ValidationError which unescrows below
                         msg = f"OOO Stale event escrow at dig = {bytes(edig)}"
                         logger.trace("Kevery unescrow error: %s", msg)
-                        raise ValidationError(msg)
+                        raise StaleEscrowError(msg)
 
                     # get the escrowed event using edig
                     eraw = self.db.getEvt(dgKey(pre, bytes(edig)))
@@ -5697,6 +5712,7 @@ class Kevery:
                 except Exception as ex:  # log diagnostics errors etc
                     # error other than out of order so remove from OO escrow
                     self.db.delOoe(snKey(pre, sn), edig)  # removes one escrow at key val
+                    self.db.escrowMeter.fail("ooes", ex)
                     if logger.isEnabledFor(logging.DEBUG):
                         logger.debug("Kevery: OOO escrow other error on escrow: %s\n", ex.args[0])
                         logger.exception("Kevery: OOO escrow other error on : %s\n", ex.args[0])
@@ -5706,6 +5722,7 @@ class Kevery:
                     # duplicitous so we process remaining escrows in spite of found
                     # valid event escrow.
                     self.db.delOoe(snKey(pre, sn), edig)  # removes one escrow at key val
+                    self.db.escrowMeter.succeed("ooes")
                     logger.info("Kevery OOO unescrow succeeded in valid event: "
                                 "event=%s", eserder.said)
                     logger.debug("Event=\n%s\n", eserder.pretty())
@@ -5778,7 +5795,7 @@ class Kevery:
                     # escrow stale so raise ValidationError which unescrows below
                     msg = f"PSE Stale event escrow at dig = {bytes(edig)}"
                     logger.trace("Kevery unescrow error: %s", msg)
-                    raise ValidationError(msg)
+                    raise StaleEscrowError(msg)
 
                 # get the escrowed event using edig
                 eraw = self.db.getEvt(dgkey)
@@ -5856,6 +5873,7 @@ class Kevery:
             except Exception as ex:  # log diagnostics errors etc
                 # error other than waiting on sigs  so remove from escrow
                 self.db.delPse(snKey(pre, sn), edig)  # removes one escrow at key val
+                self.db.escrowMeter.fail("pses", ex)
                 #self.db.udes.rem(keys=dgkey)  # leave here since could PartialDelegationEscrow
 
                 if eserder is not None and eserder.ked["t"] in (Ilks.dip, Ilks.drt,):
@@ -5872,6 +5890,7 @@ class Kevery:
                 # duplicitous so we process remaining escrows in spite of found
                 # valid event escrow.
                 self.db.delPse(snKey(pre, sn), edig)  # removes one escrow at key val
+                self.db.escrowMeter.succeed("pses")
                 self.db.udes.rem(keys=dgkey)  # remove escrow if any
 
                 if eserder is not None and eserder.ked["t"] in (Ilks.dip, Ilks.drt,):
@@ -5945,7 +5964,7 @@ class Kevery:
                     # escrow stale so raise ValidationError which unescrows below
                     msg = f"PWE Stale event escrow at dig = {bytes(edig)}"
                     logger.trace("Kevery unescrow error: %s", msg)
-                    raise ValidationError(msg)
+                    raise StaleEscrowError(msg)
 
                 # get the escrowed event using edig
                 eraw = self.db.getEvt(dgKey(pre, bytes(edig)))
@@ -6033,6 +6052,7 @@ class Kevery:
             except Exception as ex:  # log diagnostics errors etc
                 # error other than waiting on wigs so remove from escrow
                 self.db.delPwe(snKey(pre, sn), edig)  # removes one escrow at key val
+                self.db.escrowMeter.fail("pwes", ex)
                 #self.db.udes.rem(keys=dgkey)  # leave here since could PartialDelegationEscrow
                 if logger.isEnabledFor(logging.TRACE):
                     logger.trace("Kevery: PWE other error on unescrow: %s\n", ex.args[0])
@@ -6043,6 +6063,7 @@ class Kevery:
                 # duplicitous so we process remaining escrows in spite of found
                 # valid event escrow.
                 self.db.delPwe(snKey(pre, sn), edig)  # removes one escrow at key val
+                self.db.escrowMeter.succeed("pwes")
                 self.db.udes.rem(keys=dgkey)  # remove escrow if any
                 logger.info("Kevery: PWE unescrow succeeded in valid event: key = %s \tdigest = %s",
                             bytes(ekey).decode(), bytes(edig).decode())
@@ -6101,7 +6122,7 @@ class Kevery:
                     # escrow stale so raise ValidationError which unescrows below
                     msg = f"PDE Stale event escrow at dig = {bytes(edig)}"
                     logger.info("Kevery unescrow error: %s", msg)
-                    raise ValidationError(msg)
+                    raise StaleEscrowError(msg)
 
                 # get the escrowed event using edig
                 eraw = self.db.getEvt(dgkey)
@@ -6192,6 +6213,7 @@ class Kevery:
                 # error other than waiting on sigs or seal so remove from escrow
                 # removes one event escrow at key val
                 self.db.pdes.remOn(keys=epre, on=esn, val=edig)  # event idx escrow
+                self.db.escrowMeter.fail("pdes", ex)
                 self.db.udes.rem(keys=dgkey)  # remove source seal escrow if any
                 if logger.isEnabledFor(logging.DEBUG):
                     logger.exception("Kevery PDE unescrowed: %s", ex.args[0])
@@ -6204,6 +6226,7 @@ class Kevery:
                 # valid event escrow.
                  # removes one event escrow at key val
                 self.db.pdes.remOn(keys=epre, on=esn, val=edig)  # event idx escrow
+                self.db.escrowMeter.succeed("pdes")
                 self.db.udes.rem(keys=dgkey)  # remove source seal escrow if any
                 logger.info("Kevery PDE unescrow succeeded in valid event: "
                             "event=%s", eserder.said)
@@ -6276,7 +6299,7 @@ class Kevery:
                     # escrow stale so raise ValidationError which unescrows below
                     msg = f"UWE Stale event escrow at dig = {rdiger.qb64b}"
                     logger.trace("Kevery unescrow error: %s", rdiger.qb64b)
-                    raise ValidationError(msg)
+                    raise StaleEscrowError(msg)
 
                 # lookup database dig of the receipted event in pwes escrow
                 # using pre and sn lastEvt
@@ -6305,6 +6328,7 @@ class Kevery:
             except Exception as ex:  # log diagnostics errors etc
                 # error other than out of order so remove from OO escrow
                 self.db.uwes.rem(keys=(pre, snh), val=(rdiger, wiger))
+                self.db.escrowMeter.fail("uwes", ex)
                 if logger.isEnabledFor(logging.DEBUG):  # adds exception data
                     logger.trace("Kevery: UWE other unescrow error: %s\n", ex.args[0])
                     logger.exception("Kevery: UWE other unescrow error: %s\n", ex.args[0])
@@ -6314,6 +6338,7 @@ class Kevery:
                 # duplicitous so we process remaining escrows in spite of found
                 # valid event escrow.
                 self.db.uwes.rem(keys=(pre, snh), val=(rdiger, wiger))
+                self.db.escrowMeter.succeed("uwes")
                 logger.info("Kevery UWE unescrow succeeded for event pre=%s sn=%s", pre, sn)
 
     def processEscrowUnverNonTrans(self):
@@ -6387,7 +6412,7 @@ class Kevery:
                         # escrow stale so raise ValidationError which unescrows below
                         msg = f"URE Stale event escrow at dig = {rsaider.qb64b}"
                         logger.trace("Kevery unescrow error: %s", msg)
-                        raise ValidationError(msg)
+                        raise StaleEscrowError(msg)
 
                     # Is receipt for unverified witnessed event in .Pwes escrow
                     # if found then try else clause will remove from escrow
@@ -6457,6 +6482,7 @@ class Kevery:
                 except Exception as ex:  # log diagnostics errors etc
                     # error other than out of order so remove from OO escrow
                     self.db.delUre(snKey(pre, sn), etriplet)  # removes one escrow at key val
+                    self.db.escrowMeter.fail("ures", ex)
                     if logger.isEnabledFor(logging.DEBUG):  # adds exception data
                         logger.exception("Kevery URE unescrowed: %s", ex.args[0])
                     else:
@@ -6467,6 +6493,7 @@ class Kevery:
                     # duplicitous so we process remaining escrows in spite of found
                     # valid event escrow.
                     self.db.delUre(snKey(pre, sn), etriplet)  # removes one escrow at key val
+                    self.db.escrowMeter.succeed("ures")
                     logger.info("Kevery URE unescrow succeeded for event pre=%s "
                                 "sn=%s", pre, sn)
 
@@ -6496,8 +6523,15 @@ class Kevery:
                         Get and Attach Signatures
                         Process event as if it came in over the wire
                         If successful then remove from escrow table
+
+        Not run by .processEscrows since delegables wait on approval by the
+        delegator so the pass is timed here for whoever runs it.
         """
+        with self.db.escrowMeter.timed("delegables"):
+            self._processEscrowDelegables()
 
+    def _processEscrowDelegables(self):
+        """ One pass over .db.delegables. See .processEscrowDelegables """
         for (pre, sn), dig in self.db.delegables.getItemIter():
             try:
                 edig = dig.encode("utf-8")
@@ -6523,7 +6557,7 @@ class Kevery:
                     # escrow stale so raise ValidationError which unescrows below
                     msg = f"DEL Stale event escrow at dig = {bytes(edig)}"
                     logger.info("Kevery unescrow error: %s", msg)
-                    raise ValidationError(msg)
+                    raise StaleEscrowError(msg)
 
                 # get the escrowed event using edig
                 eraw = self.db.getEvt(dgKey(pre, bytes(edig)))
@@ -6570,6 +6604,7 @@ class Kevery:
             except Exception as ex:  # log diagnostics errors etc
                 # error other than out of order so remove from OO escrow
                 self.db.delegables.rem(keys=(pre, sn,), val=edig)  # removes one escrow at key val
+                self.db.escrowMeter.fail("delegables", ex)
                 if logger.isEnabledFor(logging.DEBUG):
                     logger.exception("Kevery DEL other unescrow error: %s", ex.args[0])
                 else:
@@ -6580,6 +6615,7 @@ class Kevery:
                 # duplicitous so we process remaining escrows in spite of found
                 # valid event escrow.
                 self.db.delegables.rem(keys=(pre, sn,), val=edig)  # removes one escrow at key val
+                self.db.escrowMeter.succeed("delegables")
                 logger.info("Kevery DEL unescrow succeeded in valid event: "
                             "event=%s", eserder.said)
                 logger.debug(f"Event=\n%s\n", eserder.pretty())
@@ -6632,7 +6668,7 @@ class Kevery:
                         # escrow stale so raise ValidationError which unescrows below
                         msg = f"QNF Stale qry event escrow at dig = {bytes(edig).decode()}"
                         logger.trace("Kevery unescrow error: %s", msg)
-                        raise ValidationError(msg)
+                        raise StaleEscrowError(msg)
 
                     # get the escrowed event using edig
                     eraw = self.db.getEvt(dgkey)
@@ -6680,6 +6716,7 @@ class Kevery:
                 except Exception as ex:  # log diagnostics errors etc
                     # error other than out of order so remove from OO escrow
                     self.db.qnfs.rem(keys=(pre, said), val=edig)  # removes one escrow at key val
+                    self.db.escrowMeter.fail("qnfs", ex)
                     if logger.isEnabledFor(logging.DEBUG):
                         logger.debug("Kevery: QNF other unescrow error: %s\n", ex.args[0])
                         logger.exception("Kevery: QNF other unescrow error: %s\n", ex.args[0])
@@ -6688,6 +6725,7 @@ class Kevery:
                     # duplicitous so we process remaining escrows in spite of found
                     # valid event escrow.
                     self.db.qnfs.rem(keys=(pre, said), val=edig)   # removes one escrow at key val
+                    self.db.escrowMeter.succeed("qnfs")
                     logger.info("Kevery: QNF unescrow succeeded in valid event: "
                                 "key = %s \tdigest = %s", ekey.decode(), edig)
                     logger.debug("Event=\n%s\n", eserder.pretty())
@@ -6869,7 +6907,7 @@ class Kevery:
                         # escrow stale so raise ValidationError which unescrows below
                         msg = f"VRE Stale event escrow at dig = {esaider.qb64b}"
                         logger.trace("Kevery unescrow error: %s", msg)
-                        raise ValidationError(msg)
+                        raise StaleEscrowError(msg)
 
                     # get dig of the receipted event using pre and sn lastEvt
                     raw = self.db.getKeLast(snKey(pre, sn))
@@ -6952,6 +6990,7 @@ class Kevery:
                 except Exception as ex:  # log diagnostics errors etc
                     # error other than out of order so remove from OO escrow
                     self.db.delVre(snKey(pre, sn), equinlet)  # removes one escrow at key val
+                    self.db.escrowMeter.fail("vres", ex)
                     if logger.isEnabledFor(logging.DEBUG):  # adds exception data
                         logger.debug("Kevery: VRE other error on unescrow: %s\n", ex.args[0])
                         logger.exception("Kevery: VRE other error on unescrow: %s\n", ex.args[0])
@@ -6961,6 +7000,7 @@ class Kevery:
                     # duplicitous so we process remaining escrows in spite of found
                     # valid event escrow.
                     self.db.delVre(snKey(pre, sn), equinlet)  # removes one escrow at key val
+                    self.db.escrowMeter.succeed("vres")
                     logger.info("Kevery VRE unescrow succeeded for event = %s", serder.said)
                     logger.debug("Event=\n%s\n", serder.pretty())
 
@@ -7031,7 +7071,7 @@ class Kevery:
                         # escrow stale so raise ValidationError which unescrows below
                         msg = f"DUP Stale event escrow at dig = {bytes(edig)}"
                         logger.trace("Kevery unescrow error: %s", msg)
-                        raise ValidationError(msg)
+                        raise StaleEscrowError(msg)
 
                     # get the escrowed event using edig
                     eraw = self.db.getEvt(dgKey(pre, bytes(edig)))
@@ -7077,6 +7117,7 @@ class Kevery:
                 except Exception as ex:  # log diagnostics errors etc
                     # error other than likely duplicitous so remove from escrow
                     self.db.delLde(snKey(pre, sn), edig)  # removes one escrow at key val
+                    self.db.escrowMeter.fail("ldes", ex)
                     if logger.isEnabledFor(logging.DEBUG):
                         logger.trace("Kevery: DUP other unescrow error: %s\n", ex.args[0])
                         logger.exception("Kevery: DUP other unescrow error: %s\n", ex.args[0])
@@ -7086,6 +7127,7 @@ class Kevery:
                     # duplicitous so we process remaining escrows in spite of found
                     # valid event escrow.
                     self.db.delLde(snKey(pre, sn), edig)  # removes one escrow at key val
+                    self.db.escrowMeter.succeed("ldes")
                     logger.info("Kevery DUP unescrow succeeded in valid event: event=%s",
                                 eserder.said)
                     logger.debug("event=\n%s\n", eserder.pretty())
@@ -6,16 +6,18 @@ keri.core.routing module
 import datetime
 import logging
 import re
+from itertools import islice
 
 from hio.help import decking
 
-from . import eventing, coring, serdering
+from . import eventing, coring
 from .. import help, kering
-from ..db import dbing
 from ..help import helping
 
 logger = help.ogler.getLogger()
 
+RouteFieldRex = re.compile(r'{([a-zA-Z]\w*)}')  # whole segment route template field
+
 
 class Router:
     """ Reply message router
@@ -23,9 +25,26 @@ class Router:
     Reply message router that accepts registration of route `r` handlers and dispatches
     reply messages to the appropriate handler.
 
+    Static route templates are looked up whole in a dict. Templates made of
+    static and whole `{field}` segments are compiled into a trie of RouteNode
+    keyed by static segment so that finding a route costs one dict lookup per
+    segment however many routes are registered. Any other template falls back
+    to a search of its regex. When several routes match, the first registered
+    wins as if all were searched in order. Tables with fewer than .TrieMin
+    routes are searched in order instead since a linear search of a handful of
+    regexes is faster than the lookups (see benchmark in tests.core.test_routing).
+
+    Attributes:
+        routes (list): registered Route instances in order of registration
+        exact (dict): Route of each static template keyed by lowercase template.
+            Static templates matched by an earlier route are left out
+        root (RouteNode): root of trie of templates with fields
+        complex (list): (order, Route) of routes searched by regex
+
     """
 
     defaultResourceFunc = "processReply"
+    TrieMin = 10  # fewest routes for which indexed lookup beats linear search
 
     def __init__(self, routes=None):
         """ Initialized instance with optiona list of existing routes
@@ -35,6 +54,11 @@ class Router:
 
         """
         self.routes = routes if routes is not None else list()
+        self.exact = dict()
+        self.root = RouteNode()
+        self.complex = list()
+        for order, route in enumerate(self.routes):
+            self._index(order, route)
 
     def addRoute(self, routeTemplate, resource, suffix=None):
         """ Add a route between a route template and a resource
@@ -50,7 +74,51 @@ class Router:
         """
 
         fields, regex = compile_uri_template(routeTemplate)
-        self.routes.append(Route(regex=regex, fields=fields, resource=resource, suffix=suffix))
+        route = Route(regex=regex, fields=fields, resource=resource, suffix=suffix,
+                      template=routeTemplate)
+        self.routes.append(route)
+        self._index(len(self.routes) - 1, route)
+
+    def _index(self, order, route):
+        """ Add route to .exact when its template is static, to trie when its
+        template is simple otherwise to .complex
+
+        Parameters:
+            order (int): registration order of route
+            route (Route): route to index
+
+        """
+        segments = None
+        if (template := route.template) is not None:
+            if template != "/" and template.endswith("/"):  # as compile_uri_template
+                template = template[:-1]
+            segments = splitRoute(template)
+
+        if segments is None or not all(RouteFieldRex.fullmatch(seg) or
+                                       ("{" not in seg and "}" not in seg)
+                                       for seg in segments):
+            self.complex.append((order, route))  # regex only or mixed segment
+            return
+
+        if not any(seg.startswith("{") for seg in segments):  # static template
+            found, _ = self._lookup(template)
+            if found is None:  # otherwise earlier route always matches first
+                self.exact[template.lower()] = route  # templates ignore case
+            return
+
+        node = self.root
+        names = []
+        for seg in segments:
+            if seg.startswith("{"):
+                names.append(seg[1:-1])
+                if node.wild is None:
+                    node.wild = RouteNode()
+                node = node.wild
+            else:
+                node = node.statics.setdefault(seg.lower(), RouteNode())  # templates ignore case
+
+        if node.leaf is None:  # same template registered again never matches first
+            node.leaf = (order, route, names)
 
     def dispatch(self, serder, saider, cigars, tsgs):
         """
@@ -67,7 +135,7 @@ class Router:
         ked = serder.ked
         # Dispatch based on route
         r = ked["r"]
-        route, match = self._find(route=r)
+        route, kwargs = self._find(route=r)
         if route is None:
             raise kering.ValidationError(f"No resource is registered to handle route {r}")
 
@@ -75,7 +143,6 @@ class Router:
         if route.suffix is not None:
             fname += route.suffix
 
-        kwargs = match.groupdict()
         for name in route.fields:
             if name not in kwargs:
                 raise kering.ValidationError(f"parameter {name} not found in route {r}")
@@ -84,25 +151,126 @@ class Router:
         fn(serder=serder, saider=saider, route=r, cigars=cigars, tsgs=tsgs, **kwargs)
 
     def _find(self, route):
-        """ Linear seach thru added routes, returning the first one that matchs
+        """ Find first registered route that matches route
 
-        Searches through the registered routes until a regex in one of the routes matches
-        the provided route and returns the Route object along with the re.Match object.
+        Searches the regex of each route in order when fewer than .TrieMin
+        routes are registered otherwise looks up the indexes.
 
         Parameters:
             route (str): the route from the `r` of the reply message
 
         Returns:
             Route: the Route object with the resource that is registered to process this rpy message
-            re.Match:  the regular expression match that contains the grouping of matched parameters.
+            dict:  matched parameters of route keyed by field name
 
         """
+        if len(self.routes) >= self.TrieMin:
+            return self._lookup(route)
+
+        if not isinstance(route, str):
+            return None, None
+
         for r in self.routes:
             if res := r.regex.search(route):
-                return r, res
+                return r, res.groupdict()
 
         return None, None
 
+    def _lookup(self, route):
+        """ Find first registered route that matches route in indexes
+
+        Looks up static templates, walks the trie of simple templates and then
+        searches the regex of each complex template registered before the route
+        found in the trie if any.
+
+        Parameters:
+            route (str): the route from the `r` of the reply message
+
+        Returns:
+            Route: the Route object with the resource that is registered to process this rpy message
+            dict:  matched parameters of route keyed by field name
+
+        """
+        if not isinstance(route, str):
+            return None, None
+
+        if (r := self.exact.get(route.lower())) is not None:
+            return r, {}
+
+        found = self._walk(route) if route.startswith("/") else None
+
+        for order, r in self.complex:
+            if found is not None and order > found[0]:
+                break
+            if res := r.regex.search(route):
+                return r, res.groupdict()
+
+        if found is None:
+            return None, None
+
+        _, r, params = found
+        return r, params
+
+    def _walk(self, route):
+        """ Returns (order, Route, params) of first registered match of route in trie or None
+
+        Parameters:
+            route (str): route starting with '/'
+
+        """
+        segments = route.split("/")
+        node = self.root
+        values = []
+        for seg in islice(segments, 1, None):
+            statics = node.statics
+            if statics:
+                if node.wild is not None:  # static or field so search both
+                    return self._search(segments)
+                node = statics.get(seg) or statics.get(seg.lower())
+            elif seg:
+                values.append(seg)
+                node = node.wild
+            else:
+                return None
+            if node is None:
+                return None
+
+        if node.leaf is None:
+            return None
+        order, r, names = node.leaf
+        return order, r, dict(zip(names, values))
+
+    def _search(self, segments):
+        """ Returns (order, Route, params) of first registered match of segments
+        in trie or None by backtracking search of both branches where a static
+        segment and a field may match
+
+        Parameters:
+            segments (list): of route split on '/'
+
+        """
+        last = len(segments)
+        found = None
+        stack = [(self.root, 1, ())]
+        while stack:
+            node, i, values = stack.pop()
+            while node is not None and i < last:
+                seg = segments[i]
+                if node.wild is not None and seg:  # backtrack to field after static
+                    stack.append((node.wild, i + 1, values + (seg,)))
+                if statics := node.statics:
+                    node = statics.get(seg) or statics.get(seg.lower())
+                else:
+                    node = None
+                i += 1
+
+            if node is not None and node.leaf is not None:
+                order, r, names = node.leaf
+                if found is None or order < found[0]:
+                    found = (order, r, dict(zip(names, values)))
+
+        return found
+
     def processRouteNotFound(self, *, serder, saider, route,
                              cigars=None, tsgs=None, **kwargs):
         """ Default handler for processing reply message with an unregistered route
@@ -334,9 +502,9 @@ class Revery:
                                 logger.debug("event=\n%s\n", serder.pretty())
                                 continue  # skip if not later
 
-            # retrieve sdig of last event at sn of signer.
-            sdig = self.db.getKeLast(key=dbing.snKey(pre=spre, sn=seqner.sn))
-            if sdig is None:
+            # retrieve key state of last event at sn of signer.
+            verifiers = self.db.fetchVerifiers(pre=spre, sn=seqner.sn)
+            if verifiers is None:
                 # create cue here to request key state for sprefixer signer
                 # signer's est event not yet in signer's KEL
                 logger.info("Revery: escrowing without key state for signer"
@@ -347,15 +515,12 @@ class Revery:
                 self.cues.append(dict(kin="query", q=dict(pre=spre)))
                 continue
 
-            # retrieve last event itself of signer given sdig
-            sraw = self.db.getEvt(key=dbing.dgKey(pre=spre, dig=bytes(sdig)))
-            # assumes db ensures that sraw must not be none because sdig was in KE
-            sserder = serdering.SerderKERI(raw=bytes(sraw))
-            if sserder.said != ssaider.qb64:  # signer's dig not match est evt
+            ssaid, stholder, sverfers = verifiers
+            if ssaid != ssaider.qb64:  # signer's dig not match est evt
                 raise kering.ValidationError(f"Bad trans indexed sig group at sn = "
                                              f"{seqner.sn} for reply = {serder.ked}.")
             # verify sigs
-            if not (sverfers := sserder.verfers):
+            if not sverfers:
                 raise kering.ValidationError(f"Invalid reply from signer={spre}, no "
                                              f"keys at signer's est. event sn={seqner.sn}.")
 
@@ -367,7 +532,7 @@ class Revery:
             sigers, valid = eventing.validateSigs(serder=serder,
                                                   sigers=sigers,
                                                   verfers=sverfers,
-                                                  tholder=sserder.tholder)
+                                                  tholder=stholder)
             # no error so at least one verified siger
 
             if valid:  # meet threshold so save
@@ -530,10 +695,11 @@ class Route:
         .fields(set): field names for matches in regex
         .resource(object): the handler for this route
         .suffix(Optional(str)): a suffix to be applied to the handler method
+        .template(Optional(str)): url template of regex. None means regex only
 
     """
 
-    def __init__(self, regex, fields, resource, suffix=None):
+    def __init__(self, regex, fields, resource, suffix=None, template=None):
         """ Initialize instance of route
 
         Parameters:
@@ -541,12 +707,43 @@ class Route:
             fields(set): field names for matches in regex
             resource(object): the handler for this route
             suffix(Optional(str)): a suffix to be applied to the handler method
+            template(Optional(str)): url template of regex
 
         """
         self.regex = regex
         self.fields = fields
         self.resource = resource
         self.suffix = suffix
+        self.template = template
+
+
+class RouteNode:
+    """ Node of trie of route templates in Router
+
+    Attributes:
+        statics (dict): child RouteNode keyed by lowercase static segment
+        wild (RouteNode | None): child for a `{field}` segment
+        leaf (tuple | None): (order, Route, field names) of route ending here
+
+    """
+    __slots__ = ("statics", "wild", "leaf")
+
+    def __init__(self):
+        self.statics = dict()
+        self.wild = None
+        self.leaf = None
+
+
+def splitRoute(route):
+    """ Returns segments of route between slashes or None when not absolute
+
+    Parameters:
+        route (str): route or route template starting with '/'
+
+    """
+    if not route.startswith("/"):
+        return None
+    return route.split("/")[1:]
 
 
 def compile_uri_template(template):
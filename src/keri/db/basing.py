@@ -19,9 +19,10 @@ So only need to set dupsort first time opened each other opening does not
 need to call it
 """
 import importlib
+import itertools
 import os
 import shutil
-from collections import namedtuple
+from collections import OrderedDict
 from contextlib import contextmanager
 from dataclasses import dataclass, asdict, field
 import json
@@ -36,11 +37,11 @@ from ordered_set import OrderedSet as oset
 from hio.base import doing
 
 import keri
-from . import dbing, koming, subing
+from . import caching, dbing, koming, subing, metering
 from .. import kering
-from ..kering import Vrsn_1_0, Vrsn_2_0
+from ..kering import Vrsn_2_0
 from .. import core
-from ..core import coring, eventing, parsing, serdering, indexing
+from ..core import coring, eventing, serdering, indexing
 
 
 from .. import help
@@ -53,9 +54,12 @@ logger = help.ogler.getLogger()
 MIGRATIONS = [
     ("0.6.8", ["hab_data_rename"]),
     ("1.0.0", ["add_key_and_reg_state_schemas"]),
-    ("1.2.0", ["rekey_habs"])
+    ("1.2.0", ["rekey_habs"]),
+    ("2.0.0", ["index_anchored_seals", "binary_records"]),
 ]
 
+SealsMigration = "index_anchored_seals"  # migration that backfills Baser.seals
+
 
 # ToDo XXXX maybe
 '''
@@ -83,33 +87,68 @@ class komerdict(dict):
 
 
 # ToDo XXXX change name to statedict since not a generic dbdict
-class dbdict(dict):
+class dbdict(OrderedDict):
     """
-    Subclass of dict that has db as attribute and employs read through cache
+    Subclass of OrderedDict that has db as attribute and employs read through cache
     from db Baser.stts of kever states to reload kever from state in database
     when not found in memory as dict item.
+
+    When .capacity is not None the cache is bounded with least recently used
+    eviction. Kevers of locally owned prefixes in .db.prefixes and .db.groups
+    are pinned and never evicted. Evicted kevers are reloaded from .db.states
+    on the next access since key state is pinned to .states on every update.
+    Iteration only visits kevers currently in memory.
+
+    Attributes:
+        db (Baser | None): database with .states to reload evicted kevers
+        capacity (int | None): maximum number of kevers held in memory before
+            evicting least recently used unpinned kevers. None means unbounded
+        hits (int): number of lookups found in memory
+        misses (int): number of lookups that went to .db.states
+        evictions (int): number of kevers evicted from memory
+        pins (set): pinned keys in memory when bounded
     """
-    __slots__ = ('db')  # no .__dict__ just for db reference
+    __slots__ = ('db', 'capacity', 'hits', 'misses', 'evictions', 'pins')
 
     def __init__(self, *pa, **kwa):
-        super(dbdict, self).__init__(*pa, **kwa)
         self.db = None
+        self.capacity = None
+        self.hits = 0
+        self.misses = 0
+        self.evictions = 0
+        self.pins = set()
+        super(dbdict, self).__init__(*pa, **kwa)  # OrderedDict inits via __setitem__
 
     def __getitem__(self, k):
         try:
-            return super(dbdict, self).__getitem__(k)
+            kever = super(dbdict, self).__getitem__(k)
         except KeyError as ex:
+            self.misses += 1
             if not self.db:
                 raise ex  # reraise KeyError
-            if (ksr := self.db.states.get(keys=k)) is None:
-                raise ex  # reraise KeyError
-            try:
-                kever = eventing.Kever(state=ksr, db=self.db)
-            except kering.MissingEntryError:  # no kel event for keystate
-                raise ex  # reraise KeyError
+            with self.db.snapshot():  # state and its event consistent
+                if (ksr := self.db.states.get(keys=k)) is None:
+                    raise ex  # reraise KeyError
+                try:
+                    kever = eventing.Kever(state=ksr, db=self.db)
+                except kering.MissingEntryError:  # no kel event for keystate
+                    raise ex  # reraise KeyError
             self.__setitem__(k, kever)
             return kever
 
+        self.hits += 1
+        if self.capacity is not None:  # refresh recency
+            self.move_to_end(k)
+        return kever
+
+    def __setitem__(self, k, v):
+        super(dbdict, self).__setitem__(k, v)
+        if self.capacity is not None:
+            self.move_to_end(k)  # refresh recency
+            if self.pinned(k):
+                self.pins.add(k)
+            self.evict()
+
     def __contains__(self, k):
         if not super(dbdict, self).__contains__(k):
             try:
@@ -128,16 +167,63 @@ class dbdict(dict):
             default: default value to return if not found
 
         Returns:
-            kever: converted from underlying dict or database
+            kever: converted from underlying dict or database. When bounded
+                reads through to database since k may have been evicted.
 
         """
+        if self.capacity is not None:
+            try:
+                return self.__getitem__(k)
+            except KeyError:
+                return default
+
         if not super(dbdict, self).__contains__(k):
             return default
         else:
             return self.__getitem__(k)
 
+    def pinned(self, k):
+        """
+        Returns:
+            pinned (bool): True if k is locally owned prefix never evicted
+        """
+        return (self.db is not None and
+                (k in self.db.prefixes or k in self.db.groups))
+
+    def evict(self):
+        """
+        Evict least recently used unpinned kevers until at most .capacity
+        remain in memory. Pinned kevers do not count against .capacity. Scans
+        only from the least recently used end up to the evicted kevers.
+        """
+        if self.capacity is None:
+            return
+        excess = len(self) - len(self.pins) - self.capacity
+        if excess <= 0:
+            return
+        evicts = []
+        for k in super(dbdict, self).keys():  # oldest first
+            if excess <= 0:
+                break
+            if self.pinned(k):
+                if k not in self.pins:  # pinned after it was added
+                    self.pins.add(k)
+                    excess -= 1
+                continue
+            evicts.append(k)
+            excess -= 1
+        for k in evicts:
+            super(dbdict, self).__delitem__(k)
+            self.pins.discard(k)
+            self.evictions += 1
 
-
+    def stats(self):
+        """
+        Returns:
+            stats (dict): size, capacity, hits, misses and evictions of cache
+        """
+        return dict(size=len(self), capacity=self.capacity, hits=self.hits,
+                    misses=self.misses, evictions=self.evictions)
 
 
 @dataclass
@@ -564,6 +650,43 @@ class WellKnownAuthN:
     dt: str  # iso8601 date/time of success resolution
 
 
+@dataclass(eq=False)
+class WigWatch:
+    """
+    In memory completion notice of the witness receipts of one event. Baser
+    updates .count of each watch on its key whenever witness signatures are
+    written to or deleted from .wigs through this Baser so waiters check .done
+    instead of reading .wigs. See Baser.watchWigs
+
+    Attributes:
+        key (bytes): dgKey of receipted event
+        need (int): number of witness signatures that completes the event
+        count (int): number of witness signatures stored for the event
+    """
+    key: bytes
+    need: int
+    count: int = 0
+
+    @property
+    def done(self):
+        """ Returns True when event has all needed witness signatures """
+        return self.count >= self.need
+
+
+def sealDigest(seal):
+    """
+    Returns:
+        dig (str): qb64 Blake3_256 digest of anchored seal in dict form for
+            .seals index. Digest is over compact JSON of seal so includes labels
+            in order and differs for different types of seal with same values.
+
+    Parameters:
+        seal (dict): anchored seal of any type in dict form
+    """
+    ser = json.dumps(seal, separators=(",", ":"), ensure_ascii=False).encode("utf-8")
+    return coring.Diger(ser=ser).qb64
+
+
 def openDB(*, cls=None, name="test", **kwa):
     """
     Returns contextmanager generated by openLMDB but with Baser instance as default
@@ -598,6 +721,7 @@ def reopenDB(db, clear=False, **kwa):
 
 
 KERIBaserMapSizeKey = "KERI_BASER_MAP_SIZE"
+KERIBaserKeverCapacityKey = "KERI_BASER_KEVER_CAPACITY"
 
 
 class Baser(dbing.LMDBer):
@@ -609,6 +733,7 @@ class Baser(dbing.LMDBer):
 
         kevers (dict): Kever instances indexed by identifier prefix qb64
         prefixes (OrderedSet): local prefixes corresponding to habitats for this db
+        wigWatches (dict): lists of WigWatch keyed by dgKey of watched event
 
         .evts is named sub DB whose values are serialized key events
             dgKey
@@ -940,10 +1065,26 @@ class Baser(dbing.LMDBer):
         Missing ToDo XXXX other attributes as sub dbs not documented here
             such as .wits etc
 
+        .states, .habs, .ends, .locs, .ksns and .schema are hot sub dbs read
+        on the request path so are cached variants that hold up to
+        .CacheCapacity deserialized values each. See caching.CacheMixin
+
+        .verifiers is LRUCache of (said, tholder, verfers) of the last event at
+        each (pre, sn) of transferable KELs read by .fetchVerifiers for
+        signature checks. Updated by Kever.logEvent. Like the cached sub dbs
+        KEL updates made through another Baser instance are not seen
+
+        .migc is named sub DB of the resume cursor of each batched migration
+        still in progress keyed by migration name. See .migrateBatched
+
     Properties:
         kevers (dbdict): read through cache of kevers of states for KELs in db
+            bounded to .KeverCapacity unpinned kevers when not None
 
     """
+    KeverCapacity = None  # unbounded kevers cache
+    CacheCapacity = 1024  # values cached per cached sub db, 0 disables
+    MigrationBatchSize = 1024  # records per transaction of batched migrations
 
     def __init__(self, headDirPath=None, reopen=False, **kwa):
         """
@@ -967,6 +1108,8 @@ class Baser(dbing.LMDBer):
         self.groups = oset()  # group hab ids
         self._kevers = dbdict()
         self._kevers.db = self  # assign db for read through cache of kevers
+        self.escrowMeter = metering.EscrowMeter()  # escrow processing tallies
+        self.wigWatches = dict()  # witness receipt completion notices
 
         if (mapSize := os.getenv(KERIBaserMapSizeKey)) is not None:
             try:
@@ -975,6 +1118,14 @@ class Baser(dbing.LMDBer):
                 logger.error("KERI_BASER_MAP_SIZE must be an integer value >1!")
                 raise
 
+        if (capacity := os.getenv(KERIBaserKeverCapacityKey)) is not None:
+            try:
+                self.KeverCapacity = int(capacity)
+            except ValueError:
+                logger.error("KERI_BASER_KEVER_CAPACITY must be an integer value >0!")
+                raise
+        self._kevers.capacity = self.KeverCapacity
+
         super(Baser, self).__init__(headDirPath=headDirPath, reopen=reopen, **kwa)
 
     @property
@@ -1002,6 +1153,9 @@ class Baser(dbing.LMDBer):
         """
         super(Baser, self).reopen(**kwa)
 
+        # key state of signers for signature checks keyed by (pre, sn)
+        self.verifiers = caching.LRUCache(capacity=self.CacheCapacity)
+
         # Create by opening first time named sub DBs within main DB instance
         # Names end with "." as sub DB name must include a non Base64 character
         # to avoid namespace collisions with Base64 identifier prefixes.
@@ -1031,9 +1185,21 @@ class Baser(dbing.LMDBer):
         # events as ordered by first seen ordinals
         self.fons = subing.CesrSuber(db=self, subkey='fons.', klas=core.Number)
 
+        # anchored seals index keyed by (pre, sealDigest(seal)) of seals in
+        # accepted events of KEL of pre. Values are (sn, said) of each anchoring
+        # event in insertion order. Updated by Kever.logEvent
+        self.seals = subing.CatCesrIoSetSuber(db=self, subkey='seals.',
+                                              klas=(coring.Seqner, coring.Saider))
+
         self.migs = subing.CesrSuber(db=self, subkey="migs.", klas=coring.Dater)
+        self.migc = subing.Suber(db=self, subkey="migc.")
         self.vers = subing.Suber(db=self, subkey="vers.")
 
+        # a database without KEL events needs no backfill of .seals
+        if (not self.readonly and not self.sealsIndexed
+                and next(self.getTopIoDupItemIter(db=self.kels), None) is None):
+            self.migs.pin(keys=(SealsMigration,), val=coring.Dater())
+
         # event source local (protected) or non-local (remote not protected)
         self.esrs = koming.Komer(db=self,
                                    schema=EventSourceRecord,
@@ -1047,16 +1213,20 @@ class Baser(dbing.LMDBer):
 
         # Kever state made of KeyStateRecord key states
         # TODO: clean
-        self.states = koming.Komer(db=self,
-                                   schema=KeyStateRecord,
-                                   subkey='stts.')
+        self.states = koming.CacheKomer(db=self,
+                                        schema=KeyStateRecord,
+                                        kind=koming.RecordKind,
+                                        subkey='stts.',
+                                        capacity=self.CacheCapacity)
 
         self.wits = subing.CesrIoSetSuber(db=self, subkey="wits.", klas=coring.Prefixer)
 
         # habitat application state keyed by habitat name, includes prefix
-        self.habs = koming.Komer(db=self,
-                                 subkey='habs.',
-                                 schema=HabitatRecord, )
+        self.habs = koming.CacheKomer(db=self,
+                                      subkey='habs.',
+                                      schema=HabitatRecord,
+                                      kind=koming.RecordKind,
+                                      capacity=self.CacheCapacity)
         # habitat name database mapping (domain,name) as key to Prefixer
         self.names = subing.Suber(db=self, subkey='names.', sep="^")
 
@@ -1099,14 +1269,18 @@ class Baser(dbing.LMDBer):
 
         # service endpoint identifier (eid) auths keyed by controller cid.role.eid
         # data extracted from reply /end/role/add or /end/role/cut
-        self.ends = koming.Komer(db=self, subkey='ends.',
-                                 schema=EndpointRecord, )
+        self.ends = koming.CacheKomer(db=self, subkey='ends.',
+                                      schema=EndpointRecord,
+                                      kind=koming.RecordKind,
+                                      capacity=self.CacheCapacity)
 
         # service endpoint locations keyed by eid.scheme  (endpoint identifier)
         # data extracted from reply loc
-        self.locs = koming.Komer(db=self,
-                                 subkey='locs.',
-                                 schema=LocationRecord, )
+        self.locs = koming.CacheKomer(db=self,
+                                      subkey='locs.',
+                                      schema=LocationRecord,
+                                      kind=koming.RecordKind,
+                                      capacity=self.CacheCapacity)
         # observed oids by watcher by cid.aid.oid  (endpoint identifier)
         # data extracted from reply loc
         self.obvs = koming.Komer(db=self,
@@ -1187,9 +1361,11 @@ class Baser(dbing.LMDBer):
         # KeyStateRecords so use ._asdict or ._asjson as appropriate
         # use  .kdts, .ksgs, and .kcgs for datetimes and signatures
         # TODO: clean
-        self.ksns = koming.Komer(db=self,
-                                schema=KeyStateRecord,
-                                subkey='ksns.')
+        self.ksns = koming.CacheKomer(db=self,
+                                      schema=KeyStateRecord,
+                                      kind=koming.RecordKind,
+                                      subkey='ksns.',
+                                      capacity=self.CacheCapacity)
 
         # key state SAID database for successfully saved key state notices
         # maps key=(prefix, aid) to val=said of key state
@@ -1206,18 +1382,21 @@ class Baser(dbing.LMDBer):
         self.oobis = koming.Komer(db=self,
                                   subkey='oobis.',
                                   schema=OobiRecord,
+                                  kind=koming.RecordKind,
                                   sep=">")  # Use seperator not a allowed in URLs so no splitting occurs.
 
         # escrow OOBIs that failed to load, retriable, keyed by oobi URL
         self.eoobi = koming.Komer(db=self,
                                   subkey='eoobi.',
                                   schema=OobiRecord,
+                                  kind=koming.RecordKind,
                                   sep=">")  # Use seperator not a allowed in URLs so no splitting occurs.
 
         # OOBIs with outstand client requests.
         self.coobi = koming.Komer(db=self,
                                   subkey='coobi.',
                                   schema=OobiRecord,
+                                  kind=koming.RecordKind,
                                   sep=">")  # Use seperator not a allowed in URLs so no splitting occurs.
 
         # Resolved OOBIs (those that have been processed successfully for this database.
@@ -1225,6 +1404,7 @@ class Baser(dbing.LMDBer):
         self.roobi = koming.Komer(db=self,
                                   subkey='roobi.',
                                   schema=OobiRecord,
+                                  kind=koming.RecordKind,
                                   sep=">")  # Use seperator not a allowed in URLs so no splitting occurs.
 
         # Well known OOBIs that are to be used for mfa against a resolved OOBI.
@@ -1232,6 +1412,7 @@ class Baser(dbing.LMDBer):
         self.woobi = koming.Komer(db=self,
                                   subkey='woobi.',
                                   schema=OobiRecord,
+                                  kind=koming.RecordKind,
                                   sep=">")  # Use seperator not a allowed in URLs so no splitting occurs.
 
         # Well known OOBIs that are to be used for mfa against a resolved OOBI.
@@ -1239,6 +1420,7 @@ class Baser(dbing.LMDBer):
         self.moobi = koming.Komer(db=self,
                                   subkey='moobi.',
                                   schema=OobiRecord,
+                                  kind=koming.RecordKind,
                                   sep=">")  # Use seperator not a allowed in URLs so no splitting occurs.
 
         # Multifactor well known OOBI auth records to process.  Keys by controller URL
@@ -1246,6 +1428,7 @@ class Baser(dbing.LMDBer):
         self.mfa = koming.Komer(db=self,
                                 subkey='mfa.',
                                 schema=OobiRecord,
+                                kind=koming.RecordKind,
                                 sep=">")  # Use seperator not a allowed in URLs so no splitting occurs.
 
         # Resolved multifactor well known OOBI auth records.  Keys by controller URL
@@ -1253,12 +1436,14 @@ class Baser(dbing.LMDBer):
         self.rmfa = koming.Komer(db=self,
                                  subkey='rmfa.',
                                  schema=OobiRecord,
+                                 kind=koming.RecordKind,
                                  sep=">")  # Use seperator not a allowed in URLs so no splitting occurs.
 
         # JSON schema SADs keys by the SAID
         # TODO: clean
-        self.schema = subing.SchemerSuber(db=self,
-                                          subkey='schema.')
+        self.schema = subing.CacheSchemerSuber(db=self,
+                                               subkey='schema.',
+                                               capacity=self.CacheCapacity)
 
         # Field values for contact information for remote identifiers.  Keyed by prefix/field
         # TODO: clean
@@ -1338,15 +1523,21 @@ class Baser(dbing.LMDBer):
         for keys in removes:  # remove bare .habs records
             self.habs.rem(keys=keys)
 
-    def migrate(self):
+    def migrate(self, size=None):
         """ Run all migrations required
 
         Run all migrations  that are required from the current version of database up to the current version
          of the software that have not already been run.
 
+         Migration modules that provide migrateIter are run in batches that resume where an interrupted run
+         left off. See .migrateBatched
+
          Sets the version of the database to the current version of the software after successful completion
          of required migrations
 
+        Parameters:
+            size (int | None): records per transaction of batched migrations. None means .MigrationBatchSize
+
         """
         for (version, migrations) in MIGRATIONS:
             # Only run migration if current source code version is at or below the migration version
@@ -1369,7 +1560,10 @@ class Baser(dbing.LMDBer):
                 mod = importlib.import_module(modName)
                 try:
                     print(f"running migration {modName}")
-                    mod.migrate(self)
+                    if hasattr(mod, "migrateIter"):
+                        self.migrateBatched(migration, mod, size=size)
+                    else:
+                        mod.migrate(self)
                 except Exception as e:
                     print(f"\nAbandoning migration {migration} at version {version} with error: {e}")
                     return
@@ -1381,6 +1575,63 @@ class Baser(dbing.LMDBer):
 
         self.version = keri.__version__
 
+    def migrateBatched(self, name, mod, size=None):
+        """
+        Runs migration name of module mod in batches of at most size records.
+        Each batch commits in one transaction together with the resume cursor
+        of the migration in .migc so an interrupted migration resumes after
+        the last committed batch instead of starting over. Reports progress
+        after each batch. A batch that fills the memory map is retried after
+        growing the map.
+
+        Module mod provides:
+            _check_if_needed(db) returns True when migration is needed
+            migrateIter(db, cursor=None) generator that migrates one record per
+                iteration and yields str cursor that resumes iteration after
+                that record when passed back as cursor
+
+        Returns:
+            count (int): number of records migrated by this run
+
+        Parameters:
+            name (str): name of migration
+            mod (module): migration module
+            size (int | None): records per transaction. None means
+                .MigrationBatchSize
+        """
+        size = size if size is not None else self.MigrationBatchSize
+        cursor = self.migc.get(keys=(name,))
+        if cursor is None and not mod._check_if_needed(self):
+            print(f"{mod.__name__} migration not needed, database already in correct state")
+            return 0
+        if cursor is not None:
+            print(f"resuming migration {name} after {cursor}")
+
+        count = 0
+        while True:
+            try:
+                with self.batch():
+                    items = mod.migrateIter(self, cursor=cursor)
+                    cursors = list(itertools.islice(items, size))
+                    items.close()
+                    if cursors:
+                        self.migc.pin(keys=(name,), val=cursors[-1])
+            except lmdb.MapFullError:
+                if not self.grow():
+                    raise
+                continue  # redo batch from last committed cursor
+
+            count += len(cursors)
+            if cursors:
+                cursor = cursors[-1]
+                print(f"migration {name} migrated {count} records")
+            if len(cursors) < size:
+                break
+
+        self.migc.rem(keys=(name,))
+        logger.info("Migration %s migrated %d records of %s", name, count, self.path)
+        return count
+
     def clearEscrows(self):
         """
         Clear all escrows
@@ -1416,6 +1667,7 @@ class Baser(dbing.LMDBer):
          If the current database version is behind the current library version, check for migrations
             - If there are migrations to run, return False
             - If there are no migrations to run, reset database version to library version and return True
+            - If the only migrations to run are lazy (LAZY in their module), return True
          If the current database version is ahead of the current library version, raise exception
 
          """
@@ -1434,8 +1686,19 @@ class Baser(dbing.LMDBer):
         if self.migs.get(keys=(last[1][-1],)) is not None:
             return True
 
-        # We have migrations to run
-        return False
+        # Outstanding lazy migrations, whose records not yet migrated are still
+        # read correctly, do not keep the database from being used
+        for version, migrations in MIGRATIONS:
+            if self.version is not None and semver.compare(version, self.version) != 1:
+                continue
+            for migration in migrations:
+                if self.migs.get(keys=(migration,)) is not None:
+                    continue
+                mod = importlib.import_module(f"keri.db.migrations.{migration}")
+                if not getattr(mod, "LAZY", False):
+                    return False  # We have migrations to run
+
+        return True
 
     def complete(self, name=None):
         """ Returns list of tuples of migrations completed with date of completion
@@ -1471,13 +1734,18 @@ class Baser(dbing.LMDBer):
         Database usage should be offline during cleaning as it will be cloned in
         readonly mode
 
+        KELs are processed in order by one Kevery into the copy. They are not
+        processed in parallel since the copy has a single LMDB writer and a
+        delegated KEL needs the key state of its delegator in the same Kevery.
+
         """
         # create copy to clone into
         with openDB(name=self.name,
                     temp=False,
                     headDirPath=self.headDirPath,
                     perm=self.perm,
-                    clean=True) as copy:  # copy is Baser instance
+                    clean=True,
+                    sync=False) as copy:  # copy is Baser instance, bulk commits
 
             with reopenDB(db=self, reuse=True, readonly=True):  # reopen as readonly
                 if not os.path.exists(self.path):
@@ -1485,14 +1753,27 @@ class Baser(dbing.LMDBer):
                                      "".format(self.path))
                 kvy = eventing.Kevery(db=copy)  # promiscuous mode
 
-                # Revise in future to NOT parse msgs but to extract the processed
-                # objects so can pass directly to kvy.processEvent()
-                # need new method cloneObjAllPreIter()
-                # process event doesn't capture exceptions so we can more easily
-                # detect in the cloning that some events did not make it through
-                psr = parsing.Parser(kvy=kvy, version=Vrsn_1_0)
-                for msg in self.cloneAllPreIter():  # clone into copy
-                    psr.parseOne(ims=msg)
+                # extract the processed objects and pass them directly to
+                # kvy.processEvent() instead of serializing and reparsing msgs
+                # process event doesn't capture exceptions so count those that
+                # did not make it through
+                dropped = 0
+                for exts in self.cloneObjAllPreIter():  # clone into copy
+                    try:
+                        kvy.processEvent(**exts)
+                        if exts['cigars']:
+                            kvy.processAttachedReceiptCouples(**exts)
+                        if exts['trqs']:
+                            kvy.processAttachedReceiptQuadruples(**exts)
+                    except Exception as ex:  # escrowed or invalid
+                        dropped += 1
+                        logger.debug("Clean of event %s not accepted: %s",
+                                     exts['serder'].said, ex)
+
+                kvy.processEscrows()  # accept KELs cloned before their delegator
+                if dropped:
+                    logger.info("Clean of %s did not accept %d events on first pass",
+                                self.path, dropped)
 
                 # This is the list of non-set based databases that are not created as part of event processing.
                 # for now we are just copying them from self to copy without worrying about being able to
@@ -1559,6 +1840,8 @@ class Baser(dbing.LMDBer):
                 self.groups.clear()
                 self.groups.update(copy.groups)
 
+            copy.env.sync(True)  # flush deferred bulk commits before move
+
         # remove own db directory replace with clean clone copy
         if os.path.exists(self.path):
             shutil.rmtree(self.path)
@@ -1625,6 +1908,96 @@ class Baser(dbing.LMDBer):
             yield msg
 
 
+    def cloneObjPreIter(self, pre, fn=0):
+        """
+        Returns iterator of first seen events as dicts of processing objects for
+        the identifier prefix pre starting at first seen order number, fn.
+        Object level counterpart of .clonePreIter.
+
+        Parameters:
+            pre is bytes of itdentifier prefix
+            fn is int fn to resume replay. Earliset is fn=0
+
+        Returns:
+           exts (Iterator): over dicts from .cloneEvtObj of all items with pre
+                            starting at fn
+        """
+        if hasattr(pre, 'encode'):
+            pre = pre.encode("utf-8")
+
+        for _, fn, dig in self.getFelItemPreIter(pre, fn=fn):
+            try:
+                exts = self.cloneEvtObj(pre=pre, fn=fn, dig=dig)
+            except Exception:
+                continue  # skip this event
+            yield exts
+
+    def cloneObjAllPreIter(self):
+        """
+        Returns iterator of first seen events as dicts of processing objects for
+        all identifier prefixes. Object level counterpart of .cloneAllPreIter
+
+        Returns:
+           exts (Iterator): over dicts from .cloneEvtObj of all items in db
+        """
+        for pre, fn, dig in self.getFelItemAllPreIter():
+            try:
+                exts = self.cloneEvtObj(pre=pre, fn=fn, dig=dig)
+            except Exception:
+                continue  # skip this event
+            yield exts
+
+    def cloneEvtObj(self, pre, fn, dig):
+        """
+        Clones Event as the objects that the Parser would extract from the
+        message given by .cloneEvtMsg so they may be passed directly to
+        Kevery.processEvent without serializing and reparsing the message.
+
+        Parameters:
+            pre (bytes): identifier prefix of event
+            fn (int): first seen number (ordinal) of event
+            dig (bytes): digest of event
+
+        Returns:
+            exts (dict): keyword arguments of Kevery.processEvent,
+                .processAttachedReceiptCouples and
+                .processAttachedReceiptQuadruples with serder, sigers, wigers,
+                cigars, trqs, delseqner, delsaider, firner and dater
+        """
+        with self.snapshot():  # one consistent read of event and attachments
+            dgkey = dbing.dgKey(pre, dig)
+            if not (raw := self.getEvt(key=dgkey)):
+                raise kering.MissingEntryError("Missing event for dig={}.".format(dig))
+            serder = serdering.SerderKERI(raw=bytes(raw))
+
+            if not (sigs := self.getSigs(key=dgkey)):
+                raise kering.MissingEntryError("Missing sigs for dig={}.".format(dig))
+            sigers = [indexing.Siger(qb64b=bytes(sig)) for sig in sigs]
+            wigers = [indexing.Siger(qb64b=bytes(wig))
+                      for wig in self.getWigs(key=dgkey)]
+
+            delseqner = delsaider = None
+            if (couple := self.getAes(dgkey)) is not None:
+                delseqner, delsaider = eventing.deSourceCouple(couple)
+
+            trqs = [eventing.deTransReceiptQuadruple(quad)
+                    for quad in self.getVrcs(key=dgkey)]
+
+            cigars = []
+            for coup in self.getRcts(key=dgkey):
+                prefixer, cigar = eventing.deReceiptCouple(coup)
+                cigar.verfer = coring.Verfer(qb64b=prefixer.qb64b)
+                cigars.append(cigar)
+
+            if not (dts := self.getDts(key=dgkey)):
+                raise kering.MissingEntryError("Missing datetime for dig={}.".format(dig))
+
+            return dict(serder=serder, sigers=sigers, wigers=wigers,
+                        cigars=cigars, trqs=trqs,
+                        delseqner=delseqner, delsaider=delsaider,
+                        firner=coring.Seqner(sn=fn),
+                        dater=coring.Dater(dts=bytes(dts)))
+
     def cloneEvtMsg(self, pre, fn, dig):
         """
         Clones Event as Serialized CESR Message with Body and attached Foot
@@ -1637,68 +2010,69 @@ class Baser(dbing.LMDBer):
         Returns:
             bytearray: message body with attachments
         """
-        msg = bytearray()  # message
-        atc = bytearray()  # attachments
-        dgkey = dbing.dgKey(pre, dig)  # get message
-        if not (raw := self.getEvt(key=dgkey)):
-            raise kering.MissingEntryError("Missing event for dig={}.".format(dig))
-        msg.extend(raw)
-
-        # add indexed signatures to attachments
-        if not (sigs := self.getSigs(key=dgkey)):
-            raise kering.MissingEntryError("Missing sigs for dig={}.".format(dig))
-        atc.extend(core.Counter(code=core.Codens.ControllerIdxSigs,
-                                count=len(sigs), version=kering.Vrsn_1_0).qb64b)
-        for sig in sigs:
-            atc.extend(sig)
-
-        # add indexed witness signatures to attachments
-        if wigs := self.getWigs(key=dgkey):
-            atc.extend(core.Counter(code=core.Codens.WitnessIdxSigs,
-                                    count=len(wigs), version=kering.Vrsn_1_0).qb64b)
-            for wig in wigs:
-                atc.extend(wig)
-
-        # add authorizer (delegator/issuer) source seal event couple to attachments
-        couple = self.getAes(dgkey)
-        if couple is not None:
-            atc.extend(core.Counter(code=core.Codens.SealSourceCouples,
+        with self.snapshot():  # one consistent read of event and attachments
+            msg = bytearray()  # message
+            atc = bytearray()  # attachments
+            dgkey = dbing.dgKey(pre, dig)  # get message
+            if not (raw := self.getEvt(key=dgkey)):
+                raise kering.MissingEntryError("Missing event for dig={}.".format(dig))
+            msg.extend(raw)
+
+            # add indexed signatures to attachments
+            if not (sigs := self.getSigs(key=dgkey)):
+                raise kering.MissingEntryError("Missing sigs for dig={}.".format(dig))
+            atc.extend(core.Counter(code=core.Codens.ControllerIdxSigs,
+                                    count=len(sigs), version=kering.Vrsn_1_0).qb64b)
+            for sig in sigs:
+                atc.extend(sig)
+
+            # add indexed witness signatures to attachments
+            if wigs := self.getWigs(key=dgkey):
+                atc.extend(core.Counter(code=core.Codens.WitnessIdxSigs,
+                                        count=len(wigs), version=kering.Vrsn_1_0).qb64b)
+                for wig in wigs:
+                    atc.extend(wig)
+
+            # add authorizer (delegator/issuer) source seal event couple to attachments
+            couple = self.getAes(dgkey)
+            if couple is not None:
+                atc.extend(core.Counter(code=core.Codens.SealSourceCouples,
+                                        count=1, version=kering.Vrsn_1_0).qb64b)
+                atc.extend(couple)
+
+            # add trans endorsement quadruples to attachments not controller
+            # may have been originally key event attachments or receipted endorsements
+            if quads := self.getVrcs(key=dgkey):
+                atc.extend(core.Counter(code=core.Codens.TransReceiptQuadruples,
+                                        count=len(quads), version=kering.Vrsn_1_0).qb64b)
+                for quad in quads:
+                    atc.extend(quad)
+
+            # add nontrans endorsement couples to attachments not witnesses
+            # may have been originally key event attachments or receipted endorsements
+            if coups := self.getRcts(key=dgkey):
+                atc.extend(core.Counter(code=core.Codens.NonTransReceiptCouples,
+                                        count=len(coups), version=kering.Vrsn_1_0).qb64b)
+                for coup in coups:
+                    atc.extend(coup)
+
+            # add first seen replay couple to attachments
+            if not (dts := self.getDts(key=dgkey)):
+                raise kering.MissingEntryError("Missing datetime for dig={}.".format(dig))
+            atc.extend(core.Counter(code=core.Codens.FirstSeenReplayCouples,
                                     count=1, version=kering.Vrsn_1_0).qb64b)
-            atc.extend(couple)
-
-        # add trans endorsement quadruples to attachments not controller
-        # may have been originally key event attachments or receipted endorsements
-        if quads := self.getVrcs(key=dgkey):
-            atc.extend(core.Counter(code=core.Codens.TransReceiptQuadruples,
-                                    count=len(quads), version=kering.Vrsn_1_0).qb64b)
-            for quad in quads:
-                atc.extend(quad)
-
-        # add nontrans endorsement couples to attachments not witnesses
-        # may have been originally key event attachments or receipted endorsements
-        if coups := self.getRcts(key=dgkey):
-            atc.extend(core.Counter(code=core.Codens.NonTransReceiptCouples,
-                                    count=len(coups), version=kering.Vrsn_1_0).qb64b)
-            for coup in coups:
-                atc.extend(coup)
-
-        # add first seen replay couple to attachments
-        if not (dts := self.getDts(key=dgkey)):
-            raise kering.MissingEntryError("Missing datetime for dig={}.".format(dig))
-        atc.extend(core.Counter(code=core.Codens.FirstSeenReplayCouples,
-                                count=1, version=kering.Vrsn_1_0).qb64b)
-        atc.extend(core.Number(num=fn, code=core.NumDex.Huge).qb64b)  # may not need to be Huge
-        atc.extend(coring.Dater(dts=bytes(dts)).qb64b)
-
-        # prepend pipelining counter to attachments
-        if len(atc) % 4:
-            raise ValueError("Invalid attachments size={}, nonintegral"
-                             " quadlets.".format(len(atc)))
-        pcnt = core.Counter(code=core.Codens.AttachmentGroup,
-                            count=(len(atc) // 4), version=kering.Vrsn_1_0).qb64b
-        msg.extend(pcnt)
-        msg.extend(atc)
-        return msg
+            atc.extend(core.Number(num=fn, code=core.NumDex.Huge).qb64b)  # may not need to be Huge
+            atc.extend(coring.Dater(dts=bytes(dts)).qb64b)
+
+            # prepend pipelining counter to attachments
+            if len(atc) % 4:
+                raise ValueError("Invalid attachments size={}, nonintegral"
+                                 " quadlets.".format(len(atc)))
+            pcnt = core.Counter(code=core.Codens.AttachmentGroup,
+                                count=(len(atc) // 4), version=kering.Vrsn_1_0).qb64b
+            msg.extend(pcnt)
+            msg.extend(atc)
+            return msg
 
     def cloneDelegation(self, kever):
         """
@@ -1735,15 +2109,9 @@ class Baser(dbing.LMDBer):
         if tuple(seal) != eventing.SealEvent._fields:  # wrong type of seal
             return None
 
-        seal = eventing.SealEvent(**seal)  #convert to namedtuple
-
-        for evt in self.getEvtPreIter(pre=pre, sn=sn):  # includes disputed & superseded
-            srdr = serdering.SerderKERI(raw=evt.tobytes())
-            for eseal in srdr.seals or []:  # or [] for seals 'a' field missing
-                if tuple(eseal) == eventing.SealEvent._fields:
-                    eseal = eventing.SealEvent(**eseal)  # convert to namedtuple
-                    if seal == eseal and self.fullyWitnessed(srdr):
-                        return srdr
+        for srdr in self.fetchSealingEvents(pre=pre, seal=seal, sn=sn):  # includes disputed & superseded
+            if self.fullyWitnessed(srdr):
+                return srdr
         return None
 
     # use alias here until can change everywhere for  backwards compatibility
@@ -1773,15 +2141,9 @@ class Baser(dbing.LMDBer):
         if tuple(seal) != eventing.SealEvent._fields:  # wrong type of seal
             return None
 
-        seal = eventing.SealEvent(**seal)  #convert to namedtuple
-
-        for evt in self.getEvtLastPreIter(pre=pre, sn=sn):  # no disputed or superseded
-            srdr = serdering.SerderKERI(raw=evt.tobytes())
-            for eseal in srdr.seals or []:  # or [] for seals 'a' field missing
-                if tuple(eseal) == eventing.SealEvent._fields:
-                    eseal = eventing.SealEvent(**eseal)  # convert to namedtuple
-                    if seal == eseal and self.fullyWitnessed(srdr):
-                        return srdr
+        for srdr in self.fetchSealingEvents(pre=pre, seal=seal, sn=sn, last=True):  # no disputed or superseded
+            if self.fullyWitnessed(srdr):
+                return srdr
         return None
 
 
@@ -1802,18 +2164,71 @@ class Baser(dbing.LMDBer):
             sn (int): beginning sn to search
 
         """
-        # create generic Seal namedtuple class using keys from provided seal dict
-        Seal = namedtuple('Seal', list(seal))  # matching type
-
-        for evt in self.getEvtLastPreIter(pre=pre, sn=sn):  # only last evt at sn
-            srdr = serdering.SerderKERI(raw=evt.tobytes())
-            for eseal in srdr.seals or []:  # or [] for seals 'a' field missing
-                if tuple(eseal) == Seal._fields:  # same type of seal
-                    eseal = Seal(**eseal)  #convert to namedtuple
-                    if seal == eseal and self.fullyWitnessed(srdr):
-                        return srdr
+        for srdr in self.fetchSealingEvents(pre=pre, seal=seal, sn=sn, last=True):  # only last evt at sn
+            if self.fullyWitnessed(srdr):
+                return srdr
         return None
 
+    @property
+    def sealsIndexed(self):
+        """
+        Returns:
+            indexed (bool): True when .seals indexes the anchored seals of all
+                accepted events, that is the database had no KEL events when
+                first opened with .seals or the index_anchored_seals migration
+                has backfilled it
+        """
+        return self.migs.get(keys=(SealsMigration,)) is not None
+
+    def fetchSealingEvents(self, pre, seal, sn=0, last=False):
+        """
+        Iterate over the events in KEL of pre that anchor seal using the .seals
+        index instead of walking and deserializing every event from sn forward.
+        Walks the KEL instead until the index has been backfilled. See
+        .sealsIndexed
+
+        Returns:
+            srdrs (Iterator): of SerderKERI of each accepted event at or after sn
+                whose anchored seals include seal in sn order. Disputed and
+                superseded events at the same sn are in insertion order.
+
+        Parameters:
+            pre (bytes|str): identifier of the KEL to search
+            seal (dict): dict form of Seal of any type to find in anchored
+                seals list of each event
+            sn (int): beginning sn to search
+            last (bool): True means only last event at each sn so does not
+                include disputed or superseded events
+        """
+        if hasattr(pre, "decode"):
+            pre = pre.decode("utf-8")
+
+        # seal labels must match in order and stringify like the anchored seal
+        seal = dict(seal)
+        if not self.sealsIndexed:  # index may miss seals of events logged before it
+            evts = (self.getEvtLastPreIter(pre=pre, sn=sn) if last
+                    else self.getEvtPreIter(pre=pre, sn=sn))
+            for evt in evts:
+                srdr = serdering.SerderKERI(raw=evt.tobytes())
+                for eseal in srdr.seals or []:  # or [] for seals 'a' field missing
+                    if tuple(eseal) == tuple(seal) and eseal == seal:
+                        yield srdr
+                        break
+            return
+
+        anchors = [(seqner.sn, saider.qb64) for seqner, saider
+                   in self.seals.get(keys=(pre, sealDigest(seal)))
+                   if seqner.sn >= sn]
+        for esn, said in sorted(anchors, key=lambda anchor: anchor[0]):  # stable
+            if last and ((dig := self.getKeLast(dbing.snKey(pre, esn))) is None
+                         or bytes(dig).decode("utf-8") != said):
+                continue  # not last event at esn
+            if (raw := self.getEvt(dbing.dgKey(pre, said))) is None:
+                continue  # skip missing event
+            srdr = serdering.SerderKERI(raw=bytes(raw))
+            if seal in (srdr.seals or []):  # or [] for seals 'a' field missing
+                yield srdr
+
     def signingMembers(self, pre: str):
         """ Find signing members of a multisig group aid.
 
@@ -1882,24 +2297,15 @@ class Baser(dbing.LMDBer):
         prefixer = coring.Prefixer(qb64=pre)
         if prefixer.transferable:
             # receipted event and receipter in database so get receipter est evt
-            # retrieve dig of last event at sn of est evt of receipter.
-            sdig = self.getKeLast(key=dbing.snKey(pre=prefixer.qb64b,
-                                                  sn=sn))
-            if sdig is None:
+            if (verifiers := self.fetchVerifiers(pre=prefixer.qb64, sn=sn)) is None:
                 # receipter's est event not yet in receipters's KEL
                 raise kering.ValidationError("key event sn {} for pre {} is not yet in KEL"
                                              "".format(sn, pre))
-            # retrieve last event itself of receipter est evt from sdig
-            sraw = self.getEvt(key=dbing.dgKey(pre=prefixer.qb64b, dig=bytes(sdig)))
-            # assumes db ensures that sraw must not be none because sdig was in KE
-            sserder = serdering.SerderKERI(raw=bytes(sraw))
-            if dig is not None and not sserder.compare(said=dig):  # endorser's dig not match event
+            said, tholder, verfers = verifiers
+            if dig is not None and said != dig:  # endorser's dig not match event
                 raise kering.ValidationError("Bad proof sig group at sn = {}"
-                                             " for ksn = {}."
-                                             "".format(sn, sserder.sad))
-
-            verfers = sserder.verfers
-            tholder = sserder.tholder
+                                             " for said = {}."
+                                             "".format(sn, said))
 
         else:
             verfers = [coring.Verfer(qb64=pre)]
@@ -1907,6 +2313,35 @@ class Baser(dbing.LMDBer):
 
         return tholder, verfers
 
+    def fetchVerifiers(self, pre, sn):
+        """
+        Returns the SAID, Tholder and Verfers of the last event at sn in the KEL
+        of transferable pre from .verifiers when cached otherwise from the
+        database caching them.
+
+        Parameters:
+            pre (str): qb64 of transferable identifier prefix
+            sn (int): sequence number of est event
+
+        Returns:
+            verifiers (tuple | None): (said, tholder, verfers) of event where
+                said is qb64 str, tholder is Tholder and verfers is list of
+                Verfer or None when no event at sn in KEL yet
+        """
+        key = (pre, sn)
+        if (verifiers := self.verifiers.get(key)) is caching.LRUCache.Missing:
+            # retrieve dig of last event at sn
+            if (sdig := self.getKeLast(key=dbing.snKey(pre=pre, sn=sn))) is None:
+                return None  # do not cache absence since event may be logged
+            # assumes db ensures that sraw must not be none because sdig was in KE
+            sraw = self.getEvt(key=dbing.dgKey(pre=pre, dig=bytes(sdig)))
+            sserder = serdering.SerderKERI(raw=bytes(sraw))
+            verifiers = (sserder.said, sserder.tholder, sserder.verfers)
+            self.verifiers.put(key, verifiers)
+
+        said, tholder, verfers = verifiers
+        return said, tholder, list(verfers)  # copy so cached list not mutated
+
     def putEvt(self, key, val):
         """
         Use dgKey()
@@ -2239,7 +2674,9 @@ class Baser(dbing.LMDBer):
         Apparently always returns True (is this how .put works with dupsort=True)
         Duplicates are inserted in lexocographic order not insertion order.
         """
-        return self.putVals(self.wigs, key, vals)
+        result = self.putVals(self.wigs, key, vals)
+        self.noticeWigs(key)
+        return result
 
     def addWig(self, key, val):
         """
@@ -2249,7 +2686,9 @@ class Baser(dbing.LMDBer):
         Returns True if written else False if dup val already exists
         Duplicates are inserted in lexocographic order not insertion order.
         """
-        return self.addVal(self.wigs, key, val)
+        if result := self.addVal(self.wigs, key, val):
+            self.noticeWigs(key)
+        return result
 
     def cntWigs(self, key):
         """
@@ -2265,7 +2704,42 @@ class Baser(dbing.LMDBer):
         Deletes all values at key if val = b'' else deletes dup val = val.
         Returns True If key exists in database (or key, val if val not b'') Else False
         """
-        return self.delVals(self.wigs, key, val)
+        if result := self.delVals(self.wigs, key, val):
+            self.noticeWigs(key)
+        return result
+
+    def watchWigs(self, key, need):
+        """
+        Use dgKey()
+        Returns WigWatch of witness signatures of event at key that is done once
+        need witness signatures are stored. Caller must .unwatchWigs when done.
+
+        Parameters:
+            key (bytes): dgKey of event
+            need (int): number of witness signatures that completes event
+        """
+        watch = WigWatch(key=bytes(key), need=need, count=self.cntWigs(key))
+        self.wigWatches.setdefault(watch.key, []).append(watch)
+        return watch
+
+    def unwatchWigs(self, watch):
+        """
+        Stop updating WigWatch watch
+        """
+        if (watches := self.wigWatches.get(watch.key)) is not None and watch in watches:
+            watches.remove(watch)
+            if not watches:
+                del self.wigWatches[watch.key]
+
+    def noticeWigs(self, key):
+        """
+        Use dgKey()
+        Update count of each WigWatch of event at key after .wigs written at key
+        """
+        if (watches := self.wigWatches.get(bytes(key))) is not None:
+            count = self.cntWigs(key)
+            for watch in watches:
+                watch.count = count
 
     def putRcts(self, key, vals):
         """
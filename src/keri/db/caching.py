@@ -0,0 +1,138 @@
+# -*- encoding: utf-8 -*-
+"""
+KERI
+keri.db.caching module
+
+Read through LRU caching of the deserialized values of sub dbs.
+
+CacheMixin is mixed ahead of a Suber or Komer class to make a cached variant
+of it such as subing.CacheSuber or koming.CacheKomer. Writes through the same
+instance invalidate the cache so it stays coherent with the sub db. Writes to
+the same sub db made any other way, such as through another instance, another
+process or the LMDBer methods directly, are not seen until evicted.
+"""
+from collections import OrderedDict
+
+
+class LRUCache:
+    """
+    Bounded least recently used mapping with hit, miss and eviction counts
+
+    Attributes:
+        capacity (int): maximum number of entries held
+        hits (int): number of lookups found in cache
+        misses (int): number of lookups not found in cache
+        evictions (int): number of entries evicted to stay within capacity
+    """
+    Missing = object()  # sentinel of lookup not found
+
+    def __init__(self, capacity=1024):
+        """
+        Parameters:
+            capacity (int): maximum number of entries held
+        """
+        self.capacity = capacity
+        self.hits = 0
+        self.misses = 0
+        self.evictions = 0
+        self._entries = OrderedDict()
+
+    def __len__(self):
+        return len(self._entries)
+
+    def get(self, key):
+        """
+        Returns:
+            val: cached at key and marks it most recently used or .Missing
+        """
+        try:
+            val = self._entries[key]
+        except KeyError:
+            self.misses += 1
+            return self.Missing
+        self._entries.move_to_end(key)
+        self.hits += 1
+        return val
+
+    def put(self, key, val):
+        """ Caches val at key evicting least recently used entries over capacity """
+        if self.capacity <= 0:
+            return
+        self._entries[key] = val
+        self._entries.move_to_end(key)
+        while len(self._entries) > self.capacity:
+            self._entries.popitem(last=False)
+            self.evictions += 1
+
+    def remove(self, key):
+        """ Removes entry at key if any """
+        self._entries.pop(key, None)
+
+    def clear(self):
+        """ Removes all entries """
+        self._entries.clear()
+
+    def stats(self):
+        """
+        Returns:
+            stats (dict): size, capacity, hits, misses and evictions of cache
+        """
+        return dict(size=len(self), capacity=self.capacity, hits=self.hits,
+                    misses=self.misses, evictions=self.evictions)
+
+
+class CacheMixin:
+    """
+    Mixin of read through LRU cache of deserialized values for sub db classes
+    with put, pin, get, rem and trim methods keyed by ._tokey such as Suber
+    and Komer. Must precede the sub db class in the bases of the cached class.
+
+    Values are cached as returned by get of the sub db class so must not be
+    mutated by callers. See ._cached for classes whose values are mutable.
+
+    Attributes:
+        cache (LRUCache): cached values keyed by db key
+    """
+
+    def __init__(self, *pa, capacity: int = 1024, **kwa):
+        """
+        Parameters:
+            capacity (int): maximum number of values cached
+        """
+        super(CacheMixin, self).__init__(*pa, **kwa)
+        self.cache = LRUCache(capacity=capacity)
+
+    def _cached(self, val):
+        """ Returns val to give caller from cached val. Override to copy. """
+        return val
+
+    def put(self, keys, val, **kwa):
+        self.cache.remove(self._tokey(keys))
+        return super(CacheMixin, self).put(keys, val, **kwa)
+
+    def pin(self, keys, val, **kwa):
+        self.cache.remove(self._tokey(keys))
+        return super(CacheMixin, self).pin(keys, val, **kwa)
+
+    def get(self, keys):
+        key = self._tokey(keys)
+        if (val := self.cache.get(key)) is LRUCache.Missing:
+            if (val := super(CacheMixin, self).get(keys)) is None:
+                return None  # do not cache absence since may be put elsewhere
+            self.cache.put(key, val)
+        return self._cached(val)
+
+    def rem(self, keys, **kwa):
+        self.cache.remove(self._tokey(keys))
+        return super(CacheMixin, self).rem(keys, **kwa)
+
+    def trim(self, *pa, **kwa):
+        self.cache.clear()
+        return super(CacheMixin, self).trim(*pa, **kwa)
+
+    def stats(self):
+        """
+        Returns:
+            stats (dict): size, capacity, hits, misses and evictions of cache
+        """
+        return self.cache.stats()
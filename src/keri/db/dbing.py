@@ -45,11 +45,13 @@ l
 
 """
 
+import functools
 import os
 import platform
 import shutil
 import stat
 import tempfile
+import threading
 from collections import abc
 from contextlib import contextmanager
 from typing import Union
@@ -59,9 +61,14 @@ from ordered_set import OrderedSet as oset
 from hio.base import filing
 
 import keri
+from .. import help
+from . import caching
 from ..kering import MaxON  # maximum ordinal number for seqence or first seen
+from ..kering import DatabaseError
 from ..help import helping
 
+logger = help.ogler.getLogger()
+
 ProemSize = 32  # does not include trailing separator
 MaxProem = int("f"*(ProemSize), 16)
 SuffixSize = 32  # does not include trailing separator
@@ -204,6 +211,22 @@ def splitKeyDT(key):
     return (pre, dt)
 
 
+def topEnd(top: bytes):
+    """
+    Returns:
+        end (bytes | None): least key greater than every key that starts with
+            top key space prefix. None when there is no such key because top
+            is empty or all 0xff bytes.
+
+    Parameters:
+        top (bytes): key space prefix
+    """
+    top = bytes(top).rstrip(b'\xff')
+    if not top:
+        return None
+    return top[:-1] + bytes([top[-1] + 1])
+
+
 def suffix(key: Union[bytes, str, memoryview], ion: int, *, sep: Union[bytes, str]=b'.'):
     """
     Returns:
@@ -292,6 +315,132 @@ def openLMDB(*, cls=None, name="test", temp=True, **kwa):
             lmdber.close(clear=lmdber.temp)  # clears if lmdber.temp
 
 
+class Txner:
+    """
+    Context manager of one lmdb.Transaction that counts as active on its
+    LMDBer while entered. LMDB may only remap, that is resize, its memory map
+    when no transaction of this process is active, otherwise open readers
+    fault on access to the old mapping.
+    """
+    __slots__ = ("lmdber", "txn")
+
+    def __init__(self, lmdber, txn):
+        self.lmdber = lmdber
+        self.txn = txn
+
+    def __enter__(self):
+        self.lmdber.active += 1
+        return self.txn.__enter__()
+
+    def __exit__(self, *exc):
+        try:
+            return self.txn.__exit__(*exc)
+        finally:
+            self.lmdber.active -= 1
+
+
+class Viewer:
+    """
+    Context manager stand in for a transaction of one sub db that reads, and
+    writes, through the shared transaction of LMDBer.snapshot or LMDBer.batch
+    instead of beginning its own. Leaves the shared transaction open on exit.
+    Provides the subset of lmdb.Transaction used by LMDBer methods.
+    """
+    __slots__ = ("txn", "db")
+
+    def __init__(self, txn, db=None):
+        self.txn = txn
+        self.db = db
+
+    def __enter__(self):
+        return self
+
+    def __exit__(self, *exc):
+        return False
+
+    def get(self, key, default=None):
+        return self.txn.get(key, default, db=self.db)
+
+    def cursor(self):
+        return self.txn.cursor(db=self.db)
+
+    def stat(self, db):
+        return self.txn.stat(db)
+
+    def put(self, key, value, **kwa):
+        return self.txn.put(key, value, db=self.db, **kwa)
+
+    def delete(self, key, value=b''):
+        return self.txn.delete(key, value, db=self.db)
+
+
+class TrafficMeter:
+    """
+    Sampled counts of the read and write transactions begun on each sub db of
+    an LMDBer. Counts one in every .every transactions and scales by .every
+    so the cost of counting stays small on hot paths.
+
+    Attributes:
+        every (int): sample one in every transactions
+        names (dict): sub db name keyed by id of its lmdb handle
+        ticks (int): number of transactions seen
+        reads (dict): sampled count of read transactions keyed by sub db name
+        writes (dict): sampled count of write transactions keyed by sub db name
+    """
+
+    def __init__(self, names=None, every=1):
+        """
+        Parameters:
+            names (dict): sub db name keyed by id of its lmdb handle
+            every (int): sample one in every transactions
+        """
+        self.every = max(1, int(every))
+        self.names = names if names is not None else dict()
+        self.ticks = 0
+        self.reads = dict()
+        self.writes = dict()
+
+    def tick(self, db=None, write=False):
+        """ Counts transaction on lmdb handle db when sampled """
+        self.ticks += 1
+        if self.ticks % self.every:
+            return
+        name = self.names.get(id(db), "") if db is not None else ""
+        tally = self.writes if write else self.reads
+        tally[name] = tally.get(name, 0) + self.every
+
+    def stats(self):
+        """
+        Returns:
+            stats (dict): dict of reads and writes keyed by sub db name. ""
+                is the main db or an unnamed sub db
+        """
+        return {name: dict(reads=self.reads.get(name, 0),
+                           writes=self.writes.get(name, 0))
+                for name in sorted(set(self.reads) | set(self.writes))}
+
+
+def growing(f):
+    """
+    Decorator of LMDBer methods that each write in one transaction. When the
+    write fails because the memory map is full or was grown by another process
+    the aborted transaction is retried after resizing the map. Retries stop
+    when the map can not grow so the error is raised.
+    """
+    @functools.wraps(f)
+    def wrapper(self, *pa, **kwa):
+        while True:
+            try:
+                return f(self, *pa, **kwa)
+            except lmdb.MapResizedError:
+                if not self.grow(size=0):  # adopt size set by other process
+                    raise
+            except lmdb.MapFullError:
+                if not self.grow():
+                    raise
+    return wrapper
+
+
 class LMDBer(filing.Filer):
     """
     LBDBer base class for LMDB manager instances.
@@ -315,8 +464,25 @@ class LMDBer(filing.Filer):
     Attributes:
         env (lmdb.env): LMDB main (super) database environment
         readonly (bool): True means open LMDB env as readonly
+        sync (bool): True means flush buffers to disk on each commit
+                     False means defer flush to .env.sync() or close
+        active (int): count of transactions begun by .begin and not yet ended
+        local (threading.local): per thread .txn of open .snapshot if any
+            and .wtxn of open .batch if any
+        traffic (TrafficMeter | None): sampled transaction counts per sub db
+            when profiled by .profile
 
     Properties:
+        mapSize (int): current size in bytes of LMDB memory map
+        mapUsed (int): bytes of memory map used by pages in use
+
+    Map Growth Notes:
+        .MapSize is only the initial size of the memory map. Each write method
+        grows the map by .MapGrowth and retries when the map is full. The map
+        is also grown ahead of need when a write begins with .mapUsed over
+        .MapFill of .mapSize and no other transaction is active. .MaxMapSize
+        when not None caps the growth. The map is never resized while a
+        transaction from .begin is active so an open iterator blocks growth.
 
     File/Directory Creation Mode Notes:
         .Perm provides default restricted access permissions to directory and/or files
@@ -343,8 +509,11 @@ class LMDBer(filing.Filer):
     Perm = stat.S_ISVTX | stat.S_IRUSR | stat.S_IWUSR | stat.S_IXUSR  # 0o1700==960
     MaxNamedDBs = 96
     MapSize = 104857600
+    MapGrowth = 2  # factor by which map grows when full
+    MapFill = 0.8  # fraction of map used after which map grows ahead of need
+    MaxMapSize = None  # None means unlimited growth
 
-    def __init__(self, readonly=False, **kwa):
+    def __init__(self, readonly=False, sync=True, **kwa):
         """
         Setup main database directory at .dirpath.
         Create main database environment at .env using .path.
@@ -378,15 +547,22 @@ class LMDBer(filing.Filer):
 
             readonly (bool): True means open database in readonly mode
                                 False means open database in read/write mode
+            sync (bool): True means flush buffers to disk on each commit
+                         False means defer flush so bulk writes commit faster
+                         at the risk of losing the latest commits on crash
 
         """
 
         self.env = None
+        self.active = 0
+        self.local = threading.local()
+        self.traffic = None
         self._version = None
         self.readonly = True if readonly else False
+        self.sync = True if sync else False
         super(LMDBer, self).__init__(**kwa)
 
-    def reopen(self, readonly=False, **kwa):
+    def reopen(self, readonly=False, sync=None, **kwa):
         """
         Open if closed or close and reopen if opened or create and open if not
         if not preexistent, directory path for lmdb at .path and then
@@ -410,16 +586,22 @@ class LMDBer(filing.Filer):
             fext (str): File extension when .filed
             readonly (bool): True means open database in readonly mode
                                 False means open database in read/write mode
+            sync (bool | None): True means flush buffers to disk on each commit
+                                False means defer flush
+                                None means keep .sync
         """
         exists = self.exists(name=self.name, base=self.base)
         opened = super(LMDBer, self).reopen(**kwa)
         if readonly is not None:
             self.readonly = readonly
+        if sync is not None:
+            self.sync = sync
 
         # open lmdb major database instance
         # creates files data.mdb and lock.mdb in .dbDirPath
         self.env = lmdb.open(self.path, max_dbs=self.MaxNamedDBs, map_size=self.MapSize,
-                             mode=self.perm, readonly=self.readonly)
+                             mode=self.perm, readonly=self.readonly,
+                             sync=self.sync)
 
         self.opened = True if opened and self.env else False
 
@@ -457,6 +639,279 @@ class LMDBer(filing.Filer):
         self._version = val
         self.setVer(self._version)
 
+    @property
+    def mapSize(self):
+        """ Returns current size in bytes of LMDB memory map """
+        return self.env.info()["map_size"]
+
+    @property
+    def mapUsed(self):
+        """ Returns bytes of LMDB memory map used by pages in use """
+        return (self.env.info()["last_pgno"] + 1) * self.env.stat()["psize"]
+
+    def grow(self, size=None):
+        """
+        Grows LMDB memory map to size bytes. Only grows when no transaction of
+        this process is active since remapping under an open reader is unsafe.
+
+        Returns:
+            result (bool): True if map resized, False otherwise
+
+        Parameters:
+            size (int | None): new size in bytes. None means grow current size
+                by .MapGrowth capped by .MaxMapSize. 0 means adopt size set
+                by another process
+        """
+        if self.env is None or self.readonly or self.active:
+            return False
+
+        current = self.mapSize
+        if size is None:
+            size = int(current * self.MapGrowth)
+            if self.MaxMapSize is not None:
+                size = min(size, self.MaxMapSize)
+            if size <= current:
+                return False
+
+        self.env.set_mapsize(size)
+        logger.info("Resized LMDB map of %s from %d to %d bytes.", self.path,
+                    current, self.mapSize)
+        return True
+
+    def begin(self, **kwa):
+        """
+        Returns context manager of lmdb transaction of .env that counts as
+        active while entered. Parameters are those of lmdb.Environment.begin.
+        Grows memory map ahead of need before beginning a write when no other
+        transaction is active and .mapUsed is over .MapFill of .mapSize.
+        Buffered reads within a .snapshot of this thread read through its
+        shared transaction instead of beginning their own. Writes and buffered
+        reads within a .batch of this thread go through its shared write
+        transaction.
+        """
+        if self.traffic is not None:
+            self.traffic.tick(kwa.get("db"), kwa.get("write", False))
+        if ((kwa.get("write") or kwa.get("buffers"))
+                and (txn := getattr(self.local, "wtxn", None)) is not None):
+            return Viewer(txn, db=kwa.get("db"))
+        if kwa.get("write"):
+            if not self.active and self.mapUsed > self.MapFill * self.mapSize:
+                self.grow()
+        elif kwa.get("buffers") and (txn := getattr(self.local, "txn", None)) is not None:
+            return Viewer(txn, db=kwa.get("db"))
+        return Txner(self, self.env.begin(**kwa))
+
+    @contextmanager
+    def snapshot(self):
+        """
+        Context manager that binds one read only transaction to this thread.
+        Every getter of this LMDBer, and so of its Subers and Komers, called
+        from this thread within the context reads through that transaction.
+        So multi-key reads see one consistent state of the database and do
+        not pay for a transaction each. Nested snapshots share the outermost.
+
+        Writes within the context are not seen by reads within the context.
+        Iterators must be consumed before the context exits. The memory map
+        does not grow while a snapshot is open.
+
+        Usage:
+            with db.snapshot():
+                evt = db.getEvt(key)
+                sigs = db.getSigs(key)
+        """
+        if getattr(self.local, "txn", None) is not None:
+            yield self.local.txn  # nested so share outer
+            return
+
+        with self.begin(buffers=True) as txn:
+            self.local.txn = txn
+            try:
+                yield txn
+            finally:
+                self.local.txn = None
+
+    @contextmanager
+    def batch(self):
+        """
+        Context manager that binds one write transaction to this thread. Every
+        write and getter of this LMDBer, and so of its Subers and Komers,
+        called from this thread within the context goes through that
+        transaction. So the writes commit together, with one sync, on exit or
+        abort together on error. Reads within the context see its writes.
+        Nested batches share the outermost.
+
+        A batch blocks writers of other threads and processes until it exits
+        so keep batches bounded. The memory map does not grow while a batch is
+        open so a batch that fills the map raises lmdb.MapFullError. Retry it
+        after .grow. On abort the cached values of Subers and Komers of this
+        LMDBer are cleared as they may have been read from aborted writes.
+
+        Usage:
+            with db.batch():
+                for key, val in items:
+                    db.setVal(db=sdb, key=key, val=val)
+        """
+        if getattr(self.local, "wtxn", None) is not None:
+            yield self.local.wtxn  # nested so share outer
+            return
+
+        if not self.active and self.mapUsed > self.MapFill * self.mapSize:
+            self.grow()
+        try:
+            with Txner(self, self.env.begin(write=True, buffers=True)) as txn:
+                self.local.wtxn = txn
+                try:
+                    yield txn
+                finally:
+                    self.local.wtxn = None
+        except BaseException:
+            for val in list(vars(self).values()):
+                if isinstance(val, caching.LRUCache):
+                    val.clear()
+                elif isinstance(getattr(val, "cache", None), caching.LRUCache):
+                    val.cache.clear()
+            raise
+
+    def stats(self):
+        """
+        Storage statistics of each named sub db from its LMDB stat.
+
+        Returns:
+            stats (dict): stats dict keyed by name of each named sub db with
+                entries, depth, branch, leaf and overflow page counts, bytes
+                of those pages and dupsort. When profiled by .profile also
+                sampled reads and writes
+        """
+        traffic = self.traffic.stats() if self.traffic is not None else None
+        stats = dict()
+        with self.begin() as txn:
+            psize = txn.stat(self.env.open_db(key=None, txn=txn))["psize"]
+            for key, _ in list(txn.cursor()):  # main db keys are sub db names
+                try:
+                    sdb = self.env.open_db(key=key, txn=txn, create=False)
+                except lmdb.IncompatibleError:  # plain value such as __version__
+                    continue
+                stat = txn.stat(sdb)
+                pages = stat["branch_pages"] + stat["leaf_pages"] + stat["overflow_pages"]
+                name = bytes(key).decode("utf-8")
+                stats[name] = dict(entries=stat["entries"],
+                                   depth=stat["depth"],
+                                   branch=stat["branch_pages"],
+                                   leaf=stat["leaf_pages"],
+                                   overflow=stat["overflow_pages"],
+                                   bytes=pages * psize,
+                                   dupsort=sdb.flags(txn)["dupsort"])
+                if traffic is not None:
+                    stats[name].update(traffic.get(name, dict(reads=0, writes=0)))
+        return stats
+
+    def profile(self, every=1):
+        """
+        Starts sampled counting of the read and write transactions of each sub
+        db into .traffic. Sub dbs are named from the lmdb handles held by the
+        attributes of this LMDBer. Raw handles are named by attribute name
+        plus "." which is the convention for their keys. Subers and Komers,
+        also when held by an attribute object such as a Broker, are named by
+        their subkey.
+
+        Returns:
+            traffic (TrafficMeter | None): started meter at .traffic
+
+        Parameters:
+            every (int): sample one in every transactions. 0 means stop
+        """
+        if not every:
+            self.traffic = None
+            return None
+
+        names = dict()
+        for attr, val in vars(self).items():
+            if isinstance(val, lmdb._Database):
+                names[id(val)] = f"{attr}."
+            elif (subkey := getattr(val, "subkey", None)) is not None:
+                names[id(val.sdb)] = subkey
+            elif hasattr(val, "__dict__") and not isinstance(val, LMDBer):
+                for v in vars(val).values():  # one level such as Broker
+                    if (subkey := getattr(v, "subkey", None)) is not None:
+                        names[id(v.sdb)] = subkey
+
+        self.traffic = TrafficMeter(names=names, every=every)
+        return self.traffic
+
+    def backup(self, path=None, fd=None, compact=True):
+        """
+        Online point in time backup of LMDB at .env to directory path or to
+        open file descriptor fd. Copies within one read transaction so the
+        backup is consistent while other threads and processes keep reading
+        and writing. Compaction omits free pages and renumbers the rest so
+        the backup is as small as its contents.
+
+        Returns:
+            path (str | None): directory of backup that is itself openable as
+                LMDB environment. None when backed up to fd
+
+        Parameters:
+            path (str | None): directory to write backup data.mdb into, made
+                when missing
+            fd (int | None): open file descriptor to stream backup to such as
+                of file or pipe. Only one of path or fd.
+            compact (bool): True means compact backup
+                            False means copy pages as is which is faster
+        """
+        if (path is None) == (fd is None):
+            raise ValueError("Backup requires one of path or fd.")
+        if self.env is None:
+            raise DatabaseError(f"Can not backup unopened database {self.name}.")
+
+        with self.begin() as txn:  # point in time and holds map from growing
+            txn = txn if compact else None  # lmdb copies from txn only compact
+            if path is not None:
+                os.makedirs(path, exist_ok=True)
+                self.env.copy(path, compact=compact, txn=txn)
+            else:
+                self.env.copyfd(fd, compact=compact, txn=txn)
+
+        return path
+
+    def restore(self, path=None, fd=None):
+        """
+        Replace LMDB at .path with backup from .backup read from directory
+        path or open file descriptor fd then reopen. The database, when not
+        yet created, is created. Other processes must not have the database
+        open while restoring.
+
+        Returns:
+            opened (bool): True means reopened on restored database
+
+        Parameters:
+            path (str | None): backup directory with data.mdb or backup file
+            fd (int | None): open file descriptor to read backup from. Only
+                one of path or fd.
+        """
+        if (path is None) == (fd is None):
+            raise ValueError("Restore requires one of path or fd.")
+        if self.active:
+            raise DatabaseError(f"Can not restore {self.name} with active"
+                                f" transactions.")
+        if path is not None and os.path.isdir(path):
+            path = os.path.join(path, "data.mdb")
+
+        readonly = self.readonly
+        if not self.opened:
+            self.reopen(readonly=False)  # makes .path when missing
+        self.close()
+
+        data = os.path.join(self.path, "data.mdb")
+        part = data + ".restore"
+        if path is not None:
+            shutil.copyfile(path, part)
+        else:
+            with os.fdopen(os.dup(fd), "rb") as src, open(part, "wb") as dst:
+                shutil.copyfileobj(src, dst)
+        os.replace(part, data)  # atomic so never left with partial data.mdb
+
+        return self.reopen(reuse=True, readonly=readonly)
+
     def close(self, clear=False):
         """
         Close lmdb at .env and if clear or .temp then remove lmdb directory at .path
@@ -480,11 +935,12 @@ class LMDBer(filing.Filer):
             str: semver formatted version of the database
 
         """
-        with self.env.begin() as txn:
+        with self.begin() as txn:
             cursor = txn.cursor()
             version = cursor.get(b'__version__')
             return version.decode("utf-8") if version is not None else None
 
+    @growing
     def setVer(self, val):
         """  Set the version of the database in the __version__ key
 
@@ -495,11 +951,12 @@ class LMDBer(filing.Filer):
         if hasattr(val, "encode"):
             val = val.encode("utf-8")  # convert str to bytes
 
-        with self.env.begin(write=True) as txn:
+        with self.begin(write=True) as txn:
             cursor = txn.cursor()
             cursor.replace(b'__version__', val)
 
     # For subdbs with no duplicate values allowed at each key. (dupsort==False)
+    @growing
     def putVal(self, db, key, val):
         """
         Write serialized bytes val to location key in db
@@ -512,7 +969,7 @@ class LMDBer(filing.Filer):
             key is bytes of key within sub db's keyspace
             val is bytes of value to be written
         """
-        with self.env.begin(db=db, write=True, buffers=True) as txn:
+        with self.begin(db=db, write=True, buffers=True) as txn:
             try:
                 return (txn.put(key, val, overwrite=False))
             except lmdb.BadValsizeError as ex:
@@ -520,6 +977,7 @@ class LMDBer(filing.Filer):
                                " or wrong DUPFIXED size. ref) lmdb.BadValsizeError")
 
 
+    @growing
     def setVal(self, db, key, val):
         """
         Write serialized bytes val to location key in db
@@ -533,7 +991,7 @@ class LMDBer(filing.Filer):
             key is bytes of key within sub db's keyspace
             val is bytes of value to be written
         """
-        with self.env.begin(db=db, write=True, buffers=True) as txn:
+        with self.begin(db=db, write=True, buffers=True) as txn:
             try:
                 return (txn.put(key, val))
             except lmdb.BadValsizeError as ex:
@@ -551,7 +1009,7 @@ class LMDBer(filing.Filer):
             key is bytes of key within sub db's keyspace
 
         """
-        with self.env.begin(db=db, write=False, buffers=True) as txn:
+        with self.begin(db=db, write=False, buffers=True) as txn:
             try:
                 return(txn.get(key))
             except lmdb.BadValsizeError as ex:
@@ -559,6 +1017,7 @@ class LMDBer(filing.Filer):
                                " or wrong DUPFIXED size. ref) lmdb.BadValsizeError")
 
 
+    @growing
     def delVal(self, db, key):
         """
         Deletes value at key in db.
@@ -568,7 +1027,7 @@ class LMDBer(filing.Filer):
             db is opened named sub db with dupsort=False
             key is bytes of key within sub db's keyspace
         """
-        with self.env.begin(db=db, write=True, buffers=True) as txn:
+        with self.begin(db=db, write=True, buffers=True) as txn:
             try:
                 return (txn.delete(key))
             except lmdb.BadValsizeError as ex:
@@ -580,15 +1039,14 @@ class LMDBer(filing.Filer):
         """
         Return count of values in db, or zero otherwise
 
+        Uses the lmdb stat of db so count is constant time not a cursor walk.
+        When dupsort==true then duplicates are included in count.
+
         Parameters:
             db is opened named sub db with dupsort=True
         """
-        with self.env.begin(db=db, write=False, buffers=True) as txn:
-            cursor = txn.cursor()
-            count = 0
-            for _, _ in cursor:
-                count += 1
-            return count
+        with self.begin(db=db, write=False, buffers=True) as txn:
+            return txn.stat(db)["entries"]
 
 
     def getTopItemIter(self, db, top=b''):
@@ -614,7 +1072,7 @@ class LMDBer(filing.Filer):
                         In Python str.startswith('') always returns True so if branch
                         key is empty string it matches all keys in db with startswith.
         """
-        with self.env.begin(db=db, write=False, buffers=True) as txn:
+        with self.begin(db=db, write=False, buffers=True) as txn:
             cursor = txn.cursor()
             if cursor.set_range(top):  # move to val at key >= key if any
                 for ckey, cval in cursor.iternext():  # get key, val at cursor
@@ -625,6 +1083,87 @@ class LMDBer(filing.Filer):
             return  # done raises StopIteration
 
 
+    def getRangeIter(self, db, top=b'', *, seek=None, after=False, stop=None,
+                     reverse=False, limit=None, values=True):
+        """
+        Iterates over a bounded range of the branch of db given by top key in
+        either key order or reverse key order on one cursor. Positioning at
+        seek is a single cursor seek so a page read resumed from the last key
+        of the previous page costs O(page size) not O(offset).
+
+        Returns:
+            items (abc.Iterator): iterator of (full key, val) tuples or when
+                values is False of full keys only
+
+        Works for both dupsort==False and dupsort==True. When dupsort==True
+        each dup is an item in the range and key only scans skip dups.
+
+        Parameters:
+            db (lmdb._Database): instance of named sub db
+            top (bytes): truncated top key, a key space prefix that bounds the
+                range to a branch. Empty means all keys in db.
+            seek (bytes | None): key at which to begin. Forward begins at first
+                key >= seek, reverse at last key <= seek. None means begin at
+                start of branch, or end of branch when reverse.
+            after (bool): True means begin strictly after seek in the direction
+                of iteration, that is > seek forward and < seek reverse.
+                Use with last key of previous page to read next page.
+            stop (bytes | None): key at which to stop exclusive in direction of
+                iteration, that is keys < stop forward and > stop reverse.
+                None means end of branch.
+            reverse (bool): True means iterate in reverse key order
+            limit (int | None): maximum number of items. None means unlimited
+            values (bool): True means yield (key, val) items. False means yield
+                distinct keys only without reading values
+        """
+        if limit is not None and limit <= 0:
+            return
+        top = bytes(top)
+        seek = bytes(seek) if seek is not None else None
+        stop = bytes(stop) if stop is not None else None
+
+        with self.begin(db=db, write=False, buffers=True) as txn:
+            cursor = txn.cursor()
+            if not reverse:
+                lower = top
+                if seek is not None:  # immediate successor of seek is seek + 0x00
+                    lower = max(lower, seek + b'\x00' if after else seek)
+                if not cursor.set_range(lower):  # move to key >= lower if any
+                    return
+                if values:
+                    items = cursor.iternext(keys=True, values=True)
+                else:
+                    items = cursor.iternext_nodup(keys=True, values=False)
+            else:
+                upper = topEnd(top) if top else None  # exclusive upper bound
+                if seek is not None:
+                    end = seek if after else seek + b'\x00'
+                    upper = end if upper is None else min(upper, end)
+                if upper is not None and cursor.set_range(upper):
+                    if not cursor.prev():  # last item < upper
+                        return
+                elif not cursor.last():  # all keys < upper or no upper
+                    return
+                if values:
+                    items = cursor.iterprev(keys=True, values=True)
+                else:
+                    items = cursor.iterprev_nodup(keys=True, values=False)
+
+            count = 0
+            for item in items:
+                ckey = bytes(item[0] if values else item)
+                if not ckey.startswith(top):
+                    break  # past branch
+                if stop is not None and (ckey <= stop if reverse else ckey >= stop):
+                    break  # past range
+                yield (ckey, item[1]) if values else ckey
+                count += 1
+                if limit is not None and count >= limit:
+                    break
+            return  # done raises StopIteration
+
+
+    @growing
     def delTopVal(self, db, top=b''):
         """
         Deletes all values in branch of db given top key.
@@ -648,7 +1187,7 @@ class LMDBer(filing.Filer):
         """
         # when deleting can't use cursor.iternext() because the cursor advances
         # twice (skips one) once for iternext and once for delete.
-        with self.env.begin(db=db, write=True, buffers=True) as txn:
+        with self.begin(db=db, write=True, buffers=True) as txn:
             result = False
             cursor = txn.cursor()
             if cursor.set_range(top):  # move to val at key >= key if any
@@ -666,6 +1205,7 @@ class LMDBer(filing.Filer):
     # ordinal number serialized as 32 hex bytes
 
     # used in OnSuberBase
+    @growing
     def putOnVal(self, db, key,  on=0, val=b'', *, sep=b'.'):
         """Write serialized bytes val to location at onkey consisting of
         key + sep + serialized on in db.
@@ -682,7 +1222,7 @@ class LMDBer(filing.Filer):
             val (bytes): to be written at onkey
             sep (bytes): separator character for split
         """
-        with self.env.begin(db=db, write=True, buffers=True) as txn:
+        with self.begin(db=db, write=True, buffers=True) as txn:
             if key:  # not empty
                 onkey = onKey(key, on, sep=sep)  # start replay at this enty 0 is earliest
             else:
@@ -694,6 +1234,7 @@ class LMDBer(filing.Filer):
                                " or wrong DUPFIXED size. ref) lmdb.BadValsizeError")
 
     # used in OnSuberBase
+    @growing
     def setOnVal(self, db, key, on=0, val=b'',  *, sep=b'.'):
         """
         Write serialized bytes val to location at onkey consisting of
@@ -711,7 +1252,7 @@ class LMDBer(filing.Filer):
             val (bytes): to be written at onkey
             sep (bytes): separator character for split
         """
-        with self.env.begin(db=db, write=True, buffers=True) as txn:
+        with self.begin(db=db, write=True, buffers=True) as txn:
             if key:  # not empty
                 onkey = onKey(key, on, sep=sep)  # start replay at this enty 0 is earliest
             else:
@@ -724,6 +1265,7 @@ class LMDBer(filing.Filer):
 
 
     # used in OnSuberBase
+    @growing
     def appendOnVal(self, db, key, val, *, sep=b'.'):
         """
         Appends val in order after last previous onkey in db where
@@ -751,7 +1293,7 @@ class LMDBer(filing.Filer):
         # set key with fn at max and then walk backwards to find last entry at pre
         # if any otherwise zeroth entry at pre
         onkey = onKey(key, MaxON, sep=sep)
-        with self.env.begin(db=db, write=True, buffers=True) as txn:
+        with self.begin(db=db, write=True, buffers=True) as txn:
             on = 0  # unless other cases match then zeroth entry at pre
             cursor = txn.cursor()
             if not cursor.set_range(onkey):  # max is past end of database
@@ -799,7 +1341,7 @@ class LMDBer(filing.Filer):
             sep (bytes): separator character for split
 
         """
-        with self.env.begin(db=db, write=False, buffers=True) as txn:
+        with self.begin(db=db, write=False, buffers=True) as txn:
             if key:  # not empty
                 onkey = onKey(key, on, sep=sep)  # start replay at this enty 0 is earliest
             else:
@@ -812,6 +1354,7 @@ class LMDBer(filing.Filer):
 
 
     # used in OnSuberBase
+    @growing
     def delOnVal(self, db, key, on=0, *, sep=b'.'):
         """
         Deletes value at onkey consisting of key + sep + serialized on in db.
@@ -823,7 +1366,7 @@ class LMDBer(filing.Filer):
             on (int): ordinal number at which to delete
             sep (bytes): separator character for split
         """
-        with self.env.begin(db=db, write=True, buffers=True) as txn:
+        with self.begin(db=db, write=True, buffers=True) as txn:
             if key:  # not empty
                 onkey = onKey(key, on, sep=sep)  # start replay at this enty 0 is earliest
             else:
@@ -851,7 +1394,7 @@ class LMDBer(filing.Filer):
             on (int): ordinal number at which to initiate count
             sep (bytes): separator character for split
         """
-        with self.env.begin(db=db, write=False, buffers=True) as txn:
+        with self.begin(db=db, write=False, buffers=True) as txn:
             cursor = txn.cursor()
             if key:  # not empty
                 onkey = onKey(key, on, sep=sep)  # start replay at this enty 0 is earliest
@@ -924,7 +1467,7 @@ class LMDBer(filing.Filer):
             on (int): ordinal number at which to initiate retrieval
             sep (bytes): separator character for split
         """
-        with self.env.begin(db=db, write=False, buffers=True) as txn:
+        with self.begin(db=db, write=False, buffers=True) as txn:
             cursor = txn.cursor()
             if key:  # not empty
                 onkey = onKey(key, on, sep=sep)  # start replay at this enty 0 is earliest
@@ -954,6 +1497,7 @@ class LMDBer(filing.Filer):
     # size limitation of 511 bytes.
 
 
+    @growing
     def putIoSetVals(self, db, key, vals, *, sep=b'.'):
         """
         Add each val in vals to insertion ordered set of values all with the
@@ -973,7 +1517,7 @@ class LMDBer(filing.Filer):
         """
         result = False
         vals = oset(vals)  # make set
-        with self.env.begin(db=db, write=True, buffers=True) as txn:
+        with self.begin(db=db, write=True, buffers=True) as txn:
             ion = 0
             iokey = suffix(key, ion, sep=sep)  # start zeroth entry if any
             cursor = txn.cursor()
@@ -997,6 +1541,7 @@ class LMDBer(filing.Filer):
             return result
 
 
+    @growing
     def addIoSetVal(self, db, key, val, *, sep=b'.'):
         """
         Add val idempotently to insertion ordered set of values all with the
@@ -1013,7 +1558,7 @@ class LMDBer(filing.Filer):
             val (bytes): serialized value to add
 
         """
-        with self.env.begin(db=db, write=True, buffers=True) as txn:
+        with self.begin(db=db, write=True, buffers=True) as txn:
             vals = oset()
             ion = 0
             iokey = suffix(key, ion, sep=sep)  # start zeroth entry if any
@@ -1034,6 +1579,7 @@ class LMDBer(filing.Filer):
             return cursor.put(iokey, val, dupdata=False, overwrite=False)
 
 
+    @growing
     def setIoSetVals(self, db, key, vals, *, sep=b'.'):
         """
         Erase all vals at key and then add unique vals as insertion ordered set of
@@ -1052,7 +1598,7 @@ class LMDBer(filing.Filer):
         self.delIoSetVals(db=db, key=key, sep=sep)
         result = False
         vals = oset(vals)  # make set
-        with self.env.begin(db=db, write=True, buffers=True) as txn:
+        with self.begin(db=db, write=True, buffers=True) as txn:
             for i, val in enumerate(vals):
                 iokey = suffix(key, i, sep=sep)  # ion is at add on amount
                 result = txn.put(iokey, val, dupdata=False, overwrite=True) or result
@@ -1074,7 +1620,7 @@ class LMDBer(filing.Filer):
             ion (int): starting ordinal value, default 0
 
         """
-        with self.env.begin(db=db, write=False, buffers=True) as txn:
+        with self.begin(db=db, write=False, buffers=True) as txn:
             vals = []
             iokey = suffix(key, ion, sep=sep)  # start ion th value for key zeroth default
             cursor = txn.cursor()
@@ -1102,7 +1648,7 @@ class LMDBer(filing.Filer):
             key (bytes): Apparent effective key
             ion (int): starting ordinal value, default 0
         """
-        with self.env.begin(db=db, write=False, buffers=True) as txn:
+        with self.begin(db=db, write=False, buffers=True) as txn:
             iokey = suffix(key, ion, sep=sep)  # start ion th value for key zeroth default
             cursor = txn.cursor()
             if cursor.set_range(iokey):  # move to val at key >= iokey if any
@@ -1130,7 +1676,7 @@ class LMDBer(filing.Filer):
         val = None
         ion = None  # no last value
         iokey = suffix(key, ion=MaxSuffix, sep=sep)  # make iokey at max and walk back
-        with self.env.begin(db=db, write=False, buffers=True) as txn:
+        with self.begin(db=db, write=False, buffers=True) as txn:
             cursor = txn.cursor()  # create cursor to walk back
             if not cursor.set_range(iokey):  # max is past end of database
                 # Three possibilities for max past end of database
@@ -1181,6 +1727,7 @@ class LMDBer(filing.Filer):
         return len(self.getIoSetVals(db=db, key=key, sep=sep))
 
 
+    @growing
     def delIoSetVals(self, db, key, *, sep=b'.'):
         """
         Deletes all values at apparent effective key.
@@ -1196,7 +1743,7 @@ class LMDBer(filing.Filer):
             key (bytes): Apparent effective key
         """
         result = False
-        with self.env.begin(db=db, write=True, buffers=True) as txn:
+        with self.begin(db=db, write=True, buffers=True) as txn:
             iokey = suffix(key, 0, sep=sep)  # start at zeroth value for key
             cursor = txn.cursor()
             if cursor.set_range(iokey):  # move to val at key >= iokey if any
@@ -1210,6 +1757,7 @@ class LMDBer(filing.Filer):
             return result
 
 
+    @growing
     def delIoSetVal(self, db, key, val, *, sep=b'.'):
         """
         Deletes val at apparent effective key if exists.
@@ -1239,7 +1787,7 @@ class LMDBer(filing.Filer):
             key (bytes): Apparent effective key
             val (bytes): value to delete
         """
-        with self.env.begin(db=db, write=True, buffers=True) as txn:
+        with self.begin(db=db, write=True, buffers=True) as txn:
             iokey = suffix(key, 0, sep=sep)  # start zeroth value for key
             cursor = txn.cursor()
             if cursor.set_range(iokey):  # move to val at key >= iokey if any
@@ -1276,8 +1824,59 @@ class LMDBer(filing.Filer):
             yield (key, val)
 
 
+    def getIoSetRangeIter(self, db, top=b'', *, seek=None, after=False,
+                          stop=None, reverse=False, limit=None, values=True,
+                          sep=b'.'):
+        """
+        Range scan of insertion ordered set values. See getRangeIter.
+        Bounds seek and stop are apparent keys without hidden suffix so after
+        skips all set members at seek and stop excludes all set members at stop.
+
+        Returns:
+            items (Iterator): of (key, val) tuples or when values is False of
+                distinct keys only where key is apparent key with hidden
+                insertion ordering suffix removed
+
+        Parameters:
+            db (lmdb._Database): instance of named sub db with dupsort==False
+            top (bytes): top key space prefix. Empty means every item in db.
+            seek (bytes | None): apparent key at which to begin
+            after (bool): True means begin strictly after seek
+            stop (bytes | None): apparent key at which to stop exclusive
+            reverse (bool): True means iterate in reverse order
+            limit (int | None): maximum number of items. None means unlimited
+            values (bool): False means yield distinct apparent keys only
+            sep (bytes): sep character for attached io suffix
+        """
+        if seek is not None and after != reverse:  # past every member at seek
+            seek = suffix(seek, MaxSuffix, sep=sep)
+        if stop is not None and reverse:  # exclude every member at stop
+            stop = suffix(stop, MaxSuffix, sep=sep)
+        items = self.getRangeIter(db=db, top=top, seek=seek, after=after,
+                                  stop=stop, reverse=reverse,
+                                  limit=limit if values else None,
+                                  values=values)
+        if values:
+            for iokey, val in items:
+                key, ion = splitOnKey(iokey, sep=sep)
+                yield (key, val)
+            return
+
+        count, last = 0, None
+        for iokey in items:
+            key, ion = splitOnKey(iokey, sep=sep)
+            if key == last:
+                continue  # key only yields each apparent key once
+            yield key
+            last = key
+            count += 1
+            if limit is not None and count >= limit:
+                return
+
+
 
     # For subdbs that support duplicates at each key (dupsort==True)
+    @growing
     def putVals(self, db, key, vals):
         """
         Write each entry from list of bytes vals to key in db
@@ -1294,7 +1893,7 @@ class LMDBer(filing.Filer):
             key is bytes of key within sub db's keyspace
             vals is list of bytes of values to be written
         """
-        with self.env.begin(db=db, write=True, buffers=True) as txn:
+        with self.begin(db=db, write=True, buffers=True) as txn:
             result = True
             try:
                 for val in vals:
@@ -1305,6 +1904,7 @@ class LMDBer(filing.Filer):
             return result
 
 
+    @growing
     def addVal(self, db, key, val):
         """
         Add val bytes as dup to key in db
@@ -1327,7 +1927,7 @@ class LMDBer(filing.Filer):
         dups = set(self.getVals(db, key))  #get preexisting dups if any
         result = False
         if val not in dups:
-            with self.env.begin(db=db, write=True, buffers=True) as txn:
+            with self.begin(db=db, write=True, buffers=True) as txn:
                 try:
                     result = txn.put(key, val, dupdata=True)
                 except lmdb.BadValsizeError as ex:
@@ -1348,7 +1948,7 @@ class LMDBer(filing.Filer):
             key is bytes of key within sub db's keyspace
         """
 
-        with self.env.begin(db=db, write=False, buffers=True) as txn:
+        with self.begin(db=db, write=False, buffers=True) as txn:
             cursor = txn.cursor()
             vals = []
             try:
@@ -1371,7 +1971,7 @@ class LMDBer(filing.Filer):
             key is bytes of key within sub db's keyspace
         """
 
-        with self.env.begin(db=db, write=False, buffers=True) as txn:
+        with self.begin(db=db, write=False, buffers=True) as txn:
             cursor = txn.cursor()
             val = None
             try:
@@ -1395,7 +1995,7 @@ class LMDBer(filing.Filer):
             db is opened named sub db with dupsort=True
             key is bytes of key within sub db's keyspace
         """
-        with self.env.begin(db=db, write=False, buffers=True) as txn:
+        with self.begin(db=db, write=False, buffers=True) as txn:
             cursor = txn.cursor()
             vals = []
             try:
@@ -1415,7 +2015,7 @@ class LMDBer(filing.Filer):
             db is opened named sub db with dupsort=True
             key is bytes of key within sub db's keyspace
         """
-        with self.env.begin(db=db, write=False, buffers=True) as txn:
+        with self.begin(db=db, write=False, buffers=True) as txn:
             cursor = txn.cursor()
             count = 0
             try:
@@ -1429,6 +2029,7 @@ class LMDBer(filing.Filer):
 
 
 
+    @growing
     def delVals(self, db, key, val=b''):
         """
         Deletes all values at key in db if val=b'' else deletes the dup
@@ -1440,7 +2041,7 @@ class LMDBer(filing.Filer):
             key is bytes of key within sub db's keyspace
             val is bytes of dup val at key to delete
         """
-        with self.env.begin(db=db, write=True, buffers=True) as txn:
+        with self.begin(db=db, write=True, buffers=True) as txn:
             try:
                 return (txn.delete(key, val))
             except lmdb.BadValsizeError as ex:
@@ -1452,6 +2053,7 @@ class LMDBer(filing.Filer):
     # IoDup class IoVals IoItems
     # dupsort==True and prepends and strips io val proem to each value.
     # because dupsort==True values are limited to 511 bytes including proem
+    @growing
     def putIoDupVals(self, db, key, vals):
         """
         Write each entry from list of bytes vals to key in db in insertion order
@@ -1480,7 +2082,7 @@ class LMDBer(filing.Filer):
 
         result = False
         dups = set(self.getIoDupVals(db, key))  #get preexisting dups if any
-        with self.env.begin(db=db, write=True, buffers=True) as txn:
+        with self.begin(db=db, write=True, buffers=True) as txn:
             idx = 0
             cursor = txn.cursor()
             try:
@@ -1555,7 +2157,7 @@ class LMDBer(filing.Filer):
             key is bytes of key within sub db's keyspace
         """
 
-        with self.env.begin(db=db, write=False, buffers=True) as txn:
+        with self.begin(db=db, write=False, buffers=True) as txn:
             cursor = txn.cursor()
             vals = []
             try:
@@ -1594,7 +2196,7 @@ class LMDBer(filing.Filer):
             key is bytes of key within sub db's keyspace
         """
 
-        with self.env.begin(db=db, write=False, buffers=True) as txn:
+        with self.begin(db=db, write=False, buffers=True) as txn:
             cursor = txn.cursor()
             vals = []
             try:
@@ -1631,7 +2233,7 @@ class LMDBer(filing.Filer):
             key is bytes of key within sub db's keyspace
         """
 
-        with self.env.begin(db=db, write=False, buffers=True) as txn:
+        with self.begin(db=db, write=False, buffers=True) as txn:
             cursor = txn.cursor()
             val = None
             try:
@@ -1644,6 +2246,7 @@ class LMDBer(filing.Filer):
                                " or wrong DUPFIXED size. ref) lmdb.BadValsizeError")
 
 
+    @growing
     def delIoDupVals(self, db, key):
         """
         Deletes all values at key in db if key present.
@@ -1667,7 +2270,7 @@ class LMDBer(filing.Filer):
             key is bytes of key within sub db's keyspace
         """
 
-        with self.env.begin(db=db, write=True, buffers=True) as txn:
+        with self.begin(db=db, write=True, buffers=True) as txn:
             try:
                 return (txn.delete(key))
             except lmdb.BadValsizeError as ex:
@@ -1675,6 +2278,7 @@ class LMDBer(filing.Filer):
                                " or wrong DUPFIXED size. ref) lmdb.BadValsizeError")
 
 
+    @growing
     def delIoDupVal(self, db, key, val):
         """
         Deletes dup io val at key in db. Performs strip search to find match.
@@ -1703,7 +2307,7 @@ class LMDBer(filing.Filer):
             val is bytes of value to be deleted without intersion ordering proem
         """
 
-        with self.env.begin(db=db, write=True, buffers=True) as txn:
+        with self.begin(db=db, write=True, buffers=True) as txn:
             cursor = txn.cursor()
             try:
                 if cursor.set_key(key):  # move to first_dup
@@ -1739,7 +2343,7 @@ class LMDBer(filing.Filer):
             key is bytes of key within sub db's keyspace
         """
 
-        with self.env.begin(db=db, write=False, buffers=True) as txn:
+        with self.begin(db=db, write=False, buffers=True) as txn:
             cursor = txn.cursor()
             count = 0
             try:
@@ -1798,6 +2402,36 @@ class LMDBer(filing.Filer):
             yield (top, val)
 
 
+    def getIoDupRangeIter(self, db, top=b'', *, seek=None, after=False,
+                          stop=None, reverse=False, limit=None, values=True):
+        """
+        Range scan of insertion ordered dup values with hidden proem stripped
+        from each val. See getRangeIter.
+
+        Returns:
+            items (Iterator): of (key, val) tuples or when values is False of
+                distinct keys only
+
+        Parameters:
+            db (lmdb._Database): instance of named sub db with dupsort==True
+            top (bytes): top key space prefix. Empty means every item in db.
+            seek (bytes | None): key at which to begin
+            after (bool): True means begin strictly after seek
+            stop (bytes | None): key at which to stop exclusive
+            reverse (bool): True means iterate in reverse order
+            limit (int | None): maximum number of items. None means unlimited
+            values (bool): False means yield distinct keys only
+        """
+        items = self.getRangeIter(db=db, top=top, seek=seek, after=after,
+                                  stop=stop, reverse=reverse, limit=limit,
+                                  values=values)
+        if not values:
+            yield from items
+            return
+        for key, val in items:
+            yield (key, val[33:])  # strip proem
+
+
     # methods for OnIoDup that combines IoDup value proem with On ordinal numbered
     # trailing prefix
     # this is so we do the proem add and strip here not in some higher level class
@@ -2021,7 +2655,7 @@ class LMDBer(filing.Filer):
             on (int): ordinal number at which to initiate retrieval
             sep (bytes): separator character for split
         """
-        with self.env.begin(db=db, write=False, buffers=True) as txn:
+        with self.begin(db=db, write=False, buffers=True) as txn:
             cursor = txn.cursor()
             if key:  # not empty
                 onkey = onKey(key, on, sep=sep)  # start replay at this enty 0 is earliest
@@ -2103,7 +2737,7 @@ class LMDBer(filing.Filer):
             on (int): ordinal number at which to initiate retrieval
             sep (bytes): separator character for split
         """
-        with self.env.begin(db=db, write=False, buffers=True) as txn:
+        with self.begin(db=db, write=False, buffers=True) as txn:
             cursor = txn.cursor()
             if not cursor.last():  # pre-position cursor at last dup of last key
                 return  # empty database so raise StopIteration
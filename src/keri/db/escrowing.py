@@ -13,7 +13,7 @@ from keri import help
 from keri.help import helping
 
 from keri.core import coring, eventing, indexing
-from keri.db import subing
+from keri.db import subing, metering
 
 
 logger = help.ogler.getLogger()
@@ -35,6 +35,8 @@ class Broker:
         Attributes:
             db (Reger): TEL event database to make sub databases under
             timeout (int): timeout in seconds for escrows, default is 3600 seconds (1 hour)
+            name (str): escrow name for tallies in meter, subkey without trailing '.'
+            meter (EscrowMeter): escrow processing tallies, .escrowMeter of db if any
             daterdb (CesrSuber): database for datetime stamps by ksn SAID
             serderdb (SerderSuber): database for reply messages by ksn SAID
             tigerdb (CesrIoSetSuber): database for indexed signatures by ksn quadruple
@@ -45,6 +47,8 @@ class Broker:
         """
         self.db = db
         self.timeout = timeout
+        self.name = subkey.rstrip(".")
+        self.meter = getattr(db, "escrowMeter", None) or metering.EscrowMeter()
 
         # State support datetime stamps and signatures indexed and not-indexed
         # all ksn  kdts (key state datetime serializations) maps said to date-time
@@ -109,6 +113,11 @@ class Broker:
             extype (Type[Exception]): the expected exception type if the message should remain in escrow
 
         """
+        with self.meter.timed(self.name):
+            self._processEscrowState(typ, processReply, extype)
+
+    def _processEscrowState(self, typ, processReply, extype):
+        """ Single pass of processEscrowState over escrows of typ """
         for (typ, pre, aid), saider in self.escrowdb.getItemIter(keys=(typ, '')):
             try:
                 tsgs = eventing.fetchTsgs(db=self.tigerdb, saider=saider)
@@ -136,7 +145,7 @@ class Broker:
                         # escrow stale so raise ValidationError which unescrows below
                         msg = f"Escrow unescrow error: Stale txn state escrow at pre = {pre}"
                         logger.trace("Broker %s: %s", typ, msg)
-                        raise kering.ValidationError(msg)
+                        raise kering.StaleEscrowError(msg)
 
                     processReply(serder=serder, saider=saider, route=serder.ked["r"],
                                  cigars=cigars, tsgs=tsgs, aid=aid)
@@ -149,6 +158,7 @@ class Broker:
 
                 except Exception as ex:  # other error so remove from reply escrow
                     self.escrowdb.rem(keys=(typ, pre, aid), val=saider)   # remove escrow
+                    self.meter.fail(self.name, ex)
                     if logger.isEnabledFor(logging.DEBUG):
                         logger.exception("Broker %s: unescrowed due to error: %s", typ, ex.args[0])
                     else:
@@ -156,6 +166,7 @@ class Broker:
 
                 else:  # unescrow succeded
                     self.escrowdb.rem(keys=(typ, pre, aid), val=saider)  # remove escrow
+                    self.meter.succeed(self.name)
                     logger.info("Broker %s: unescrow succeeded for txn state=%s",
                                 typ, serder.said)
                     logger.debug("TXN State Body=\n%s\n", serder.pretty())
@@ -163,6 +174,7 @@ class Broker:
             except Exception as ex:  # log diagnostics errors etc
                 self.escrowdb.rem(keys=(typ, pre, aid), val=saider)  # remove escrow
                 self.removeState(saider)
+                self.meter.fail(self.name, ex)
                 if logger.isEnabledFor(logging.DEBUG):
                     logger.exception("Broker %s: unescrowed due to error: %s", typ, ex.args[0])
                 else:
@@ -4,8 +4,12 @@ KERI
 keri.db.koming module
 
 """
+import copy
+import dataclasses
+import functools
 import types
 import json
+import typing
 from dataclasses import dataclass
 from typing import Type, Union
 from collections.abc import Iterable
@@ -16,12 +20,75 @@ import lmdb
 
 
 from . import dbing
+from .caching import CacheMixin
 from .. import help
 from ..core import coring
 from ..help import helping
 
 logger = help.ogler.getLogger()
 
+RecordKind = "MGPR"  # msgpack of dataclass record keyed by field index
+
+
+@functools.lru_cache(maxsize=None)
+def recordFields(schema):
+    """
+    Returns:
+        fields (tuple): of (name, klas) duple for each field of dataclass
+            schema in declaration order where klas is the nested dataclass
+            of the field if any else None
+
+    Parameters:
+        schema (Type[dataclass]): class reference of dataclass
+    """
+    def nested(hint):  # dataclass of hint itself or of optional hint
+        for klas in (hint, *typing.get_args(hint)):
+            if isinstance(klas, type) and dataclasses.is_dataclass(klas):
+                return klas
+        return None
+
+    hints = typing.get_type_hints(schema)
+    return tuple((f.name, nested(hints.get(f.name))) for f in dataclasses.fields(schema))
+
+
+def recordify(val):
+    """
+    Returns:
+        rec (dict): of field values of dataclass instance val keyed by field
+            index with nested dataclasses recordified. Compact form of
+            helping.dictify for RecordKind serialization.
+    """
+    rec = {}
+    for i, (name, klas) in enumerate(recordFields(type(val))):
+        field = getattr(val, name)
+        if klas is not None and field is not None:
+            if isinstance(field, dict):  # nested given as dict like JSON allows
+                field = helping.datify(klas, field)
+            field = recordify(field)
+        rec[i] = field
+    return rec
+
+
+def derecordify(schema, rec):
+    """
+    Returns:
+        val (dataclass): instance of schema from rec made by recordify.
+            Fields missing from rec take their defaults.
+
+    Parameters:
+        schema (Type[dataclass]): class reference of dataclass
+        rec (dict): of field values keyed by field index
+    """
+    fields = recordFields(schema)
+    kwa = {}
+    for i, field in rec.items():
+        try:
+            name, klas = fields[i]
+        except (IndexError, TypeError) as ex:
+            raise ValueError(f"Invalid field index={i} for {schema}.") from ex
+        kwa[name] = derecordify(klas, field) if klas is not None and field is not None else field
+    return schema(**kwa)
+
 
 
 class KomerBase:
@@ -36,8 +103,10 @@ class KomerBase:
     Attributes:
         db (dbing.LMDBer): instance of LMDB database manager class
         sdb (lmdb._Database): instance of named sub db lmdb for this Komer
+        subkey (str): LMDB sub database key of .sdb
         schema (Type[dataclass]): class reference of dataclass subclass
-        kind (str): serialization/deserialization type from coring.Serials
+        kind (str): serialization/deserialization type from coring.Kinds
+            or RecordKind for compact msgpack records keyed by field index
         serializer (types.MethodType): serializer method
         deserializer (types.MethodType): deserializer method
         sep (str): separator for combining keys tuple of strs into key bytes
@@ -65,6 +134,7 @@ class KomerBase:
         """
         super(KomerBase, self).__init__()
         self.db = db
+        self.subkey = subkey
         self.sdb = self.db.env.open_db(key=subkey.encode("utf-8"), dupsort=dupsort)
         self.schema = schema
         self.kind = kind
@@ -175,6 +245,62 @@ class KomerBase:
             yield (self._tokeys(key), self.deserializer(val))
 
 
+    def _rangeIter(self, **kwa):
+        """Range scan of .sdb on one cursor. Subclasses that hide a key space
+        suffix override this to hide it. See LMDBer.getRangeIter for parameters.
+        """
+        return self.db.getRangeIter(db=self.sdb, **kwa)
+
+
+    def getRangeItemIter(self, keys: Union[str, Iterable]=b"", *, topive=False,
+                         seek=None, after=False, stop=None, reverse=False,
+                         limit=None):
+        """Cursor range scan over items in top branch defined by keys that
+        supports seek, bounded range, reverse order and limit on one LMDB
+        cursor. See subing.SuberBase.getRangeItemIter
+
+        Returns:
+            items (Iterator): of (key, val) tuples of each item in range
+
+        Parameters:
+            keys (Iterable): key or key parts of top branch that bounds range.
+                Empty means all items in subdb.
+            topive (bool): True means treat keys as partial key tuple from top
+                branch of key space
+            seek (Iterable | None): keys at which to begin. None means start of
+                branch or end when reverse.
+            after (bool): True means begin strictly after seek in direction of
+                iteration
+            stop (Iterable | None): keys at which to stop exclusive in direction
+                of iteration. None means end of branch
+            reverse (bool): True means iterate in reverse key order
+            limit (int | None): maximum number of items. None means unlimited
+        """
+        for key, val in self._rangeIter(top=self._tokey(keys, topive=topive),
+                                        seek=self._tokey(seek) if seek is not None else None,
+                                        after=after,
+                                        stop=self._tokey(stop) if stop is not None else None,
+                                        reverse=reverse, limit=limit):
+            yield (self._tokeys(key), self.deserializer(val))
+
+
+    def getRangeKeyIter(self, keys: Union[str, Iterable]=b"", *, topive=False,
+                        seek=None, after=False, stop=None, reverse=False,
+                        limit=None):
+        """Key only cursor range scan that yields each distinct key in range
+        once without deserializing values. Parameters as for getRangeItemIter.
+
+        Returns:
+            keys (Iterator): keys tuple of each distinct key in range
+        """
+        for key in self._rangeIter(top=self._tokey(keys, topive=topive),
+                                   seek=self._tokey(seek) if seek is not None else None,
+                                   after=after,
+                                   stop=self._tokey(stop) if stop is not None else None,
+                                   reverse=reverse, limit=limit, values=False):
+            yield self._tokeys(key)
+
+
     def _serializer(self, kind):
         """
         Parameters:
@@ -184,6 +310,8 @@ class KomerBase:
             return self.__serializeMGPK
         elif kind == coring.Kinds.cbor:
             return self.__serializeCBOR
+        elif kind == RecordKind:
+            return self.__serializeRecord
         else:
             return self.__serializeJSON
 
@@ -197,6 +325,8 @@ class KomerBase:
             return self.__deserializeMGPK
         elif kind == coring.Kinds.cbor:
             return self.__deserializeCBOR
+        elif kind == RecordKind:
+            return self.__deserializeRecord
         else:
             return self.__deserializeJSON
 
@@ -228,6 +358,18 @@ class KomerBase:
         return val
 
 
+    def __deserializeRecord(self, val):
+        if val is not None:
+            val = bytes(val)
+            if val[:1] == b'{':  # JSON not yet migrated. Never leads msgpack map
+                return self.__deserializeJSON(val)
+            try:
+                val = derecordify(self.schema, msgpack.loads(val, strict_map_key=False))
+            except TypeError as ex:
+                raise ValueError(f"Invalid record for schema {self.schema}.") from ex
+        return val
+
+
     def __serializeJSON(self, val):
         if val is not None:
             if not isinstance(val, self.schema):
@@ -248,6 +390,15 @@ class KomerBase:
         return val
 
 
+    def __serializeRecord(self, val):
+        if val is not None:
+            if not isinstance(val, self.schema):
+                raise ValueError("Invalid schema type={} of value={}, expected {}."
+                                 "".format(type(val), val, self.schema))
+            val = msgpack.dumps(recordify(val))
+        return val
+
+
     def __serializeCBOR(self, val):
         if val is not None:
             if not isinstance(val, self.schema):
@@ -394,6 +545,31 @@ class Komer(KomerBase):
         return self.db.cnt(db=self.sdb)
 
 
+class CacheKomer(CacheMixin, Komer):
+    """
+    Komer with read through LRU cache of dataclass instances.
+    See caching.CacheMixin
+
+    Each get returns a shallow copy of the cached instance so callers may
+    assign its fields before a pin without changing the cache. Nested values
+    are shared so must not be mutated in place.
+    """
+
+    def __init__(self, *pa, **kwa):
+        """
+        Inherited Parameters:
+            db (dbing.LMDBer): base db
+            schema (Type[dataclass]):  reference to Class definition for dataclass sub class
+            subkey (str):  LMDB sub database key
+            kind (str): serialization/deserialization type
+            capacity (int): maximum number of values cached
+        """
+        super(CacheKomer, self).__init__(*pa, **kwa)
+
+    def _cached(self, val):
+        return copy.copy(val)
+
+
 class IoSetKomer(KomerBase):
     """
     Insertion Ordered Set Keyspace Object Mapper factory class that supports
@@ -645,6 +821,11 @@ class IoSetKomer(KomerBase):
             yield (self._tokeys(iokey), self.deserializer(val))
 
 
+    def _rangeIter(self, **kwa):
+        """Range scan with hidden ordinal key suffix removed"""
+        return self.db.getIoSetRangeIter(db=self.sdb, sep=self.sep.encode(), **kwa)
+
+
 
 class DupKomer(KomerBase):
     """
@@ -0,0 +1,295 @@
+# -*- encoding: utf-8 -*-
+"""
+KERI
+keri.db.metering module
+
+In memory meters of escrow processing and the escrow metrics that combine them
+with the escrow sub dbs of Baser and Reger.
+
+Counts come from the LMDB stat of each escrow sub db so they are constant time.
+Ages walk at most limit entries of each escrow in key order, not age order, so a
+scrape stays cheap even when an escrow has built up. The oldest and median ages
+are therefore of the sampled entries and exact only when sampled equals count.
+"""
+import itertools
+import statistics
+import time
+from contextlib import contextmanager
+from dataclasses import dataclass, asdict
+
+from .. import help, kering
+from ..core import coring
+from ..help import helping
+from . import dbing
+
+logger = help.ogler.getLogger()
+
+
+@dataclass
+class EscrowTally:
+    """
+    Running tally of processing passes over one escrow
+
+    Attributes:
+        passes (int): number of processing passes over the escrow
+        elapsed (float): duration in seconds of the latest pass
+        total (float): accumulated duration in seconds of all passes
+        successes (int): escrowed items unescrowed as accepted
+        failures (int): escrowed items removed due to some error
+        timeouts (int): escrowed items removed because stale
+    """
+    passes: int = 0
+    elapsed: float = 0.0
+    total: float = 0.0
+    successes: int = 0
+    failures: int = 0
+    timeouts: int = 0
+
+
+class EscrowMeter:
+    """
+    EscrowMeter keeps an EscrowTally per escrow name in memory. The escrow
+    processors of Kevery, Tevery, Exchanger and Broker tally into the meter of
+    the database that holds their escrows.
+
+    Attributes:
+        tallies (dict): EscrowTally instances keyed by escrow name
+    """
+
+    def __init__(self):
+        self.tallies = dict()
+
+    def tally(self, escrow):
+        """
+        Returns:
+            tally (EscrowTally): for escrow, created when not yet tallied
+
+        Parameters:
+            escrow (str): name of escrow
+        """
+        if (tally := self.tallies.get(escrow)) is None:
+            tally = self.tallies[escrow] = EscrowTally()
+        return tally
+
+    def succeed(self, escrow, count=1):
+        """
+        Tally count of items unescrowed as accepted from escrow
+        """
+        self.tally(escrow).successes += count
+
+    def fail(self, escrow, ex=None):
+        """
+        Tally one item removed from escrow due to error ex. Stale items are
+        tallied as timeouts, all others as failures.
+
+        Parameters:
+            escrow (str): name of escrow
+            ex (Exception | None): error that caused removal
+        """
+        if isinstance(ex, kering.StaleEscrowError):
+            self.tally(escrow).timeouts += 1
+        else:
+            self.tally(escrow).failures += 1
+
+    @contextmanager
+    def timed(self, escrow):
+        """
+        Context manager that tallies one pass over escrow and its duration
+
+        Usage:
+            with db.escrowMeter.timed("ooes"):
+                processEscrowOutOfOrders()
+        """
+        start = time.perf_counter()
+        try:
+            yield self.tally(escrow)
+        finally:
+            tally = self.tally(escrow)
+            tally.passes += 1
+            tally.elapsed = time.perf_counter() - start
+            tally.total += tally.elapsed
+
+    def stats(self):
+        """
+        Returns:
+            stats (dict): dict of tally dicts keyed by escrow name
+        """
+        return {escrow: asdict(tally) for escrow, tally in self.tallies.items()}
+
+    def clear(self):
+        """ Clear all tallies """
+        self.tallies.clear()
+
+
+def _snDigDts(db, sdb):
+    """ Datetimes of IoDup escrows keyed by snKey with event digest values """
+    for key, val in db.getTopIoDupItemIter(db=sdb):
+        pre, _ = dbing.splitSnKey(key)
+        yield db.getDts(dbing.dgKey(pre, bytes(val)))
+
+
+def _subDigDts(db, suber):
+    """ Datetimes of Suber escrows keyed by (pre, ...) with event digest values """
+    for keys, dig in suber.getItemIter():
+        yield db.getDts(dbing.dgKey(keys[0], dig))
+
+
+def _receiptDts(db, sdb):
+    """ Datetimes of IoDup receipt escrows whose values lead with receipted event digest """
+    for key, val in db.getTopIoDupItemIter(db=sdb):
+        pre, _ = dbing.splitSnKey(key)
+        saider = coring.Saider(qb64b=bytes(val))  # leading primitive only
+        yield db.getDts(dbing.dgKey(pre, saider.qb64b))
+
+
+def _udesDts(db):
+    for (pre, dig), _ in db.udes.getItemIter():
+        yield db.getDts(dbing.dgKey(pre, dig))
+
+
+def _uwesDts(db):
+    for (pre, _), (rdig, _) in db.uwes.getItemIter():
+        yield db.getDts(dbing.dgKey(pre, rdig))
+
+
+def _epseDts(db):
+    for (dig,), _ in db.epse.getItemIter():
+        if (dater := db.epsd.get(keys=(dig,))) is not None:
+            yield dater.dts
+
+
+def _telDts(reger, sdb):
+    """ Datetimes of TEL escrows keyed by snKey with TEL event digest values """
+    for key, val in reger.getTopItemIter(db=sdb):
+        pre, _ = dbing.splitSnKey(key)
+        if (dater := reger.tets.get(keys=(pre.decode("utf-8"),
+                                          bytes(val).decode("utf-8")))) is not None:
+            yield dater.dts
+
+
+def _daterDts(suber):
+    """ Datetimes of escrows whose values are Daters """
+    for _, dater in suber.getItemIter():
+        yield dater.dts
+
+
+def _brokerDts(broker):
+    for _, saider in broker.escrowdb.getItemIter():
+        if (dater := broker.daterdb.get(keys=(saider.qb64,))) is not None:
+            yield dater.dts
+
+
+def kelEscrows(db):
+    """
+    Returns:
+        escrows (list): of triples (name, sdb, dts) for each escrow of Baser db
+            where sdb is the lmdb sub db to count and dts is None or a callable
+            that returns an iterator of escrowed datetime stamps
+    """
+    return [
+        ("ooes", db.ooes, lambda: _snDigDts(db, db.ooes)),
+        ("pses", db.pses, lambda: _snDigDts(db, db.pses)),
+        ("pwes", db.pwes, lambda: _snDigDts(db, db.pwes)),
+        ("ldes", db.ldes, lambda: _snDigDts(db, db.ldes)),
+        ("pdes", db.pdes.sdb, lambda: _subDigDts(db, db.pdes)),
+        ("udes", db.udes.sdb, lambda: _udesDts(db)),
+        ("uwes", db.uwes.sdb, lambda: _uwesDts(db)),
+        ("ures", db.ures, lambda: _receiptDts(db, db.ures)),
+        ("vres", db.vres, lambda: _receiptDts(db, db.vres)),
+        ("qnfs", db.qnfs.sdb, lambda: _subDigDts(db, db.qnfs)),
+        ("misfits", db.misfits.sdb, lambda: _subDigDts(db, db.misfits)),
+        ("delegables", db.delegables.sdb, lambda: _subDigDts(db, db.delegables)),
+        ("epse", db.epse.sdb, lambda: _epseDts(db)),
+        ("rpes", db.rpes.sdb, None),
+        ("gpse", db.gpse.sdb, None),
+        ("gdee", db.gdee.sdb, None),
+        ("gpwe", db.gpwe.sdb, None),
+        ("dpwe", db.dpwe.sdb, None),
+        ("dune", db.dune.sdb, None),
+        ("dpub", db.dpub.sdb, None),
+    ]
+
+
+def telEscrows(reger):
+    """
+    Returns:
+        escrows (list): of triples (name, sdb, dts) for each escrow of Reger
+            reger like kelEscrows
+    """
+    return [
+        ("oots", reger.oots, lambda: _telDts(reger, reger.oots)),
+        ("twes", reger.twes, lambda: _telDts(reger, reger.twes)),
+        ("taes", reger.taes, lambda: _telDts(reger, reger.taes)),
+        ("mre", reger.mre.sdb, lambda: _daterDts(reger.mre)),
+        ("mce", reger.mce.sdb, lambda: _daterDts(reger.mce)),
+        ("mse", reger.mse.sdb, lambda: _daterDts(reger.mse)),
+        ("txn", reger.txnsb.escrowdb.sdb, lambda: _brokerDts(reger.txnsb)),
+        ("tpwe", reger.tpwe.sdb, None),
+        ("tmse", reger.tmse.sdb, None),
+        ("tede", reger.tede.sdb, None),
+        ("cmse", reger.cmse.sdb, None),
+    ]
+
+
+def measure(lmdber, escrows, *, limit=1024, now=None):
+    """
+    Returns:
+        metrics (dict): escrow metrics dict keyed by escrow name. Each value is
+            dict with count, sampled, sampledOldest and sampledMedian age in
+            seconds of the first sampled entries in key order plus the tallied
+            processing stats from lmdber.escrowMeter if any.
+
+    Parameters:
+        lmdber (LMDBer): database that holds escrows
+        escrows (list): of (name, sdb, dts) triples from kelEscrows or telEscrows
+        limit (int): maximum number of entries walked per escrow to compute ages
+            0 means do not compute ages
+        now (datetime | None): timezone aware datetime to compute ages relative
+            to. None means now
+    """
+    now = now if now is not None else helping.nowUTC()
+    meter = getattr(lmdber, "escrowMeter", None)
+    tallies = meter.stats() if meter is not None else {}
+    metrics = dict()
+    for name, sdb, dts in escrows:
+        count = lmdber.cnt(sdb)
+        ages = []
+        if count and limit and dts is not None:
+            for dt in itertools.islice(dts(), limit):
+                if dt is None:  # missing datetime, escrow processing removes it
+                    continue
+                if isinstance(dt, memoryview):
+                    dt = bytes(dt)
+                ages.append((now - helping.fromIso8601(dt)).total_seconds())
+
+        metric = dict(count=count,
+                      sampled=len(ages),
+                      sampledOldest=max(ages) if ages else None,
+                      sampledMedian=statistics.median(ages) if ages else None)
+        metric.update(tallies.get(name, asdict(EscrowTally())))
+        metrics[name] = metric
+
+    return metrics
+
+
+def escrowMetrics(db, reger=None, *, limit=1024, now=None):
+    """
+    Escrow observability surface over the escrows of a Baser and optionally
+    of a Reger including its Broker escrows.
+
+    Returns:
+        metrics (dict): with "kel" escrow metrics of db and when reger provided
+            "tel" escrow metrics of reger. See measure
+
+    Parameters:
+        db (Baser): KEL database
+        reger (Reger | None): TEL database
+        limit (int): maximum number of entries walked per escrow to compute ages
+        now (datetime | None): timezone aware datetime to compute ages relative
+            to. None means now
+    """
+    now = now if now is not None else helping.nowUTC()
+    metrics = dict(kel=measure(db, kelEscrows(db), limit=limit, now=now))
+    if reger is not None:
+        metrics["tel"] = measure(reger, telEscrows(reger), limit=limit, now=now)
+    return metrics
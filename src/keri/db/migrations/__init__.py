@@ -0,0 +1,24 @@
+# -*- encoding: utf-8 -*-
+"""
+KERI
+keri.db.migrations package
+
+Each migration module provides _check_if_needed(db) and migrate(db). Modules
+that migrate many records also provide migrateIter(db, cursor=None) so
+Baser.migrateBatched can run them in bounded, resumable batches. Modules whose
+records not yet migrated are still read correctly set LAZY = True so the
+database may be used before they run.
+"""
+
+
+def keysAfter(db, sdb, key=None):
+    """
+    Returns iterator of the distinct keys of sub db sdb of LMDBer db in order
+    after key. Use to resume a migrateIter at its cursor.
+
+    Parameters:
+        db (LMDBer): database of sdb
+        sdb (lmdb._Database): named sub db to iterate
+        key (bytes | None): key to resume after. None means from first key
+    """
+    return db.getRangeIter(db=sdb, seek=key, after=key is not None, values=False)
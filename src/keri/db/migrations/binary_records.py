@@ -0,0 +1,78 @@
+from keri import help
+from keri.db.migrations import keysAfter
+
+logger = help.ogler.getLogger()
+
+# Baser Komer sub dbs whose records are serialized with koming.RecordKind
+SUBDBS = ("states", "habs", "ends", "locs", "ksns", "oobis", "eoobi", "coobi",
+          "roobi", "woobi", "moobi", "mfa", "rmfa")
+
+# Record deserializer reads JSON records not yet migrated so lazy
+LAZY = True
+
+
+def _jsonItemIter(db, komer):
+    """ Iterate (key, raw) of records of komer still serialized as JSON """
+    for key, val in db.getTopItemIter(db=komer.sdb):
+        if bytes(val[:1]) == b'{':
+            yield bytes(key), bytes(val)
+
+
+def _check_if_needed(db):
+    for name in SUBDBS:
+        komer = getattr(db, name)
+        if next(_jsonItemIter(db, komer), None) is not None:
+            return True
+    return False
+
+
+def migrateIter(db, cursor=None):
+    """ Reserialize each JSON record of hot Baser Komer sub dbs as binary record
+
+    Yields cursor "name key" after each record of sub db name with key visited.
+    Records already binary are skipped so do not count.
+
+    Parameters:
+        db(Baser): Baser database object on which to run the migration
+        cursor(str | None): cursor from which to resume. None means from start
+    """
+    start, after = 0, None
+    if cursor is not None:
+        name, key = cursor.split(" ", 1)
+        start, after = SUBDBS.index(name), key.encode("utf-8")
+
+    for name in SUBDBS[start:]:
+        komer = getattr(db, name)
+        for key in keysAfter(db, komer.sdb, key=after):
+            raw = bytes(db.getVal(db=komer.sdb, key=key))
+            if raw[:1] != b'{':
+                continue  # already binary
+            # record deserializer reads JSON not yet migrated
+            db.setVal(db=komer.sdb, key=key, val=komer.serializer(komer.deserializer(raw)))
+            if hasattr(komer, "cache"):
+                komer.cache.remove(key)
+            yield f"{name} {key.decode('utf-8')}"
+        after = None
+
+
+def migrate(db):
+    """ Reserialize JSON records of hot Baser Komer sub dbs as binary records
+
+    This migration performs the following:
+    -  hby.db -> "stts.", "habs.", "ends.", "locs.", "ksns." and the OOBI sub dbs
+        Each JSON record is rewritten in place as a msgpack record keyed by
+        field index, see koming.RecordKind. Keys are unchanged.
+
+    Baser.migrate runs it in resumable batches. See migrateIter
+
+    Parameters:
+        db(Baser): Baser database object on which to run the migration
+    """
+    # May be running on a database whose records were all written as binary
+    # so check if the migration is needed
+    if not _check_if_needed(db):
+        print(f"{__name__} migration not needed, database already in correct state")
+        return
+
+    count = sum(1 for _ in migrateIter(db))
+    logger.info(f"Reserialized {count} records as binary for {db.path}")
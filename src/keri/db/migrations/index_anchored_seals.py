@@ -0,0 +1,69 @@
+from keri import help
+from keri.core import coring, serdering
+from keri.db import dbing
+from keri.db.basing import SealsMigration, sealDigest
+from keri.db.migrations import keysAfter
+
+logger = help.ogler.getLogger()
+
+# Baser.fetchSealingEvents walks the KEL until the index is backfilled so lazy
+LAZY = True
+
+
+def _check_if_needed(db):
+    if db.sealsIndexed:  # backfill completed or database never had KEL events
+        return False
+    first = next(db.getTopIoDupItemIter(db=db.kels), None)
+    if first is None:
+        return False
+    return True
+
+
+def migrateIter(db, cursor=None):
+    """ Index the anchored seals of the accepted events at each key of .kels
+
+    Yields cursor of each .kels snKey visited as str.
+
+    Parameters:
+        db(Baser): Baser database object on which to run the migration
+        cursor(str | None): cursor from which to resume. None means from start
+    """
+    after = cursor.encode("utf-8") if cursor is not None else None
+    for key in keysAfter(db, db.kels, key=after):
+        pre, sn = dbing.splitSnKey(key)
+        for dig in db.getIoDupVals(db.kels, key):
+            if (raw := db.getEvt(dbing.dgKey(pre, dig))) is None:
+                continue  # skip missing event
+
+            serder = serdering.SerderKERI(raw=bytes(raw))
+            for seal in serder.seals or []:
+                if isinstance(seal, dict):
+                    db.seals.add(keys=(serder.pre, sealDigest(seal)),
+                                 val=(coring.Seqner(sn=serder.sn),
+                                      coring.Saider(qb64=serder.said)))
+        yield key.decode("utf-8")
+
+
+def migrate(db):
+    """ Backfill the .seals anchored seal index from the accepted events of every KEL
+
+    This migration performs the following:
+    -  hby.db -> "seals." populated from the anchored seals of each event in "kels."
+        Keys: (prefix, sealDigest(seal)) of each anchored seal in dict form
+        Value: (sn, said) of each event that anchors the seal
+
+    Baser.migrate runs it in resumable batches. See migrateIter
+
+    Parameters:
+        db(Baser): Baser database object on which to run the migration
+    """
+    # May be running on a database whose events were all logged with the index
+    # so check if the migration is needed
+    if not _check_if_needed(db):
+        print(f"{__name__} migration not needed, database already in correct state")
+        return
+
+    logger.debug(f"Indexing anchored seals for {db.path}")
+    count = sum(1 for _ in migrateIter(db))
+    db.migs.pin(keys=(SealsMigration,), val=coring.Dater())  # index complete
+    logger.info(f"Indexed anchored seals of {count} KEL entries for {db.path}")
@@ -45,6 +45,9 @@ Other special classer for special values
 
 SerderSuber stores Serialized Serder Instances of in JSON, CBOR, or MGPK
 
+CacheSuber, CacheCesrSuber, CacheSerderSuber and CacheSchemerSuber add a read
+through LRU cache of deserialized values for hot sub dbs. See caching.CacheMixin
+
 Also for Secrets private keys
 SignerSuber
 CryptSignerSuber
@@ -102,6 +105,7 @@ from ..help.helping import isNonStringIterable, Reb64
 from .. import core
 from ..core import coring, scheming, serdering
 from . import dbing
+from .caching import CacheMixin
 
 logger = help.ogler.getLogger()
 
@@ -115,6 +119,7 @@ class SuberBase():
     Attributes:
         db (dbing.LMDBer): base LMDB db
         sdb (lmdb._Database): instance of lmdb named sub db for this Suber
+        subkey (str): LMDB sub database key of .sdb
         sep (str): separator for combining keys tuple of strs into key bytes
         verify (bool): True means reverify when ._des from db when applicable
                        False means do not reverify. Default False
@@ -141,6 +146,7 @@ class SuberBase():
         """
         super(SuberBase, self).__init__()  # for multi inheritance
         self.db = db
+        self.subkey = subkey
         self.sdb = self.db.env.open_db(key=subkey.encode("utf-8"), dupsort=dupsort)
         self.sep = sep if sep is not None else self.Sep
         self.verify = True if verify else False
@@ -337,6 +343,66 @@ class SuberBase():
                                                top=self._tokey(keys, topive=topive)):
             yield (self._tokeys(key), self._des(val))
 
+    def _rangeIter(self, **kwa):
+        """Range scan of .sdb on one cursor. Subclasses that hide a key space
+        suffix or val space proem override this to hide it. See
+        LMDBer.getRangeIter for parameters.
+        """
+        return self.db.getRangeIter(db=self.sdb, **kwa)
+
+
+    def getRangeItemIter(self, keys: str|bytes|memoryview|Iterable="",
+                         *, topive=False, seek=None, after=False, stop=None,
+                         reverse=False, limit=None):
+        """Cursor range scan over items in top branch defined by keys that
+        supports seek, bounded range, reverse order and limit on one LMDB
+        cursor. Paginate by passing the keys of the last item of a page as
+        seek with after=True to read the next page in O(page size).
+
+        Returns:
+            items (Iterator[tuple[key,val]]): (key, val) tuples of each item
+            in range with hidden parts removed as for getItemIter
+
+        Parameters:
+            keys (str|bytes|memoryview|Iterable): key or key parts of top
+                branch that bounds the range. Empty means all items in subdb.
+            topive (bool): True means treat keys as partial key tuple from top
+                branch of key space. See getItemIter
+            seek (str|bytes|memoryview|Iterable|None): keys at which to begin.
+                Forward begins at first key >= seek, reverse at last key <= seek.
+                None means begin at start of branch or end when reverse.
+            after (bool): True means begin strictly after seek in the direction
+                of iteration
+            stop (str|bytes|memoryview|Iterable|None): keys at which to stop
+                exclusive in the direction of iteration. None means end of branch
+            reverse (bool): True means iterate in reverse key order
+            limit (int | None): maximum number of items. None means unlimited
+        """
+        for key, val in self._rangeIter(top=self._tokey(keys, topive=topive),
+                                        seek=self._tokey(seek) if seek is not None else None,
+                                        after=after,
+                                        stop=self._tokey(stop) if stop is not None else None,
+                                        reverse=reverse, limit=limit):
+            yield (self._tokeys(key), self._des(val))
+
+
+    def getRangeKeyIter(self, keys: str|bytes|memoryview|Iterable="",
+                        *, topive=False, seek=None, after=False, stop=None,
+                        reverse=False, limit=None):
+        """Key only cursor range scan that yields each distinct key in range
+        once without reading values. Parameters as for getRangeItemIter.
+
+        Returns:
+            keys (Iterator[tuple]): keys tuple of each distinct key in range
+        """
+        for key in self._rangeIter(top=self._tokey(keys, topive=topive),
+                                   seek=self._tokey(seek) if seek is not None else None,
+                                   after=after,
+                                   stop=self._tokey(stop) if stop is not None else None,
+                                   reverse=reverse, limit=limit, values=False):
+            yield self._tokeys(key)
+
+
     def cntAll(self):
         """
         Return iterator over the all the items in subdb
@@ -1278,6 +1344,11 @@ class IoSetSuber(SuberBase):
             yield (self._tokeys(key), self._des(val))
 
 
+    def _rangeIter(self, **kwa):
+        """Range scan with hidden ordinal key suffix removed"""
+        return self.db.getIoSetRangeIter(db=self.sdb, sep=self.sep.encode(), **kwa)
+
+
 class CesrIoSetSuber(CesrSuberBase, IoSetSuber):
     """
     Subclass of CesrSuber and IoSetSuber.
@@ -1466,6 +1537,20 @@ class SignerSuber(CesrSuber):
                                    transferable=verfer.transferable))
 
 
+    def getRangeItemIter(self, keys: str | bytes | memoryview | Iterable = "",
+                         **kwa):
+        """Cursor range scan. See SuberBase.getRangeItemIter
+
+        Returns:
+            items (Iterator): of (key, val) tuples where val is Signer whose
+            transferability is given by the verkey that is the last key part
+        """
+        for ikeys, signer in super(SignerSuber, self).getRangeItemIter(keys, **kwa):
+            verfer = coring.Verfer(qb64b=ikeys[-1].encode())   # last split
+            yield (ikeys, self.klas(qb64b=signer.qb64b,
+                                    transferable=verfer.transferable))
+
+
 class CryptSignerSuber(SignerSuber):
     """
     Sub class of SignerSuber where data is Signer subclass instance .qb64b property
@@ -2194,6 +2279,11 @@ class IoDupSuber(DupSuber):
             yield (self._tokeys(key), self._des(val))
 
 
+    def _rangeIter(self, **kwa):
+        """Range scan with hidden dup ordinal proem removed from vals"""
+        return self.db.getIoDupRangeIter(db=self.sdb, **kwa)
+
+
 class B64IoDupSuber(B64SuberBase, IoDupSuber):
     """
     Subclass of B64SuberBase and IoDupSuber that serializes and deserializes
@@ -2515,3 +2605,84 @@ class B64OnIoDupSuber(B64SuberBase, OnIoDupSuber):
                            False means do not reverify. Default False
         """
         super(B64OnIoDupSuber, self).__init__(*pa, **kwa)
+
+
+class CacheSuber(CacheMixin, Suber):
+    """
+    Suber with read through LRU cache of values. See caching.CacheMixin
+    """
+
+    def __init__(self, *pa, **kwa):
+        """
+        Inherited Parameters:
+            db (dbing.LMDBer): base db
+            subkey (str):  LMDB sub database key
+            sep (str): separator to convert keys iterator to key bytes for db key
+                       default is self.Sep == '.'
+            verify (bool): True means reverify when ._des from db when applicable
+                           False means do not reverify. Default False
+            capacity (int): maximum number of values cached
+        """
+        super(CacheSuber, self).__init__(*pa, **kwa)
+
+
+class CacheCesrSuber(CacheMixin, CesrSuber):
+    """
+    CesrSuber with read through LRU cache of CESR primitive instances.
+    See caching.CacheMixin
+    """
+
+    def __init__(self, *pa, **kwa):
+        """
+        Inherited Parameters:
+            db (dbing.LMDBer): base db
+            subkey (str):  LMDB sub database key
+            sep (str): separator to convert keys iterator to key bytes for db key
+                       default is self.Sep == '.'
+            verify (bool): True means reverify when ._des from db when applicable
+                           False means do not reverify. Default False
+            klas (Type[coring.Matter]): Class reference to subclass of Matter
+            capacity (int): maximum number of values cached
+        """
+        super(CacheCesrSuber, self).__init__(*pa, **kwa)
+
+
+class CacheSerderSuber(CacheMixin, SerderSuber):
+    """
+    SerderSuber with read through LRU cache of Serder instances.
+    See caching.CacheMixin
+    """
+
+    def __init__(self, *pa, **kwa):
+        """
+        Inherited Parameters:
+            db (dbing.LMDBer): base db
+            subkey (str):  LMDB sub database key
+            sep (str): separator to convert keys iterator to key bytes for db key
+                       default is self.Sep == '.'
+            verify (bool): True means reverify when ._des from db when applicable
+                           False means do not reverify. Default False
+            klas (Type[serdering.Serder]): Class reference to subclass of Serder
+            capacity (int): maximum number of values cached
+        """
+        super(CacheSerderSuber, self).__init__(*pa, **kwa)
+
+
+class CacheSchemerSuber(CacheMixin, SchemerSuber):
+    """
+    SchemerSuber with read through LRU cache of Schemer instances.
+    See caching.CacheMixin
+    """
+
+    def __init__(self, *pa, **kwa):
+        """
+        Inherited Parameters:
+            db (dbing.LMDBer): base db
+            subkey (str):  LMDB sub database key
+            sep (str): separator to convert keys iterator to key bytes for db key
+                       default is self.Sep == '.'
+            verify (bool): True means reverify when ._des from db when applicable
+                           False means do not reverify. Default False
+            capacity (int): maximum number of values cached
+        """
+        super(CacheSchemerSuber, self).__init__(*pa, **kwa)
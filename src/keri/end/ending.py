@@ -23,6 +23,7 @@ from .. import help
 from .. import kering
 from ..app import habbing
 from ..core import coring, indexing
+from ..db import metering
 from ..help import helping
 
 logger = help.ogler.getLogger()
@@ -601,15 +602,62 @@ class OOBIEnd:
             msgs.extend(hab.replay(aid))
 
         if msgs:
-            rep.status = falcon.HTTP_200  # This is the default status
+            data = bytes(msgs)
+            etag = coring.Diger(ser=data).qb64  # lets resolvers re-fetch conditionally
+            rep.etag = etag
             rep.set_header(OOBI_AID_HEADER, aid)
+            if etag in (req.if_none_match or []):
+                rep.status = falcon.HTTP_NOT_MODIFIED
+                return
+
+            rep.status = falcon.HTTP_200  # This is the default status
             rep.content_type = "application/json+cesr"
-            rep.data = bytes(msgs)
+            rep.data = data
 
         else:
             rep.status = falcon.HTTP_NOT_FOUND
 
 
+class EscrowEnd:
+    """ REST API for escrow metrics of KEL and optionally TEL escrows
+
+    Attributes:
+        .db (Baser): KEL database
+        .reger (Reger | None): TEL database
+
+    """
+
+    def __init__(self, db, reger=None):
+        """  End point for reporting escrow metrics
+
+        Parameters:
+            db (Baser): KEL database with escrows
+            reger (Reger | None): TEL database with escrows
+
+        """
+        self.db = db
+        self.reger = reger
+
+    def on_get(self, req, rep):
+        """  GET endpoint for escrow metrics
+
+        Parameters:
+            req: Falcon request object
+            rep: Falcon response object
+
+        Query Parameters:
+            limit (int): maximum number of entries walked per escrow to compute
+                ages, 0 means counts and tallies only
+
+        """
+        limit = req.get_param_as_int("limit", min_value=0, default=1024)
+        metrics = metering.escrowMetrics(self.db, self.reger, limit=limit)
+
+        rep.status = falcon.HTTP_200
+        rep.content_type = "application/json"
+        rep.data = json.dumps(metrics).encode("utf-8")
+
+
 WEB_DIR_PATH = os.path.dirname(
     os.path.abspath(
         sys.modules.get(__name__).__file__))
@@ -667,7 +715,7 @@ def setup(name="who", temp=False, tymth=None, isith=None, count=1,
     path = os.path.dirname(__file__)
     path = os.path.join(path, 'logs')
     wl = wiring.WireLog(samed=True, filed=True, name=name, prefix='keri',
-                        reopen=True, headDirPath=path)
+                        temp=temp, reopen=True, headDirPath=path)
     wireDoer = wiring.WireLogDoer(wl=wl)  # setup doer
 
     # client = tcp.Client(host='127.0.0.1', port=remotePort, wl=wl)
@@ -804,6 +804,13 @@ class MissingDelegableApprovalError(ValidationError):
         raise MissingDelegableApprovalError("error message")
     """
 
+class StaleEscrowError(ValidationError):
+    """
+    Error escrowed item timed out before it could be unescrowed
+    Usage:
+        raise StaleEscrowError("error message")
+    """
+
 
 
 # Stream Parsing and Extraction Errors
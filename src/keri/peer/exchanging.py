@@ -13,7 +13,8 @@ from .. import help, kering, core
 from ..app import habbing
 from ..core import eventing, coring, serdering
 from ..help import helping
-from ..kering import ValidationError, MissingSignatureError, Vrsn_1_0, Vrsn_2_0
+from ..kering import (ValidationError, MissingSignatureError, StaleEscrowError,
+                      Vrsn_1_0, Vrsn_2_0)
 
 ExchangeMessageTimeWindow = timedelta(seconds=300)
 
@@ -185,7 +186,8 @@ class Exchanger:
         """ Process all escrows for `exn` messages
 
         """
-        self.processEscrowPartialSigned()
+        with self.hby.db.escrowMeter.timed("epse"):
+            self.processEscrowPartialSigned()
 
     def escrowPSEvent(self, serder, tsgs, pathed):
         """ Escrow event that does not have enough signatures.
@@ -224,7 +226,7 @@ class Exchanger:
                 dte = dater.datetime
                 if (dtnow - dte) > datetime.timedelta(seconds=self.TimeoutPSE):
                     # escrow stale so raise ValidationError which unescrows below
-                    raise ValidationError("Stale exn event escrow "
+                    raise StaleEscrowError("Stale exn event escrow "
                                           f"at dig = {dig}.")
 
                 old = None  # empty keys
@@ -255,6 +257,7 @@ class Exchanger:
                 self.hby.db.epse.rem(dig)
                 self.hby.db.epsd.rem(dig)
                 self.hby.db.esigs.rem(dig)
+                self.hby.db.escrowMeter.fail("epse", ex)
                 if logger.isEnabledFor(logging.DEBUG):
                     logger.exception("Exchange partially signed unescrowed: %s", ex.args[0])
                 else:
@@ -262,6 +265,7 @@ class Exchanger:
             else:
                 self.hby.db.epse.rem(dig)
                 self.hby.db.esigs.rem(dig)
+                self.hby.db.escrowMeter.succeed("epse")
                 logger.info("Exchanger unescrow succeeded in valid exchange: creder=%s", serder.said)
                 logger.debug("Event=\n%s\n", serder.pretty())
 
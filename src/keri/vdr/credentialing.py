@@ -719,9 +719,13 @@ class Registrar(doing.DoDoer):
         """
         Process TEL event escrows for multisig TEL events and their underlying KEL events.
         """
-        self.processWitnessEscrow()
-        self.processMultisigEscrow()
-        self.processDisseminationEscrow()
+        meter = self.rgy.reger.escrowMeter
+        with meter.timed("tpwe"):
+            self.processWitnessEscrow()
+        with meter.timed("tmse"):
+            self.processMultisigEscrow()
+        with meter.timed("tede"):
+            self.processDisseminationEscrow()
 
     def processWitnessEscrow(self):
         """
@@ -750,6 +754,7 @@ class Registrar(doing.DoDoer):
 
             rseq = coring.Seqner(qb64=snq)
             self.rgy.reger.tpwe.rem(keys=(regk, snq))
+            self.rgy.reger.escrowMeter.succeed("tpwe")
 
             self.rgy.reger.tede.add(keys=(regk, rseq.qb64), val=(prefixer, seqner, saider))
 
@@ -763,8 +768,9 @@ class Registrar(doing.DoDoer):
             try:
                 if not self.counselor.complete(prefixer, seqner, saider):
                     continue
-            except kering.ValidationError:
+            except kering.ValidationError as ex:
                 self.rgy.reger.tmse.rem(keys=(regk, snq, regd))
+                self.rgy.reger.escrowMeter.fail("tmse", ex)
                 continue
 
             rseq = coring.Seqner(qb64=snq)
@@ -775,6 +781,7 @@ class Registrar(doing.DoDoer):
             self.rgy.reger.putAnc(key, sealet)
 
             self.rgy.reger.tmse.rem(keys=(regk, snq, regd))
+            self.rgy.reger.escrowMeter.succeed("tmse")
             self.rgy.reger.tede.add(keys=(regk, rseq.qb64), val=(prefixer, seqner, saider))
 
     def processDisseminationEscrow(self):
@@ -790,6 +797,7 @@ class Registrar(doing.DoDoer):
                 continue
 
             self.rgy.reger.tede.rem(keys=(regk, snq))
+            self.rgy.reger.escrowMeter.succeed("tede")
 
             tevt = bytearray()
             for msg in self.rgy.reger.clonePreIter(pre=regk, fn=rseq.sn):
@@ -932,6 +940,7 @@ class Credentialer(doing.DoDoer):
 
             # Remove from this escrow
             self.rgy.reger.cmse.rem(keys=(said, snq))
+            self.rgy.reger.escrowMeter.succeed("cmse")
 
             # place in escrow to disseminate to other if witnesser and if there is an issuee
             self.rgy.reger.ccrd.put(keys=(said,), val=creder)
@@ -972,7 +981,8 @@ class Credentialer(doing.DoDoer):
         """
         Process credential missing signature escrow.
         """
-        self.processCredentialMissingSigEscrow()
+        with self.rgy.reger.escrowMeter.timed("cmse"):
+            self.processCredentialMissingSigEscrow()
 
 
 def sendCredential(hby, hab, reger, postman, creder, recp):
@@ -2012,8 +2012,10 @@ class Tevery:
         """ Loop through escrows and process and events that may now be finalized """
 
         try:
-            self.processEscrowAnchorless()
-            self.processEscrowOutOfOrders()
+            with self.reger.escrowMeter.timed("taes"):
+                self.processEscrowAnchorless()
+            with self.reger.escrowMeter.timed("oots"):
+                self.processEscrowOutOfOrders()
             self.reger.txnsb.processEscrowState(typ="credential-mre", processReply=self.processReplyCredentialTxnState,
                                                 extype=kering.MissingRegistryError)
             self.reger.txnsb.processEscrowState(typ="credential-mae", processReply=self.processReplyCredentialTxnState,
@@ -2080,6 +2082,7 @@ class Tevery:
             except Exception as ex:  # log diagnostics errors etc
                 # error other than out of order so remove from OO escrow
                 self.reger.delOot(snKey(pre, sn))  # removes one escrow at key val
+                self.reger.escrowMeter.fail("oots", ex)
                 if logger.isEnabledFor(logging.DEBUG):
                     logger.exception("Tevery OOO unescrowed: %s", ex.args[0])
                 else:
@@ -2090,6 +2093,7 @@ class Tevery:
                 # duplicitous so we process remaining escrows in spite of found
                 # valid event escrow.
                 self.reger.delOot(snKey(pre, sn))  # removes from escrow
+                self.reger.escrowMeter.succeed("oots")
                 logger.info("Tevery OOO unescrow succeeded in valid event: said=%s", tserder.said)
                 logger.debug("Event=\n%s\n", tserder.pretty())
 
@@ -2144,6 +2148,7 @@ class Tevery:
             except Exception as ex:  # log diagnostics errors etc
                 # error other than out of order so remove from OO escrow
                 self.reger.delTae(snKey(pre, sn))  # removes one escrow at key val
+                self.reger.escrowMeter.fail("taes", ex)
                 if logger.isEnabledFor(logging.DEBUG):
                     logger.exception("Tevery ANC unescrowed: %s", ex.args[0])
                 else:
@@ -2154,5 +2159,6 @@ class Tevery:
                 # duplicitous so we process remaining escrows in spite of found
                 # valid event escrow.
                 self.reger.delTae(snKey(pre, sn))  # removes from escrow
+                self.reger.escrowMeter.succeed("taes")
                 logger.info("Tevery ANC unescrow succeeded in valid event: said=%s", tserder.said)
                 logger.debug("event=\n%s\n", tserder.pretty())
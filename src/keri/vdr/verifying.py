@@ -251,17 +251,26 @@ class Verifier:
 
         """
 
-        self._processEscrow(self.reger.mce, self.TimeoutMRI, kering.MissingChainError)
-        self._processEscrow(self.reger.mse, self.TimeoutMRI, kering.MissingSchemaError)
-        self._processEscrow(self.reger.mre, self.TimeoutMRE, kering.MissingRegistryError)
-
-    def _processEscrow(self, db, timeout, etype: Type[Exception]):
+        meter = self.reger.escrowMeter
+        with meter.timed("mce"):
+            self._processEscrow(self.reger.mce, self.TimeoutMRI, kering.MissingChainError,
+                                escrow="mce")
+        with meter.timed("mse"):
+            self._processEscrow(self.reger.mse, self.TimeoutMRI, kering.MissingSchemaError,
+                                escrow="mse")
+        with meter.timed("mre"):
+            self._processEscrow(self.reger.mre, self.TimeoutMRE, kering.MissingRegistryError,
+                                escrow="mre")
+
+    def _processEscrow(self, db, timeout, etype: Type[Exception], escrow=None):
         """ Generic credential escrow processing
 
         Parameters:
             db (LMDBer): escrow database table to process
             timeout (float): escrow specific message timeout
             etype (TypeOf(Exception)): exception class to catch and ignore
+            escrow (str | None): name of escrow to tally outcomes under in
+                .reger.escrowMeter. None means do not tally
 
         """
         for (said,), dater in db.getItemIter():
@@ -276,8 +285,8 @@ class Verifier:
                     logger.info("Verifier unescrow error: Stale event escrow "
                                 " at said = %s", said)
 
-                    raise kering.ValidationError("Stale event escrow "
-                                                 "at said = {}.".format(said))
+                    raise kering.StaleEscrowError("Stale event escrow "
+                                                  "at said = {}.".format(said))
 
                 self.processCredential(creder, prefixer, seqner, saider)
 
@@ -288,12 +297,16 @@ class Verifier:
             except Exception as ex:  # log diagnostics errors etc
                 # error other than missing sigs so remove from PA escrow
                 db.rem(said)
+                if escrow is not None:
+                    self.reger.escrowMeter.fail(escrow, ex)
                 if logger.isEnabledFor(logging.DEBUG):
                     logger.exception("Verifier unescrowed: %s", ex.args[0])
                 else:
                     logger.error("Verifier unescrowed: %s", ex.args[0])
             else:
                 db.rem(said)
+                if escrow is not None:
+                    self.reger.escrowMeter.succeed(escrow)
                 logger.info("Verifier: unescrow succeeded in valid group op: creder=%s", creder.said)
                 logger.debug(f"#vent=\n%s\n", creder.pretty())
 
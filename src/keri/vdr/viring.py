@@ -11,7 +11,7 @@ A special purpose Verifiable Data Registry (VDR)
 from dataclasses import dataclass, field, asdict
 from  ordered_set import OrderedSet as oset
 
-from ..db import koming, subing, escrowing
+from ..db import koming, subing, escrowing, metering
 
 from .. import kering, core
 from ..app import signing
@@ -233,11 +233,15 @@ class Reger(dbing.LMDBer):
             key is habitat name str
             value is serialized RegistryRecord dataclass
 
+        .states is CacheKomer of RegStateRecord registry states that holds up
+            to .CacheCapacity deserialized states. See caching.CacheMixin
+
 
     """
     TailDirPath = "keri/reg"
     AltTailDirPath = ".keri/reg"
     TempPrefix = "keri_reg_"
+    CacheCapacity = 1024  # values cached per cached sub db, 0 disables
 
     def __init__(self, headDirPath=None, reopen=True, **kwa):
         """
@@ -269,6 +273,7 @@ class Reger(dbing.LMDBer):
         """
 
         self.registries = oset()
+        self.escrowMeter = metering.EscrowMeter()  # escrow processing tallies
         if "db" in kwa:
             self._tevers = rbdict()
             self._tevers.reger = self  # assign db for read thorugh cache of kevers
@@ -311,9 +316,10 @@ class Reger(dbing.LMDBer):
 
         # Registry state made of RegStateRecord.
         # Each registry has registry event log keyed by registry identifier
-        self.states = koming.Komer(db=self,
-                                   schema=RegStateRecord,
-                                   subkey='stts.')
+        self.states = koming.CacheKomer(db=self,
+                                        schema=RegStateRecord,
+                                        subkey='stts.',
+                                        capacity=self.CacheCapacity)
         #self.states = subing.SerderSuber(db=self, subkey='stts.')  # registry event state
 
         # Holds the credential
@@ -395,88 +401,89 @@ class Reger(dbing.LMDBer):
             list: fully hydrated credentials with full chains provided
 
         """
-        creds = []
-        for saider in saids:
-            key = saider.qb64
-            creder, prefixer, seqner, asaider = self.cloneCred(said=key)
-            atc = bytearray(signing.serialize(creder, prefixer, seqner, saider))
-            del atc[0:creder.size]
-
-            regk = creder.regid
-            status = self.tevers[regk].vcState(saider.qb64)
-            schemer = db.schema.get(creder.schema)
-
-            iss = bytearray(self.cloneTvtAt(creder.said, sn=0))
-            iserder = serdering.SerderKERI(raw=iss)
-            issatc = bytes(iss[iserder.size:])
-            del iss[0:iserder.size]
-            if status.et in [coring.Ilks.rev, coring.Ilks.brv]:
-                rev = bytearray(self.cloneTvtAt(creder.said, sn=1))
-                rserder = serdering.SerderKERI(raw=rev)
-                revatc = bytes(rev[rserder.size:])
-                del rev[0:rserder.size]
-
-            chainSaids = []
-            for k, p in (creder.edge.items() if creder.edge is not None else {}):
-                if k == "d":
-                    continue
-
-                if not isinstance(p, dict):
-                    continue
-
-                chainSaids.append(coring.Saider(qb64=p["n"]))
-            chains = self.cloneCreds(chainSaids, db)
-
-            cred = dict(
-                sad=creder.sad,
-                atc=atc.decode("utf-8"),
-                iss=iserder.sad,
-                issatc=issatc.decode("utf-8"),
-                rev=rserder.sad if status.et in [coring.Ilks.rev, coring.Ilks.brv] else None,
-                revatc=revatc.decode("utf-8") if status.et in [coring.Ilks.rev, coring.Ilks.brv] else None,
-                pre=creder.issuer,
-                schema=schemer.sed,
-                chains=chains,
-                status=asdict(status),
-                anchor=dict(
-                    pre=prefixer.qb64,
-                    sn=seqner.sn,
-                    d=asaider.qb64
+        with self.snapshot(), db.snapshot():  # consistent reads of both dbs
+            creds = []
+            for saider in saids:
+                key = saider.qb64
+                creder, prefixer, seqner, asaider = self.cloneCred(said=key)
+                atc = bytearray(signing.serialize(creder, prefixer, seqner, saider))
+                del atc[0:creder.size]
+
+                regk = creder.regid
+                status = self.tevers[regk].vcState(saider.qb64)
+                schemer = db.schema.get(creder.schema)
+
+                iss = bytearray(self.cloneTvtAt(creder.said, sn=0))
+                iserder = serdering.SerderKERI(raw=iss)
+                issatc = bytes(iss[iserder.size:])
+                del iss[0:iserder.size]
+                if status.et in [coring.Ilks.rev, coring.Ilks.brv]:
+                    rev = bytearray(self.cloneTvtAt(creder.said, sn=1))
+                    rserder = serdering.SerderKERI(raw=rev)
+                    revatc = bytes(rev[rserder.size:])
+                    del rev[0:rserder.size]
+
+                chainSaids = []
+                for k, p in (creder.edge.items() if creder.edge is not None else {}):
+                    if k == "d":
+                        continue
+
+                    if not isinstance(p, dict):
+                        continue
+
+                    chainSaids.append(coring.Saider(qb64=p["n"]))
+                chains = self.cloneCreds(chainSaids, db)
+
+                cred = dict(
+                    sad=creder.sad,
+                    atc=atc.decode("utf-8"),
+                    iss=iserder.sad,
+                    issatc=issatc.decode("utf-8"),
+                    rev=rserder.sad if status.et in [coring.Ilks.rev, coring.Ilks.brv] else None,
+                    revatc=revatc.decode("utf-8") if status.et in [coring.Ilks.rev, coring.Ilks.brv] else None,
+                    pre=creder.issuer,
+                    schema=schemer.sed,
+                    chains=chains,
+                    status=asdict(status),
+                    anchor=dict(
+                        pre=prefixer.qb64,
+                        sn=seqner.sn,
+                        d=asaider.qb64
+                    )
                 )
-            )
 
-            ctr = core.Counter(qb64b=iss, strip=True, version=kering.Vrsn_1_0)
-            if ctr.code == counting.CtrDex_1_0.AttachmentGroup:
                 ctr = core.Counter(qb64b=iss, strip=True, version=kering.Vrsn_1_0)
-
-            if ctr.code == counting.CtrDex_1_0.SealSourceCouples:
-                coring.Seqner(qb64b=iss, strip=True)
-                saider = coring.Saider(qb64b=iss)
-
-                anc = db.cloneEvtMsg(pre=creder.issuer, fn=0, dig=saider.qb64b)
-                aserder = serdering.SerderKERI(raw=anc)
-                ancatc = bytes(anc[aserder.size:])
-                cred['anc'] = aserder.sad
-                cred['ancatc'] = ancatc.decode("utf-8"),
-
-            if status.et in [coring.Ilks.rev, coring.Ilks.brv]:
-                ctr = core.Counter(qb64b=rev, strip=True, version=kering.Vrsn_1_0)
                 if ctr.code == counting.CtrDex_1_0.AttachmentGroup:
-                    ctr = core.Counter(qb64b=rev, strip=True, version=kering.Vrsn_1_0)
+                    ctr = core.Counter(qb64b=iss, strip=True, version=kering.Vrsn_1_0)
 
                 if ctr.code == counting.CtrDex_1_0.SealSourceCouples:
-                    coring.Seqner(qb64b=rev, strip=True)
-                    saider = coring.Saider(qb64b=rev)
+                    coring.Seqner(qb64b=iss, strip=True)
+                    saider = coring.Saider(qb64b=iss)
 
                     anc = db.cloneEvtMsg(pre=creder.issuer, fn=0, dig=saider.qb64b)
                     aserder = serdering.SerderKERI(raw=anc)
                     ancatc = bytes(anc[aserder.size:])
-                    cred['revanc'] = aserder.sad
-                    cred['revancatc'] = ancatc.decode("utf-8"),
+                    cred['anc'] = aserder.sad
+                    cred['ancatc'] = ancatc.decode("utf-8"),
+
+                if status.et in [coring.Ilks.rev, coring.Ilks.brv]:
+                    ctr = core.Counter(qb64b=rev, strip=True, version=kering.Vrsn_1_0)
+                    if ctr.code == counting.CtrDex_1_0.AttachmentGroup:
+                        ctr = core.Counter(qb64b=rev, strip=True, version=kering.Vrsn_1_0)
+
+                    if ctr.code == counting.CtrDex_1_0.SealSourceCouples:
+                        coring.Seqner(qb64b=rev, strip=True)
+                        saider = coring.Saider(qb64b=rev)
+
+                        anc = db.cloneEvtMsg(pre=creder.issuer, fn=0, dig=saider.qb64b)
+                        aserder = serdering.SerderKERI(raw=anc)
+                        ancatc = bytes(anc[aserder.size:])
+                        cred['revanc'] = aserder.sad
+                        cred['revancatc'] = ancatc.decode("utf-8"),
 
-            creds.append(cred)
+                creds.append(cred)
 
-        return creds
+            return creds
 
     def logCred(self, creder, prefixer, seqner, saider):
         """ Save the base credential and seals (est evt+sigs quad) with no indices.
@@ -66,21 +66,35 @@ class ReceiptDoer(doing.DoDoer):
 
         palHab = self.hby.makeHab(name="pal", wits=[self.wanHab.pre, self.wilHab.pre], transferable=True)
 
+        pamHab = self.hby.makeHab(name="pam", wits=[self.wanHab.pre, self.wilHab.pre], transferable=True)
+
         witDoer = agenting.WitnessReceiptor(hby=self.hby)
         witDoer.msgs.append(dict(pre=palHab.pre))
+        witDoer.msgs.append(dict(pre=pamHab.pre))
         self.extend([witDoer])
 
         kev = palHab.kever
         ser = kev.serder
         dgkey = dbing.dgKey(ser.preb, ser.saidb)
+        pamDgkey = dbing.dgKey(pamHab.kever.serder.preb, pamHab.kever.serder.saidb)
 
+        receipting = 0
         while True:
+            receipting = max(receipting, len(witDoer.receipting))
             wilWigs = self.wilHab.db.getWigs(dgkey)
             wanWigs = self.wanHab.db.getWigs(dgkey)
-            if len(wilWigs) == 2 and len(wanWigs) == 2:
+            pamWigs = self.hby.db.getWigs(pamDgkey)
+            if len(wilWigs) == 2 and len(wanWigs) == 2 and len(pamWigs) == 2:
                 break
             yield self.tock
 
+        assert receipting == 2  # both events receipted concurrently
+        while len(witDoer.cues) < 2:
+            yield self.tock
+        assert [cue["pre"] for cue in witDoer.cues] == [palHab.pre, pamHab.pre] or \
+               [cue["pre"] for cue in witDoer.cues] == [pamHab.pre, palHab.pre]
+        assert self.hby.db.wigWatches == {}
+
         # Controller should send endpoints between witnesses.  Check for Endpoints for each other:
         keys = (self.wanHab.pre, kering.Schemes.tcp)
         said = self.wilHab.db.lans.get(keys=keys)
@@ -119,6 +119,37 @@ def anchorer_test_do(tymth=None, tock=0.0, **opts):
         yield tock
 
 
+def test_anchorer_notices():
+    """
+    Test Anchorer notices each completed witness receipt watch once and drops
+    watches of events removed from escrow elsewhere
+    """
+    with habbing.openHby(name="ext", temp=True) as extHby, \
+            habbing.openHby(name="del", temp=True) as delHby:
+        extHab = extHby.makeHab(name="ext")
+        delHby.psr.parse(ims=bytearray(extHab.makeOwnInception()))
+        serder = extHab.kever.serder
+        key = (serder.pre, serder.said)
+
+        anchorer = delegating.Anchorer(hby=delHby)
+        delHby.db.dpwe.pin(keys=key, val=serder)
+        assert not anchorer.notices()
+
+        anchorer.processPartialWitnessEscrow()  # not local so stays in escrow
+        assert anchorer.witnessed[key].done
+        assert anchorer.notices()
+        assert not anchorer.notices()  # noticed once so left to periodic pass
+        anchorer.processPartialWitnessEscrow()
+        assert not anchorer.notices()
+
+        delHby.db.dpwe.rem(keys=key)
+        anchorer.processPartialWitnessEscrow()
+        assert anchorer.witnessed == {}
+        assert anchorer.noticed == set()
+        assert delHby.db.wigWatches == {}
+    """Done Test"""
+
+
 def test_delegation_request(mockHelpingNowUTC):
     with habbing.openHab(name="test", temp=True, salt=b'0123456789abcdef') as (hby, hab):
 
@@ -7,8 +7,10 @@ tests.peer.httping module
 import falcon
 import pytest
 from falcon.testing import helpers
+from hio.base import doing
+from hio.core import http, tcp
 
-from keri.app import habbing, httping
+from keri.app import habbing, httping, indirecting
 from keri.core import coring, serdering
 from keri.vdr import credentialing, verifying
 
@@ -200,5 +202,213 @@ def test_stream_cesr_request(mockHelpingNowUTC):
                                               b'jIu5ZwJILbL2bcID')
 
 
+def test_batch_cesr_request():
+    """
+    Test batched CESR requests and fallback to one request per message for older peers
+    """
+    class LegacyEnd:
+        def __init__(self):
+            self.payloads = []
+
+        def on_post(self, req, rep):
+            cr = httping.parseCesrHttpRequest(req=req)
+            self.payloads.append(cr.payload)
+            rep.status = falcon.HTTP_204
+
+    with habbing.openHab(name="test", transferable=True, temp=True, salt=b'0123456789abcdef') as (hby, hab):
+        wit = "BGKVzj4ve0VSd8z_AmvhLg4lqcC_9WYX90k03q-R_Ydo"
+        hab.interact()
+        hab.interact()
+        msgs = bytearray()
+        for msg in hby.db.clonePreIter(pre=hab.pre):
+            msgs.extend(msg)
+
+        client = MockClient()
+        assert httping.batchCESRRequest(client, bytearray(msgs), dest=wit, path="/events") == 1
+        args = client.args.pop()
+        assert args["method"] == "POST"
+        assert args["path"] == "/events"
+        assert args["body"] == bytes(msgs)
+        headers = args["headers"]
+        assert headers["Content-Type"] == "application/cesr"
+        assert headers["Content-Length"] == len(msgs)
+        assert headers["CESR-DESTINATION"] == wit
+
+        rxbs = bytearray()
+        app = falcon.App()
+        app.add_route("/", indirecting.HttpEnd(rxbs=rxbs))
+        server = http.Server(port=5690, app=app)
+        legacyEnd = LegacyEnd()
+        legacyApp = falcon.App()
+        legacyApp.add_route("/", legacyEnd)
+        legacyServer = http.Server(port=5691, app=legacyApp)
+
+        clienter = httping.Clienter()
+        results = dict()
+
+        def postDo(tymth=None, tock=0.0, **kwa):
+            yield tock
+            client = clienter.client("http://127.0.0.1:5690")
+            results["sent"] = clienter.post(client, ims=bytearray(msgs), dest=wit)
+            while not client.responses:
+                yield tock
+            rep = client.respond()
+            results["status"] = rep.status
+            results["reposted"] = clienter.fallback(client, rep)
+
+            client = clienter.client("http://127.0.0.1:5691")
+            sent = clienter.post(client, ims=bytearray(msgs), dest=wit)
+            while not client.responses:
+                yield tock
+            rep = client.respond()
+            results["legacyStatus"] = rep.status
+            sent += clienter.fallback(client, rep) - 1
+            results["legacySent"] = sent
+            statuses = []
+            while len(statuses) < sent:
+                while not client.responses:
+                    yield tock
+                statuses.append(client.respond().status)
+            results["legacyStatuses"] = statuses
+            return True
+
+        doist = doing.Doist(limit=2.0, tock=0.03125, real=True)
+        doist.do(doers=[http.ServerDoer(server=server), http.ServerDoer(server=legacyServer),
+                        clienter, doing.doify(postDo)])
+
+        assert results["sent"] == 1
+        assert results["status"] == 204
+        assert results["reposted"] == 0
+        assert rxbs == msgs  # whole batch fed once
+
+        assert results["legacyStatus"] == 406
+        assert results["legacySent"] == 3
+        assert results["legacyStatuses"] == [204, 204, 204]
+        assert [payload["s"] for payload in legacyEnd.payloads] == ["0", "1", "2"]
+        assert clienter.legacy == {("http", "127.0.0.1", 5691)}
+
+        client = MockClient()
+        client.origin = ("http", "127.0.0.1", 5691)
+        assert clienter.post(client, ims=bytearray(msgs), dest=wit) == 3
+
+
+def test_clienter_pool():
+    """
+    Test Clienter pools keep-alive connections per origin
+    """
+    class EchoEnd:
+        def on_get(self, req, rep):
+            rep.status = falcon.HTTP_200
+            rep.text = req.get_param("n", default="")
+
+        def on_post(self, req, rep):
+            rep.status = falcon.HTTP_200
+            rep.data = req.bounded_stream.read()
+
+    app = falcon.App()
+    app.add_route("/echo", EchoEnd())
+    server = http.Server(port=5689, app=app)
+    serverDoer = http.ServerDoer(server=server)
+
+    clienter = httping.Clienter()
+    clienter.MaxConnections = 2
+    results = dict()
+
+    def requestDo(tymth=None, tock=0.0, **kwa):
+        yield tock
+        # sequential requests reuse one keep-alive connection
+        for n in range(3):
+            client = clienter.request("GET", f"http://127.0.0.1:5689/echo?n={n}")
+            while not client.responses:
+                yield tock
+            rep = client.respond()
+            results.setdefault("seq", []).append((rep.status, rep.body))
+            clienter.remove(client)
+        results["seqConns"] = len(clienter.pool[("http", "127.0.0.1", 5689)])
+
+        # concurrent requests are capped per origin and queued onto connections
+        clients = [clienter.request("POST", "http://127.0.0.1:5689/echo", body=f"b{n}")
+                   for n in range(5)]
+        results["conConns"] = len(clienter.pool[("http", "127.0.0.1", 5689)])
+        while not all(client.responses for client in clients):
+            yield tock
+        results["con"] = [client.respond().body for client in clients]
+        for client in clients:
+            clienter.remove(client)
+        assert clienter.clients == []
+        return True
+
+    doist = doing.Doist(limit=2.0, tock=0.03125, real=True)
+    doist.do(doers=[serverDoer, clienter, doing.doify(requestDo)])
+
+    assert results["seq"] == [(200, b"0"), (200, b"1"), (200, b"2")]
+    assert results["seqConns"] == 1
+    assert results["conConns"] == 2
+    assert results["con"] == [b"b0", b"b1", b"b2", b"b3", b"b4"]
+
+    # idle connections are closed
+    clienter.IdleTimeout = -1
+    doist = doing.Doist(limit=0.1, tock=0.03125, real=True)
+    doist.do(doers=[clienter])
+    assert clienter.pool == {}
+
+
+def test_clienter_cutoff():
+    """
+    Test Clienter fails the request in flight and requeues the queued requests
+    of a connection the server drops mid response
+    """
+    class DroppingServerDoer(tcp.ServerDoer):
+        """ Drops first connection mid response then answers in full """
+        def recur(self, tyme):
+            self.server.service()
+            for ca, ix in list(self.server.ixes.items()):
+                if b"\r\n\r\n" not in ix.rxbs:
+                    continue
+                ix.clearRxbs()
+                self.seen += 1
+                if self.seen == 1:  # promise 10 bytes, send 3 then drop
+                    ix.tx(b"HTTP/1.1 200 OK\r\nContent-Length: 10\r\n\r\nabc")
+                    ix.serviceSends()
+                    self.server.removeIx(ca)
+                else:
+                    ix.tx(b"HTTP/1.1 200 OK\r\nContent-Length: 2\r\n\r\nok")
+
+    server = tcp.Server(host="127.0.0.1", port=5692)
+    serverDoer = DroppingServerDoer(server=server)
+    serverDoer.seen = 0
+
+    clienter = httping.Clienter()
+    clienter.MaxConnections = 1
+    origin = ("http", "127.0.0.1", 5692)
+    results = dict()
+
+    def requestDo(tymth=None, tock=0.0, **kwa):
+        yield tock
+        first = clienter.request("GET", "http://127.0.0.1:5692/first")
+        second = clienter.request("GET", "http://127.0.0.1:5692/second")
+        results["conn"] = clienter.pool[origin][0]
+        while not (first.responses and second.responses):
+            yield tock
+        results["first"] = first.respond()
+        results["second"] = second.respond()
+        results["conns"] = list(clienter.pool[origin])
+        return True
+
+    doist = doing.Doist(limit=2.0, tock=0.03125, real=True)
+    doist.do(doers=[serverDoer, clienter, doing.doify(requestDo)])
+
+    rep = results["first"]  # in flight when dropped so failed not resent
+    assert rep.errored
+    assert rep.status is None
+    assert rep.request["path"].startswith("/first")
+    rep = results["second"]  # queued behind it so requeued on new connection
+    assert not rep.errored
+    assert (rep.status, rep.body) == (200, b"ok")
+    assert rep.request["path"].startswith("/second")
+    assert serverDoer.seen == 2
+    assert results["conn"] not in results["conns"]  # cut off connection retired
+
+
 if __name__ == '__main__':
     test_parse_cesr_request()
@@ -76,6 +76,38 @@ def test_mailbox_iter():
         next(mbi)
 
 
+def test_mailbox_iter_idle():
+    pre = "EA3mbE6upuYnFlx68GmLYCQd7cCcwG_AtHM6dW_GT068"
+    mbx = storing.Mailboxer(temp=True)
+    mb = indirecting.MailboxIterable(mbx=mbx, pre=pre, topics={"/receipt": 0, "/multisig": 0},
+                                     retry=1000)
+    scans = []
+    cloneTopicIter = mbx.cloneTopicIter
+
+    def countingIter(topic, fn=0):
+        scans.append(topic)
+        return cloneTopicIter(topic, fn)
+
+    mbx.cloneTopicIter = countingIter
+
+    mbi = iter(mb)
+    assert next(mbi) == b'retry: 1000\n\n'
+    for _ in range(10):  # idle stream does not scan mailbox
+        assert next(mbi) == b''
+    assert scans == []
+
+    msg = json.dumps(dict(i=pre, t="rct")).encode("utf-8")
+    mbx.storeMsg(topic=f"{pre}/multisig", msg=msg)
+    val = next(mbi)
+    assert val.startswith(b'id: 0\nevent: /multisig\n')
+    assert scans == [f"{pre}/multisig"]  # only topic with new message
+    assert mb.topics == {"/receipt": 0, "/multisig": 1}
+
+    assert next(mbi) == b''
+    assert scans == [f"{pre}/multisig"]
+    mbx.close(clear=True)
+
+
 def test_mailbox_multiple_iter():
     pre = "EA3mbE6upuYnFlx68GmLYCQd7cCcwG_AtHM6dW_GT068"
     msg = dict(words=["abc", "def"])
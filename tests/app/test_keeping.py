@@ -2008,5 +2008,183 @@ def test_manager_sign_dual_indices():
     assert not manager.ks.opened
     """End Test"""
 
+
+def test_signer_cache():
+    """
+    test SignerCache and Manager signing through it
+    """
+    signer = core.Signer(raw=b'0123456789abcdef0123456789abcdef')
+    other = core.Signer(raw=b'abcdef0123456789abcdef0123456789')
+    pub = signer.verfer.qb64
+
+    cache = keeping.SignerCache(ttl=60.0, size=1)
+    assert cache.enabled
+    assert cache.get(pub) is None
+    cache.put(pub, signer)
+    assert cache.get(pub) is signer
+    assert (cache.hits, cache.misses) == (1, 1)
+
+    cache.put(other.verfer.qb64, other)  # evicts least recently used signer
+    assert len(cache) == 1
+    assert cache.get(pub) is None
+    assert signer.raw == bytes(32)  # zeroized on eviction
+    with pytest.raises(kering.KeriError):
+        signer.sign(b"abc")  # lingering reference fails loudly
+
+    seed = b'0123456789abcdef0123456789abcdef'
+    signer = core.Signer(raw=seed)
+    cache.put(signer.verfer.qb64, signer)
+    held = signer.raw
+    assert isinstance(held, bytearray) and held == seed
+    assert signer.verfer.verify(signer.sign(b"abc").raw, b"abc")  # cached signs
+    assert signer.qb64 == core.Signer(raw=seed).qb64
+    cache.remove(signer.verfer.qb64)
+    assert held == bytes(32)  # seed bytearray overwritten in place
+    with pytest.raises(kering.KeriError):
+        signer.sign(b"abc", index=0)
+
+    cache.ttl = 0.0  # expires immediately
+    assert not cache.enabled
+    cache.put(pub, core.Signer())  # disabled so not cached
+    assert cache.get(pub) is None
+    assert cache.get(other.verfer.qb64) is None  # expired
+    assert other.raw == bytes(32)
+    assert len(cache) == 0
+
+    raw = b'0123456789abcdef'
+    salt = core.Salter(raw=raw).qb64
+    ser = b"See ya later Alligator. In a while Crocodile."
+
+    with keeping.openKS() as keeper:
+        manager = keeping.Manager(ks=keeper, salt=salt)
+        assert isinstance(manager.signers, keeping.SignerCache)
+        verfers, digers = manager.incept(icount=2, ncount=2, stem="red", temp=True)
+        pre = verfers[0].qb64
+        pubs = [verfer.qb64 for verfer in verfers]
+
+        sigers = manager.sign(ser=ser, pubs=pubs)
+        assert len(manager.signers) == 2
+        assert manager.signers.misses == 2
+        cached = manager.signers.get(pubs[0])
+
+        assert ([siger.qb64 for siger in manager.sign(ser=ser, verfers=verfers)] ==
+                [siger.qb64 for siger in sigers])  # from cache
+        assert manager.signers.hits == 3
+
+        cigars = manager.sign(ser=ser, pubs=pubs, indexed=False)
+        assert [cigar.verfer.qb64 for cigar in cigars] == pubs
+
+        nverfers, _ = manager.rotate(pre=pre, temp=True)
+        assert len(manager.signers) == 0  # prior signers invalidated
+        assert cached.raw == bytes(32)
+        with pytest.raises(kering.KeriError):
+            cached.sign(ser=ser)
+        assert manager.sign(ser=ser, verfers=nverfers)
+        assert len(manager.signers) == 2
+
+        manager.close()
+        assert len(manager.signers) == 0
+
+    with keeping.openKS() as keeper:
+        manager = keeping.Manager(ks=keeper, salt=salt, signerTTL=0)
+        verfers, digers = manager.incept(icount=1, ncount=1, stem="red", temp=True)
+        assert manager.sign(ser=ser, verfers=verfers)
+        assert len(manager.signers) == 0  # disabled
+
+        manager.signers.ttl = 60.0
+        assert manager.sign(ser=ser, verfers=verfers)
+        assert len(manager.signers) == 1
+        manager.updateAeid(manager.aeid, manager.seed)
+        assert len(manager.signers) == 0  # re-encrypted so invalidated
+        assert manager.sign(ser=ser, verfers=verfers)
+    """End Test"""
+
+
+def test_prederiver():
+    """
+    test Prederiver staging of next key sets used by Manager.rotate
+    """
+    raw = b'0123456789abcdef'
+    salt = core.Salter(raw=raw).qb64
+    seed = core.Signer(raw=b'0123456789abcdef0123456789abcdef',
+                       transferable=False).qb64
+    aeid = core.Signer(qb64=seed, transferable=False).verfer.qb64
+
+    with keeping.openKS() as keeper, keeping.openKS() as other:
+        manager = keeping.Manager(ks=keeper, seed=seed, aeid=aeid, salt=salt)
+        unstaged = keeping.Manager(ks=other, salt=salt)
+        verfers, _ = manager.incept(icount=2, ncount=2, stem="red", temp=True)
+        pre = verfers[0].qb64
+        unstaged.incept(icount=2, ncount=2, stem="red", temp=True)
+        assert manager.prederivation(pre, ncount=0) is None
+
+        prederiver = keeping.Prederiver(manager=manager)
+        assert prederiver.limit == keeping.Prederiver.Limits[core.Tiers.low]
+        with pytest.raises(kering.ClosedError):
+            prederiver.submit(pre, temp=True)
+
+        prederiver.enter()
+        try:
+            assert prederiver.submit(pre, ncount=2, temp=True)
+            future = prederiver.pending[0][1]
+            future.result(timeout=60)
+            assert not prederiver.recur(tyme=0.0)
+            assert prederiver.pending == []
+        finally:
+            prederiver.exit()
+        assert prederiver.executor is None
+
+        staged = list(keeper.stgs.getItemIter(decrypter=manager.decrypter))
+        assert len(staged) == 2
+        assert all(bytes(keeper.getVal(keeper.stgs.sdb, keeper.stgs._tokey(keys)))
+                   != signer.qb64b for keys, signer in staged)  # stored encrypted
+
+        nverfers, ndigers = manager.rotate(pre=pre, ncount=2, temp=True)
+        assert keeper.cnt(keeper.stgs.sdb) == 0  # used so unstaged
+        uverfers, udigers = unstaged.rotate(pre=pre, ncount=2, temp=True)  # same salt same pre
+        assert [verfer.qb64 for verfer in nverfers] == [verfer.qb64 for verfer in uverfers]
+        assert [diger.qb64 for diger in ndigers] == [diger.qb64 for diger in udigers]
+        assert ({signer.verfer.qb64 for _, signer in staged} ==
+                set(manager.ks.sits.get(pre).nxt.pubs))
+
+        nverfers, ndigers = manager.rotate(pre=pre, temp=True)  # not staged so derived
+        uverfers, udigers = unstaged.rotate(pre=pre, temp=True)
+        assert [diger.qb64 for diger in ndigers] == [diger.qb64 for diger in udigers]
+
+        def stage(manager):
+            spec = manager.prederivation(pre, temp=True)
+            manager.stage(spec, keeping.prederive(**{k: spec[k] for k in
+                                                     ("salt", "tier", "paths", "codes",
+                                                      "transferable", "temp")}))
+            return [keeping.stageKey(spec["salt"], path, code, spec["tier"],
+                                     spec["transferable"], spec["temp"])
+                    for path, code in zip(spec["paths"], spec["codes"])]
+
+        # staged signers re-encrypted when aeid changes
+        stage(manager)
+        nseed = core.Signer(transferable=False).qb64
+        naeid = core.Signer(qb64=nseed, transferable=False).verfer.qb64
+        manager.updateAeid(aeid=naeid, seed=nseed)
+        assert len(list(keeper.stgs.getItemIter(decrypter=manager.decrypter))) == 1
+        nverfers, ndigers = manager.rotate(pre=pre, temp=True)
+        assert keeper.cnt(keeper.stgs.sdb) == 0  # used so unstaged
+        uverfers, udigers = unstaged.rotate(pre=pre, temp=True)
+        assert [diger.qb64 for diger in ndigers] == [diger.qb64 for diger in udigers]
+
+        # staged in plaintext before any aeid then encrypted when aeid set
+        stage(unstaged)
+        unstaged.updateAeid(aeid=aeid, seed=seed)
+        assert len(list(other.stgs.getItemIter(decrypter=unstaged.decrypter))) == 1
+
+        # staged signers not readable with decrypter are a miss
+        skeys = stage(manager)
+        decrypter = manager.decrypter
+        manager.decrypter = core.Decrypter(seed=seed)  # not decrypter of stage
+        assert manager.unstage(skeys) is None
+        manager.decrypter = decrypter
+        assert keeper.cnt(keeper.stgs.sdb) == 1
+    """End Test"""
+
+
 if __name__ == "__main__":
     test_manager_sign_dual_indices()
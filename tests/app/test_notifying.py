@@ -179,6 +179,44 @@ def test_noter(mockHelpingNowUTC):
 
     cnt = noter.getNoteCnt()
     assert cnt == 13
+    assert noter.getUnreadCnt() == 13
+
+    # keyset pagination
+    page = noter.getNotePage(limit=5)
+    assert [n.rid for n, _ in page] == [n.rid for n, _ in noter.getNotes(end=4)]
+    last, _ = page[-1]
+    page = noter.getNotePage(after=(last.datetime, last.rid), limit=5)
+    assert [n.rid for n, _ in page] == [n.rid for n, _ in noter.getNotes(start=5, end=9)]
+    assert all(cig.qb64 == cig1.qb64 for _, cig in page)
+    page = noter.getNotePage(limit=3, reverse=True)
+    assert [n.attrs['a'] for n, _ in page] == [3, 2, 1]  # newest first
+    notes = noter.getNotes(start=helping.fromIso8601("2022-07-08T15:01:06.453632"))
+    assert [n.attrs['a'] for n, _ in notes] == [2, 3]
+
+    # read index, unread count and retention of read notes
+    first, _ = noter.getNotes(end=0)[0]
+    first.read = True
+    assert noter.update(first, cig) is True
+    assert noter.getUnreadCnt() == 12
+    read, _ = page[0]
+    read.read = True
+    assert noter.update(read, cig) is True
+    assert noter.getUnreadCnt() == 11
+
+    noter.nmeta.rem(keys=("nrds",))
+    noter.reindex()  # rebuild of index for notes that predate it
+    assert noter.getUnreadCnt() == 11
+
+    assert noter.prune(before="2021-01-01T00:00:00.000000+00:00") == 0
+    assert noter.prune(before="2022-07-08T15:01:08") == 2
+    assert noter.get(first.rid) is None
+    assert noter.get(read.rid) is None
+    assert noter.getNoteCnt() == 11
+    assert noter.getUnreadCnt() == 11
+
+    assert noter.rem(page[1][0].rid) is True
+    assert noter.getNoteCnt() == 10
+    assert noter.getUnreadCnt() == 10
 
 
 def test_notifier(mockHelpingNowUTC):
@@ -203,7 +241,9 @@ def test_notifier(mockHelpingNowUTC):
         assert hby.signator.verify(ser=note.raw, cigar=cig1) is True
 
         assert notifier.mar('ABC') is False
+        assert notifier.getUnreadCnt() == 1
         assert notifier.mar(note.rid) is True
+        assert notifier.getUnreadCnt() == 0
         note = notifier.getNotes()[0]
         assert note.read is True
         assert notifier.mar(note.rid) is False
@@ -221,6 +261,21 @@ def test_notifier(mockHelpingNowUTC):
         assert len(notes) == 3
 
         assert notes[2].datetime == "2021-01-01T00:00:00.000000+00:00"
+        page = notifier.getNotePage(limit=2)
+        assert [n.rid for n in page] == [n.rid for n in notes[:2]]
+        page = notifier.getNotePage(after=(page[-1].datetime, page[-1].rid))
+        assert [n.rid for n in page] == [notes[2].rid]
+
+        # read notices older than retention are pruned on mar when opted in
+        assert notifier.retention is None
+        notifier.retention = datetime.timedelta(seconds=-1)  # mocked now never advances
+        assert notifier.mar(notes[0].rid) is True
+        assert notifier.noter.get(notes[0].rid) is None
+        assert notifier.getNoteCnt() == 2
+        assert notifier.getUnreadCnt() == 2
+        notifier.retention = None
+        assert notifier.mar(notes[1].rid) is True
+        assert notifier.getNoteCnt() == 2
 
     payload = dict(a=1, b=2, c=3)
     dt = helping.fromIso8601("2022-07-08T15:01:05.453632")
@@ -4,6 +4,8 @@ tests.app.test_multisig module
 
 """
 
+import datetime
+
 import falcon
 from hio.base import doing
 from hio.core import http
@@ -131,6 +133,94 @@ def test_oobiery():
     """Done Test"""
 
 
+def test_oobiery_concurrency():
+    """
+    Test Oobiery limits requests in flight, coalesces identical URLs and caches
+    responses with conditional re-fetch
+    """
+    with habbing.openHby(name="oobi", temp=True) as hby:
+        hab = hby.makeHab(name="oobi")
+        msgs = bytearray()
+        msgs.extend(hab.makeEndRole(eid=hab.pre,
+                                    role=kering.Roles.controller,
+                                    stamp=help.nowIso8601()))
+        msgs.extend(hab.makeLocScheme(url='http://127.0.0.1:5692',
+                                      scheme=kering.Schemes.http,
+                                      stamp=help.nowIso8601()))
+        hab.psr.parse(ims=msgs)
+
+        app = falcon.App()
+        ending.loadEnds(app, hby=hby)
+        server = http.Server(port=5692, app=app)
+        serverDoer = http.ServerDoer(server=server)
+
+        oobiery = oobiing.Oobiery(hby=hby, maxPerHost=1)
+        curl = f'http://127.0.0.1:5692/oobi/{hab.pre}/controller'
+        nurl = f'http://127.0.0.1:5692/oobi/{hab.pre}/controller?name=oobi'
+        hby.db.oobis.pin(keys=(curl,), val=basing.OobiRecord(date=helping.nowIso8601()))
+        hby.db.oobis.pin(keys=(nurl,), val=basing.OobiRecord(date=helping.nowIso8601()))
+        results = dict()
+
+        def resolveDo(tymth=None, tock=0.0, **kwa):
+            yield tock
+            oobiery.processOobis()
+            results["inflight"] = list(oobiery.clients)
+            results["waiting"] = [url for (url,), _ in hby.db.oobis.getItemIter()]
+
+            # same URL again while in flight joins the request in flight
+            hby.db.oobis.pin(keys=(curl,), val=basing.OobiRecord(date=helping.nowIso8601()))
+            oobiery.processOobis()
+
+            while hby.db.roobi.get(keys=(nurl,)) is None:
+                oobiery.processOobis()
+                oobiery.processClients()
+                yield tock
+            results["resolved"] = oobiery.stats()
+
+            # fresh in cache so resolves without a request
+            hby.db.roobi.rem(keys=(curl,))
+            hby.db.oobis.pin(keys=(curl,), val=basing.OobiRecord(date=helping.nowIso8601()))
+            oobiery.processOobis()
+            results["cached"] = hby.db.roobi.get(keys=(curl,))
+
+            # stale in cache so re-fetched conditionally on its entity tag
+            entry = oobiery.cache.get(curl)
+            entry.fetched = helping.nowUTC() - datetime.timedelta(seconds=oobiery.cacheTTL + 1)
+            hby.db.roobi.rem(keys=(curl,))
+            hby.db.oobis.pin(keys=(curl,), val=basing.OobiRecord(date=helping.nowIso8601()))
+            while hby.db.roobi.get(keys=(curl,)) is None:
+                oobiery.processOobis()
+                oobiery.processClients()
+                yield tock
+            return True
+
+        doist = doing.Doist(limit=2.0, tock=0.03125, real=True)
+        doist.do(doers=[serverDoer, oobiery.clienter, doing.doify(resolveDo)])
+
+        assert results["inflight"] == [curl]  # one per host
+        assert results["waiting"] == [nurl]
+        resolved = results["resolved"]
+        assert resolved["coalesced"] == 1
+        assert resolved["requests"] == 2
+        assert resolved["responses"] == 2
+        assert resolved["longest"] >= resolved["latency"] > 0.0
+        assert hby.db.roobi.get(keys=(nurl,)).state == oobiing.Result.resolved
+
+        assert results["cached"].state == oobiing.Result.resolved
+        stats = oobiery.stats()
+        assert stats["hits"] == 1
+        assert stats["revalidated"] == 1
+        assert stats["requests"] == 3
+        assert stats["responses"] == 3
+        assert stats["mean"] > 0.0
+        assert stats["inflight"] == 0
+        assert stats["cached"] == 2
+        assert hby.db.roobi.get(keys=(curl,)).state == oobiing.Result.resolved
+        assert hby.db.coobi.get(keys=(curl,)) is None
+
+    """Done Test"""
+
+
 def test_introduce(mockHelpingNowUTC):
     raw = b'\x05\xaa\x8f-S\x9a\xe9\xfaU\x9c\x02\x9c\x9b\x08Hu'
     salt = core.Salter(raw=raw).qb64
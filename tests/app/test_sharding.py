@@ -0,0 +1,83 @@
+# -*- encoding: utf-8 -*-
+"""
+tests.app.sharding module
+
+"""
+from keri import core
+from keri.app import habbing, sharding
+from keri.core import coring, eventing, parsing
+from keri.db import dbing
+from keri.kering import Vrsn_1_0
+
+
+def test_sharder():
+    """
+    Test Sharder routes KELs to their home shards and mirrors delegator and
+    receipter KELs into the shards that need them
+    """
+    with (habbing.openHby(name="tor", temp=True) as torHby,
+          habbing.openHby(name="gate", temp=True) as gateHby,
+          habbing.openHby(name="val", temp=True) as valHby,
+          sharding.openSharder(count=2) as sharder):
+        assert len(sharder.shards) == 2
+        assert [shard.db.name for shard in sharder.shards] == ["test-0", "test-1"]
+
+        torHab = torHby.makeHab(name="tor")
+        home = sharder.home(torHab.pre)
+        assert sharder.index(torHab.pre) == home.index
+        assert sharder.index(torHab.pre) == sharder.index(torHab.pre.encode("utf-8"))
+
+        # delegate and validator each homed in other shard than delegator
+        gateHab = next(hab for hab in (gateHby.makeHab(name=f"gate{i}", delpre=torHab.pre)
+                                       for i in range(32))
+                       if sharder.home(hab.pre) is not home)
+        valHab = next(hab for hab in (valHby.makeHab(name=f"val{i}") for i in range(32))
+                      if sharder.home(hab.pre) is not home)
+        other = sharder.home(gateHab.pre)
+
+        psr = parsing.Parser(kvy=sharder, version=Vrsn_1_0)
+        psr.parse(ims=bytearray(torHab.makeOwnInception()))
+        assert torHab.pre in home.kevers
+        assert sharder.kever(torHab.pre) is not None
+        assert sharder.kever(gateHab.pre) is None
+
+        # delegated inception arrives before its delegating event
+        seal = eventing.SealEvent(i=gateHab.pre, s="0", d=gateHab.pre)
+        ixn = torHab.interact(data=[seal._asdict()])
+        dip = bytearray(gateHab.makeOwnEvent(sn=0))
+        dip.extend(core.Counter(core.Codens.SealSourceCouples, count=1,
+                                version=Vrsn_1_0).qb64b)
+        dip.extend(coring.Seqner(sn=1).qb64b)
+        dip.extend(torHab.kever.serder.saidb)
+        psr.parse(ims=dip)
+        assert torHab.pre in other.kevers  # delegator mirrored
+        assert (other.index, torHab.pre) in sharder.mirrors
+        assert gateHab.pre not in sharder.kevers  # escrowed on delegating event
+
+        psr.parse(ims=bytearray(ixn))
+        assert sharder.kevers[torHab.pre].sn == 1
+        sharder.processEscrows()
+        assert other.kevers[torHab.pre].sn == 1  # mirror refreshed
+        assert sharder.kevers[gateHab.pre].delpre == torHab.pre
+        assert sharder.kever(gateHab.pre) is other.kevers[gateHab.pre]
+        assert sharder.mirrors[(other.index, torHab.pre)] == 2
+        assert home.db.getKeLast(dbing.snKey(gateHab.pre, 0)) is None  # homed only
+
+        # transferable receipt from validator homed in other shard
+        valHab.psr.parse(ims=bytearray(torHab.makeOwnInception()))
+        valHab.psr.parse(ims=bytearray(ixn))
+        psr.parse(ims=bytearray(valHab.makeOwnInception()))
+        assert valHab.pre in sharder.home(valHab.pre).kevers
+        rct = valHab.receipt(torHab.kever.serder)
+        psr.parse(ims=bytearray(rct))
+        assert valHab.pre in home.kevers  # receipter mirrored
+        vrcs = home.db.getVrcs(dbing.dgKey(torHab.pre, torHab.kever.serder.said))
+        assert len(vrcs) == 1
+
+        tholder, verfers = sharder.resolveVerifiers(pre=valHab.pre, sn=0)
+        assert [verfer.qb64 for verfer in verfers] == [verfer.qb64 for verfer in valHab.kever.verfers]
+        assert tholder.sith == valHab.kever.tholder.sith
+
+        assert sorted(sharder.kevers) == sorted([torHab.pre, gateHab.pre, valHab.pre])
+        assert len(sharder.kevers) == 3
+    """Done Test"""
@@ -3,13 +3,18 @@
 tests.app.storing
 
 """
+import datetime
 import os
+import subprocess
+import sys
+import tempfile
 
 import lmdb
 
-from keri.app import keeping
+from keri.app import keeping, storing
 from keri.core import coring, serdering
 from keri.db import dbing, basing, subing
+from keri.help import helping
 from keri.peer import exchanging
 from keri.app.storing import Mailboxer
 
@@ -68,7 +73,7 @@ def test_mailboxing():
         saved = mber.storeMsg(topic=dest.qb64b, msg=msg)
         assert saved is True
 
-        actual = mber.getTopicMsgs(topic=dest.qb64)
+        actual = list(mber.getTopicMsgs(topic=dest.qb64))
         assert actual[0] == msg
 
     assert not os.path.exists(mber.path)
@@ -90,6 +95,15 @@ def test_mailboxing():
             msgs.append((fn, msg))
 
         assert(len(msgs)) == 10
+        assert mber.tip(dest.qb64) == 9
+        assert mber.tip(dest.qb64b) == 9
+        assert mber.tip(dest.qb64 + "/other") == -1
+
+        mber.tips.clear()  # read back from .tpcs
+        assert mber.tip(dest.qb64b) == 9
+        assert mber.tip(dest.qb64[:-1]) == -1  # topic prefix is not topic
+        assert mber.appendToTopic(topic=dest.qb64b, val=b'') == 10
+        assert mber.tip(dest.qb64) == 10
 
         for idx, msg in msgs:
             exn = serdering.SerderKERI(raw=msg)
@@ -111,5 +125,113 @@ def test_mailboxing():
 
 
 
+def test_mailbox_retention():
+    """
+    Test Mailboxer reference counted messages and retention of topics
+    """
+    pre = "EAD919wF4oiG7ck6mnBWTRD_Z-Io0wZKCxL0zjx5je9I"
+    other = "EIaGMMWJFPmtXznY1IIiKDIrg-vIyge6mBl2QV8dDjI3"
+    with dbing.openLMDB(cls=Mailboxer) as mber:
+        msgs = [f'{{"i":"{pre}","n":{idx}}}'.encode("utf-8") for idx in range(6)]
+        for msg in msgs:
+            mber.storeMsg(topic=f"{pre}/receipt", msg=msg)
+        mber.storeMsg(topic=f"{other}/receipt", msg=msgs[0])  # shared body
+        mber.storeMsg(topic=f"{pre}/multisig", msg=msgs[0])
+
+        dig = coring.Diger(ser=msgs[0], code=coring.MtrDex.Blake3_256).qb64
+        assert mber.mrcs.get(keys=dig).num == 3
+        assert mber.msgs.cntAll() == 6  # each body stored once
+
+        msgIter = mber.getTopicMsgs(topic=f"{pre}/receipt", fn=4)
+        assert next(msgIter) == msgs[4]  # streamed
+        assert list(msgIter) == [msgs[5]]
+
+        # truncate acknowledged only when retention truncates
+        assert mber.ack(pre, {"/receipt": 2}) == 0
+        mber.retentions[pre] = storing.Retention(truncate=True)
+        assert mber.retentionOf(f"{pre}/receipt").truncate
+        assert not mber.retentionOf(f"{other}/receipt").truncate
+        assert mber.ack(pre, {"/receipt": 2, "/multisig": 0}) == 2
+        assert list(mber.getTopicMsgs(topic=f"{pre}/receipt")) == msgs[2:]
+        assert mber.mrcs.get(keys=dig).num == 2
+        assert mber.msgs.get(keys=dig) is not None  # still referenced
+        assert mber.tip(f"{pre}/receipt") == 5  # marks unchanged
+
+        # max count
+        assert mber.prune(f"{pre}/receipt", retention=storing.Retention(maxCount=2)) == 2
+        assert [on for on, _, _ in mber.cloneTopicIter(f"{pre}/receipt")] == [4, 5]
+        assert mber.tdts.cntOn(keys=f"{pre}/receipt") == 2
+
+        # max age
+        now = helping.nowUTC() + datetime.timedelta(seconds=10)
+        assert mber.prune(f"{other}/receipt", retention=storing.Retention(maxAge=60), now=now) == 0
+        assert mber.prunePre(other, retention=storing.Retention(maxAge=5), now=now) == 1
+        assert mber.prunePre(pre, retention=storing.Retention(maxAge=5), now=now) == 3
+        assert mber.mrcs.get(keys=dig) is None
+        assert mber.msgs.get(keys=dig) is None
+        assert mber.msgs.cntAll() == 0
+        assert mber.tpcs.cntOn() == 0
+
+        # emptied topics keep their ordinals
+        assert mber.tons.get(keys=f"{other}/receipt").num == 0
+        mber.tips.clear()
+        assert mber.tip(f"{other}/receipt") == 0
+
+        # bounded on store
+        mber.retention = storing.Retention(maxCount=3)
+        for msg in msgs:
+            mber.storeMsg(topic=f"{other}/receipt", msg=msg)
+        assert [on for on, _, _ in mber.cloneTopicIter(f"{other}/receipt")] == [4, 5, 6]
+        assert mber.tons.get(keys=f"{other}/receipt") is None
+        assert mber.msgs.cntAll() == 3
+
+        # body stored before reference counting stays uncounted when stored again
+        mber.retention = storing.Retention()
+        old = b'{"n":"old"}'
+        odig = coring.Diger(ser=old, code=coring.MtrDex.Blake3_256).qb64
+        mber.storeMsg(topic=f"{pre}/old", msg=old)
+        mber.mrcs.rem(keys=odig)  # like stored before counting
+        mber.storeMsg(topic=f"{pre}/new", msg=old)
+        assert mber.mrcs.get(keys=odig) is None
+        assert mber.prune(f"{pre}/new", retention=storing.Retention(maxCount=0)) == 1
+        assert list(mber.getTopicMsgs(topic=f"{pre}/old")) == [old]
+    """ End Test """
+
+
+def storeElsewhere(head, topic, msg):
+    """ Store msg at topic with a Mailboxer on head in another process """
+    code = ("import sys\n"
+            "from keri.app.storing import Mailboxer\n"
+            "mber = Mailboxer(name='shared', headDirPath=sys.argv[1])\n"
+            "mber.storeMsg(topic=sys.argv[2], msg=sys.argv[3].encode())\n"
+            "mber.close()\n")
+    subprocess.run([sys.executable, "-c", code, head, topic, msg], check=True,
+                   env=dict(os.environ, PYTHONPATH=os.pathsep.join(sys.path)))
+
+
+def test_mailbox_tip_shared():
+    """
+    Test Mailboxer sees messages stored by another process on the same
+    database once its held tip is .TipRefresh old
+    """
+    with tempfile.TemporaryDirectory() as head:
+        mber = Mailboxer(name="shared", headDirPath=head)
+        topic = "EBWNHdSXCJnFJL5OuQPyM5K0neuniccMBdXt3gIXOf2B/receipt"
+
+        assert mber.tip(topic) == -1
+        storeElsewhere(head, topic, "first")
+        assert mber.tip(topic) == -1  # held tip not yet stale
+
+        mber.tipped[topic] -= mber.TipRefresh  # age held tip
+        assert mber.tip(topic) == 0  # read again from .tpcs
+        storeElsewhere(head, topic, "second")
+        assert mber.tip(topic) == 0
+
+        mber.TipRefresh = 0.0  # always read again
+        assert mber.tip(topic) == 1
+        assert [msg for _, _, msg in mber.cloneTopicIter(topic=topic)] == [b"first", b"second"]
+        mber.close()
+
+
 if __name__ == '__main__':
     test_mailboxing()
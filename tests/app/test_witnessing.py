@@ -0,0 +1,122 @@
+# -*- encoding: utf-8 -*-
+"""
+tests.app.witnessing module
+
+"""
+import time
+
+import pytest
+from hio.base import doing
+
+from keri import kering
+from keri.app import habbing, httping, indirecting, witnessing
+
+
+def test_reopener():
+    """
+    Test reopener reproduces path of opened database
+    """
+    with habbing.openHby(name="wit", temp=True) as hby:
+        kwa = witnessing.reopener(hby.db)
+        assert kwa["name"] == hby.db.name
+        assert kwa["base"] == hby.db.base
+        assert kwa["temp"] is False
+        assert hby.db.path.startswith(kwa["headDirPath"])
+    """Done Test"""
+
+
+def test_screener():
+    """
+    Test Screener passes validly signed messages and screens out the others
+    """
+    with (habbing.openHby(name="bob", temp=True) as bobHby,
+          habbing.openHby(name="wit", temp=True) as witHby):
+        bobHab = bobHby.makeHab(name="bob", isith="1", icount=1, transferable=True)
+        icp = bytes(bobHab.makeOwnInception())
+        # tamper with signature by flipping a character of it
+        sig = len(icp) - 2
+        tampered = icp[:sig] + (b'A' if icp[sig:sig + 1] != b'A' else b'B') + icp[sig + 1:]
+
+        screener = witnessing.Screener()
+        screened = screener.screen(icp + tampered)
+        assert len(screened) == 1
+        serder, raw = screened[0]
+        assert serder.said == bobHab.kever.serder.said
+        assert raw == icp
+        assert screener.rejected == 1
+
+        ixn = bytes(bobHab.interact())
+        sig = len(ixn) - 2
+        badIxn = ixn[:sig] + (b'A' if ixn[sig:sig + 1] != b'A' else b'B') + ixn[sig + 1:]
+
+        # key state unknown so ixn passes to be validated by writer
+        screener = witnessing.Screener(db=witHby.db)
+        assert len(screener.screen(badIxn)) == 1
+        assert screener.rejected == 0
+
+        witHab = witHby.makeHab(name="wit", transferable=False)
+        witHab.psr.parse(ims=bytearray(icp))
+        assert bobHab.pre in witHby.db.kevers
+
+        screened = screener.screen(ixn + badIxn)
+        assert [raw for _, raw in screened] == [ixn]
+        assert screener.rejected == 1
+    """Done Test"""
+
+
+def test_witness_workers():
+    """
+    Test witness with worker processes sharing its HTTP port
+    """
+    port = 5693
+    with (habbing.openHby(name="bob", temp=True) as bobHby,
+          habbing.openHby(name="wit", temp=True) as witHby):
+        with pytest.raises(kering.ConfigurationError):
+            indirecting.setupWitness(hby=witHby, alias="wit", tcpPort=None, httpPort=port,
+                                     keypath="key.pem", workers=1)
+
+        bobHab = bobHby.makeHab(name="bob", isith="1", icount=1, transferable=True)
+        doers = indirecting.setupWitness(hby=witHby, alias="wit", tcpPort=None,
+                                         httpPort=port, workers=1)
+        intaker = next(doer for doer in doers if isinstance(doer, witnessing.Intaker))
+
+        clienter = httping.Clienter()
+        doist = doing.Doist(limit=30.0, tock=0.03125, real=True)
+        doist.doers = doers + [clienter]
+        doist.enter()
+        assert len(intaker.procs) == 1
+
+        def pump(done):
+            while not done():
+                assert doist.tyme < doist.limit
+                doist.recur()
+                time.sleep(doist.tock)
+
+        try:
+            url = f"http://127.0.0.1:{port}"
+            client = clienter.client(url)
+            client.request(method="POST", path="/", body=bytes(bobHab.makeOwnInception()),
+                           headers={"Content-Type": httping.CESR_STREAM_CONTENT_TYPE})
+            pump(lambda: bobHab.pre in witHby.db.kevers)
+            assert intaker.forwarded >= 1
+            pump(lambda: client.responses)
+            assert client.respond().status == 204
+
+            # KEL read served by worker from its read only database
+            client = clienter.request("GET", f"{url}/query?typ=kel&pre={bobHab.pre}")
+            pump(lambda: client.responses)
+            rep = client.respond()
+            assert rep.status == 200
+            assert bobHab.pre.encode("utf-8") in bytes(rep.body)
+
+            # escrows relayed to writer
+            client = clienter.request("GET", f"{url}/escrows")
+            pump(lambda: client.responses)
+            assert client.respond().status == 200
+        finally:
+            procs = list(intaker.procs)
+            doist.exit()
+
+        assert intaker.procs == []
+        assert not any(proc.is_alive() for proc in procs)
+    """Done Test"""
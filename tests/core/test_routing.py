@@ -0,0 +1,168 @@
+# -*- encoding: utf-8 -*-
+"""
+tests.core.routing module
+
+"""
+import time
+
+import pytest
+
+from keri.app import habbing, oobiing
+from keri.core import routing
+from keri.vdr import eventing as veventing
+from keri.vdr import viring
+
+
+def linearFind(rtr, route):
+    """ Returns (Route, params) of first registered route whose regex matches """
+    for r in rtr.routes:
+        if res := r.regex.search(route):
+            return r, res.groupdict()
+    return None, None
+
+
+def test_router_find():
+    """
+    Test Router indexes find the first registered route matching like a linear regex search
+    """
+    rtr = routing.Router()
+    rtr.addRoute("/end/role/{action}", "endRole", suffix="EndRole")
+    rtr.addRoute("/loc/scheme", "locScheme", suffix="LocScheme")
+    rtr.addRoute("/ksn/{aid}", "ksn", suffix="KeyStateNotice")
+    rtr.addRoute("/ksn/special", "special")  # shadowed by earlier /ksn/{aid}
+    rtr.addRoute("/watcher/{aid}/{action}", "watcher", suffix="AddWatched")
+    rtr.addRoute("/watcher/{aid}/add", "shadowed")
+    rtr.addRoute("/tsn/v{ver}/{aid}", "complex")  # mixed segment searched by regex
+    rtr.addRoute("/tsn/registry/{aid}/", "registry")  # trailing slash dropped
+    rtr.addRoute("/introduce", "introduce")
+    rtr.addRoute("/", "root")
+
+    assert len(rtr.complex) == 1
+    assert rtr.complex[0][1].resource == "complex"
+
+    route, params = rtr._lookup("/end/role/add")
+    assert route.resource == "endRole"
+    assert params == dict(action="add")
+
+    route, params = rtr._lookup("/END/Role/cut")  # templates ignore case
+    assert route.resource == "endRole"
+    assert params == dict(action="cut")
+
+    route, params = rtr._lookup("/ksn/special")
+    assert route.resource == "ksn"
+    assert params == dict(aid="special")
+
+    route, params = rtr._lookup("/watcher/EAbc/add")
+    assert route.resource == "watcher"
+    assert params == dict(aid="EAbc", action="add")
+
+    route, params = rtr._lookup("/tsn/v1/EAbc")
+    assert route.resource == "complex"
+    assert params == dict(ver="1", aid="EAbc")
+
+    route, params = rtr._lookup("/tsn/registry/EAbc")
+    assert route.resource == "registry"
+    assert params == dict(aid="EAbc")
+
+    assert rtr._lookup("/introduce")[0].resource == "introduce"
+    assert rtr._lookup("/")[0].resource == "root"
+
+    for route in ("/ksn", "/ksn/", "/ksn/a/b", "/tsn/registry/EAbc/", "ksn/EAbc",
+                  "/loc/scheme/x", "/end//add", "", "/unknown"):
+        assert rtr._lookup(route) == (None, None)
+
+    for route in ("/end/role/add", "/END/Role/cut", "/ksn/special", "/watcher/EAbc/add",
+                  "/tsn/v1/EAbc", "/tsn/registry/EAbc", "/introduce", "/", "/ksn/",
+                  "/end//add", "/unknown"):
+        assert rtr._lookup(route) == linearFind(rtr, route)
+        assert rtr._find(route) == linearFind(rtr, route)
+
+    # complex route registered first wins over later simple route
+    rtr = routing.Router()
+    rtr.addRoute("/ksn/{aid}x", "complex")
+    rtr.addRoute("/ksn/{aid}", "simple")
+    assert rtr._lookup("/ksn/EAbcx")[0].resource == "complex"
+    assert rtr._lookup("/ksn/EAbc")[0].resource == "simple"
+
+    # preregistered routes are indexed
+    rtr = routing.Router(routes=list(rtr.routes))
+    assert rtr._lookup("/ksn/EAbcx")[0].resource == "complex"
+    assert rtr._lookup("/ksn/EAbc") == (rtr.routes[1], dict(aid="EAbc"))
+    """Done Test"""
+
+
+def test_router_reply_routes():
+    """
+    Test Router finds the reply routes that Kevery, Tevery and Oobiery register
+    like a linear regex search also with many routes registered ahead of them
+    """
+    with (habbing.openHby(name="routes", temp=True) as hby,
+          viring.openReger(name="routes", temp=True) as reger):
+        rtr = routing.Router()
+        hby.kvy.registerReplyRoutes(router=rtr)  # includes watcher routes
+        tvy = veventing.Tevery(reger=reger, db=hby.db)
+        tvy.registerReplyRoutes(router=rtr)
+        oobiing.Oobiery(hby=hby).registerReplyRoutes(router=rtr)
+
+        pre = "EA3mbE6upuYnFlx68GmLYCQd7cCcwG_AtHM6dW_GT068"
+        routes = ["/end/role/add", "/end/role/cut", "/loc/scheme", f"/ksn/{pre}",
+                  f"/watcher/{pre}/add", f"/tsn/registry/{pre}",
+                  f"/tsn/credential/{pre}", "/introduce"]
+
+        for route in routes:
+            assert rtr._find(route)[0] is not None
+            assert rtr._find(route) == linearFind(rtr, route)
+
+        for i in range(200):  # unrelated routes registered ahead of the others
+            template = f"/pad{i}/{{aid}}"
+            fields, regex = routing.compile_uri_template(template)
+            rtr.routes.insert(0, routing.Route(regex=regex, fields=fields, resource=None,
+                                               template=template))
+        rtr = routing.Router(routes=rtr.routes)
+        assert len(rtr.routes) >= rtr.TrieMin
+        for route in routes + ["/pad7/EAbc", "/pad7"]:
+            assert rtr._find(route) == linearFind(rtr, route)
+    """Done Test"""
+
+
+@pytest.mark.benchmark
+def test_router_benchmark():
+    """
+    Benchmark indexed lookup against linear regex search of the reply routes
+    with unrelated routes registered ahead of them. Run with `-m benchmark`.
+    Router.TrieMin is chosen from where the indexes start to win.
+    """
+    with (habbing.openHby(name="bench", temp=True) as hby,
+          viring.openReger(name="bench", temp=True) as reger):
+        rtr = routing.Router()
+        hby.kvy.registerReplyRoutes(router=rtr)
+        veventing.Tevery(reger=reger, db=hby.db).registerReplyRoutes(router=rtr)
+        oobiing.Oobiery(hby=hby).registerReplyRoutes(router=rtr)
+        base = list(rtr.routes)
+
+    pre = "EA3mbE6upuYnFlx68GmLYCQd7cCcwG_AtHM6dW_GT068"
+    routes = ["/end/role/add", "/end/role/cut", "/loc/scheme", f"/ksn/{pre}",
+              f"/watcher/{pre}/add", f"/tsn/registry/{pre}",
+              f"/tsn/credential/{pre}", "/introduce", "/unknown/route"]
+
+    def measure(find, n=2000):
+        start = time.perf_counter()
+        for _ in range(n):
+            for route in routes:
+                find(route)
+        return (time.perf_counter() - start) / (n * len(routes)) * 1e6
+
+    print(f"\n{'routes':>6} {'lookup us':>10} {'linear us':>10}")
+    for pad in (0, 4, 8, 16, 32, 64, 200):
+        table = []
+        for i in range(pad):  # unrelated routes registered ahead of the others
+            template = f"/pad{i}/{{aid}}"
+            fields, regex = routing.compile_uri_template(template)
+            table.append(routing.Route(regex=regex, fields=fields, resource=None,
+                                       template=template))
+        rtr = routing.Router(routes=table + base)
+        for route in routes:
+            assert rtr._lookup(route) == linearFind(rtr, route)
+        print(f"{len(rtr.routes):>6} {measure(rtr._lookup):>10.2f} "
+              f"{measure(lambda route: linearFind(rtr, route)):>10.2f}")
+    """Done Test"""
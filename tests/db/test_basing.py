@@ -13,7 +13,8 @@ import pytest
 
 import lmdb
 from hio.base import doing
-from keri import core
+import keri
+from keri import core, kering
 from keri.app import habbing
 from keri.core import coring, eventing, serdering
 from keri.core.coring import Kinds, versify, Seqner
@@ -1173,6 +1174,46 @@ def test_baser():
     """ End Test """
 
 
+def test_watch_wigs():
+    """
+    Test WigWatch completion notices of witness signatures written to Baser
+    """
+    with openDB() as db:
+        pre = b'BWzwEHHzq7K0gzQPYGGwTmuupUhPx5_yZ-Wk1x4ejhcc'
+        dig = b'EGAPkzNZMtX-QiVgbRbyAIZGoXvbGv9IPb0foWTZvI_4'
+        key = dgKey(pre, dig)
+        wig0 = b'AAAz1KAV2z5IRqcFe4gPs9l3wsFKi1NsSZ42wjl-LqJ9aTCs6IO_5ZQqW6qoBvdXWe0ACGbh8sWKk7-GNqxqr_HU'
+        wig1 = b'ABBz1KAV2z5IRqcFe4gPs9l3wsFKi1NsSZ42wjl-LqJ9aTCs6IO_5ZQqW6qoBvdXWe0ACGbh8sWKk7-GNqxqr_HU'
+
+        assert db.addWig(key, wig0) is True
+        watch = db.watchWigs(key, need=2)
+        other = db.watchWigs(key, need=1)
+        assert isinstance(watch, basing.WigWatch)
+        assert watch.count == 1
+        assert not watch.done
+        assert other.done
+
+        assert db.addWig(key, wig0) is False  # dup so no notice
+        assert watch.count == 1
+        assert db.putWigs(key, [wig1]) is True
+        assert watch.count == 2
+        assert watch.done
+
+        assert db.delWigs(key, wig1) is True
+        assert watch.count == 1
+        assert not watch.done
+
+        db.unwatchWigs(watch)
+        assert db.wigWatches[key] == [other]
+        db.unwatchWigs(other)
+        db.unwatchWigs(other)
+        assert db.wigWatches == {}
+
+        db.addWig(key, wig1)
+        assert watch.count == 1  # no longer watched
+    """ End Test """
+
+
 def test_clean_baser():
     """
     Test Baser db clean clone method
@@ -1294,6 +1335,50 @@ def test_clean_baser():
     """End Test"""
 
 
+def test_clone_evt_obj():
+    """
+    Test Baser object level cloning of events matches cloned messages
+    """
+    with habbing.openHby(name="nat", salt=core.Salter(raw=b'0123456789abcdef').qb64) as hby:
+        natHab = hby.makeHab(name="nat", isith='2', icount=3)
+        natHab.interact()
+        natHab.rotate()
+        natHab.interact()
+
+        msgs = list(hby.db.cloneAllPreIter())
+        objs = list(hby.db.cloneObjAllPreIter())
+        assert len(objs) == len(msgs) == len(list(hby.db.getFelItemAllPreIter()))
+        assert [exts['serder'].said for exts in objs
+                if exts['serder'].pre == natHab.pre] == [
+                    exts['serder'].said for exts in hby.db.cloneObjPreIter(natHab.pre)]
+
+        for fn, exts in enumerate(hby.db.cloneObjPreIter(natHab.pre)):
+            msg = hby.db.cloneEvtMsg(pre=natHab.pre.encode("utf-8"), fn=fn,
+                                     dig=exts['serder'].saidb)
+            serder = serdering.SerderKERI(raw=bytes(msg))
+            assert exts['serder'].raw == serder.raw
+            assert len(exts['sigers']) == 3
+            assert [siger.qb64 for siger in exts['sigers']] == [
+                bytes(sig).decode("utf-8") for sig in hby.db.getSigs(
+                    dgKey(natHab.pre, serder.said))]
+            assert exts['wigers'] == exts['cigars'] == exts['trqs'] == []
+            assert exts['delseqner'] is None and exts['delsaider'] is None
+            assert exts['firner'].sn == fn
+            assert exts['dater'].dts == bytes(hby.db.getDts(
+                dgKey(natHab.pre, serder.said))).decode("utf-8")
+
+        # objects process into another database like the parsed messages
+        with basing.openDB(name="copy", sync=False) as copy:
+            assert not copy.sync
+            kvy = eventing.Kevery(db=copy)
+            for exts in hby.db.cloneObjPreIter(natHab.pre):
+                kvy.processEvent(**exts)
+            assert copy.kevers[natHab.pre].sn == natHab.kever.sn == 3
+            assert copy.kevers[natHab.pre].serder.said == natHab.kever.serder.said
+            copy.env.sync(True)
+    """End Test"""
+
+
 def test_fetchkeldel():
     """
     Test fetching full KEL and full DEL from Baser
@@ -1404,6 +1489,164 @@ def test_fetchkeldel():
 
 
 
+def test_fetch_sealing_events():
+    """
+    Test anchored seal index lookups and backfill migration
+    """
+    from keri.db.migrations import index_anchored_seals
+
+    with habbing.openHby(name="del", base="test") as hby:
+        hab = hby.makeHab(name="del", transferable=True)
+        seal0 = dict(i=hab.pre, s="0", d=hab.kever.serder.said)
+        seal1 = dict(i="EKYeu3OulOR8OXnnX5vfRkxvQ8WKqr6ithbGHx6UmNeo", s="1",
+                     d="EOHU0FI662C8yhxFNtYsK0A8LQcv2SmSL27-6kSNXWNK")
+        other = dict(d="EB9O4V-zUteZJJFubu1h0xMtzt0wuGpLMVj1sKVsElA_")
+
+        hab.interact()
+        hab.interact(data=[seal0])
+        hab.interact(data=[seal1, other])
+        hab.interact(data=[seal1])
+
+        assert basing.sealDigest(seal0) != basing.sealDigest(dict(seal0, s="1"))
+        anchors = hby.db.seals.get(keys=(hab.pre, basing.sealDigest(seal1)))
+        assert [(seqner.sn, saider.qb64) for seqner, saider in anchors] == [
+            (3, bytes(hby.db.getKeLast(snKey(hab.pre, 3))).decode()),
+            (4, bytes(hby.db.getKeLast(snKey(hab.pre, 4))).decode())]
+
+        srdr = hby.db.fetchAllSealingEventByEventSeal(hab.pre, seal=seal0)
+        assert srdr.sn == 2
+        assert hby.db.fetchLastSealingEventByEventSeal(hab.pre, seal=seal0).sn == 2
+        assert hby.db.fetchLastSealingEventByEventSeal(hab.pre, seal=seal0, sn=3) is None
+        assert hby.db.fetchLastSealingEventByEventSeal(hab.pre, seal=seal1).sn == 3
+        assert hby.db.fetchLastSealingEventByEventSeal(hab.pre, seal=seal1, sn=4).sn == 4
+        assert hby.db.fetchLastSealingEventBySeal(hab.pre, seal=other).sn == 3
+        assert hby.db.fetchAllSealingEventByEventSeal(hab.pre, seal=other) is None  # wrong type
+        assert hby.db.fetchLastSealingEventByEventSeal(hab.pre, seal=dict(seal0, s="1")) is None
+        assert [srdr.sn for srdr in hby.db.fetchSealingEvents(hab.pre, seal=seal1)] == [3, 4]
+
+        # backfill index from KEL
+        assert hby.db.sealsIndexed  # no KEL events when first opened
+        assert not index_anchored_seals._check_if_needed(hby.db)
+
+        # like database with KEL events logged before index
+        hby.db.seals.trim()
+        hby.db.migs.rem(keys=(basing.SealsMigration,))
+        assert not hby.db.sealsIndexed
+        assert index_anchored_seals._check_if_needed(hby.db)
+        # lookups walk KEL until backfilled
+        assert hby.db.fetchLastSealingEventByEventSeal(hab.pre, seal=seal0).sn == 2
+        assert hby.db.fetchLastSealingEventByEventSeal(hab.pre, seal=seal0, sn=3) is None
+        assert hby.db.fetchLastSealingEventBySeal(hab.pre, seal=other).sn == 3
+        assert hby.db.fetchAllSealingEventByEventSeal(hab.pre, seal=other) is None
+        assert [srdr.sn for srdr in hby.db.fetchSealingEvents(hab.pre, seal=seal1)] == [3, 4]
+
+        hab.interact(data=[seal0])  # event logged after upgrade does not disable backfill
+        assert next(hby.db.seals.getItemIter(), None) is not None
+        assert index_anchored_seals._check_if_needed(hby.db)
+        index_anchored_seals.migrate(hby.db)
+        assert hby.db.sealsIndexed
+        assert not index_anchored_seals._check_if_needed(hby.db)
+        assert hby.db.fetchLastSealingEventByEventSeal(hab.pre, seal=seal0).sn == 2
+        assert [srdr.sn for srdr in hby.db.fetchSealingEvents(hab.pre, seal=seal0)] == [2, 5]
+        assert [srdr.sn for srdr in hby.db.fetchSealingEvents(hab.pre, seal=seal1)] == [3, 4]
+
+        hby.db.seals.trim()  # index is trusted once backfilled
+        assert hby.db.fetchLastSealingEventByEventSeal(hab.pre, seal=seal0) is None
+    """End Test"""
+
+
+def test_binary_records_migration():
+    """
+    Test binary record sub dbs read JSON records and their migration
+    """
+    from keri.db.migrations import binary_records
+
+    with habbing.openHby(name="bin", base="test") as hby:
+        hab = hby.makeHab(name="bin", transferable=True)
+        state = hby.db.states.get(keys=hab.pre)
+        raw = bytes(hby.db.getVal(db=hby.db.states.sdb, key=hab.pre.encode()))
+        assert raw[:1] != b'{'
+        assert len(raw) < len(state._asjson())
+        assert not binary_records._check_if_needed(hby.db)
+
+        # rewrite as JSON like a database made before binary records
+        hby.db.setVal(db=hby.db.states.sdb, key=hab.pre.encode(), val=state._asjson())
+        oobi = OobiRecord(cid=hab.pre, state="resolved")
+        hby.db.setVal(db=hby.db.roobi.sdb, key=b"http://localhost:5642/oobi",
+                      val=json.dumps(asdict(oobi)).encode())
+        hby.db.states.cache.clear()
+        assert hby.db.states.get(keys=hab.pre) == state  # JSON still readable
+        assert hby.db.roobi.get(keys="http://localhost:5642/oobi") == oobi
+        assert binary_records._check_if_needed(hby.db)
+
+        binary_records.migrate(hby.db)
+        assert not binary_records._check_if_needed(hby.db)
+        raw = bytes(hby.db.getVal(db=hby.db.states.sdb, key=hab.pre.encode()))
+        assert raw[:1] != b'{'
+        assert hby.db.states.get(keys=hab.pre) == state
+        assert hby.db.roobi.get(keys="http://localhost:5642/oobi") == oobi
+        assert hby.db.habs.get(keys=hab.pre).name == "bin"
+    """End Test"""
+
+
+def test_migrate_batched():
+    """
+    Test batched resumable migrations and lazy migrations
+    """
+    from types import SimpleNamespace
+    from keri.db.migrations import binary_records
+
+    with habbing.openHby(name="bat", base="test") as hby:
+        hab = hby.makeHab(name="bat", transferable=True)
+        urls = [f"http://localhost:{5600 + i}/oobi" for i in range(8)]
+        for url in urls:  # JSON records like a database made before binary records
+            hby.db.setVal(db=hby.db.roobi.sdb, key=url.encode(),
+                          val=json.dumps(asdict(OobiRecord(cid=hab.pre))).encode())
+        assert binary_records._check_if_needed(hby.db)
+
+        migrated = []
+
+        def interrupted(db, cursor=None):  # fails in the middle of second batch
+            for cursor in binary_records.migrateIter(db, cursor=cursor):
+                migrated.append(cursor)
+                if len(migrated) == 5:
+                    raise ValueError("interrupted")
+                yield cursor
+
+        mod = SimpleNamespace(__name__="interrupted", migrateIter=interrupted,
+                              _check_if_needed=binary_records._check_if_needed)
+        with pytest.raises(ValueError):
+            hby.db.migrateBatched("binary_records", mod, size=3)
+        assert hby.db.migc.get(keys=("binary_records",)) == f"roobi {urls[2]}"
+        raws = [bytes(hby.db.getVal(db=hby.db.roobi.sdb, key=url.encode()))
+                for url in urls]
+        assert [raw[:1] == b'{' for raw in raws] == [False] * 3 + [True] * 5  # second batch aborted
+
+        assert hby.db.migrateBatched("binary_records", binary_records, size=3) == 5
+        assert hby.db.migc.get(keys=("binary_records",)) is None
+        assert not binary_records._check_if_needed(hby.db)
+        assert [hby.db.roobi.get(keys=url).cid for url in urls] == [hab.pre] * 8
+        assert hby.db.migrateBatched("binary_records", binary_records) == 0
+
+        # outstanding lazy migrations do not keep database from being used
+        hby.db.version = "1.2.0"
+        hby.db.migs.rem(keys=("index_anchored_seals",))
+        assert hby.db.current  # lookups walk KEL until seals backfilled
+        hby.db.version = "1.0.0"
+        rekeyed = hby.db.migs.get(keys=("rekey_habs",))
+        hby.db.migs.rem(keys=("rekey_habs",))
+        assert not hby.db.current  # outstanding migration not lazy
+        if rekeyed is not None:
+            hby.db.migs.pin(keys=("rekey_habs",), val=rekeyed)
+        hby.db.version = "1.2.0"
+        hby.db.migrate(size=2)
+        assert hby.db.current
+        assert hby.db.version == keri.__version__
+        assert hby.db.migs.get(keys=("index_anchored_seals",)) is not None
+        assert hby.db.migs.get(keys=("binary_records",)) is not None
+    """End Test"""
+
+
 def test_usebaser():
     """
     Test using Baser
@@ -1694,6 +1937,81 @@ def test_dbdict():
 
 
 
+    """End Test"""
+
+
+def test_dbdict_lru():
+    """
+    Test bounded dbdict with least recently used eviction and pinning
+    """
+    dbd = basing.dbdict()
+    assert dbd.capacity is None
+    assert dbd.stats() == dict(size=0, capacity=None, hits=0, misses=0, evictions=0)
+
+    with basing.openDB(name="nat") as db:
+        dbd.db = db
+        dbd.capacity = 2
+        dig = 'EAskHI462CuIMS_gNkcl_QewzrRSKH2p9zHQIO132Z30'
+        pres = ['DApYGFaqnrALTyejaJaGAVhNpSCtqyerPqWVK9ZBNZk0',
+                'DAEd3XSzXV9x3WAFNHfG3FHkY-fPcP8Q1ROCJPjoRmlR',
+                'DKWc6nm-zw5zV2TgjPSA2u_4a-XTV6XeBOsZc5BUgPi6',
+                'DCIWbWzXNTW-Ej8CcFNvR6u2T7YqXWbLz6R2Jr6lcoP9']
+        for pre in pres:
+            serder = eventing.interact(pre=pre, dig=dig, sn=4)
+            eevt = eventing.StateEstEvent(s='3', d=dig, br=[], ba=[])
+            state = eventing.state(pre=pre, sn=4, pig=dig, dig=serder.said,
+                                   fn=4, eilk=coring.Ilks.ixn, keys=[pre],
+                                   eevt=eevt)
+            db.putEvt(key=eventing.dgKey(pre=pre, dig=serder.said), val=serder.raw)
+            db.states.pin(keys=pre, val=state)
+
+        db.prefixes.add(pres[0])  # locally owned so pinned
+        assert dbd.pinned(pres[0])
+        assert not dbd.pinned(pres[1])
+
+        kever0 = dbd[pres[0]]  # read through miss
+        dbd[pres[1]]
+        dbd[pres[2]]
+        assert list(dbd.keys()) == pres[:3]  # pinned does not count
+        assert dbd.stats() == dict(size=3, capacity=2, hits=0, misses=3, evictions=0)
+
+        dbd[pres[1]]  # hit refreshes recency so pres[2] least recently used
+        dbd[pres[3]]  # evicts pres[2]
+        assert list(dbd.keys()) == [pres[0], pres[1], pres[3]]
+        assert dbd.stats() == dict(size=3, capacity=2, hits=1, misses=4, evictions=1)
+
+        assert dbd.get(pres[2]).state() == db.states.get(keys=pres[2])  # reloaded
+        assert list(dbd.keys()) == [pres[0], pres[3], pres[2]]
+        assert dbd.evictions == 2
+        assert dbd[pres[0]] is kever0  # pinned never evicted
+        assert dbd.get('DNotKnownNotKnownNotKnownNotKnownNotKnownNo') is None
+
+        dbd.capacity = 1
+        dbd.evict()
+        assert list(dbd.keys()) == [pres[2], pres[0]]
+        assert dbd.evictions == 3
+        assert dbd.pins == {pres[0]}
+
+        db.groups.add(pres[2])  # pinned after added so found by eviction scan
+        dbd.capacity = 0
+        dbd.evict()
+        assert list(dbd.keys()) == [pres[2], pres[0]]
+        assert dbd.pins == {pres[0], pres[2]}
+        assert dbd.evictions == 3
+
+    assert not os.path.exists(db.path)
+
+    os.environ["KERI_BASER_KEVER_CAPACITY"] = "16"
+    try:
+        baser = Baser(reopen=False, temp=True)
+        assert baser.KeverCapacity == 16
+        assert baser.kevers.capacity == 16
+        os.environ["KERI_BASER_KEVER_CAPACITY"] = "foo"  # Not an int
+        with pytest.raises(ValueError):
+            Baser(reopen=False, temp=True)
+    finally:
+        os.environ.pop("KERI_BASER_KEVER_CAPACITY")
+    assert Baser(reopen=False, temp=True).kevers.capacity is None
     """End Test"""
 
 
@@ -1913,6 +2231,49 @@ def test_clear_escrows():
         assert db.epsd.cntAll() == 0
         assert db.dpub.cntAll() == 0
 
+
+def test_resolve_verifiers():
+    """
+    Test resolveVerifiers caches key state of signers until Kever.logEvent
+    logs another event at the same sn
+    """
+    with habbing.openHby(name="test", temp=True) as hby:
+        hab = hby.makeHab(name="test", isith="1", icount=2)
+        db = hby.db
+        assert db.verifiers.stats()["size"] == 0
+
+        tholder, verfers = db.resolveVerifiers(pre=hab.pre, sn=0, dig=hab.kever.serder.said)
+        assert [verfer.qb64 for verfer in verfers] == [verfer.qb64 for verfer in hab.kever.verfers]
+        assert tholder.sith == "1"
+        assert db.verifiers.stats()["misses"] == 1
+
+        verfers.clear()  # callers get a copy of cached verfers
+        tholder, verfers = db.resolveVerifiers(pre=hab.pre, sn=0)
+        assert len(verfers) == 2
+        assert db.verifiers.stats()["hits"] == 1
+
+        with pytest.raises(kering.ValidationError):  # dig not match event at sn
+            db.resolveVerifiers(pre=hab.pre, sn=0, dig=hab.pre[:-1] + "A")
+        with pytest.raises(kering.ValidationError):  # event not yet in KEL
+            db.resolveVerifiers(pre=hab.pre, sn=1)
+        assert db.fetchVerifiers(pre=hab.pre, sn=1) is None
+        assert (hab.pre, 1) not in db.verifiers._entries  # absence not cached
+
+        db.verifiers.put((hab.pre, 1), ("stale", None, []))
+        hab.rotate(isith="2", ncount=2)
+        said, tholder, verfers = db.fetchVerifiers(pre=hab.pre, sn=1)  # logEvent removed stale
+        assert said == hab.kever.serder.said
+        assert tholder.sith == "2"
+        assert [verfer.qb64 for verfer in verfers] == [verfer.qb64 for verfer in hab.kever.verfers]
+
+        # non transferable prefix is its own verifier and is not cached
+        nhab = hby.makeHab(name="non", transferable=False)
+        tholder, verfers = db.resolveVerifiers(pre=nhab.pre)
+        assert [verfer.qb64 for verfer in verfers] == [nhab.pre]
+        assert (nhab.pre, 0) not in db.verifiers._entries
+    """Done Test"""
+
+
 if __name__ == "__main__":
     test_baser()
     test_clean_baser()
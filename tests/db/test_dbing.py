@@ -17,7 +17,8 @@ from  ordered_set import OrderedSet as oset
 
 from hio.base import doing
 
-from keri.db import dbing
+import keri
+from keri.db import dbing, subing
 from keri.db.dbing import clearDatabaserDir, openLMDB
 from keri.db.dbing import (dgKey, onKey, fnKey, snKey, dtKey, splitKey,
                            splitOnKey, splitKeyFN, splitSnKey, splitKeyDT)
@@ -1159,6 +1160,322 @@ def test_lmdber():
     """ End Test """
 
 
+def test_lmdber_map_growth():
+    """
+    Test LMDBer grows its memory map instead of failing when full
+    """
+    class SmallLMDBer(LMDBer):
+        MapSize = 256 * 1024
+
+    with openLMDB(cls=SmallLMDBer) as dber:
+        assert dber.mapSize == SmallLMDBer.MapSize
+        assert 0 < dber.mapUsed < dber.mapSize
+        assert dber.active == 0
+
+        db = dber.env.open_db(key=b'beta.')
+        val = b'x' * 32 * 1024
+        for i in range(32):  # 1 MiB of values overfills initial map
+            assert dber.putVal(db, b'%08d' % i, val)
+        assert dber.mapSize > SmallLMDBer.MapSize
+        assert dber.mapUsed <= dber.mapSize
+        assert dber.getVal(db, b'%08d' % 0) == val
+        assert dber.cnt(db) == 32
+
+        # map grown by retry when full. MapFill of 1 disables growth ahead of need
+        dber.MapFill = 1.0
+        size = dber.mapSize
+        i = 32
+        while dber.mapSize == size:
+            assert dber.putVal(db, b'%08d' % i, val)
+            i += 1
+        assert dber.mapSize == size * dber.MapGrowth
+        assert dber.cnt(db) == i
+
+        # map not resized under open reader so write fails instead of faulting
+        items = dber.getTopItemIter(db=db)
+        next(items)
+        assert dber.active == 1
+        assert not dber.grow()
+        with pytest.raises(lmdb.MapFullError):
+            while True:
+                dber.putVal(db, b'%08d' % i, val)
+                i += 1
+        items.close()
+        assert dber.active == 0
+
+        dber.MaxMapSize = dber.mapSize  # capped so no growth
+        assert not dber.grow()
+        dber.MaxMapSize = None
+        assert dber.grow()
+        assert dber.putVal(db, b'%08d' % i, val)
+
+    """ End Test """
+
+
+def test_lmdber_snapshot():
+    """
+    Test LMDBer.snapshot shares one consistent read transaction
+    """
+    with openLMDB() as dber:
+        db = dber.env.open_db(key=b'beta.')
+        assert dber.putVal(db, b'a', b'one')
+        assert dber.putVal(db, b'b', b'two')
+
+        with dber.snapshot() as txn:
+            assert dber.active == 1
+            assert bytes(dber.getVal(db, b'a')) == b'one'
+            assert dber.setVal(db, b'a', b'uno')  # write commits in own txn
+            assert dber.putVal(db, b'c', b'three')
+            assert bytes(dber.getVal(db, b'a')) == b'one'  # not seen in snapshot
+            assert dber.getVal(db, b'c') is None
+            assert dber.cnt(db) == 2
+            assert [bytes(val) for _, val in dber.getTopItemIter(db=db)] == [b'one', b'two']
+            with dber.snapshot() as inner:  # nested shares outer
+                assert inner is txn
+                assert dber.active == 1
+            assert dber.local.txn is txn
+            assert dber.version == keri.__version__  # unbuffered read own txn
+
+        assert dber.active == 0
+        assert dber.local.txn is None
+        assert bytes(dber.getVal(db, b'a')) == b'uno'
+        assert dber.cnt(db) == 3
+
+    """ End Test """
+
+
+def test_lmdber_batch():
+    """
+    Test LMDBer.batch shares one write transaction
+    """
+    with openLMDB() as dber:
+        dber.docs = subing.Suber(db=dber, subkey='docs.')
+        db = dber.env.open_db(key=b'beta.')
+        assert dber.putVal(db, b'a', b'one')
+
+        with dber.batch() as txn:
+            assert dber.active == 1
+            assert dber.setVal(db, b'a', b'uno')
+            assert dber.putVal(db, b'b', b'two')
+            assert bytes(dber.getVal(db, b'a')) == b'uno'  # sees own writes
+            assert dber.cnt(db) == 2
+            assert dber.delVal(db, b'b')
+            assert dber.docs.put(keys="x", val="ex")
+            assert dber.docs.get(keys="x") == "ex"
+            with dber.batch() as inner:  # nested shares outer
+                assert inner is txn
+                assert dber.putVal(db, b'c', b'three')
+            with dber.snapshot():  # reads go through batch
+                assert bytes(dber.getVal(db, b'c')) == b'three'
+            assert dber.active == 1
+
+        assert dber.active == 0
+        assert dber.local.wtxn is None
+        assert bytes(dber.getVal(db, b'a')) == b'uno'
+        assert dber.getVal(db, b'b') is None
+        assert bytes(dber.getVal(db, b'c')) == b'three'
+        assert dber.docs.get(keys="x") == "ex"
+
+        with pytest.raises(ValueError):
+            with dber.batch():  # aborts all writes on error
+                assert dber.setVal(db, b'a', b'ein')
+                assert dber.putVal(db, b'd', b'four')
+                raise ValueError("abort")
+        assert dber.active == 0
+        assert bytes(dber.getVal(db, b'a')) == b'uno'
+        assert dber.getVal(db, b'd') is None
+
+    """ End Test """
+
+
+def test_lmdber_range():
+    """
+    Test LMDBer.getRangeIter and its IoSet and IoDup variants
+    """
+    assert dbing.topEnd(b'ab') == b'ac'
+    assert dbing.topEnd(b'a\xff') == b'b'
+    assert dbing.topEnd(b'') is None
+    assert dbing.topEnd(b'\xff\xff') is None
+
+    with openLMDB() as dber:
+        db = dber.env.open_db(key=b'rng.')
+        for key in (b'a.1', b'a.2', b'a.3', b'b.1', b'b.2', b'c.1'):
+            assert dber.putVal(db, key, key.upper())
+
+        keys = lambda **kwa: [key for key, val in dber.getRangeIter(db, **kwa)]
+        assert keys() == [b'a.1', b'a.2', b'a.3', b'b.1', b'b.2', b'c.1']
+        assert keys(reverse=True) == [b'c.1', b'b.2', b'b.1', b'a.3', b'a.2', b'a.1']
+        assert keys(top=b'b.') == [b'b.1', b'b.2']
+        assert keys(top=b'b.', reverse=True) == [b'b.2', b'b.1']
+        assert keys(seek=b'a.2') == [b'a.2', b'a.3', b'b.1', b'b.2', b'c.1']
+        assert keys(seek=b'a.2', after=True, limit=2) == [b'a.3', b'b.1']
+        assert keys(seek=b'b.1', reverse=True) == [b'b.1', b'a.3', b'a.2', b'a.1']
+        assert keys(seek=b'b.1', after=True, reverse=True, limit=1) == [b'a.3']
+        assert keys(seek=b'a.2', stop=b'b.2') == [b'a.2', b'a.3', b'b.1']
+        assert keys(stop=b'a.3', reverse=True) == [b'c.1', b'b.2', b'b.1']
+        assert keys(top=b'a.', seek=b'b') == []
+        assert keys(top=b'a.', seek=b'b', reverse=True) == [b'a.3', b'a.2', b'a.1']
+        assert keys(seek=b'z') == []
+        assert keys(seek=b'0', reverse=True) == []
+        assert keys(limit=0) == []
+        items = list(dber.getRangeIter(db, top=b'c.'))
+        assert [(key, bytes(val)) for key, val in items] == [(b'c.1', b'C.1')]
+        assert list(dber.getRangeIter(db, top=b'b.', values=False)) == [b'b.1', b'b.2']
+
+        # paginate forward and back by keys with cost of page not offset
+        pages, last = [], None
+        while page := keys(seek=last, after=last is not None, limit=4):
+            pages.append(page)
+            last = page[-1]
+        assert pages == [[b'a.1', b'a.2', b'a.3', b'b.1'], [b'b.2', b'c.1']]
+
+        dup = dber.env.open_db(key=b'dup.', dupsort=True)
+        assert dber.putVals(dup, b'a', [b'x', b'y'])
+        assert dber.putVals(dup, b'b', [b'z'])
+        items = [(key, bytes(val)) for key, val in dber.getRangeIter(dup, reverse=True)]
+        assert items == [(b'b', b'z'), (b'a', b'y'), (b'a', b'x')]
+        assert list(dber.getRangeIter(dup, values=False)) == [b'a', b'b']
+        assert list(dber.getRangeIter(dup, values=False, reverse=True)) == [b'b', b'a']
+        assert [key for key, _ in dber.getRangeIter(dup, seek=b'a', after=True)] == [b'b']
+        assert [key for key, _ in dber.getRangeIter(dup, seek=b'b', after=True,
+                                                    reverse=True)] == [b'a', b'a']
+
+        ioset = dber.env.open_db(key=b'ioset.')
+        assert dber.putIoSetVals(ioset, b'a', [b'x', b'y'])
+        assert dber.putIoSetVals(ioset, b'b', [b'z'])
+        assert dber.putIoSetVals(ioset, b'c', [b'w'])
+        items = [(key, bytes(val)) for key, val in dber.getIoSetRangeIter(ioset)]
+        assert items == [(b'a', b'x'), (b'a', b'y'), (b'b', b'z'), (b'c', b'w')]
+        items = [(key, bytes(val)) for key, val in dber.getIoSetRangeIter(ioset,
+                                                                          reverse=True,
+                                                                          limit=3)]
+        assert items == [(b'c', b'w'), (b'b', b'z'), (b'a', b'y')]
+        assert [key for key, _ in dber.getIoSetRangeIter(ioset, seek=b'a', after=True)] == [b'b', b'c']
+        assert [key for key, _ in dber.getIoSetRangeIter(ioset, seek=b'b')] == [b'b', b'c']
+        assert [key for key, _ in dber.getIoSetRangeIter(ioset, seek=b'b',
+                                                         reverse=True)] == [b'b', b'a', b'a']
+        assert [key for key, _ in dber.getIoSetRangeIter(ioset, seek=b'b', after=True,
+                                                         reverse=True)] == [b'a', b'a']
+        assert [key for key, _ in dber.getIoSetRangeIter(ioset, stop=b'c')] == [b'a', b'a', b'b']
+        assert [key for key, _ in dber.getIoSetRangeIter(ioset, stop=b'a',
+                                                         reverse=True)] == [b'c', b'b']
+        assert list(dber.getIoSetRangeIter(ioset, values=False)) == [b'a', b'b', b'c']
+        assert list(dber.getIoSetRangeIter(ioset, values=False, reverse=True,
+                                           limit=2)) == [b'c', b'b']
+
+        iodup = dber.env.open_db(key=b'iodup.', dupsort=True)
+        assert dber.putIoDupVals(iodup, b'a', [b'y', b'x'])
+        items = [(key, bytes(val)) for key, val in dber.getIoDupRangeIter(iodup)]
+        assert items == [(b'a', b'y'), (b'a', b'x')]  # insertion order
+        items = [(key, bytes(val)) for key, val in dber.getIoDupRangeIter(iodup,
+                                                                          reverse=True)]
+        assert items == [(b'a', b'x'), (b'a', b'y')]
+        assert list(dber.getIoDupRangeIter(iodup, values=False)) == [b'a']
+
+    """ End Test """
+
+
+def test_lmdber_stats():
+    """
+    Test LMDBer per sub db stats and sampled traffic profile
+    """
+    with openLMDB() as dber:
+        dber.beta = dber.env.open_db(key=b'beta.')
+        dber.dups = dber.env.open_db(key=b'dups.', dupsort=True)
+        dber.docs = subing.Suber(db=dber, subkey='docs.')
+        assert dber.docs.subkey == 'docs.'
+        for i in range(64):
+            assert dber.putVal(dber.beta, b'%03d' % i, b'x' * 64)
+        assert dber.putVals(dber.dups, b'a', [b'1', b'2', b'3'])
+        assert dber.docs.put(keys="a", val="big" * 4096)  # overflow pages
+
+        stats = dber.stats()
+        assert list(stats) == ['beta.', 'docs.', 'dups.']  # not __version__
+        assert stats['beta.']['entries'] == 64
+        assert stats['beta.']['depth'] >= 1
+        assert stats['beta.']['leaf'] >= 1
+        assert stats['beta.']['bytes'] == 4096 * (stats['beta.']['branch']
+                                                  + stats['beta.']['leaf']
+                                                  + stats['beta.']['overflow'])
+        assert not stats['beta.']['dupsort']
+        assert stats['dups.']['entries'] == 3
+        assert stats['dups.']['dupsort']
+        assert stats['docs.']['overflow'] >= 3
+        assert 'reads' not in stats['beta.']
+
+        traffic = dber.profile()
+        assert dber.traffic is traffic
+        assert dber.getVal(dber.beta, b'000') is not None
+        assert dber.docs.get(keys="a") == "big" * 4096
+        assert dber.docs.pin(keys="b", val="small")
+        assert traffic.stats() == {'beta.': dict(reads=1, writes=0),
+                                   'docs.': dict(reads=1, writes=1)}
+        stats = dber.stats()
+        assert stats['docs.']['reads'] == 1
+        assert stats['docs.']['writes'] == 1
+        assert stats['dups.']['reads'] == stats['dups.']['writes'] == 0
+
+        traffic = dber.profile(every=4)  # sampled
+        for i in range(8):
+            dber.getVal(dber.beta, b'000')
+        assert traffic.stats() == {'beta.': dict(reads=8, writes=0)}
+
+        assert dber.profile(every=0) is None
+        assert dber.traffic is None
+
+    """ End Test """
+
+
+def test_lmdber_backup():
+    """
+    Test LMDBer online compacting backup and restore
+    """
+    with (openLMDB(name="orig") as dber, openLMDB(name="copy") as copy,
+          tempfile.TemporaryDirectory() as tmp):
+        db = dber.env.open_db(key=b'beta.')
+        for i in range(256):
+            assert dber.putVal(db, b'%03d' % i, b'x' * 1024)
+        for i in range(128):  # free pages for compaction to drop
+            assert dber.delVal(db, b'%03d' % i)
+
+        with pytest.raises(ValueError):
+            dber.backup()
+
+        with dber.snapshot():  # backup while a reader is open
+            path = dber.backup(path=os.path.join(tmp, "full"), compact=False)
+            assert dber.putVal(db, b'new', b'after')  # writes during backup
+        assert dber.backup(path=os.path.join(tmp, "compact")) == os.path.join(tmp, "compact")
+        assert dber.active == 0
+        full = os.path.getsize(os.path.join(path, "data.mdb"))
+        compact = os.path.getsize(os.path.join(tmp, "compact", "data.mdb"))
+        assert compact < full
+
+        with open(os.path.join(tmp, "stream.mdb"), "wb") as f:
+            assert dber.backup(fd=f.fileno()) is None
+        assert os.path.getsize(os.path.join(tmp, "stream.mdb")) == compact
+
+        # restore from directory then from file descriptor
+        assert copy.restore(path=os.path.join(tmp, "compact"))
+        assert copy.opened
+        db = copy.env.open_db(key=b'beta.')
+        assert copy.cnt(db) == 129
+        assert bytes(copy.getVal(db, b'new')) == b'after'
+        assert copy.getVal(db, b'000') is None
+        assert bytes(copy.getVal(db, b'255')) == b'x' * 1024
+
+        assert copy.delVal(db, b'new')
+        with open(os.path.join(tmp, "stream.mdb"), "rb") as f:
+            assert copy.restore(fd=f.fileno())
+        db = copy.env.open_db(key=b'beta.')
+        assert bytes(copy.getVal(db, b'new')) == b'after'
+
+        with copy.snapshot():
+            with pytest.raises(keri.kering.DatabaseError):
+                copy.restore(path=os.path.join(tmp, "compact"))
+
+    """ End Test """
+
+
 if __name__ == "__main__":
     test_key_funcs()
     test_suffix()
@@ -6,8 +6,9 @@ tests.app.apping module
 
 import json
 import os
-from dataclasses import dataclass, asdict
+from dataclasses import dataclass, asdict, field
 
+import msgpack
 import pytest
 
 from keri.core.coring import Kinds
@@ -218,6 +219,38 @@ def test_kom_get_item_iter():
 
 
 
+def test_kom_range_iter():
+    """
+    Test cursor range scans of Komer and IoSetKomer
+    """
+    @dataclass
+    class Stuff:
+        a: str  # dummy
+        b: str  # dummy too
+
+        def __iter__(self):
+            return iter(asdict(self))
+
+    with dbing.openLMDB() as db:
+        mydb = koming.Komer(db=db, schema=Stuff, subkey='recs.')
+        for i in range(5):
+            assert mydb.put(keys=("pre", f"{i}"), val=Stuff(a=f"a{i}", b=f"b{i}"))
+
+        items = list(mydb.getRangeItemIter(keys=("pre", ""), seek=("pre", "1"),
+                                           after=True, limit=2))
+        assert items == [(("pre", "2"), Stuff(a="a2", b="b2")),
+                         (("pre", "3"), Stuff(a="a3", b="b3"))]
+        assert list(mydb.getRangeKeyIter(reverse=True, stop=("pre", "2"))) == [
+            ("pre", "4"), ("pre", "3")]
+
+        iodb = koming.IoSetKomer(db=db, schema=Stuff, subkey='sets.')
+        assert iodb.put(keys=("x",), vals=[Stuff(a="1", b="2"), Stuff(a="3", b="4")])
+        assert iodb.put(keys=("y",), vals=[Stuff(a="5", b="6")])
+        items = list(iodb.getRangeItemIter(reverse=True, limit=2))
+        assert items == [(("y",), Stuff(a="5", b="6")), (("x",), Stuff(a="3", b="4"))]
+        assert list(iodb.getRangeKeyIter()) == [("x",), ("y",)]
+
+
 def test_put_invalid_dataclass():
     @dataclass
     class Record:
@@ -837,6 +870,94 @@ def test_ioset_komer():
     assert not db.opened
 
 
+def test_cache_komer():
+    """
+    Test CacheKomer read through LRU caching
+    """
+
+    @dataclass
+    class Record:
+        first: str
+        last: str
+        tags: list
+
+    with dbing.openLMDB() as db:
+        mydb = koming.CacheKomer(db=db, schema=Record, subkey='records.')
+        assert isinstance(mydb, koming.Komer)
+        keys = ("test_key", "0001")
+        sue = Record(first="Sue", last="Test", tags=["a"])
+        assert mydb.put(keys=keys, val=sue)
+
+        actual = mydb.get(keys=keys)
+        assert actual == sue
+        assert actual is not sue
+        actual.first = "Susan"  # copy so cache unchanged
+        again = mydb.get(keys=keys)
+        assert again.first == "Sue"
+        assert again is not actual
+        assert mydb.stats()["hits"] == 1
+        assert mydb.getDict(keys=keys)["first"] == "Sue"
+
+        assert mydb.pin(keys=keys, val=actual)  # invalidates
+        assert mydb.get(keys=keys).first == "Susan"
+        assert mydb.rem(keys=keys)
+        assert mydb.get(keys=keys) is None
+        assert len(mydb.cache) == 0
+    """Done Test"""
+
+
+def test_record_kind():
+    """
+    Test Komer RecordKind serialization of dataclasses by field index
+    """
+
+    @dataclass
+    class Inner:
+        s: str = '0'
+        br: list = field(default_factory=list)
+
+    @dataclass
+    class Record:
+        first: str
+        tags: list
+        inner: Inner = field(default_factory=Inner)
+        other: Inner | None = None
+        note: str = ''
+
+    assert koming.recordFields(Record) == (("first", None), ("tags", None),
+                                           ("inner", Inner), ("other", Inner),
+                                           ("note", None))
+    sue = Record(first="Sue", tags=["a", 1], inner=Inner(s="1", br=["x"]))
+    rec = koming.recordify(sue)
+    assert rec == {0: "Sue", 1: ["a", 1], 2: {0: "1", 1: ["x"]}, 3: None, 4: ''}
+    assert koming.derecordify(Record, rec) == sue
+    assert koming.derecordify(Record, {0: "Bob", 1: []}) == Record(first="Bob", tags=[])
+    with pytest.raises(ValueError):
+        koming.derecordify(Record, {9: "Bob"})
+
+    with dbing.openLMDB() as db:
+        mydb = koming.Komer(db=db, schema=Record, subkey='records.',
+                            kind=koming.RecordKind)
+        jsdb = koming.Komer(db=db, schema=Record, subkey='jsons.')
+        keys = ("test_key", "0001")
+        assert mydb.put(keys=keys, val=sue)
+        assert jsdb.put(keys=keys, val=sue)
+        raw = bytes(db.getVal(db=mydb.sdb, key=mydb._tokey(keys)))
+        assert raw == msgpack.dumps(rec)
+        assert len(raw) < len(bytes(db.getVal(db=jsdb.sdb, key=jsdb._tokey(keys))))
+        assert mydb.get(keys=keys) == sue
+        assert [val for _, val in mydb.getItemIter()] == [sue]
+
+        # JSON record of unmigrated db still read
+        db.setVal(db=mydb.sdb, key=mydb._tokey(keys),
+                  val=db.getVal(db=jsdb.sdb, key=jsdb._tokey(keys)))
+        assert mydb.get(keys=keys) == sue
+
+        with pytest.raises(ValueError):
+            mydb.put(keys=keys, val=Inner())
+    """Done Test"""
+
+
 if __name__ == "__main__":
     test_kom_happy_path()
     test_kom_get_item_iter()
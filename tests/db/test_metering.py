@@ -0,0 +1,146 @@
+# -*- encoding: utf-8 -*-
+"""
+tests.db.metering module
+
+"""
+import datetime
+
+from keri import kering
+from keri.kering import Vrsn_1_0
+
+from keri.app import habbing
+from keri.core import eventing, parsing
+from keri.db import basing, dbing, metering
+from keri.vdr import verifying, viring
+from keri.help import helping
+
+
+def test_escrow_meter():
+    """
+    Test EscrowMeter tallies
+    """
+    meter = metering.EscrowMeter()
+    assert meter.stats() == {}
+
+    with meter.timed("ooes") as tally:
+        assert isinstance(tally, metering.EscrowTally)
+        meter.succeed("ooes")
+        meter.fail("ooes", kering.ValidationError("bad"))
+        meter.fail("ooes", kering.StaleEscrowError("stale"))
+        meter.fail("ooes")
+
+    with meter.timed("ooes"):
+        pass
+
+    stats = meter.stats()
+    assert list(stats) == ["ooes"]
+    ooes = stats["ooes"]
+    assert ooes["passes"] == 2
+    assert ooes["successes"] == 1
+    assert ooes["failures"] == 2
+    assert ooes["timeouts"] == 1
+    assert ooes["total"] >= ooes["elapsed"] >= 0.0
+
+    meter.clear()
+    assert meter.stats() == {}
+    """Done Test"""
+
+
+def test_escrow_metrics():
+    """
+    Test escrowMetrics counts and ages over Baser escrows
+    """
+    with basing.openDB() as db:
+        assert isinstance(db.escrowMeter, metering.EscrowMeter)
+
+        metrics = metering.escrowMetrics(db)
+        assert list(metrics) == ["kel"]
+        assert [name for name, _, _ in metering.kelEscrows(db)] == list(metrics["kel"])
+        for metric in metrics["kel"].values():
+            assert metric["count"] == 0
+            assert metric["sampledOldest"] is None
+            assert metric["sampledMedian"] is None
+
+        pre = b"BWzwEHHzq7K0gzQPYGGwTmuupUhPx5_yZ-Wk1x4ejhcc"
+        digs = [b"EA8Ih8hxLi3mmkyItXK1u55cnHl4WgNZ_RE-gKXqgcX4",
+                b"EBAjkX6Mkl8kZ2rEr3-4GRU9wxmxqcH7p6shVSWyMXBI",
+                b"ECMNKeBOObGoqTpnTtuRAKgA4LnZDlzuCydqeQvf1C6X"]
+        start = datetime.datetime(2021, 1, 1, tzinfo=datetime.timezone.utc)
+        for i, dig in enumerate(digs):
+            dts = helping.toIso8601(start + datetime.timedelta(seconds=10 * i))
+            db.putDts(dbing.dgKey(pre, dig), dts.encode("utf-8"))
+            db.addOoe(dbing.snKey(pre, 1), dig)
+
+        now = start + datetime.timedelta(seconds=100)
+        ooes = metering.escrowMetrics(db, now=now)["kel"]["ooes"]
+        assert ooes["count"] == 3
+        assert ooes["sampled"] == 3
+        assert ooes["sampledOldest"] == 100.0
+        assert ooes["sampledMedian"] == 90.0
+        assert ooes["passes"] == 0
+
+        ooes = metering.escrowMetrics(db, limit=2, now=now)["kel"]["ooes"]
+        assert ooes["count"] == 3
+        assert ooes["sampled"] == 2
+        assert ooes["sampledOldest"] == 100.0  # first entries in key order
+
+        ooes = metering.escrowMetrics(db, limit=0, now=now)["kel"]["ooes"]
+        assert ooes["count"] == 3
+        assert ooes["sampled"] == 0
+        assert ooes["sampledOldest"] is None
+    """Done Test"""
+
+
+def test_kevery_escrow_tallies():
+    """
+    Test Kevery escrow processing tallies into escrowMeter of its db
+    """
+    with (habbing.openHby(name="bob", base="test") as bobHby,
+          habbing.openHby(name="eve", base="test") as eveHby):
+        bobHab = bobHby.makeHab(name="bob", isith="1", icount=1, transferable=True)
+        icp = bobHab.makeOwnInception()
+        bobHab.rotate()
+        rot = bobHab.makeOwnEvent(sn=1)
+
+        kvy = eventing.Kevery(db=eveHby.db, lax=False, local=False)
+        parsing.Parser(version=Vrsn_1_0).parse(ims=bytearray(rot), kvy=kvy)  # out of order
+        assert eveHby.db.cnt(eveHby.db.ooes) == 1
+
+        kvy.processEscrows()
+        ooes = eveHby.db.escrowMeter.stats()["ooes"]
+        assert ooes["passes"] == 1
+        assert ooes["successes"] == 0
+
+        parsing.Parser(version=Vrsn_1_0).parse(ims=bytearray(icp), kvy=kvy)
+        kvy.processEscrows()
+        ooes = metering.escrowMetrics(eveHby.db)["kel"]["ooes"]
+        assert ooes["count"] == 0
+        assert ooes["passes"] == 2
+        assert ooes["successes"] == 1
+        assert ooes["failures"] == 0
+        assert bobHab.pre in eveHby.db.kevers
+        assert eveHby.db.kevers[bobHab.pre].sn == 1
+
+        kvy.processEscrowDelegables()  # awaits delegator approval so run apart
+        assert eveHby.db.escrowMeter.stats()["delegables"]["passes"] == 1
+    """Done Test"""
+
+
+def test_tel_escrow_tallies():
+    """
+    Test Verifier escrow processing tallies into escrowMeter of its reger
+    """
+    with (habbing.openHby(name="ted", base="test") as hby,
+          viring.openReger(name="ted", temp=True) as reger):
+        vry = verifying.Verifier(hby=hby, reger=reger)
+        vry.processEscrows()
+        stats = reger.escrowMeter.stats()
+        assert list(stats) == ["mce", "mse", "mre"]
+        for name in ("mce", "mse", "mre"):
+            assert stats[name]["passes"] == 1
+            assert stats[name]["failures"] == 0
+
+        metrics = metering.escrowMetrics(hby.db, reger=reger)["tel"]
+        assert metrics["mre"]["passes"] == 1
+        assert metrics["mre"]["count"] == 0
+    """Done Test"""
@@ -219,6 +219,55 @@ def test_suber():
     assert not db.opened
 
 
+def test_suber_range():
+    """
+    Test cursor range scans of Suber, IoSetSuber, IoDupSuber and OnSuber
+    """
+    with dbing.openLMDB() as db:
+        sdb = subing.Suber(db=db, subkey='bags.')
+        for keys in (("a", "1"), ("a", "2"), ("b", "1"), ("b", "2"), ("c", "1")):
+            assert sdb.put(keys=keys, val="".join(keys))
+
+        items = list(sdb.getRangeItemIter(limit=2))
+        assert items == [(("a", "1"), "a1"), (("a", "2"), "a2")]
+        items = list(sdb.getRangeItemIter(seek=items[-1][0], after=True, limit=2))
+        assert items == [(("b", "1"), "b1"), (("b", "2"), "b2")]
+        items = list(sdb.getRangeItemIter(keys=("b", ""), reverse=True))
+        assert items == [(("b", "2"), "b2"), (("b", "1"), "b1")]
+        items = list(sdb.getRangeItemIter(keys="b", topive=False, reverse=True,
+                                          limit=1))
+        assert items == [(("b", "2"), "b2")]
+        items = list(sdb.getRangeItemIter(seek=("a", "2"), stop=("c",)))
+        assert [keys for keys, _ in items] == [("a", "2"), ("b", "1"), ("b", "2")]
+        assert list(sdb.getRangeKeyIter(reverse=True, limit=3)) == [("c", "1"),
+                                                                     ("b", "2"),
+                                                                     ("b", "1")]
+
+        iosdb = subing.IoSetSuber(db=db, subkey='sets.')
+        assert iosdb.put(keys=("a",), vals=["x", "y"])
+        assert iosdb.put(keys=("b",), vals=["z"])
+        items = list(iosdb.getRangeItemIter(reverse=True))
+        assert items == [(("b",), "z"), (("a",), "y"), (("a",), "x")]
+        items = list(iosdb.getRangeItemIter(seek=("a",), after=True))
+        assert items == [(("b",), "z")]
+        assert list(iosdb.getRangeKeyIter()) == [("a",), ("b",)]
+
+        iodb = subing.IoDupSuber(db=db, subkey='dups.')
+        assert iodb.put(keys=("a",), vals=["y", "x"])
+        assert iodb.put(keys=("b",), vals=["z"])
+        items = list(iodb.getRangeItemIter(reverse=True))
+        assert items == [(("b",), "z"), (("a",), "x"), (("a",), "y")]
+        assert list(iodb.getRangeKeyIter(seek=("b",), reverse=True)) == [("b",), ("a",)]
+
+        # tail read of an ordinal keyed branch
+        ondb = subing.OnSuber(db=db, subkey='ons.')
+        for on in range(20):
+            assert ondb.putOn(keys="pre", on=on, val=f"v{on}")
+        items = list(ondb.getRangeItemIter(keys=("pre", ""), reverse=True, limit=2))
+        assert [val for _, val in items] == ["v19", "v18"]
+    """ Done Test """
+
+
 def test_on_suber():
     """
     Test OnSuber LMDBer sub database class
@@ -3286,6 +3335,55 @@ def test_crypt_signer_suber():
 
 
 
+def test_cache_suber():
+    """
+    Test CacheSuber and CacheCesrSuber read through LRU caching
+    """
+    with dbing.openLMDB() as db:
+        suber = subing.CacheSuber(db=db, subkey='bags.', capacity=2)
+        assert isinstance(suber, subing.Suber)
+        assert suber.stats() == dict(size=0, capacity=2, hits=0, misses=0, evictions=0)
+
+        assert suber.put(keys=("a", "1"), val="Blue")
+        assert suber.get(keys=("a", "1")) == "Blue"  # miss reads through
+        assert suber.get(keys=("a", "1")) == "Blue"  # hit
+        assert suber.get(keys=("a", "2")) is None  # absence not cached
+        assert suber.stats() == dict(size=1, capacity=2, hits=1, misses=2, evictions=0)
+
+        assert suber.pin(keys=("a", "1"), val="Green")  # invalidates
+        assert suber.get(keys=("a", "1")) == "Green"
+        assert not suber.put(keys=("a", "1"), val="Red")  # exists so not put
+        assert suber.get(keys=("a", "1")) == "Green"
+
+        assert suber.put(keys=("a", "2"), val="Gray")
+        assert suber.put(keys=("a", "3"), val="Black")
+        assert suber.get(keys=("a", "2")) == "Gray"
+        assert suber.get(keys=("a", "3")) == "Black"
+        assert suber.stats()["evictions"] == 1  # least recently used evicted
+        assert len(suber.cache) == 2
+
+        db.setVal(db=suber.sdb, key=suber._tokey(("a", "3")), val=b"White")
+        assert suber.get(keys=("a", "3")) == "Black"  # not through instance so stale
+
+        assert suber.rem(keys=("a", "3"))
+        assert suber.get(keys=("a", "3")) is None
+        assert suber.trim(keys=("a", ""))
+        assert len(suber.cache) == 0
+        assert suber.get(keys=("a", "1")) is None
+
+        cesrSuber = subing.CacheCesrSuber(db=db, subkey='pres.', klas=coring.Prefixer)
+        prefixer = coring.Prefixer(qb64="BDzwEHHzq7K0gzQPYGGwTmuupUhPx5_yZ-Wk1x4ejhcc")
+        assert cesrSuber.put(keys="alpha", val=prefixer)
+        actual = cesrSuber.get(keys="alpha")
+        assert actual.qb64 == prefixer.qb64
+        assert cesrSuber.get(keys="alpha") is actual  # same deserialized instance
+        assert cesrSuber.stats()["hits"] == 1
+
+        schemeSuber = subing.CacheSchemerSuber(db=db, subkey='schema.', capacity=0)
+        assert schemeSuber.stats()["capacity"] == 0  # disabled
+    """Done Test"""
+
+
 if __name__ == "__main__":
     test_suber()
     test_on_suber()
@@ -413,6 +413,30 @@ def test_get_admin():
     """Done Test"""
 
 
+def test_get_escrows():
+    """
+    Uses falcon TestClient
+    """
+    with habbing.openHby(name="zoe", base="test") as hby:
+        myapp = falcon.App()
+        myapp.add_route("/escrows", ending.EscrowEnd(db=hby.db))
+        client = testing.TestClient(app=myapp)
+
+        rep = client.simulate_get("/escrows", params=dict(limit=0))
+        assert rep.status == falcon.HTTP_OK
+        assert rep.headers["content-type"] == "application/json"
+        metrics = rep.json
+        assert list(metrics) == ["kel"]
+        assert metrics["kel"]["ooes"] == dict(count=0, sampled=0, sampledOldest=None,
+                                              sampledMedian=None, passes=0, elapsed=0.0,
+                                              total=0.0, successes=0,
+                                              failures=0, timeouts=0)
+
+        rep = client.simulate_get("/escrows", params=dict(limit=-1))
+        assert rep.status == falcon.HTTP_BAD_REQUEST
+    """Done Test"""
+
+
 def test_get_oobi():
     """
     Uses falcon TestClient